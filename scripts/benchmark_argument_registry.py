@@ -0,0 +1,82 @@
+#---------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+#---------------------------------------------------------------------------------------------
+
+"""Times applying the registered argument settings to every command in the installed
+command table, using the scope trie of the argument registry and the previous approach
+of probing every prefix of the command name for every argument.
+
+Usage: python scripts/benchmark_argument_registry.py [--repeat N]
+"""
+
+from __future__ import print_function
+
+import argparse
+import timeit
+
+from azure.cli.commands import (CliArgumentType, get_command_table, _cli_argument_registry, # pylint: disable=protected-access
+                                _get_cli_extra_arguments, _update_command_definitions)
+
+def _flatten_registry(node, scope=''):
+    # scope -> dest -> CliArgumentType, the layout used before the trie
+    flattened = {scope: node.arguments} if node.arguments else {}
+    for part, child in node.children.items():
+        flattened.update(_flatten_registry(child, (scope + ' ' + part).strip()))
+    return flattened
+
+def _probe_all_scopes(arguments, command, name):
+    parts = command.split()
+    result = CliArgumentType()
+    for index in range(0, len(parts) + 1):
+        probe = ' '.join(parts[0:index])
+        override = arguments.get(probe, {}).get(name, None)
+        if override:
+            result.update(override)
+    return result
+
+def _update_with_prefix_probing(command_table, arguments):
+    for command_name, command in command_table.items():
+        for argument_name in command.arguments:
+            command.update_argument(argument_name,
+                                    _probe_all_scopes(arguments, command_name, argument_name))
+        for argument_name, argument_definition in _get_cli_extra_arguments(command_name):
+            command.arguments[argument_name] = argument_definition
+            command.update_argument(argument_name,
+                                    _probe_all_scopes(arguments, command_name, argument_name))
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    command_table = get_command_table()
+    pairs = [(command_name, argument_name) for command_name, command in command_table.items()
+             for argument_name in command.arguments]
+    arguments = _flatten_registry(_cli_argument_registry._root) # pylint: disable=protected-access
+    print('{} commands, {} arguments, {} registered scopes'.format(
+        len(command_table), len(pairs), len(arguments)))
+    if not pairs:
+        print('No command modules are installed.')
+        return
+
+    for command_name, argument_name in pairs:
+        expected = _probe_all_scopes(arguments, command_name, argument_name).settings
+        actual = _cli_argument_registry.get_cli_argument(command_name, argument_name).settings
+        assert expected == actual, (command_name, argument_name)
+
+    # Applying the settings again leaves the command table unchanged
+    def _probe():
+        _update_with_prefix_probing(command_table, arguments)
+
+    def _trie():
+        # Start from an empty cache, as when a process loads its command table
+        _cli_argument_registry._resolved.clear() # pylint: disable=protected-access
+        _update_command_definitions(command_table)
+
+    for label, func in (('prefix probing', _probe), ('scope trie', _trie)):
+        best = min(timeit.repeat(func, number=1, repeat=args.repeat))
+        print('{:<16}{:8.2f} ms'.format(label, best * 1000))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,157 @@
+#---------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+#---------------------------------------------------------------------------------------------
+
+"""Times writing a synthetic list result of nested objects in the list and tsv output
+formats, with the current writers and with the previous recursive ones that built the
+whole output in a StringIO, and reports the peak memory allocated while writing.
+
+Usage: python scripts/benchmark_output_writers.py [--rows N] [--repeat N]
+"""
+
+from __future__ import print_function
+
+import argparse
+import os
+import re
+import timeit
+from collections import OrderedDict
+from six import StringIO
+
+from azure.cli._output import (CommandResultItem, OutputProducer, ListOutput, TsvOutput,
+                               format_list, format_tsv)
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+class _PreviousListOutput(object): #pylint: disable=too-few-public-methods
+    FORMAT_KEYS_PATTERN = re.compile('([A-Z][^A-Z]*)')
+
+    def __init__(self):
+        self._formatted_keys_cache = {}
+
+    def _get_formatted_key(self, key):
+        try:
+            return self._formatted_keys_cache[key]
+        except KeyError:
+            words = [w for w in re.split(_PreviousListOutput.FORMAT_KEYS_PATTERN, key) if w]
+            self._formatted_keys_cache[key] = ' '.join(words).title()
+            return self._formatted_keys_cache[key]
+
+    @staticmethod
+    def _sort_key_func(key, item):
+        if isinstance(item[key], dict):
+            return '~~'+key
+        elif isinstance(item[key], list):
+            return '~'+key
+        else:
+            return key
+
+    def _dump_object(self, io, obj, indent):
+        if isinstance(obj, list):
+            for array_item in obj:
+                self._dump_object(io, array_item, indent)
+        elif isinstance(obj, dict):
+            obj_fk = {k: self._get_formatted_key(k) for k in obj}
+            key_width = len(max(obj_fk.values(), key=len)) if obj_fk else 0
+            for key in sorted(obj, key=lambda x: _PreviousListOutput._sort_key_func(x, obj)):
+                if isinstance(obj[key], dict) or isinstance(obj[key], list):
+                    io.write('   ' * indent + '%s :\n' % (
+                        self._get_formatted_key(key).ljust(key_width)))
+                    self._dump_object(io, obj[key] if obj[key] else 'None', indent+1)
+                else:
+                    io.write('   ' * indent + '%s : %s\n' % (
+                        self._get_formatted_key(key).ljust(key_width),
+                        'None' if obj[key] is None else obj[key]))
+        else:
+            io.write('   ' * indent + str(obj) + '\n')
+
+    def dump(self, data):
+        io = StringIO()
+        for obj in data:
+            self._dump_object(io, obj, 0)
+            io.write('\n')
+        io.write('\n')
+        return io.getvalue()
+
+def _previous_tsv_dump(data):
+    def _dump_obj(value, stream):
+        if isinstance(value, list):
+            stream.write(str(len(value)))
+        elif isinstance(value, dict):
+            stream.write('')
+        else:
+            stream.write(str(value))
+
+    io = StringIO()
+    for item in data:
+        if isinstance(item, OrderedDict):
+            values = item.values()
+        elif isinstance(item, dict):
+            values = [value for _, value in sorted(item.items())]
+        else:
+            values = item
+        separator = ''
+        for value in values:
+            io.write(separator)
+            _dump_obj(value, io)
+            separator = '\t'
+        io.write('\n')
+    return io.getvalue()
+
+def _create_result(rows):
+    return [{'id': '/subscriptions/sub/resourceGroups/rg/providers/Microsoft.Network/'
+                   'networkInterfaces/nic{}'.format(i),
+             'name': 'nic{}'.format(i),
+             'location': 'westus',
+             'provisioningState': 'Succeeded',
+             'enableIpForwarding': False,
+             'tags': {'environment': 'test', 'owner': 'user{}'.format(i % 10)},
+             'ipConfigurations': [{'name': 'ipconfig1',
+                                   'privateIpAddress': '10.0.{}.{}'.format(i // 250, i % 250),
+                                   'subnet': {'id': 'subnet'}}],
+             'dnsSettings': {'dnsServers': [], 'internalDomainNameSuffix': None}}
+            for i in range(rows)]
+
+def _measure(func, repeat):
+    best = min(timeit.repeat(func, number=1, repeat=repeat))
+    peak = None
+    if tracemalloc:
+        tracemalloc.start()
+        func()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return best, peak
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    result = _create_result(args.rows)
+    assert ListOutput().dump(result) == _PreviousListOutput().dump(result)
+    assert TsvOutput.dump(result) == _previous_tsv_dump(result)
+
+    with open(os.devnull, 'w') as devnull:
+        def _write(formatter):
+            OutputProducer(formatter=formatter, file=devnull).out(CommandResultItem(result))
+
+        cases = [
+            ('list, previous', lambda: devnull.write(_PreviousListOutput().dump(result))),
+            ('list', lambda: _write(format_list)),
+            ('tsv, previous', lambda: devnull.write(_previous_tsv_dump(result))),
+            ('tsv', lambda: _write(format_tsv)),
+        ]
+        print('{} rows'.format(args.rows))
+        for label, func in cases:
+            best, peak = _measure(func, args.repeat)
+            print('{:<16}{:8.0f} ms{}'.format(
+                label, best * 1000,
+                '' if peak is None else '{:8.2f} MB peak'.format(peak / 1024.0 / 1024.0)))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+#---------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+#---------------------------------------------------------------------------------------------
+
+"""
+Create the _signatures.py file for a command module.
+
+The file holds the arguments extracted from the signatures and docstrings of the SDK
+operations (and custom functions) the command module defines commands for, so loading
+the module doesn't have to introspect them again. Regenerate it when the SDK the module
+depends on is upgraded; operations whose SDK version, parameters or docstring differ from
+the ones recorded are introspected when the module is loaded.
+"""
+from __future__ import print_function
+import os
+import sys
+from importlib import import_module
+
+import azure.cli.commands._introspection as introspection
+
+OUT_FILE = sys.stdout
+
+HEADER = '''#---------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+#---------------------------------------------------------------------------------------------
+
+# This file is generated by scripts/sdk_command_gen/gen_signatures.py. Do not modify it by hand.
+# pylint: skip-file
+
+from azure.cli.commands._introspection import register_signatures
+'''
+
+def _error_exit(msg):
+    print(msg, file=sys.stderr)
+    sys.exit(1)
+
+def _get_args(argv):
+    if len(argv) != 1:
+        usage_msg = 'Usage: {} <command_module_name>'.format(os.path.basename(__file__))
+        usage_msg += '\n\n e.g. {} vm > .../command_modules/vm/_signatures.py\n'.format(
+            os.path.basename(__file__))
+        usage_msg += 'Got {} instead.\n'.format(argv)
+        _error_exit(usage_msg)
+    return argv[0]
+
+def _is_literal(value):
+    try:
+        return eval(repr(value)) == value # pylint: disable=eval-used
+    except Exception: # pylint: disable=broad-except
+        return False
+
+def _load_operations(command_module_name):
+    '''Import the command module and return the operations whose arguments it extracts.'''
+    operations = []
+
+    def _record(operation):
+        operations.append(operation)
+        return None
+
+    # Force live introspection, also for operations a previous _signatures.py covers
+    introspection._get_precomputed_arguments = _record # pylint: disable=protected-access
+    import_module('azure.cli.command_modules.' + command_module_name)
+    return operations
+
+def _get_signatures(operations):
+    signatures = {}
+    for operation in operations:
+        path = introspection.get_operation_path(operation)
+        parameters = introspection.get_operation_parameters(operation)
+        if not path or '<' in path or parameters is None or path in signatures:
+            # Nested functions and callables without code can't be looked up reliably
+            continue
+        arguments = list(introspection._introspect_arguments(operation)) # pylint: disable=protected-access
+        if not _is_literal(parameters) or not _is_literal(arguments):
+            print('Skipping {}: default values can\'t be written to the file'.format(path),
+                  file=sys.stderr)
+            continue
+        signatures[path] = {'version': introspection.get_operation_version(operation),
+                            'parameters': parameters,
+                            'doc': introspection.get_operation_doc_hash(operation),
+                            'arguments': arguments}
+    return signatures
+
+def main(argv):
+    command_module_name = _get_args(argv)
+    signatures = _get_signatures(_load_operations(command_module_name))
+    if not signatures:
+        _error_exit('No operations found in command module {}.'.format(command_module_name))
+    print(HEADER, file=OUT_FILE)
+    print('register_signatures({', file=OUT_FILE)
+    for path in sorted(signatures):
+        signature = signatures[path]
+        print('    {!r}: {{'.format(path), file=OUT_FILE)
+        print('        \'version\': {!r},'.format(signature['version']), file=OUT_FILE)
+        print('        \'parameters\': {!r},'.format(signature['parameters']), file=OUT_FILE)
+        print('        \'doc\': {!r},'.format(signature['doc']), file=OUT_FILE)
+        print('        \'arguments\': [', file=OUT_FILE)
+        for argument in signature['arguments']:
+            print('            {!r},'.format(argument), file=OUT_FILE)
+        print('        ]},', file=OUT_FILE)
+    print('})', file=OUT_FILE)
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
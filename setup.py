@@ -59,10 +59,11 @@ DEPENDENCIES = [
     'azure==2.0.0rc5',
     'colorama',
     'jmespath',
-    'msrest>=0.4.0',
+    'msrest>=0.4.28',
     'msrestazure>=0.4.0',
     'pip',
     'pygments',
+    'python-dateutil',
     'pyyaml',
     'requests',
     'six',
@@ -71,6 +72,9 @@ DEPENDENCIES = [
 if sys.version_info < (3, 4):
     DEPENDENCIES.append('enum34')
 
+if sys.version_info < (3, 2):
+    DEPENDENCIES.append('futures')
+
 if sys.version_info < (2, 7, 9):
     DEPENDENCIES.append('pyopenssl')
     DEPENDENCIES.append('ndg-httpsclient')
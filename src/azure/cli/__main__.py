@@ -6,7 +6,21 @@
 import sys
 import os
 
-import azure.cli.main
+from azure.cli._daemon import forward_to_daemon
+from azure.cli._profiling import PROFILE_STARTUP_ARGUMENT, phase, start_profiling
+
+if PROFILE_STARTUP_ARGUMENT in sys.argv:
+    # Start before the CLI is imported so the imports are profiled too
+    start_profiling()
+
+# If 'az daemon start' was used, let the daemon execute the command. This happens before
+# the rest of the CLI is imported as that is most of the cost of a short command.
+_daemon_exit_code = forward_to_daemon(sys.argv[1:])
+if _daemon_exit_code is not None:
+    sys.exit(_daemon_exit_code)
+
+with phase('import azure.cli.main'):
+    import azure.cli.main # pylint: disable=wrong-import-position
 
 from azure.cli._telemetry import init_telemetry, user_agrees_to_telemetry, telemetry_flush
 
@@ -0,0 +1,201 @@
+#---------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+#---------------------------------------------------------------------------------------------
+
+'''Execution of many commands in a single process ('az batch').
+
+Every command module is loaded once and each line of the input is executed through
+Application.execute. A JSON record is written for every line as it completes:
+
+    {"line": 3, "command": "group show -n rg", "exit_code": 0, "result": {...}}
+
+Failed lines have an "error" instead of a "result". The help shown for '-h' is the
+"result" of the line, the usage shown for invalid arguments its "error", and anything
+else a command prints goes to stderr, so only records are written to stdout.
+'''
+
+from __future__ import print_function
+import argparse
+import json
+import shlex
+import sys
+import threading
+import traceback
+from codecs import open as codecs_open
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from six import StringIO
+
+from azure.cli.application import APPLICATION, Configuration
+from azure.cli._output import ComplexEncoder
+from azure.cli._util import CLIError, ResultStream
+import azure.cli._logging as _logging
+
+logger = _logging.get_az_logger(__name__)
+
+class BatchConfiguration(Configuration): # pylint: disable=too-few-public-methods
+    '''Loads the commands of every installed command module once for all commands
+    of the batch.
+    '''
+    def __init__(self):
+        super(BatchConfiguration, self).__init__(['batch'])
+        self._command_table = None
+
+    def get_command_table(self):
+        if self._command_table is None:
+            import azure.cli.commands as commands
+            self._command_table = commands.get_command_table()
+        return self._command_table
+
+def _get_parser():
+    parser = argparse.ArgumentParser(
+        prog='az batch',
+        description='Execute the commands in a file, one per line, in a single process.')
+    parser.add_argument('--file', '-f', required=True,
+                        help="File with one command per line (without 'az'). "
+                             "Use '-' to read from stdin.")
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Number of commands to execute concurrently. Use 1 when '
+                             'commands depend on earlier ones.')
+    return parser
+
+def _read_commands(lines):
+    '''Yield (line number, argv) for every line holding a command. Lines that can't be
+    split yield the error instead of argv.
+    '''
+    for line_number, line in enumerate(lines, 1):
+        try:
+            argv = shlex.split(line, comments=True)
+        except ValueError as ex:
+            yield line_number, ex
+            continue
+        if argv and argv[0] == 'az':
+            argv = argv[1:]
+        if argv:
+            yield line_number, argv
+
+class _ThreadOutput(object):
+    '''Replaces a standard stream, writing what a thread capturing its output writes to
+    the buffer of the thread instead.
+    '''
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._thread_state = threading.local()
+
+    def _target(self):
+        captured = getattr(self._thread_state, 'captured', None)
+        return self._stream if captured is None else captured
+
+    def write(self, text):
+        self._target().write(text)
+
+    def flush(self):
+        self._target().flush()
+
+    def __getattr__(self, name):
+        return getattr(self._target(), name)
+
+    @contextmanager
+    def capture(self):
+        self._thread_state.captured = StringIO()
+        try:
+            yield self._thread_state.captured
+        finally:
+            del self._thread_state.captured
+
+@contextmanager
+def _output_captured_by_threads():
+    saved_streams = sys.stdout, sys.stderr
+    sys.stdout, sys.stderr = _ThreadOutput(sys.stdout), _ThreadOutput(sys.stderr)
+    try:
+        yield
+    finally:
+        sys.stdout, sys.stderr = saved_streams
+
+def execute_line(line_number, argv):
+    '''Execute a single command and return its record. The standard streams must be
+    replaced by _ThreadOutput, so what the command prints can be captured.
+    '''
+    if isinstance(argv, Exception):
+        return OrderedDict([('line', line_number),
+                            ('exit_code', 2),
+                            ('error', str(argv))])
+
+    record = OrderedDict([('line', line_number), ('command', ' '.join(argv))])
+    APPLICATION.new_session()
+    with sys.stdout.capture() as stdout, sys.stderr.capture() as stderr:
+        try:
+            cmd_result = APPLICATION.execute(list(argv))
+            record['exit_code'] = 0
+            record['result'] = \
+                ResultStream.materialize(cmd_result.result) if cmd_result else None
+        except CLIError as ex:
+            record['exit_code'] = ex.args[1] if len(ex.args) >= 2 else 1
+            record['error'] = str(ex.args[0])
+        except SystemExit as ex:
+            # The parser has shown the help, or the usage for invalid arguments
+            record['exit_code'] = ex.code if isinstance(ex.code, int) else 1
+            if record['exit_code']:
+                record['error'] = stderr.getvalue().strip() or 'invalid arguments'
+                stderr.truncate(0)
+            else:
+                record['result'] = stdout.getvalue()
+                stdout.truncate(0)
+        except Exception as ex: # pylint: disable=broad-except
+            logger.debug(traceback.format_exc())
+            record['exit_code'] = 1
+            record['error'] = str(ex)
+    # Anything else the command printed isn't part of its record
+    sys.stderr.write(stdout.getvalue() + stderr.getvalue())
+    return record
+
+def run_batch(argv, out_file=None):
+    '''Handle 'az batch'. Returns 0 if every command succeeded, 1 otherwise.'''
+    args = _get_parser().parse_args(argv)
+    if args.workers < 1:
+        raise CLIError('--workers must be at least 1')
+    out_file = out_file or sys.stdout
+
+    if args.file == '-':
+        input_file = sys.stdin
+    else:
+        try:
+            input_file = codecs_open(args.file, 'r', encoding='utf-8')
+        except (IOError, OSError) as ex:
+            raise CLIError("Unable to read '{}': {}".format(args.file, ex))
+
+    try:
+        from azure.cli._profile import enable_background_token_refresh
+        enable_background_token_refresh()
+        APPLICATION.initialize(BatchConfiguration())
+        # Let extensions process the commands before they are used from several threads
+        APPLICATION.load_command_table(APPLICATION.configuration.get_command_table())
+        with _output_captured_by_threads():
+            return _run_commands(input_file, args.workers, out_file)
+    finally:
+        if input_file is not sys.stdin:
+            input_file.close()
+
+def _run_commands(lines, workers, out_file):
+    failed = [False]
+
+    def _write_records(futures):
+        for record in sorted((f.result() for f in futures), key=lambda r: r['line']):
+            failed[0] = failed[0] or record['exit_code'] != 0
+            out_file.write(json.dumps(record, cls=ComplexEncoder) + '\n')
+            out_file.flush()
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = set()
+        for line_number, argv in _read_commands(lines):
+            # Bound the number of queued commands so input is read as it is executed
+            if len(pending) >= 2 * workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                _write_records(done)
+            pending.add(executor.submit(execute_line, line_number, argv))
+        _write_records(wait(pending).done)
+    return 1 if failed[0] else 0
@@ -0,0 +1,61 @@
+#---------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+#---------------------------------------------------------------------------------------------
+
+'''Commands of the CLI itself ('az batch' and 'az daemon').
+
+main() executes them before the command table is loaded, so they aren't part of it.
+They are added to the parser along with the command table, so they are listed in the
+help and completed like the commands of the command modules.
+'''
+
+from azure.cli.commands import CliCommand
+from azure.cli.help_files import helps
+from azure.cli._util import CLIError
+
+helps['batch'] = """
+    type: command
+    short-summary: Execute the commands in a file, one per line, in a single process.
+    long-summary: A JSON record with the exit code and the result or error of each line is written to stdout as the line completes.
+    examples:
+        - name: Execute the commands in commands.txt, four at a time
+          text: az batch --file commands.txt --workers 4
+"""
+
+helps['daemon'] = """
+    type: group
+    short-summary: Execute commands in a resident process, which loads the command modules once.
+"""
+
+helps['daemon start'] = """
+    type: command
+    short-summary: Start the daemon, which executes the commands of this user until it is stopped.
+"""
+
+helps['daemon stop'] = """
+    type: command
+    short-summary: Stop the daemon once the command it executes, if any, has completed.
+"""
+
+helps['daemon status'] = """
+    type: command
+    short-summary: Show the process, socket and number of commands served of the daemon.
+"""
+
+def _executed_by_main(_):
+    raise CLIError("'az batch' and 'az daemon' can't be executed by another command.")
+
+def _create_builtin_commands():
+    batch = CliCommand('batch', _executed_by_main)
+    batch.add_argument('file', '--file', '-f', required=True,
+                       help="File with one command per line (without 'az'). Use '-' to "
+                            "read from stdin.")
+    batch.add_argument('workers', '--workers', type=int, default=1,
+                       help='Number of commands to execute concurrently. Use 1 when '
+                            'commands depend on earlier ones.')
+    commands = [batch] + [CliCommand('daemon ' + verb, _executed_by_main)
+                          for verb in ('start', 'stop', 'status')]
+    return {command.name: command for command in commands}
+
+BUILTIN_COMMANDS = _create_builtin_commands()
@@ -0,0 +1,231 @@
+#---------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+#---------------------------------------------------------------------------------------------
+
+'''Tab completion of command names, option names and choices from a completion index.
+
+The completion index is a trie of the command paths of every installed command, holding
+the option strings and choices of each command. It is saved next to the command index
+whenever that is built. The 'az' script runs this file directly when invoked by the
+argcomplete shell hook, so completions are answered without importing the CLI (or the
+'azure' namespace package, which imports pkg_resources). Values that need a completer
+(e.g. resource group names) and anything the index can't answer are completed by
+argcomplete as before.
+
+This module must only use the standard library.
+'''
+
+from __future__ import print_function
+import json
+import os
+import shlex
+
+COMPLETION_INDEX_FORMAT_VERSION = 1
+COMPLETION_INDEX_FILE_NAME = 'completionIndex.json'
+COMMAND_INDEX_FILE_NAME = 'commandIndex.json'
+
+# argparse.SUPPRESS; argcomplete doesn't complete suppressed options
+_SUPPRESS = '==SUPPRESS=='
+_FLAG_ACTIONS = ('store_true', 'store_false', 'store_const', 'append_const', 'count',
+                 'help', 'version')
+_CONTINUATION_CHARS = '=/:'
+
+_STRINGS = (str, type(u''))
+
+def get_completion_index_path():
+    return os.path.join(os.path.expanduser('~/.azure'), COMPLETION_INDEX_FILE_NAME)
+
+def _get_command_index_mtime(command_index_path):
+    try:
+        return os.stat(command_index_path).st_mtime
+    except OSError:
+        return None
+
+def _describe_argument(option_strings, options, has_completer):
+    if not option_strings or options.get('help') == _SUPPRESS:
+        return None
+    action = options.get('action')
+    choices = options.get('choices')
+    description = {
+        'options': list(option_strings),
+        'value': not (action in _FLAG_ACTIONS or options.get('nargs') == 0),
+        'multiple': options.get('nargs') in ('*', '+')
+        }
+    if has_completer or (choices is not None and
+                         not all(isinstance(c, _STRINGS) for c in choices)):
+        description['dynamic'] = True
+    elif choices is not None:
+        description['choices'] = list(choices)
+    return description
+
+def describe_command_argument(argument):
+    '''Completion data of a CliCommandArgument.'''
+    return _describe_argument(argument.options_list, argument.options,
+                              argument.completer is not None)
+
+def describe_parser_action(action):
+    '''Completion data of an argparse action, e.g. of a global argument.'''
+    return _describe_argument(action.option_strings,
+                              {'help': action.help, 'nargs': action.nargs,
+                               'choices': action.choices},
+                              getattr(action, 'completer', None) is not None)
+
+def build_completion_index(command_table, global_actions, command_index_path):
+    '''Build the completion index of a command table. `global_actions` are the argparse
+    actions of the arguments every command accepts.
+    '''
+    root = {'children': {}}
+    for name, command in command_table.items():
+        node = root
+        for part in name.split():
+            node = node['children'].setdefault(part, {'children': {}})
+        node['arguments'] = [d for d in (describe_command_argument(a)
+                                         for a in command.arguments.values()) if d]
+    help_argument = {'options': ['--help', '-h'], 'value': False, 'multiple': False}
+    return {
+        'formatVersion': COMPLETION_INDEX_FORMAT_VERSION,
+        'commandIndexMtime': _get_command_index_mtime(command_index_path),
+        'globalArguments': [help_argument] + [d for d in (describe_parser_action(a)
+                                                          for a in global_actions) if d],
+        'commands': root
+        }
+
+def save_completion_index(data, file_path=None):
+    file_path = file_path or get_completion_index_path()
+    temp_path = '{}.{}.tmp'.format(file_path, os.getpid())
+    try:
+        with open(temp_path, 'w') as f:
+            json.dump(data, f)
+        if os.path.exists(file_path):
+            os.remove(file_path)
+        os.rename(temp_path, file_path)
+    except (OSError, IOError):
+        remove_completion_index(temp_path)
+
+def remove_completion_index(file_path=None):
+    try:
+        os.remove(file_path or get_completion_index_path())
+    except OSError:
+        pass
+
+def load_completion_index(file_path=None, command_index_path=None):
+    '''Load the completion index. Returns None if it is missing, or if the command index
+    it was built with has been removed or rebuilt since.
+    '''
+    file_path = file_path or get_completion_index_path()
+    command_index_path = (command_index_path or
+                          os.path.join(os.path.dirname(file_path), COMMAND_INDEX_FILE_NAME))
+    try:
+        with open(file_path, 'r') as f:
+            data = json.load(f)
+    except (OSError, IOError, ValueError):
+        return None
+    if (data.get('formatVersion') != COMPLETION_INDEX_FORMAT_VERSION or
+            data.get('commandIndexMtime') is None or
+            data.get('commandIndexMtime') != _get_command_index_mtime(command_index_path)):
+        return None
+    return data
+
+def get_completions(index, comp_line, comp_point):
+    '''Complete the word at comp_point of comp_line ('az vm cr').
+
+    Returns the matching completions, or None if they must be computed by argcomplete.
+    '''
+    line = comp_line[:comp_point]
+    try:
+        words = shlex.split(line)
+    except ValueError:
+        # Unterminated quote
+        return None
+    if line and not line[-1].isspace() and words:
+        prefix = words.pop()
+    else:
+        prefix = ''
+    if prefix.startswith(('"', "'")) or '=' in prefix:
+        return None
+
+    node = index['commands']
+    global_arguments = index['globalArguments']
+    value_argument = None
+    for word in words[1:]:
+        if word.startswith('-'):
+            argument = _find_argument(node, global_arguments, word)
+            if argument is None:
+                return None
+            value_argument = argument if argument['value'] else None
+        elif value_argument:
+            if not value_argument['multiple']:
+                value_argument = None
+        elif word in node['children']:
+            node = node['children'][word]
+        else:
+            return None
+
+    if value_argument and not prefix.startswith('-'):
+        if value_argument.get('dynamic'):
+            return None
+        return [c for c in value_argument.get('choices', [])
+                if c.lower().startswith(prefix.lower())]
+
+    completions = []
+    if not prefix.startswith('-'):
+        completions.extend(sorted(c for c in node['children'] if c.startswith(prefix)))
+    if not prefix or prefix.startswith('-'):
+        for argument in node.get('arguments', []) + global_arguments:
+            completions.extend(o for o in argument['options'] if o.startswith(prefix))
+    return completions
+
+def _find_argument(node, global_arguments, option):
+    for argument in node.get('arguments', []) + global_arguments:
+        if option in argument['options']:
+            return argument
+    return None
+
+def quote_completions(completions, comp_wordbreaks):
+    '''Escape the characters bash splits words on and add a space after a single
+    completion, as argcomplete does.
+    '''
+    for char in comp_wordbreaks + '();<>|&!`':
+        completions = [c.replace(char, '\\' + char) for c in completions]
+    if len(completions) == 1 and completions[0][-1] not in _CONTINUATION_CHARS:
+        completions[0] += ' '
+    return completions
+
+def complete():
+    '''Answer the argcomplete request in the environment from the completion index.
+    Returns False if argcomplete has to answer it.
+    '''
+    if os.environ.get('_ARGCOMPLETE') != '1':
+        return False
+    index = load_completion_index()
+    if not index:
+        return False
+    comp_line = os.environ.get('COMP_LINE', '')
+    try:
+        comp_point = int(os.environ.get('COMP_POINT', len(comp_line)))
+        comp_line.encode('ascii')
+    except (ValueError, UnicodeError):
+        # COMP_POINT counts bytes, not characters
+        return False
+    completions = get_completions(index, comp_line, comp_point)
+    if completions is None or any(':' in c for c in completions):
+        # bash splits words on colons, which argcomplete handles
+        return False
+    comp_wordbreaks = os.environ.get('_ARGCOMPLETE_COMP_WORDBREAKS',
+                                     os.environ.get('COMP_WORDBREAKS', ' \t"\'@><=;|&(:.'))
+    output = os.environ.get('_ARGCOMPLETE_IFS', '\013').join(
+        quote_completions(completions, comp_wordbreaks))
+    try:
+        output_stream = os.fdopen(8, 'wb')
+    except OSError:
+        return False
+    with output_stream:
+        output_stream.write(output.encode('utf-8'))
+    return True
+
+if __name__ == '__main__':
+    # Run by the 'az' script as a file, outside of the azure.cli package
+    if not complete():
+        import runpy
+        runpy.run_module('azure.cli', run_name='__main__', alter_sys=True)
@@ -0,0 +1,135 @@
+#---------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+#---------------------------------------------------------------------------------------------
+
+'''Discovery of the installed CLI components (azure-cli and azure-cli-* packages).
+
+Scanning every installed distribution is expensive in environments with many packages, so
+the result is cached in ~/.azure/componentCache.json. The cache is keyed by the
+modification times of the directories on sys.path and of each component's metadata, so it
+is only rebuilt when packages are installed, upgraded or removed.
+'''
+
+import json
+import os
+import sys
+from codecs import open as codecs_open
+
+from azure.cli._util import CLI_PACKAGE_NAME, COMPONENT_PREFIX
+
+COMPONENT_CACHE_FILE_NAME = 'componentCache.json'
+
+_installed_components = None
+
+def _get_cache_file_path():
+    return os.path.join(os.path.expanduser('~/.azure'), COMPONENT_CACHE_FILE_NAME)
+
+def _get_mtime(path):
+    try:
+        return os.stat(path).st_mtime
+    except (OSError, TypeError):
+        return None
+
+def _running_under_virtualenv():
+    return hasattr(sys, 'real_prefix') or getattr(sys, 'base_prefix', sys.prefix) != sys.prefix
+
+def _get_path_fingerprint():
+    # The current directory is on sys.path when running with 'python -m' but never holds
+    # installed components, and its mtime changes far too often to be part of the key.
+    cwd = os.getcwd()
+    return [[entry, _get_mtime(entry)] for entry in sys.path
+            if entry and entry != cwd and os.path.isdir(entry)]
+
+def _get_metadata_path(dist):
+    provider = getattr(dist, '_provider', None)
+    return getattr(provider, 'egg_info', None) or getattr(provider, 'path', None)
+
+def _get_egg_link_path(dist):
+    '''The .egg-link file through which a distribution installed in development mode
+    ('pip install -e') is found, if any.
+    '''
+    for entry in sys.path:
+        path = os.path.join(entry or os.curdir, dist.project_name + '.egg-link')
+        if os.path.isfile(path):
+            return path
+    return None
+
+def _is_in_environment(dist):
+    # A distribution installed in development mode lives outside of the environment,
+    # which links to it from its site-packages directory
+    location = os.path.abspath(_get_egg_link_path(dist) or dist.location)
+    return location.startswith(os.path.join(os.path.abspath(sys.prefix), ''))
+
+def _discover_components():
+    import pkg_resources
+    local_only = _running_under_virtualenv()
+    components = {}
+    for dist in pkg_resources.working_set:
+        if dist.key != CLI_PACKAGE_NAME and not dist.key.startswith(COMPONENT_PREFIX):
+            continue
+        if local_only and not _is_in_environment(dist):
+            continue
+        metadata_path = _get_metadata_path(dist)
+        components[dist.key] = {'version': dist.version,
+                                'metadata': metadata_path,
+                                'mtime': _get_mtime(metadata_path)}
+    return components
+
+def _load_cache(cache_file, fingerprint):
+    try:
+        with codecs_open(cache_file, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, IOError, ValueError):
+        return None
+    if cache.get('fingerprint') != fingerprint:
+        return None
+    components = cache.get('components', {})
+    if any(_get_mtime(c['metadata']) != c['mtime'] for c in components.values()):
+        return None
+    return components
+
+def _save_cache(cache_file, fingerprint, components):
+    try:
+        with codecs_open(cache_file, 'w', encoding='utf-8') as f:
+            json.dump({'fingerprint': fingerprint, 'components': components}, f)
+    except (OSError, IOError):
+        # The cache is an optimization only (e.g. ~/.azure may not exist yet)
+        pass
+
+def get_installed_components(refresh=False, cache_file=None):
+    '''Returns a dict of package name -> version for azure-cli and every installed
+    azure-cli-* component.
+
+    param: refresh: Ignore both the in-process result and the cache file.
+    '''
+    global _installed_components #pylint: disable=global-statement
+    if _installed_components is not None and not refresh:
+        return dict(_installed_components)
+
+    cache_file = cache_file or _get_cache_file_path()
+    fingerprint = _get_path_fingerprint()
+    components = None if refresh else _load_cache(cache_file, fingerprint)
+    if components is None:
+        components = _discover_components()
+        _save_cache(cache_file, fingerprint, components)
+
+    _installed_components = {key: c['version'] for key, c in components.items()}
+    return dict(_installed_components)
+
+def get_installed_command_modules(refresh=False):
+    '''Returns a dict of command module name (e.g. 'vm') -> version.'''
+    return {key[len(COMPONENT_PREFIX):]: version
+            for key, version in get_installed_components(refresh).items()
+            if key.startswith(COMPONENT_PREFIX)}
+
+def invalidate_installed_components(cache_file=None):
+    '''Discard the cached component list. Call this after installing, upgrading or
+    removing a component.
+    '''
+    global _installed_components #pylint: disable=global-statement
+    _installed_components = None
+    try:
+        os.remove(cache_file or _get_cache_file_path())
+    except OSError:
+        pass
@@ -0,0 +1,433 @@
+#---------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+#---------------------------------------------------------------------------------------------
+
+'''Opt-in daemon that executes commands in a resident process.
+
+'az daemon start' launches a process that loads every command module once and then
+serves commands over a UNIX socket in ~/.azure. While it is running, 'az' forwards its
+arguments, environment and working directory to the daemon and relays the output and
+exit code, so the command table, parsers and anything cached in-process stay warm
+between invocations.
+
+A command changes the environment, working directory and standard streams of the
+daemon, the daemon executes one command at a time, on a worker thread. Requests for
+status or to stop are answered while a command runs; a command sent meanwhile is
+answered with a fallback and executed by its client.
+
+The client side of this module is imported before the rest of the CLI and must only use
+the standard library.
+
+Protocol: the client sends a single JSON line; the daemon answers with JSON lines of
+the form {"stdout": text}, {"stderr": text} and a final {"exit_code": code}. A
+{"fallback": reason} answer means the command must be executed by the client itself.
+'''
+
+from __future__ import print_function
+import errno
+import json
+import os
+import socket
+import sys
+import threading
+try:
+    import queue
+except ImportError:
+    import Queue as queue # pylint: disable=import-error
+
+import azure.cli as cli
+
+SOCKET_FILE_NAME = 'az.sock'
+
+DISABLE_DAEMON_VARIABLE_NAME = 'AZURE_CLI_DISABLE_DAEMON'
+
+# Commands that interact with the user (prompts, device login, browser), read stdin
+# ('az batch') or change the installation always run in the client process.
+IN_PROCESS_COMMANDS = ['daemon', 'batch', 'login', 'feedback', 'component']
+
+# Global arguments that may precede the command and take a value
+_GLOBAL_OPTIONS_WITH_VALUES = ['--output', '-o', '--output-file', '--query', '--subscription',
+                               '--max-items', '--page-size']
+
+START_TIMEOUT_SECONDS = 30
+REQUEST_READ_TIMEOUT_SECONDS = 10
+
+def get_socket_path():
+    return os.path.join(os.path.expanduser('~/.azure'), SOCKET_FILE_NAME)
+
+def is_daemon_supported():
+    return hasattr(socket, 'AF_UNIX')
+
+def _send_frame(connection, frame):
+    connection.sendall((json.dumps(frame) + '\n').encode('utf-8'))
+
+def _read_frames(connection):
+    for line in connection.makefile('rb'):
+        yield json.loads(line.decode('utf-8'))
+
+def _connect(socket_path=None):
+    socket_path = socket_path or get_socket_path()
+    if not is_daemon_supported() or not os.path.exists(socket_path):
+        return None
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) # pylint: disable=no-member
+    try:
+        connection.connect(socket_path)
+    except socket.error:
+        connection.close()
+        return None
+    return connection
+
+def _send_request(request, socket_path=None):
+    '''Send a request to the daemon and return its answer frames, or None if the
+    daemon isn't running.
+    '''
+    connection = _connect(socket_path)
+    if not connection:
+        return None
+    try:
+        _send_frame(connection, request)
+        return list(_read_frames(connection))
+    except (socket.error, ValueError):
+        return None
+    finally:
+        connection.close()
+
+def find_command(argv):
+    '''Index of the first word of the command in argv, skipping the global arguments
+    before it, or None if there is no command.
+    '''
+    index = 0
+    while index < len(argv):
+        if not argv[index].startswith('-'):
+            return index
+        index += 2 if argv[index] in _GLOBAL_OPTIONS_WITH_VALUES else 1
+    return None
+
+def forward_to_daemon(argv, socket_path=None):
+    '''Execute the command in a running daemon.
+
+    Returns the exit code of the command, or None if it must be executed in this
+    process (no daemon running, command not suitable or daemon of a different version).
+    '''
+    command_index = find_command(argv)
+    if (os.environ.get('_ARGCOMPLETE') or os.environ.get(DISABLE_DAEMON_VARIABLE_NAME) or
+            (command_index is not None and argv[command_index] in IN_PROCESS_COMMANDS)):
+        return None
+    connection = _connect(socket_path)
+    if not connection:
+        return None
+
+    request = {
+        'command': 'run',
+        'version': cli.__version__,
+        'argv': argv,
+        'cwd': os.getcwd(),
+        'env': dict(os.environ),
+        'isatty': {'stdout': sys.stdout.isatty(), 'stderr': sys.stderr.isatty()}
+        }
+    received_output = False
+    try:
+        _send_frame(connection, request)
+        for frame in _read_frames(connection):
+            if 'fallback' in frame and not received_output:
+                return None
+            elif 'stdout' in frame:
+                received_output = True
+                sys.stdout.write(frame['stdout'])
+            elif 'stderr' in frame:
+                received_output = True
+                sys.stderr.write(frame['stderr'])
+            elif 'exit_code' in frame:
+                sys.stdout.flush()
+                return frame['exit_code']
+    except (socket.error, ValueError) as ex:
+        if getattr(ex, 'errno', None) == errno.EPIPE:
+            # Our own output was closed, e.g. piped to 'head'
+            return 1
+        if not received_output:
+            # The daemon went away before it started on the command
+            return None
+    finally:
+        connection.close()
+    print('The az daemon stopped before the command completed.', file=sys.stderr)
+    return 1
+
+def run_daemon_command(argv):
+    '''Handle 'az daemon start|stop|status'.'''
+    verb = argv[0] if argv else None
+    if verb in ('-h', '--help'):
+        print('usage: az daemon {start,stop,status}\n\n'
+              'Execute commands in a resident process, which loads the command modules once.')
+        return 0
+    if verb not in ('start', 'stop', 'status'):
+        print('usage: az daemon {start,stop,status}', file=sys.stderr)
+        return 2
+    if not is_daemon_supported():
+        print('The az daemon is not supported on this platform.', file=sys.stderr)
+        return 1
+
+    status = _send_request({'command': 'status'})
+    if verb == 'status':
+        if status:
+            print(json.dumps(status[0], indent=2, sort_keys=True))
+            return 0
+        print('The az daemon is not running.')
+        return 3
+    elif verb == 'stop':
+        if status:
+            _send_request({'command': 'stop'})
+            print('The az daemon has been stopped.')
+        else:
+            print('The az daemon is not running.')
+        return 0
+
+    if status:
+        print('The az daemon is already running (pid {}).'.format(status[0].get('pid')))
+        return 0
+    return _start_daemon()
+
+def _start_daemon():
+    import subprocess
+    import time
+    with open(os.devnull, 'r+') as devnull:
+        popen_kwargs = {'stdin': devnull, 'stdout': devnull, 'stderr': devnull,
+                        'close_fds': True}
+        if hasattr(os, 'setsid'):
+            # Detach from the terminal so the daemon survives the shell session
+            popen_kwargs['preexec_fn'] = os.setsid # pylint: disable=no-member
+        process = subprocess.Popen([sys.executable, '-m', 'azure.cli._daemon'], **popen_kwargs)
+
+    deadline = time.time() + START_TIMEOUT_SECONDS
+    while time.time() < deadline:
+        if process.poll() is not None:
+            print('The az daemon failed to start.', file=sys.stderr)
+            return 1
+        if _send_request({'command': 'status'}):
+            print('The az daemon has been started (pid {}).'.format(process.pid))
+            return 0
+        time.sleep(0.1)
+    print('Timed out waiting for the az daemon to start.', file=sys.stderr)
+    return 1
+
+class _FrameWriter(object):
+    '''File-like object that sends everything written to it to the client as frames.'''
+
+    encoding = 'utf-8'
+
+    def __init__(self, connection, name, isatty=False):
+        self._connection = connection
+        self._name = name
+        self._isatty = isatty
+
+    def write(self, text):
+        if not text:
+            return
+        if isinstance(text, bytes):
+            text = text.decode(self.encoding, 'replace')
+        try:
+            _send_frame(self._connection, {self._name: text})
+        except socket.error:
+            # The client went away; finish the command anyway
+            pass
+
+    def writelines(self, lines):
+        for line in lines:
+            self.write(line)
+
+    def flush(self):
+        pass
+
+    def isatty(self):
+        return self._isatty
+
+class CommandServer(object):
+    '''Serves commands to clients, one at a time, from a process in which every command
+    module has been loaded.
+    '''
+
+    def __init__(self, socket_path=None):
+        self.socket_path = socket_path or get_socket_path()
+        self.requests_served = 0
+        self._event_handlers = None
+        # Held while a command is queued for or executed by the worker
+        self._command_lock = threading.Lock()
+        self._commands = queue.Queue()
+        self._worker = None
+
+    def warm_up(self):
+        from azure.cli.application import APPLICATION
+        from azure.cli.commands import get_command_table
+        from azure.cli._profile import enable_background_token_refresh
+
+        enable_background_token_refresh()
+
+        # Load and post-process (e.g. the --ids parameters) every command once. Commands
+        # executed later reuse these definitions and the parsers built from them.
+        APPLICATION.load_command_table(get_command_table())
+
+        # Handlers registered while executing a command must not outlive it, so the
+        # handlers present now are restored after every command.
+        self._event_handlers = {name: list(handlers) for name, handlers
+                                in APPLICATION._event_handlers.items()} # pylint: disable=protected-access
+
+    def serve_forever(self):
+        self.warm_up()
+        socket_dir = os.path.dirname(self.socket_path)
+        if not os.path.exists(socket_dir):
+            os.makedirs(socket_dir)
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) # pylint: disable=no-member
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+        old_umask = os.umask(0o077)
+        try:
+            listener.bind(self.socket_path)
+        finally:
+            os.umask(old_umask)
+        listener.listen(16)
+        try:
+            while True:
+                connection, _ = listener.accept()
+                if not self.handle_connection(connection):
+                    break
+        finally:
+            listener.close()
+            try:
+                os.remove(self.socket_path)
+            except OSError:
+                pass
+            self.close()
+
+    def close(self):
+        '''Stop the worker once it has executed the command it was given, if any.'''
+        if self._worker:
+            self._commands.put(None)
+            self._worker.join()
+            self._worker = None
+
+    def handle_connection(self, connection):
+        '''Handle one request and close the connection once it is answered. A command is
+        handed to the worker thread, which answers it. Returns False when the daemon
+        should stop.
+        '''
+        try:
+            connection.settimeout(REQUEST_READ_TIMEOUT_SECONDS)
+            try:
+                request = next(_read_frames(connection))
+            except (socket.error, ValueError, StopIteration):
+                return True
+            connection.settimeout(None)
+
+            command = request.get('command')
+            if command == 'stop':
+                # A command being executed is completed before the process exits
+                _send_frame(connection, {'exit_code': 0})
+                return False
+            elif command == 'status':
+                _send_frame(connection, {'pid': os.getpid(),
+                                         'version': cli.__version__,
+                                         'socket': self.socket_path,
+                                         'requests_served': self.requests_served,
+                                         'busy': self._command_lock.locked()})
+            elif request.get('version') != cli.__version__:
+                _send_frame(connection, {'fallback': 'version mismatch'})
+            elif not self._command_lock.acquire(False):
+                _send_frame(connection, {'fallback': 'busy'})
+            else:
+                if not self._worker:
+                    # Commands share a thread, so what they cache per thread (e.g. the
+                    # management clients) is reused by the next
+                    self._worker = threading.Thread(target=self._run_commands)
+                    self._worker.start()
+                self._commands.put((connection, request))
+                connection = None
+            return True
+        except socket.error:
+            return True
+        finally:
+            if connection:
+                connection.close()
+
+    def _run_commands(self):
+        for connection, request in iter(self._commands.get, None):
+            try:
+                exit_code = self.execute(connection, request)
+                self.requests_served += 1
+                _send_frame(connection, {'exit_code': exit_code})
+            except socket.error:
+                pass
+            finally:
+                # Released first, so the client can send its next command once it has
+                # read the output of this one
+                self._command_lock.release()
+                connection.close()
+
+    def execute(self, connection, request):
+        '''Execute a command with the environment, working directory and output streams
+        of the client. Returns the exit code.
+        '''
+        import logging
+        import azure.cli.main
+        from azure.cli.application import APPLICATION
+        from azure.cli._profile import flush_shared_creds_cache
+        from azure.cli.commands._command_index import DISABLE_COMMAND_INDEX_VARIABLE_NAME
+
+        isatty = request.get('isatty', {})
+        saved_streams = sys.stdin, sys.stdout, sys.stderr
+        saved_environ = dict(os.environ)
+        saved_cwd = os.getcwd()
+        loggers = [logging.getLogger(), logging.getLogger('az')]
+        saved_handlers = [list(logger.handlers) for logger in loggers]
+        try:
+            os.environ.clear()
+            os.environ.update(request.get('env', {}))
+            # Every command module is loaded already, so the index would only add work
+            os.environ[DISABLE_COMMAND_INDEX_VARIABLE_NAME] = '1'
+            os.chdir(request.get('cwd') or saved_cwd)
+            # The daemon can't prompt; commands that need input run in the client
+            sys.stdin = open(os.devnull, 'r')
+            sys.stdout = _FrameWriter(connection, 'stdout', isatty.get('stdout', False))
+            sys.stderr = _FrameWriter(connection, 'stderr', isatty.get('stderr', False))
+            # Let main() configure logging to the client's stderr
+            for logger in loggers:
+                del logger.handlers[:]
+
+            APPLICATION.new_session()
+            try:
+                return azure.cli.main.main(list(request.get('argv', [])), file=sys.stdout) or 0
+            except SystemExit as ex:
+                return _get_exit_code(ex)
+            except Exception as ex: # pylint: disable=broad-except
+                print('The az daemon failed to execute the command: {}'.format(ex),
+                      file=sys.stderr)
+                return 1
+        finally:
+            # Let other processes use the tokens and settings the command changed
+            flush_shared_creds_cache()
+            azure.cli.main.flush_sessions()
+            for logger, original_handlers in zip(loggers, saved_handlers):
+                # Console handlers hold on to the streams of the command that created them
+                for handler in logger.handlers:
+                    if handler not in original_handlers:
+                        handler.close()
+                logger.handlers[:] = original_handlers
+            sys.stdin.close()
+            sys.stdin, sys.stdout, sys.stderr = saved_streams
+            os.chdir(saved_cwd)
+            os.environ.clear()
+            os.environ.update(saved_environ)
+            APPLICATION._event_handlers.clear() # pylint: disable=protected-access
+            APPLICATION._event_handlers.update( # pylint: disable=protected-access
+                (name, list(handlers)) for name, handlers in self._event_handlers.items())
+
+def _get_exit_code(system_exit):
+    code = system_exit.code
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=sys.stderr)
+    return 1
+
+if __name__ == '__main__':
+    CommandServer().serve_forever()
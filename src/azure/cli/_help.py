@@ -7,7 +7,6 @@ from __future__ import print_function
 import argparse
 import sys
 import textwrap
-import yaml
 
 from .help_files import _load_help_file
 
@@ -363,8 +362,11 @@ def _normalize_text(s):
     return initial_upper + trailing_period
 
 def _load_help_file_from_string(text):
+    if not text:
+        return None
+    import yaml
     try:
-        return yaml.load(text) if text else None
+        return yaml.load(text)
     except Exception: #pylint: disable=broad-except
         return text
 
@@ -0,0 +1,102 @@
+#---------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+#---------------------------------------------------------------------------------------------
+
+'''HTTP connection pool shared by the management and data-plane clients of a process.
+
+Every client gets its own requests session, as the credentials set the headers of the
+session, but all sessions send through the same adapter, so a connection to a host is
+kept alive and reused by the next client that sends a request to it.
+'''
+
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+# Number of hosts connections are kept to, and of connections kept to each host
+POOL_CONNECTIONS = 32
+POOL_MAXSIZE = 16
+
+class ConnectionCounters(object):
+    '''Number of connections opened and of requests sent on them.'''
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.opened = 0
+        self.requests = 0
+
+    def connection_opened(self):
+        with self._lock:
+            self.opened += 1
+
+    def request_sent(self):
+        with self._lock:
+            self.requests += 1
+
+    def snapshot(self):
+        with self._lock:
+            return (self.opened, self.requests)
+
+counters = ConnectionCounters()
+
+def _counting_pool_class(pool_class):
+    class _CountingConnectionPool(pool_class): #pylint: disable=too-few-public-methods
+        def _new_conn(self):
+            counters.connection_opened()
+            return super(_CountingConnectionPool, self)._new_conn()
+
+        def _make_request(self, *args, **kwargs): #pylint: disable=arguments-differ
+            counters.request_sent()
+            return super(_CountingConnectionPool, self)._make_request(*args, **kwargs)
+
+    _CountingConnectionPool.__name__ = 'Counting' + pool_class.__name__
+    return _CountingConnectionPool
+
+_POOL_CLASSES_BY_SCHEME = {'http': _counting_pool_class(HTTPConnectionPool),
+                           'https': _counting_pool_class(HTTPSConnectionPool)}
+
+class _SharedHTTPAdapter(HTTPAdapter):
+    '''Adapter whose connections outlive the sessions it is mounted on.'''
+
+    def init_poolmanager(self, *args, **kwargs): #pylint: disable=arguments-differ
+        super(_SharedHTTPAdapter, self).init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = _POOL_CLASSES_BY_SCHEME
+
+    def proxy_manager_for(self, *args, **kwargs):
+        manager = super(_SharedHTTPAdapter, self).proxy_manager_for(*args, **kwargs)
+        manager.pool_classes_by_scheme = _POOL_CLASSES_BY_SCHEME
+        return manager
+
+    def close(self):
+        # Closing a client closes its session, which must leave the connections other
+        # clients may reuse open
+        pass
+
+_adapter = None
+_adapter_lock = threading.Lock()
+
+def get_shared_adapter():
+    global _adapter # pylint: disable=global-statement
+    with _adapter_lock:
+        if _adapter is None:
+            _adapter = _SharedHTTPAdapter(pool_connections=POOL_CONNECTIONS,
+                                          pool_maxsize=POOL_MAXSIZE)
+        return _adapter
+
+def create_session():
+    '''Create a requests session that sends through the shared connection pool.'''
+    session = requests.Session()
+    adapter = get_shared_adapter()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+def configure_service_client(client):
+    '''Configure an msrest service client to keep its session, sending through the shared
+    connection pool.
+    '''
+    client.config.keep_alive = True
+    client._client._session = create_session() #pylint: disable=protected-access
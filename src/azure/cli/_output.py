@@ -5,18 +5,28 @@
 
 from __future__ import print_function, unicode_literals
 
+import io
+import os
 import sys
 import json
 import re
 import traceback
 from collections import OrderedDict
+from itertools import islice
 from six import StringIO, text_type, u
 
-from azure.cli._util import CLIError
+from azure.cli._util import CLIError, ResultStream
 import azure.cli._logging as _logging
 
 logger = _logging.get_az_logger(__name__)
 
+# Number of rows of a streamed table the widths of its columns are computed from
+TABLE_SAMPLE_SIZE_VARIABLE_NAME = 'AZURE_CLI_TABLE_SAMPLE_SIZE'
+DEFAULT_TABLE_SAMPLE_SIZE = 100
+
+# The level of the gzip tool, which compresses much faster than the maximum level 9
+_GZIP_COMPRESS_LEVEL = 6
+
 def _decode_str(output):
     if not isinstance(output, text_type):
         output = u(str(output))
@@ -34,6 +44,23 @@ def format_json(obj):
     return json.dumps(input_dict, indent=2, sort_keys=True, cls=ComplexEncoder,
                       separators=(',', ': ')) + '\n'
 
+def _dump_json_compact(obj):
+    # Without indent, json uses its C encoder if available
+    return json.dumps(obj, cls=ComplexEncoder, separators=(',', ':'))
+
+def format_json_compact(obj):
+    """JSON on a single line, with keys in the order of the result."""
+    return _dump_json_compact(obj.result) + '\n'
+
+def _dump_json_line(item):
+    return _dump_json_compact(item) + '\n'
+
+def format_jsonl(obj):
+    """One compact JSON document per line for each item of a list, e.g. for 'jq -c'."""
+    result = obj.result
+    result_list = result if isinstance(result, list) else [result]
+    return ''.join(_dump_json_line(item) for item in result_list)
+
 def format_json_color(obj):
     from pygments import highlight, lexers, formatters
     return highlight(format_json(obj), lexers.JsonLexer(), formatters.TerminalFormatter()) # pylint: disable=no-member
@@ -59,10 +86,13 @@ def format_table(obj):
         return to.dump()
     except (ValueError, KeyError, TypeError):
         logger.debug(traceback.format_exc())
-        raise CLIError("Table output unavailable. "\
-                       "Change output type with --output or use "\
-                       "the --query option to specify an appropriate query. "\
-                       "Use --debug for more info.")
+        raise _table_output_unavailable()
+
+def _table_output_unavailable():
+    return CLIError("Table output unavailable. "\
+                    "Change output type with --output or use "\
+                    "the --query option to specify an appropriate query. "\
+                    "Use --debug for more info.")
 
 def format_text(obj):
     result = obj.result
@@ -87,6 +117,111 @@ def format_tsv(obj):
     result_list = result if isinstance(result, list) else [result]
     return TsvOutput.dump(result_list)
 
+# Writers of streamed results. They produce the same output as the formatter applied to
+# the list of the items, and nothing for an empty stream.
+
+def stream_json(obj):
+    separator = '[\n'
+    for item in obj.result:
+        text = json.dumps(item, indent=2, sort_keys=True, cls=ComplexEncoder,
+                          separators=(',', ': '))
+        yield separator + '  ' + text.replace('\n', '\n  ')
+        separator = ',\n'
+    if separator != '[\n':
+        yield '\n]\n'
+
+def stream_json_compact(obj):
+    separator = '['
+    for item in obj.result:
+        yield separator + _dump_json_compact(item)
+        separator = ','
+    if separator != '[':
+        yield ']\n'
+
+def get_table_sample_size():
+    try:
+        return max(1, int(os.environ[TABLE_SAMPLE_SIZE_VARIABLE_NAME]))
+    except (KeyError, ValueError):
+        return DEFAULT_TABLE_SAMPLE_SIZE
+
+def _get_streamed_table_rows(obj):
+    if not isinstance(obj.result, ResultStream):
+        # All the rows are known, so the columns get their exact widths
+        return None
+    if obj.is_query_active:
+        return obj.result
+    if obj.simple_output_query and not callable(obj.simple_output_query):
+        from jmespath import compile as compile_jmespath, Options
+        from azure.cli.extensions.query import is_item_wise
+        try:
+            expression = compile_jmespath(obj.simple_output_query)
+        except ValueError:
+            # Reported by format_table
+            return None
+        if is_item_wise(expression):
+            options = Options(OrderedDict)
+            return obj.result.expand(lambda item: expression.search([item], options))
+    # e.g. the rows are sorted
+    return None
+
+def _stream_table_rows(rows, sample_size):
+    try:
+        to = TableOutput()
+        for item in islice(rows, sample_size):
+            for item_key in item:
+                to.cell(item_key, item[item_key])
+            to.end_row()
+        if not to.any_rows:
+            return
+        yield to.dump()
+        for item in rows:
+            yield to.dump_row(item)
+    except (KeyError, TypeError, AttributeError):
+        logger.debug(traceback.format_exc())
+        raise _table_output_unavailable()
+
+def stream_table(obj):
+    """Table of a streamed result, with the widths of the columns computed from the first
+    rows. Returns None if the rows can't be computed as the result is streamed.
+    """
+    rows = _get_streamed_table_rows(obj)
+    if rows is None:
+        return None
+    return _stream_table_rows(iter(rows), get_table_sample_size())
+
+def stream_jsonl(obj):
+    for item in obj.result:
+        yield _dump_json_line(item)
+
+def stream_list(obj):
+    lo = ListOutput()
+    any_items = False
+    for item in obj.result:
+        parts = []
+        lo._dump_object(parts.append, item, 0) #pylint: disable=protected-access
+        parts.append('\n')
+        yield ''.join(parts)
+        any_items = True
+    if any_items:
+        yield '\n'
+
+def stream_tsv(obj):
+    for item in obj.result:
+        yield TsvOutput._format_row(item) #pylint: disable=protected-access
+
+def open_output_file(path):
+    '''Open the file the output is written to with --output-file, compressed with gzip if
+    its name ends with '.gz'.
+    '''
+    try:
+        if path.lower().endswith('.gz'):
+            import gzip
+            return io.TextIOWrapper(gzip.open(path, 'wb', _GZIP_COMPRESS_LEVEL),
+                                    encoding='utf-8')
+        return io.open(path, 'w', encoding='utf-8')
+    except (IOError, OSError) as ex:
+        raise CLIError("Unable to open the output file '{}': {}".format(path, ex))
+
 class CommandResultItem(object): #pylint: disable=too-few-public-methods
 
     def __init__(self, result, simple_output_query=None, is_query_active=False):
@@ -99,18 +234,47 @@ class OutputProducer(object): #pylint: disable=too-few-public-methods
     format_dict = {
         'json': format_json,
         'jsonc': format_json_color,
+        'json-compact': format_json_compact,
+        'jsonl': format_jsonl,
         'table': format_table,
         'text': format_text,
         'list': format_list,
         'tsv': format_tsv,
     }
 
+    # Formatters that can write the items of a list or ResultStream as they are formatted
+    stream_format_dict = {
+        format_json: stream_json,
+        format_json_compact: stream_json_compact,
+        format_jsonl: stream_jsonl,
+        format_list: stream_list,
+        format_tsv: stream_tsv,
+        format_table: stream_table,
+    }
+
     def __init__(self, formatter=format_list, file=sys.stdout): #pylint: disable=redefined-builtin
         self.formatter = formatter
         self.file = file
 
     def out(self, obj):
-        output = self.formatter(obj)
+        stream_formatter = OutputProducer.stream_format_dict.get(self.formatter)
+        if stream_formatter and (isinstance(obj.result, ResultStream) or
+                                 (isinstance(obj.result, list) and obj.result)):
+            # Write each item rather than building the output of all of them first
+            outputs = stream_formatter(obj)
+            if outputs is not None:
+                for output in outputs:
+                    self._write(output)
+                return
+        if isinstance(obj.result, ResultStream):
+            # The output depends on all the items, e.g. the widths of table columns
+            obj = CommandResultItem(list(obj.result), obj.simple_output_query,
+                                    obj.is_query_active)
+            if not obj.result:
+                return
+        self._write(self.formatter(obj))
+
+    def _write(self, output):
         try:
             print(output, file=self.file, end='')
         except UnicodeEncodeError:
@@ -121,6 +285,10 @@ class OutputProducer(object): #pylint: disable=too-few-public-methods
     def get_formatter(format_type):
         return OutputProducer.format_dict.get(format_type, format_list)
 
+# Bound on the number of dictionary shapes whose key order is kept, e.g. for results
+# holding dictionaries with arbitrary keys such as tags
+_MAX_CACHED_SHAPES = 1000
+
 class ListOutput(object): #pylint: disable=too-few-public-methods
 
     # Match the capital letters in a camel case string
@@ -128,6 +296,8 @@ class ListOutput(object): #pylint: disable=too-few-public-methods
 
     def __init__(self):
         self._formatted_keys_cache = {}
+        # (key, is dict, is list) of every item of a dictionary -> [(key, label, is complex)]
+        self._shapes = {}
 
     @staticmethod
     def _get_max_key_len(keys):
@@ -155,42 +325,59 @@ class ListOutput(object): #pylint: disable=too-few-public-methods
             self._formatted_keys_cache[key] = _format_key(key)
             return self._formatted_keys_cache[key]
 
-    @staticmethod
-    def _dump_line(io, line, indent):
-        io.write('   ' * indent)
-        io.write(_decode_str(line))
-        io.write('\n')
-
-    def _dump_object(self, io, obj, indent):
-        if isinstance(obj, list):
-            for array_item in obj:
-                self._dump_object(io, array_item, indent)
-        elif isinstance(obj, dict):
-            obj_fk = {k: self._get_formatted_key(k) for k in obj}
-            key_width = ListOutput._get_max_key_len(obj_fk.values())
-            for key in sorted(obj, key=lambda x: ListOutput._sort_key_func(x, obj)):
-                if isinstance(obj[key], dict) or isinstance(obj[key], list):
-                    # complex object
-                    line = '%s :' % (self._get_formatted_key(key).ljust(key_width))
-                    ListOutput._dump_line(io, line, indent)
-                    self._dump_object(io, obj[key] if obj[key] else 'None', indent+1)
-                else:
-                    # non-complex so write it
-                    line = '%s : %s' % (self._get_formatted_key(key).ljust(key_width),
-                                        'None' if obj[key] is None else obj[key])
-                    ListOutput._dump_line(io, line, indent)
-        else:
-            ListOutput._dump_line(io, obj, indent)
+    def _get_layout(self, obj):
+        """The keys of the dictionary in the order they are written, with their labels
+        padded to the width of the longest one and whether their values are complex.
+        """
+        shape = (tuple(obj), tuple(map(type, obj.values())))
+        layout = self._shapes.get(shape)
+        if layout is None:
+            key_width = ListOutput._get_max_key_len([self._get_formatted_key(k) for k in obj])
+            layout = [(key, self._get_formatted_key(key).ljust(key_width),
+                       isinstance(obj[key], (dict, list)))
+                      for key in sorted(obj, key=lambda x: ListOutput._sort_key_func(x, obj))]
+            if len(self._shapes) < _MAX_CACHED_SHAPES:
+                self._shapes[shape] = layout
+        return layout
+
+    def _dump_object(self, write, obj, indent):
+        # (object, indent), or (line, None) for a line that is written as it is
+        pending = [(obj, indent)]
+        while pending:
+            obj, indent = pending.pop()
+            if indent is None:
+                write(obj)
+            elif isinstance(obj, list):
+                pending.extend((array_item, indent) for array_item in reversed(obj))
+            elif isinstance(obj, dict):
+                prefix = '   ' * indent
+                # The items after the first complex one are written after its content
+                deferred = []
+                for key, label, is_complex in self._get_layout(obj):
+                    value = obj[key]
+                    if is_complex:
+                        # complex object
+                        deferred.append((prefix + label + ' :\n', None))
+                        deferred.append((value if value else 'None', indent + 1))
+                    else:
+                        # non-complex so write it
+                        line = prefix + _decode_str('%s : %s' % (
+                            label, 'None' if value is None else value)) + '\n'
+                        if deferred:
+                            deferred.append((line, None))
+                        else:
+                            write(line)
+                pending.extend(reversed(deferred))
+            else:
+                write('   ' * indent + _decode_str(obj) + '\n')
 
     def dump(self, data):
-        io = StringIO()
+        parts = []
         for obj in data:
-            self._dump_object(io, obj, 0)
-            io.write('\n')
-        io.write('\n')
-        result = io.getvalue()
-        io.close()
-        return result
+            self._dump_object(parts.append, obj, 0)
+            parts.append('\n')
+        parts.append('\n')
+        return ''.join(parts)
 
 class TableOutput(object):
 
@@ -218,17 +405,29 @@ class TableOutput(object):
         io.close()
         return result
 
+    def dump_row(self, item):
+        """Format a row with the columns of the rows added so far, without adding it.
+        Values of other columns are left out and longer values widen only this row.
+        """
+        r = {str(name): TableOutput._get_cell_text(name, value) for name, value in item.items()}
+        return ' | '.join(r.get(c, '-').ljust(self._columns[c])
+                          for c in self._column_order) + '\n'
+
     @property
     def any_rows(self):
         return len(self._rows) > 1
 
-    def cell(self, name, value):
+    @staticmethod
+    def _get_cell_text(name, value):
         if isinstance(value, TableOutput.unsupported_types):
             raise TypeError('Table output does not support objects of type {}.\n'\
                             'Offending object name={} value={}'.format(
                                 [ut.__name__ for ut in TableOutput.unsupported_types], name, value))
+        return str(value)
+
+    def cell(self, name, value):
         n = str(name)
-        v = str(value)
+        v = TableOutput._get_cell_text(name, value)
         max_width = self._columns.get(n)
         if max_width is None:
             self._column_order.append(n)
@@ -269,51 +468,47 @@ class TextOutput(object):
 
 class TsvOutput(object): #pylint: disable=too-few-public-methods
 
+    # keys of a dictionary -> its keys in sorted order
+    _sorted_keys = {}
+
     @staticmethod
-    def _dump_obj(data, stream):
+    def _format_obj(data):
         if isinstance(data, list):
-            stream.write(str(len(data)))
+            return str(len(data))
         elif isinstance(data, dict):
             # We need to print something to avoid mismatching
             # number of columns if the value is None for some instances
             # and a dictionary value in other...
-            stream.write('')
+            return ''
         else:
-            stream.write(str(data))
+            return str(data)
 
     @staticmethod
-    def _dump_row(data, stream):
-        separator = ''
-        if isinstance(data, dict) or isinstance(data, list):
-            if isinstance(data, OrderedDict):
-                values = data.values()
-            elif isinstance(data, dict):
-                values = [value for _, value in sorted(data.items())]
-            else:
-                values = data
-
-            # Iterate through the items either sorted by key value (if dict) or in the order
-            # they were added (in the cases of an ordered dict) in order to make the output
-            # stable
-            for value in values:
-                stream.write(separator)
-                TsvOutput._dump_obj(value, stream)
-                separator = '\t'
+    def _get_sorted_keys(data):
+        keys = tuple(data)
+        sorted_keys = TsvOutput._sorted_keys.get(keys)
+        if sorted_keys is None:
+            sorted_keys = sorted(keys)
+            if len(TsvOutput._sorted_keys) < _MAX_CACHED_SHAPES:
+                TsvOutput._sorted_keys[keys] = sorted_keys
+        return sorted_keys
+
+    @staticmethod
+    def _format_row(data):
+        if isinstance(data, OrderedDict):
+            values = data.values()
+        elif isinstance(data, dict):
+            values = [data[key] for key in TsvOutput._get_sorted_keys(data)]
         elif isinstance(data, list):
-            for value in data:
-                stream.write(separator)
-                TsvOutput._dump_obj(value, stream)
-                separator = '\t'
+            values = data
         else:
-            TsvOutput._dump_obj(data, stream)
-        stream.write('\n')
+            return TsvOutput._format_obj(data) + '\n'
+
+        # Iterate through the items either sorted by key value (if dict) or in the order
+        # they were added (in the cases of an ordered dict) in order to make the output
+        # stable
+        return '\t'.join([TsvOutput._format_obj(value) for value in values]) + '\n'
 
     @staticmethod
     def dump(data):
-        io = StringIO()
-        for item in data:
-            TsvOutput._dump_row(item, io)
-
-        result = io.getvalue()
-        io.close()
-        return result
+        return ''.join([TsvOutput._format_row(item) for item in data])
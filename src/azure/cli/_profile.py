@@ -4,15 +4,22 @@
 #---------------------------------------------------------------------------------------------
 
 from __future__ import print_function
+import atexit
 import collections
 from codecs import open as codecs_open
+from datetime import datetime, timedelta
 import json
 import os.path
 import errno
+import threading
+from timeit import default_timer
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from dateutil import parser as date_parser
 from msrest.authentication import BasicTokenAuthentication
 import adal
 from azure.mgmt.resource.subscriptions import SubscriptionClient
 from .main import ACCOUNT
+from ._session import file_lock, write_file_atomically
 from ._util import CLIError
 from ._azure_env import (get_authority_url, get_env, ENDPOINT_URLS,
                          CLIENT_ID, ENV_DEFAULT, COMMON_TENANT)
@@ -48,6 +55,20 @@ TOKEN_FIELDS_EXCLUDED_FROM_PERSISTENCE = ['familyName',
                                           'givenName',
                                           'isUserIdDisplayable',
                                           'tenantId']
+_TOKEN_ENTRY_CLIENT_ID = '_clientId'
+_TOKEN_ENTRY_EXPIRES_ON = 'expiresOn'
+
+# Number of tenants whose subscriptions are listed at the same time, and time after which
+# listing the subscriptions of a tenant is given up
+MAX_TENANT_WORKERS = 8
+TENANT_TIMEOUT_SECONDS = 60
+
+# Access tokens are used from memory until this long before they expire, when adal
+# refreshes them as well
+_TOKEN_REFRESH_MARGIN = timedelta(minutes=5)
+# While a token is refreshed in the background, the previous one is used until this long
+# before it expires
+_TOKEN_MIN_VALIDITY = timedelta(minutes=1)
 
 
 _AUTH_CTX_FACTORY = lambda authority, cache: adal.AuthenticationContext(authority, cache=cache)
@@ -66,11 +87,62 @@ def _delete_file(file_path):
         if e.errno != errno.ENOENT:
             raise
 
+def _get_file_stat(file_path):
+    try:
+        stat = os.stat(file_path)
+        return (stat.st_mtime, stat.st_size)
+    except OSError:
+        return None
+
+_shared_creds_cache = None
+_shared_creds_cache_lock = threading.Lock()
+
+def get_shared_creds_cache():
+    '''The CredsCache shared by the clients created in this process, e.g. by the commands
+    executed by the daemon or by 'az batch'. It is loaded again if the token file has
+    changed since, e.g. by a login in another process.
+    '''
+    global _shared_creds_cache #pylint: disable=global-statement
+    with _shared_creds_cache_lock:
+        creds_cache = _shared_creds_cache
+        if creds_cache is None or not creds_cache.is_current():
+            creds_cache = _shared_creds_cache = CredsCache()
+        return creds_cache
+
+def invalidate_shared_creds_cache():
+    '''Drop the shared CredsCache, and with it the clients created with its credentials.'''
+    global _shared_creds_cache #pylint: disable=global-statement
+    with _shared_creds_cache_lock:
+        _shared_creds_cache = None
+
+def flush_shared_creds_cache():
+    '''Persist the tokens the shared CredsCache acquired, e.g. once the daemon executed a
+    command, rather than when the process exits.
+    '''
+    with _shared_creds_cache_lock:
+        creds_cache = _shared_creds_cache
+    if creds_cache is not None:
+        creds_cache.flush()
+
+# Whether an access token about to expire is refreshed in the background while it is
+# still used, which processes that execute many commands ('az daemon', 'az batch') enable
+_background_token_refresh = False
+
+def enable_background_token_refresh():
+    global _background_token_refresh #pylint: disable=global-statement
+    _background_token_refresh = True
+
+def _get_token_expiry(token_entry):
+    try:
+        return date_parser.parse(token_entry[_TOKEN_ENTRY_EXPIRES_ON])
+    except (KeyError, TypeError, ValueError, OverflowError):
+        return None
+
 class Profile(object):
-    def __init__(self, storage=None, auth_ctx_factory=None):
+    def __init__(self, storage=None, auth_ctx_factory=None, creds_cache=None):
         self._storage = storage or ACCOUNT
         factory = auth_ctx_factory or _AUTH_CTX_FACTORY
-        self._creds_cache = CredsCache(factory)
+        self._creds_cache = creds_cache or CredsCache(factory)
         self._subscription_finder = SubscriptionFinder(factory, self._creds_cache.adal_token_cache)
         env = get_env()
         self._management_resource_uri = env[ENDPOINT_URLS.MANAGEMENT]
@@ -112,6 +184,7 @@ class Profile(object):
                                                      is_service_principal,
                                                      ENV_DEFAULT)
         self._set_subscriptions(consolidated)
+        invalidate_shared_creds_cache()
         return consolidated
 
     @staticmethod
@@ -175,6 +248,7 @@ class Profile(object):
         result[0][_IS_DEFAULT_SUBSCRIPTION] = True
 
         self._cache_subscriptions_to_local_storage(subscriptions)
+        invalidate_shared_creds_cache()
 
     def logout(self, user_or_sp):
         subscriptions = self.load_cached_subscriptions()
@@ -190,10 +264,68 @@ class Profile(object):
         self._cache_subscriptions_to_local_storage(subscriptions)
 
         self._creds_cache.remove_cached_creds(user_or_sp)
+        invalidate_shared_creds_cache()
 
     def logout_all(self):
         self._cache_subscriptions_to_local_storage({})
         self._creds_cache.remove_all_cached_creds()
+        invalidate_shared_creds_cache()
+
+    def refresh_accounts(self):
+        '''List the subscriptions of the tenants of the accounts logged in again, with the
+        tokens in the cache, rather than discovering the tenants of every account as login
+        does. The subscriptions of a tenant in which they can't be listed are kept.
+        '''
+        subscriptions = self.load_cached_subscriptions()
+        account_tenants = []
+        for s in subscriptions:
+            account = (s[_USER_ENTITY][_USER_NAME], s[_USER_ENTITY][_USER_TYPE])
+            if (account, s[_TENANT_ID]) not in account_tenants:
+                account_tenants.append((account, s[_TENANT_ID]))
+
+        def _find_in_tenant(account_tenant):
+            (username_or_sp_id, user_type), tenant = account_tenant
+            if user_type == _USER:
+                _, access_token = self._creds_cache.retrieve_token_for_user(
+                    username_or_sp_id, tenant, self._management_resource_uri)
+            else:
+                _, access_token = self._creds_cache.retrieve_token_for_service_principal(
+                    username_or_sp_id, self._management_resource_uri)
+            return Profile._normalize_properties(
+                username_or_sp_id, self._subscription_finder.find_in_tenant(tenant, access_token),
+                user_type == _SERVICE_PRINCIPAL, ENV_DEFAULT)
+
+        refreshed = {}
+        for account_tenant, result, error in _run_for_tenants(account_tenants, _find_in_tenant):
+            if error is None:
+                refreshed[account_tenant] = result
+            else:
+                (username_or_sp_id, _), tenant = account_tenant
+                logger.warning("Unable to list the subscriptions of tenant '%s' for '%s', "
+                               "which are kept: %s", tenant, username_or_sp_id, error)
+
+        active_id = next((s[_SUBSCRIPTION_ID] for s in subscriptions
+                          if s.get(_IS_DEFAULT_SUBSCRIPTION)), None)
+        new_subscriptions = collections.OrderedDict()
+        for s in subscriptions:
+            account_tenant = ((s[_USER_ENTITY][_USER_NAME], s[_USER_ENTITY][_USER_TYPE]),
+                              s[_TENANT_ID])
+            if account_tenant in refreshed:
+                # The subscriptions found replace all those of the tenant
+                found, refreshed[account_tenant] = refreshed[account_tenant], []
+            else:
+                found = [s]
+            for new_s in found:
+                new_subscriptions.setdefault(new_s[_SUBSCRIPTION_ID], new_s)
+        subscriptions = list(new_subscriptions.values())
+
+        for s in subscriptions:
+            s[_IS_DEFAULT_SUBSCRIPTION] = s[_SUBSCRIPTION_ID] == active_id
+        if subscriptions and active_id not in new_subscriptions:
+            subscriptions[0][_IS_DEFAULT_SUBSCRIPTION] = True
+        self._cache_subscriptions_to_local_storage(subscriptions)
+        invalidate_shared_creds_cache()
+        return subscriptions
 
     def load_cached_subscriptions(self):
         return self._storage.get(_SUBSCRIPTIONS) or []
@@ -224,14 +356,19 @@ class Profile(object):
         user_type = active_account[_USER_ENTITY][_USER_TYPE]
         username_or_sp_id = active_account[_USER_ENTITY][_USER_NAME]
         resource = self._graph_resource_uri if for_graph_client else self._management_resource_uri
-        if user_type == _USER:
-            token_retriever = lambda: self._creds_cache.retrieve_token_for_user(
-                username_or_sp_id, active_account[_TENANT_ID], resource)
-            auth_object = AdalAuthentication(token_retriever)
-        else:
-            token_retriever = lambda: self._creds_cache.retrieve_token_for_service_principal(
-                username_or_sp_id, resource)
+        # The same credentials are returned for the same identity, so the clients created
+        # with them can be reused
+        key = (user_type, username_or_sp_id, active_account[_TENANT_ID], resource)
+        auth_object = self._creds_cache.authentications.get(key)
+        if auth_object is None:
+            if user_type == _USER:
+                token_retriever = lambda: self._creds_cache.retrieve_token_for_user(
+                    username_or_sp_id, active_account[_TENANT_ID], resource)
+            else:
+                token_retriever = lambda: self._creds_cache.retrieve_token_for_service_principal(
+                    username_or_sp_id, resource)
             auth_object = AdalAuthentication(token_retriever)
+            self._creds_cache.authentications[key] = auth_object
 
         return (auth_object,
                 str(active_account[_SUBSCRIPTION_ID]),
@@ -277,30 +414,51 @@ class SubscriptionFinder(object):
         result = self._find_using_specific_tenant(tenant, token_entry[_ACCESS_TOKEN])
         return result
 
+    def find_in_tenant(self, tenant, access_token):
+        return self._find_using_specific_tenant(tenant, access_token)
+
     def _create_auth_context(self, tenant, use_token_cache=True):
         token_cache = self._adal_token_cache if use_token_cache else None
         authority = get_authority_url(tenant, ENV_DEFAULT)
         return self._auth_context_factory(authority, token_cache)
 
     def _find_using_common_tenant(self, access_token, resource):
-        all_subscriptions = []
         token_credential = BasicTokenAuthentication({'access_token': access_token})
-        client = self._arm_client_factory(token_credential)
-        tenants = client.tenants.list()
-        for t in tenants:
-            tenant_id = t.tenant_id
+        client = self._create_arm_client(token_credential)
+        tenants = [t.tenant_id for t in client.tenants.list()]
+        all_subscriptions, _ = self.find_in_tenants(tenants, resource)
+        return all_subscriptions
+
+    def find_in_tenants(self, tenants, resource):
+        '''Find the subscriptions of the user in the tenants given, with the tokens in the
+        cache, several tenants at a time. Returns the subscriptions found and the tenants
+        in which they could not be listed, which are reported as warnings.
+        '''
+        def _find_in_tenant(tenant_id):
             temp_context = self._create_auth_context(tenant_id)
             temp_credentials = temp_context.acquire_token(resource, self.user_id, CLIENT_ID)
-            subscriptions = self._find_using_specific_tenant(
-                tenant_id,
-                temp_credentials[_ACCESS_TOKEN])
-            all_subscriptions.extend(subscriptions)
+            return self._find_using_specific_tenant(tenant_id, temp_credentials[_ACCESS_TOKEN])
 
-        return all_subscriptions
+        all_subscriptions = []
+        failed_tenants = []
+        for tenant_id, subscriptions, error in _run_for_tenants(tenants, _find_in_tenant):
+            if error is None:
+                all_subscriptions.extend(subscriptions)
+            else:
+                logger.warning("Unable to list the subscriptions of tenant '%s': %s",
+                               tenant_id, error)
+                failed_tenants.append(tenant_id)
+        return all_subscriptions, failed_tenants
+
+    def _create_arm_client(self, token_credential):
+        client = self._arm_client_factory(token_credential)
+        # A request that doesn't complete in time isn't waited for, see _run_for_tenants
+        client.config.connection.timeout = TENANT_TIMEOUT_SECONDS
+        return client
 
     def _find_using_specific_tenant(self, tenant, access_token):
         token_credential = BasicTokenAuthentication({'access_token': access_token})
-        client = self._arm_client_factory(token_credential)
+        client = self._create_arm_client(token_credential)
         subscriptions = client.subscriptions.list()
         all_subscriptions = []
         for s in subscriptions:
@@ -308,6 +466,48 @@ class SubscriptionFinder(object):
             all_subscriptions.append(s)
         return all_subscriptions
 
+def _run_for_tenants(tenants, find_in_tenant):
+    '''Call find_in_tenant for every tenant in a bounded thread pool. Yields the tenant,
+    the result and None, or the tenant, None and the error, in the order of tenants. A
+    tenant for which find_in_tenant doesn't return within TENANT_TIMEOUT_SECONDS of being
+    started fails with a timeout.
+    '''
+    if not tenants:
+        return
+    started = {}
+
+    def _find(tenant):
+        started[tenant] = default_timer()
+        return find_in_tenant(tenant)
+
+    outcomes = {}
+    executor = ThreadPoolExecutor(max_workers=min(MAX_TENANT_WORKERS, len(tenants)))
+    try:
+        pending = {executor.submit(_find, tenant): tenant for tenant in tenants}
+        while pending:
+            now = default_timer()
+            deadlines = [started[t] + TENANT_TIMEOUT_SECONDS for t in pending.values()
+                         if t in started]
+            # Tenants that start later are noticed within a second
+            timeout = min([max(d - now, 0) for d in deadlines] + [1.0])
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                tenant = pending.pop(future)
+                error = future.exception()
+                outcomes[tenant] = (None, error) if error else (future.result(), None)
+            now = default_timer()
+            for future, tenant in list(pending.items()):
+                if tenant in started and now - started[tenant] > TENANT_TIMEOUT_SECONDS:
+                    del pending[future]
+                    outcomes[tenant] = (None, CLIError('Timed out after {} seconds'.format(
+                        TENANT_TIMEOUT_SECONDS)))
+    finally:
+        # Threads of tenants that timed out end with their requests
+        executor.shutdown(wait=False)
+    for tenant in tenants:
+        result, error = outcomes[tenant]
+        yield tenant, result, error
+
 class CredsCache(object):
     '''Caches AAD tokena and service principal secrets, and persistence will
     also be handled
@@ -317,11 +517,26 @@ class CredsCache(object):
         self._service_principal_creds = []
         self._auth_ctx_factory = auth_ctx_factory or _AUTH_CTX_FACTORY
         self.adal_token_cache = None
+        # Credentials returned by Profile.get_login_credentials, by identity
+        self.authentications = {}
+        # (token type, access token, expiry) by identity and resource
+        self._access_tokens = {}
+        # Events set once the token being acquired for an identity and resource is
+        # cached, so other threads wait for it rather than acquiring it too
+        self._pending_tokens = {}
+        # Shared caches are used by several threads in 'az batch'
+        self._lock = threading.RLock()
+        self._file_stat = None
+        self._flush_at_exit = False
         self._load_creds()
 
+    def is_current(self):
+        '''Whether the token file is unchanged since it was loaded or written.'''
+        return (self._token_file == os.path.expanduser('~/.azure/accessTokens.json') and
+                self._file_stat == _get_file_stat(self._token_file))
+
     def persist_cached_creds(self):
-        with os.fdopen(os.open(self._token_file, os.O_RDWR|os.O_CREAT|os.O_TRUNC, 0o600),
-                       'w+') as cred_file:
+        with self._lock:
             items = self.adal_token_cache.read_items()
             all_creds = [entry for _, entry in items]
 
@@ -331,37 +546,127 @@ class CredsCache(object):
                     i.pop(key, None)
 
             all_creds.extend(self._service_principal_creds)
-            cred_file.write(json.dumps(all_creds))
-
-        self.adal_token_cache.has_state_changed = False
+            write_file_atomically(self._token_file, json.dumps(all_creds))
+
+            self.adal_token_cache.has_state_changed = False
+            self._file_stat = _get_file_stat(self._token_file)
+
+    def flush(self):
+        '''Persist the tokens acquired since the token file was loaded or written. They are
+        dropped if another process changed the file since, e.g. by a login or logout.
+        '''
+        with self._lock:
+            if not self.adal_token_cache.has_state_changed:
+                return
+            try:
+                with file_lock(self._token_file + '.lock'):
+                    if self._file_stat != _get_file_stat(self._token_file):
+                        logger.debug('%s changed since it was loaded, so the tokens acquired '
+                                     'are not persisted', self._token_file)
+                        self.adal_token_cache.has_state_changed = False
+                        return
+                    self.persist_cached_creds()
+            except (IOError, OSError) as ex:
+                # The tokens are acquired again by the next process
+                logger.warning("Unable to write '%s': %s", self._token_file, ex)
 
     def retrieve_token_for_user(self, username, tenant, resource):
-        authority = get_authority_url(tenant, ENV_DEFAULT)
-        context = self._auth_ctx_factory(authority, cache=self.adal_token_cache)
-        token_entry = context.acquire_token(resource, username, CLIENT_ID)
-        if not token_entry:
-            raise CLIError('Could not retrieve token from local cache, please run \'login\'.')
+        def _acquire_token():
+            authority = get_authority_url(tenant, ENV_DEFAULT)
+            context = self._auth_ctx_factory(authority, cache=self.adal_token_cache)
+            token_entry = context.acquire_token(resource, username, CLIENT_ID)
+            if not token_entry:
+                raise CLIError('Could not retrieve token from local cache, please run \'login\'.')
+            return token_entry
 
-        if self.adal_token_cache.has_state_changed:
-            self.persist_cached_creds()
-        return (token_entry[_TOKEN_ENTRY_TOKEN_TYPE], token_entry[_ACCESS_TOKEN])
+        return self._retrieve_token((_USER, username, tenant, resource), _acquire_token)
 
     def retrieve_token_for_service_principal(self, sp_id, resource):
         matched = [x for x in self._service_principal_creds if sp_id == x[_SERVICE_PRINCIPAL_ID]]
         if not matched:
             raise CLIError('Please run "account set" to select active account.')
         cred = matched[0]
-        authority_url = get_authority_url(cred[_SERVICE_PRINCIPAL_TENANT], ENV_DEFAULT)
-        context = self._auth_ctx_factory(authority_url, None)
-        token_entry = context.acquire_token_with_client_credentials(resource,
-                                                                    sp_id,
-                                                                    cred[_ACCESS_TOKEN])
-        return (token_entry[_TOKEN_ENTRY_TOKEN_TYPE], token_entry[_ACCESS_TOKEN])
+
+        def _acquire_token():
+            authority_url = get_authority_url(cred[_SERVICE_PRINCIPAL_TENANT], ENV_DEFAULT)
+            # adal returns the token in the cache until it is about to expire
+            context = self._auth_ctx_factory(authority_url, self.adal_token_cache)
+            return context.acquire_token_with_client_credentials(resource,
+                                                                 sp_id,
+                                                                 cred[_ACCESS_TOKEN])
+
+        return self._retrieve_token((_SERVICE_PRINCIPAL, sp_id, resource), _acquire_token)
+
+    def _retrieve_token(self, key, acquire_token):
+        # The lock is not held while a token is acquired, as that may call AAD, so
+        # threads that need other tokens, or have them cached, aren't held up
+        while True:
+            with self._lock:
+                cached = self._access_tokens.get(key)
+                if cached:
+                    token_type, access_token, expires_on = cached
+                    remaining = expires_on - datetime.now(expires_on.tzinfo)
+                    if remaining > _TOKEN_REFRESH_MARGIN:
+                        return (token_type, access_token)
+                    if remaining > _TOKEN_MIN_VALIDITY and _background_token_refresh:
+                        self._refresh_token_in_background(key, acquire_token)
+                        return (token_type, access_token)
+                pending = self._pending_tokens.get(key)
+                if pending is None:
+                    pending = self._pending_tokens[key] = threading.Event()
+                    break
+            # Another thread is acquiring the token, which is cached once it is done
+            pending.wait()
+
+        try:
+            return self._acquire_token(key, acquire_token)
+        finally:
+            self._end_pending_token(key, pending)
+
+    def _acquire_token(self, key, acquire_token):
+        token_entry = acquire_token()
+        result = (token_entry[_TOKEN_ENTRY_TOKEN_TYPE], token_entry[_ACCESS_TOKEN])
+        expires_on = _get_token_expiry(token_entry)
+        with self._lock:
+            if expires_on:
+                self._access_tokens[key] = result + (expires_on,)
+            if self.adal_token_cache.has_state_changed and not self._flush_at_exit:
+                # Tokens are written once, rather than every time one is acquired
+                self._flush_at_exit = True
+                atexit.register(self.flush)
+        return result
+
+    def _end_pending_token(self, key, pending):
+        with self._lock:
+            del self._pending_tokens[key]
+        pending.set()
+
+    def _refresh_token_in_background(self, key, acquire_token):
+        # Called with the lock held
+        if key in self._pending_tokens:
+            return
+        pending = self._pending_tokens[key] = threading.Event()
+
+        def _refresh():
+            try:
+                self._acquire_token(key, acquire_token)
+            except Exception: #pylint: disable=broad-except
+                # The token is acquired again when it is used next
+                logger.debug('Unable to refresh the access token in the background',
+                             exc_info=True)
+            finally:
+                self._end_pending_token(key, pending)
+
+        thread = threading.Thread(target=_refresh)
+        thread.daemon = True
+        thread.start()
 
     def _load_creds(self):
         if self.adal_token_cache is not None:
             return self.adal_token_cache
 
+        # Taken before reading, so a change while reading is noticed by is_current
+        self._file_stat = _get_file_stat(self._token_file)
         json_text = _read_file_content(self._token_file)
         if json_text:
             json_text = json_text.replace('\n', '')
@@ -406,6 +711,10 @@ class CredsCache(object):
         state_changed = False
         #clear AAD tokens
         tokens = self.adal_token_cache.find({_TOKEN_ENTRY_USER_ID: user_or_sp})
+        #the tokens of a service principal are issued to it as the client
+        tokens.extend(self.adal_token_cache.find({_TOKEN_ENTRY_CLIENT_ID: user_or_sp}))
+        self._access_tokens = {key: value for key, value in self._access_tokens.items()
+                               if key[1] != user_or_sp}
         if tokens:
             state_changed = True
             self.adal_token_cache.remove(tokens)
@@ -422,5 +731,6 @@ class CredsCache(object):
             self.persist_cached_creds()
 
     def remove_all_cached_creds(self):
+        self._access_tokens = {}
         #we can clear file contents, but deleting it is simpler
         _delete_file(self._token_file)
@@ -0,0 +1,144 @@
+#---------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+#---------------------------------------------------------------------------------------------
+
+'''Timing of the phases of a command and of the modules it imports ('--profile-startup').
+
+Code marks a phase with
+
+    with phase('load command table'):
+        ...
+
+which costs a function call while profiling is off. With --profile-startup, the wall
+time of every phase and the self and cumulative time of every module imported while
+profiling are written to stderr as JSON once the command completes.
+
+This module must only use the standard library.
+'''
+
+from __future__ import print_function
+import json
+import sys
+from timeit import default_timer
+
+PROFILE_STARTUP_ARGUMENT = '--profile-startup'
+
+_profile = None
+
+class _NullPhase(object):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+_NULL_PHASE = _NullPhase()
+
+class _Phase(object):
+    def __init__(self, profile, name):
+        self._profile = profile
+        self._record = {'name': name}
+
+    def __enter__(self):
+        self._record['depth'] = self._profile.depth
+        self._profile.depth += 1
+        self._start = default_timer()
+        self._record['start'] = self._start - self._profile.start
+        self._profile.phases.append(self._record)
+        return self
+
+    def __exit__(self, *args):
+        self._record['duration'] = default_timer() - self._start
+        self._profile.depth -= 1
+        return False
+
+class _ImportTimer(object):
+    '''Meta path finder that times the execution of every module imported after it is
+    installed. Only supported on Python 3.4 and later.
+    '''
+    def __init__(self):
+        self.imports = []
+        self._stack = []
+
+    def find_spec(self, fullname, path=None, target=None):
+        spec = None
+        for finder in sys.meta_path:
+            if finder is self:
+                continue
+            if not hasattr(finder, 'find_spec'):
+                # Let the import system handle finders of the older protocol
+                return None
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        loader = getattr(spec, 'loader', None)
+        # Loaders that are classes (built-in and frozen modules) are shared
+        if loader is not None and not isinstance(loader, type) and \
+                hasattr(loader, 'exec_module'):
+            loader.exec_module = self._timed_exec_module(fullname, loader)
+        return spec
+
+    def _timed_exec_module(self, fullname, loader):
+        exec_module = loader.exec_module
+
+        def _exec_module(module):
+            del loader.exec_module
+            self._stack.append(0.0)
+            start = default_timer()
+            try:
+                exec_module(module)
+            finally:
+                cumulative = default_timer() - start
+                children = self._stack.pop()
+                if self._stack:
+                    self._stack[-1] += cumulative
+                self.imports.append({'module': fullname,
+                                     'self': cumulative - children,
+                                     'cumulative': cumulative})
+        return _exec_module
+
+class StartupProfile(object):
+    def __init__(self):
+        self.start = default_timer()
+        self.depth = 0
+        self.phases = []
+        self.import_timer = _ImportTimer() if sys.version_info >= (3, 4) else None
+
+    def to_dict(self):
+        imports = sorted(self.import_timer.imports if self.import_timer else [],
+                         key=lambda i: i['cumulative'], reverse=True)
+        return {'total': default_timer() - self.start,
+                'phases': self.phases,
+                'imports': imports}
+
+def phase(name):
+    '''Context manager that records the wall time of a phase while profiling.'''
+    return _Phase(_profile, name) if _profile else _NULL_PHASE
+
+def is_profiling():
+    return _profile is not None
+
+def start_profiling():
+    '''Start recording phases and imports. Does nothing if profiling is active already.'''
+    global _profile # pylint: disable=global-statement
+    if _profile is None:
+        _profile = StartupProfile()
+        if _profile.import_timer:
+            sys.meta_path.insert(0, _profile.import_timer)
+
+def stop_profiling(file=None): #pylint: disable=redefined-builtin
+    '''Stop profiling and write the profile to file (stderr by default) as JSON.'''
+    global _profile # pylint: disable=global-statement
+    profile, _profile = _profile, None
+    if profile is None:
+        return
+    if profile.import_timer in sys.meta_path:
+        sys.meta_path.remove(profile.import_timer)
+    file = file or sys.stderr
+    try:
+        print(json.dumps(profile.to_dict(), indent=2), file=file)
+        file.flush()
+    except (IOError, OSError):
+        # The output was closed, e.g. piped to 'head'. Don't fail the command for it.
+        pass
@@ -3,46 +3,140 @@
 # Licensed under the MIT License. See License.txt in the project root for license information.
 #---------------------------------------------------------------------------------------------
 
+import atexit
+import errno
 import json
 import os
+import tempfile
+import threading
 import time
+from contextlib import contextmanager
 try:
     import collections.abc as collections
 except ImportError:
     import collections
-
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt # pylint: disable=import-error
 
 from codecs import open as codecs_open
 
+def write_file_atomically(file_path, text, encoding='utf-8'):
+    '''Write text to a file only the user can read, which replaces file_path once it is
+    complete, so other processes never read a partially written file.
+    '''
+    directory, file_name = os.path.split(file_path)
+    descriptor, temp_path = tempfile.mkstemp(prefix=file_name + '.', suffix='.tmp',
+                                             dir=directory or None)
+    try:
+        with os.fdopen(descriptor, 'wb') as temp_file:
+            temp_file.write(text.encode(encoding))
+        if hasattr(os, 'replace'):
+            os.replace(temp_path, file_path) #pylint: disable=no-member
+        else:
+            # os.rename can't replace a file on Windows before Python 3.3
+            if os.name == 'nt' and os.path.exists(file_path):
+                os.remove(file_path)
+            os.rename(temp_path, file_path)
+    except:
+        try:
+            os.remove(temp_path)
+        except OSError as ex:
+            if ex.errno != errno.ENOENT:
+                raise
+        raise
+
+@contextmanager
+def file_lock(lock_path):
+    '''Hold an exclusive lock on lock_path, which other processes wait for.'''
+    with open(lock_path, 'a+') as lock_file:
+        if fcntl:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        else:
+            lock_file.seek(0)
+            # Retries for 10 seconds before raising an IOError
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
 class Session(collections.MutableMapping):
     '''A simple dict-like class that is backed by a JSON file.
 
-    All direct modifications will save the file. Indirect modifications should
-    be followed by a call to `save_with_retry` or `save`.
+    The keys set or deleted are saved once, by `flush` or when the process exits. They
+    are merged into the file as it is then, under a lock, so processes that change
+    different keys don't lose each other's changes. Indirect modifications should be
+    followed by a call to `save_with_retry` or `save`.
     '''
 
     def __init__(self, encoding=None):
         self.filename = None
         self.data = {}
         self._encoding = encoding if encoding else 'utf-8-sig'
+        self._lock = threading.RLock()
+        self._changed_keys = set()
+        # Whether the file is replaced, rather than merged into, e.g. as it has expired
+        self._replace = False
+        self._flush_at_exit = False
 
     def load(self, filename, max_age=0):
-        self.filename = filename
-        self.data = {}
-        try:
-            if max_age > 0:
-                st = os.stat(self.filename)
-                if st.st_mtime + max_age < time.clock():
-                    self.save()
-            with codecs_open(self.filename, 'r', encoding=self._encoding) as f:
-                self.data = json.load(f)
-        except (OSError, IOError):
-            self.save()
+        self.flush()
+        with self._lock:
+            self.filename = filename
+            self.data = {}
+            self._changed_keys.clear()
+            self._replace = False
+            try:
+                if max_age > 0 and os.stat(self.filename).st_mtime + max_age < time.time():
+                    self._replace = True
+                    return
+                self.data = self._read()
+            except (OSError, IOError):
+                # The file is created once a key is set
+                pass
+            except ValueError:
+                # A corrupt file is replaced once a key is set
+                self._replace = True
+
+    def _read(self):
+        with codecs_open(self.filename, 'r', encoding=self._encoding) as f:
+            data = json.load(f)
+        if not isinstance(data, dict):
+            raise ValueError('{} does not contain a JSON object'.format(self.filename))
+        return data
+
+    def flush(self):
+        '''Save the keys set or deleted since the file was loaded or saved.'''
+        with self._lock:
+            if not self.filename or not (self._changed_keys or self._replace):
+                return
+            with file_lock(self.filename + '.lock'):
+                data = {}
+                if not self._replace:
+                    try:
+                        data = self._read()
+                    except (OSError, IOError, ValueError):
+                        pass
+                for key in self._changed_keys:
+                    if key in self.data:
+                        data[key] = self.data[key]
+                    else:
+                        data.pop(key, None)
+                write_file_atomically(self.filename, json.dumps(data), self._encoding)
+            self._changed_keys.clear()
+            self._replace = False
 
     def save(self):
-        if self.filename:
-            with codecs_open(self.filename, 'w', encoding=self._encoding) as f:
-                json.dump(self.data, f)
+        with self._lock:
+            self._changed_keys.update(self.data)
+            self.flush()
 
     def save_with_retry(self, retries=5):
         for _ in range(retries - 1):
@@ -54,6 +148,13 @@ class Session(collections.MutableMapping):
         else:
             self.save()
 
+    def _mark_changed(self, key):
+        with self._lock:
+            self._changed_keys.add(key)
+            if not self._flush_at_exit:
+                self._flush_at_exit = True
+                atexit.register(self.flush)
+
     def get(self, key, default=None):
         return self.data.get(key, default)
 
@@ -62,11 +163,11 @@ class Session(collections.MutableMapping):
 
     def __setitem__(self, key, value):
         self.data[key] = value
-        self.save_with_retry()
+        self._mark_changed(key)
 
     def __delitem__(self, key):
         del self.data[key]
-        self.save_with_retry()
+        self._mark_changed(key)
 
     def __iter__(self):
         return iter(self.data)
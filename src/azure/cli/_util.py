@@ -11,6 +11,7 @@ import platform
 import re
 import sys
 from enum import Enum
+from six import text_type, integer_types
 
 CLI_PACKAGE_NAME = 'azure-cli'
 COMPONENT_PREFIX = 'azure-cli-'
@@ -26,22 +27,17 @@ def normalize_newlines(str_to_normalize):
     return str_to_normalize.replace('\r\n', '\n')
 
 def show_version_info_exit(out_file):
-    from pip import get_installed_distributions
-    installed_dists = get_installed_distributions(local_only=True)
-
-    cli_info = None
-    for dist in installed_dists:
-        if dist.key == CLI_PACKAGE_NAME:
-            cli_info = {'name': dist.key, 'version': dist.version}
-            break
-
-    if cli_info:
-        print('{} ({})'.format(cli_info['name'], cli_info['version']), file=out_file)
-
-    component_version_info = sorted([{'name': dist.key.replace(COMPONENT_PREFIX, ''),
-                                      'version': dist.version}
-                                     for dist in installed_dists
-                                     if dist.key.startswith(COMPONENT_PREFIX)],
+    from azure.cli._component_registry import get_installed_components
+    installed_components = get_installed_components()
+
+    if CLI_PACKAGE_NAME in installed_components:
+        print('{} ({})'.format(CLI_PACKAGE_NAME, installed_components[CLI_PACKAGE_NAME]),
+              file=out_file)
+
+    component_version_info = sorted([{'name': name.replace(COMPONENT_PREFIX, ''),
+                                      'version': version}
+                                     for name, version in installed_components.items()
+                                     if name.startswith(COMPONENT_PREFIX)],
                                     key=lambda x: x['name'])
 
     print(file=out_file)
@@ -64,26 +60,93 @@ def get_file_json(file_path):
 
     raise CLIError('Failed to decode file {} - unknown decoding'.format(file_path))
 
+class ResultStream(object):
+    """The items of a list result that are produced incrementally, e.g. from the pages of
+    a Paged SDK result, so they can be converted and written as they arrive.
+    A stream can only be iterated once.
+    """
+    def __init__(self, items):
+        self._items = iter(items)
+
+    def __iter__(self):
+        return self._items
+
+    def map(self, func):
+        """Stream of the items returned by func for every item."""
+        return ResultStream(func(item) for item in self._items)
+
+    def expand(self, func):
+        """Stream of the items of the lists returned by func for every item."""
+        return ResultStream(result for item in self._items for result in func(item))
+
+    @staticmethod
+    def materialize(result):
+        """Return result, with a stream read into a list."""
+        return list(result) if isinstance(result, ResultStream) else result
+
 KEYS_CAMELCASE_PATTERN = re.compile('(?!^)_([a-zA-Z])')
-def todict(obj): #pylint: disable=too-many-return-statements
-    def to_camelcase(s):
-        return re.sub(KEYS_CAMELCASE_PATTERN, lambda x: x.group(1).upper(), s)
 
+_camelcase_keys = {}
+
+def _to_camelcase(key):
+    try:
+        return _camelcase_keys[key]
+    except KeyError:
+        camelcase_key = re.sub(KEYS_CAMELCASE_PATTERN, lambda x: x.group(1).upper(), key)
+        _camelcase_keys[key] = camelcase_key
+        return camelcase_key
+
+def _convert_unchanged(obj):
+    return obj
+
+def _convert_dict(obj):
+    return {k: todict(v) for (k, v) in obj.items()}
+
+def _convert_list(obj):
+    return [todict(a) for a in obj]
+
+def _convert_enum(obj):
+    return obj.value
+
+def _convert_datetime(obj):
+    return obj.isoformat()
+
+def _convert_namedtuple(obj):
+    return todict(obj._asdict())
+
+def _convert_object(obj):
+    return {_to_camelcase(k): todict(v) for k, v in obj.__dict__.items()
+            if not k.startswith('_') and not callable(v)}
+
+# type -> function converting its instances, filled as types are first converted
+_todict_converters = dict.fromkeys(
+    (bool, float, type(None), bytes, str, text_type) + integer_types,
+    _convert_unchanged)
+_todict_converters.update({dict: _convert_dict, list: _convert_list})
+
+def _get_todict_converter(obj):
     if isinstance(obj, dict):
-        return {k: todict(v) for (k, v) in obj.items()}
+        converter = _convert_dict
     elif isinstance(obj, list):
-        return [todict(a) for a in obj]
+        converter = _convert_list
     elif isinstance(obj, Enum):
-        return obj.value
+        converter = _convert_enum
     elif isinstance(obj, datetime):
-        return obj.isoformat()
+        converter = _convert_datetime
     elif isinstance(obj, timedelta):
-        return str(obj)
+        converter = str
     elif hasattr(obj, '_asdict'):
-        return todict(obj._asdict())
+        converter = _convert_namedtuple
     elif hasattr(obj, '__dict__'):
-        return dict([(to_camelcase(k), todict(v))
-                     for k, v in obj.__dict__.items()
-                     if not callable(v) and not k.startswith('_')])
+        converter = _convert_object
     else:
-        return obj
+        converter = _convert_unchanged
+    _todict_converters[type(obj)] = converter
+    return converter
+
+def todict(obj):
+    try:
+        converter = _todict_converters[type(obj)]
+    except KeyError:
+        converter = _get_todict_converter(obj)
+    return converter(obj)
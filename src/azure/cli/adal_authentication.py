@@ -14,8 +14,8 @@ class AdalAuthentication(Authentication):#pylint: disable=too-few-public-methods
     def __init__(self, token_retriever):
         self._token_retriever = token_retriever
 
-    def signed_session(self):
-        session = super(AdalAuthentication, self).signed_session()
+    def signed_session(self, session=None):
+        session = super(AdalAuthentication, self).signed_session(session)
 
         try:
             scheme, token = self._token_retriever()
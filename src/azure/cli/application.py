@@ -3,9 +3,10 @@
 # Licensed under the MIT License. See License.txt in the project root for license information.
 #---------------------------------------------------------------------------------------------
 
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 import sys
 import os
+import threading
 import uuid
 import argparse
 from .parser import AzCliCommandParser
@@ -13,7 +14,8 @@ from azure.cli._output import CommandResultItem
 import azure.cli.extensions
 import azure.cli._help as _help
 import azure.cli._logging as _logging
-from azure.cli._util import todict
+from azure.cli._util import todict, ResultStream
+from azure.cli._profiling import phase
 
 logger = _logging.get_az_logger(__name__)
 
@@ -26,10 +28,26 @@ class Configuration(object): # pylint: disable=too-few-public-methods
     def __init__(self, argv):
         self.argv = argv or sys.argv[1:]
         self.output_format = 'list'
+        self.output_file = None
 
     def get_command_table(self):
         import azure.cli.commands as commands
 
+        # Use the command index to find the module that owns the command on the command
+        # line. If no single module owns it, build the table from the index itself so
+        # we don't have to import every installed command module.
+        index = commands.load_command_index()
+        if index:
+            module_name = index.resolve_module(self.argv)
+            if module_name:
+                index.register_help(module_name)
+                return commands.get_command_table(module_name)
+            # Commands registered in this process other than by an installed command
+            # module aren't in the index
+            if all(name in index.commands for name in commands.command_table):
+                return index.get_command_table()
+            return commands.get_command_table()
+
         # Find the first noun on the command line and only load commands from that
         # module to improve startup time.
         for a in self.argv:
@@ -39,6 +57,12 @@ class Configuration(object): # pylint: disable=too-few-public-methods
         # No noun found, so load all commands.
         return  commands.get_command_table()
 
+def _get_command_metadata(command_table, name):
+    if name in command_table:
+        return command_table[name]
+    from azure.cli._builtin_commands import BUILTIN_COMMANDS
+    return BUILTIN_COMMANDS[name]
+
 class Application(object):
 
     TRANSFORM_RESULT = 'Application.TransformResults'
@@ -50,15 +74,7 @@ class Application(object):
 
     def __init__(self, config=None):
         self._event_handlers = defaultdict(lambda: [])
-        self.session = {
-            'headers': {
-                'x-ms-client-request-id': str(uuid.uuid1())
-                },
-            'command': 'unknown',
-            'completer_active': ARGCOMPLETE_ENV_NAME in os.environ,
-            'query_active': False
-            }
-
+        self._thread_state = threading.local()
 
         # Register presence of and handlers for global parameters
         self.register(self.GLOBAL_PARSER_CREATED, Application._register_builtin_arguments)
@@ -79,11 +95,51 @@ class Application(object):
     def initialize(self, configuration):
         self.configuration = configuration
 
+    @property
+    def session(self):
+        '''State of the command being executed. Each thread has its own session so
+        commands can be executed concurrently (e.g. by 'az batch').
+        '''
+        if not hasattr(self._thread_state, 'session'):
+            self.new_session()
+        return self._thread_state.session
+
+    def new_session(self):
+        '''Reset the state tracked for the command being executed. A process that
+        executes several commands (e.g. the daemon) calls this before each of them.
+        '''
+        self._thread_state.session = {
+            'headers': {
+                'x-ms-client-request-id': str(uuid.uuid1())
+                },
+            'command': 'unknown',
+            'completer_active': ARGCOMPLETE_ENV_NAME in os.environ,
+            'query_active': False
+            }
+
+    def load_command_table(self, command_table):
+        '''Let extensions process the command table and load it into the parser.
+        Loading the same table again is cheap, so processes that execute many commands
+        (e.g. the daemon) load all commands once up front.
+        '''
+        from azure.cli.commands import save_pending_completion_index
+        from azure.cli._builtin_commands import BUILTIN_COMMANDS
+        with phase('load command table'):
+            self.raise_event(self.COMMAND_TABLE_LOADED, command_table=command_table)
+            # The completion index holds the arguments extensions have added
+            save_pending_completion_index(command_table,
+                                          self.global_parser._actions, # pylint: disable=protected-access
+                                          BUILTIN_COMMANDS)
+            parser_table = OrderedDict(command_table)
+            for name, command in BUILTIN_COMMANDS.items():
+                parser_table.setdefault(name, command)
+            self.parser.load_command_table(parser_table)
+            self.raise_event(self.COMMAND_PARSER_LOADED, parser=self.parser)
+
     def execute(self, argv):
-        command_table = self.configuration.get_command_table()
-        self.raise_event(self.COMMAND_TABLE_LOADED, command_table=command_table)
-        self.parser.load_command_table(command_table)
-        self.raise_event(self.COMMAND_PARSER_LOADED, parser=self.parser)
+        with phase('get command table'):
+            command_table = self.configuration.get_command_table()
+        self.load_command_table(command_table)
 
         if len(argv) == 0:
             az_subparser = self.parser.subparsers[tuple()]
@@ -93,12 +149,16 @@ class Application(object):
         if argv[0].lower() == 'help':
             argv[0] = '--help'
 
-        args = self.parser.parse_args(argv)
-        self.raise_event(self.COMMAND_PARSER_PARSED, command=args.command, args=args)
+        with phase('parse arguments'):
+            args = self.parser.parse_args(argv)
+            self.raise_event(self.COMMAND_PARSER_PARSED, command=args.command, args=args,
+                             command_metadata=_get_command_metadata(command_table,
+                                                                    args.command))
         results = []
         for expanded_arg in _explode_list_args(args):
             try:
-                _validate_arguments(expanded_arg)
+                with phase('validate arguments'):
+                    _validate_arguments(expanded_arg)
             except: # pylint: disable=bare-except
                 err = sys.exc_info()[1]
                 getattr(expanded_arg, '_parser', self.parser).error(str(err))
@@ -114,16 +174,24 @@ class Application(object):
             params.pop('func', None)
             params.pop('command', None)
 
-            result = expanded_arg.func(params)
-            result = todict(result)
+            with phase('execute handler'):
+                result = expanded_arg.func(params)
+            with phase('convert result'):
+                if isinstance(result, ResultStream):
+                    result = result.map(todict)
+                else:
+                    result = todict(result)
             results.append(result)
 
         if len(results) == 1:
             results = results[0]
+        else:
+            results = [ResultStream.materialize(r) for r in results]
 
         event_data = {'result': results}
-        self.raise_event(self.TRANSFORM_RESULT, event_data=event_data)
-        self.raise_event(self.FILTER_RESULT, event_data=event_data)
+        with phase('transform result'):
+            self.raise_event(self.TRANSFORM_RESULT, event_data=event_data)
+            self.raise_event(self.FILTER_RESULT, event_data=event_data)
         return CommandResultItem(event_data['result'],
                                  simple_output_query=
                                  command_table[args.command].simple_output_query,
@@ -165,20 +233,28 @@ class Application(object):
         global_group = kwargs['global_group']
         global_group.add_argument('--subscription', dest='_subscription_id', help=argparse.SUPPRESS)
         global_group.add_argument('--output', '-o', dest='_output_format',
-                                  choices=['json', 'tsv', 'list', 'table', 'jsonc'],
+                                  choices=['json', 'tsv', 'list', 'table', 'jsonc', 'jsonl',
+                                           'json-compact'],
                                   default='json',
                                   help='Output format',
                                   type=str.lower)
         # The arguments for verbosity don't get parsed by argparse but we add it here for help.
+        global_group.add_argument('--output-file', dest='_output_file', metavar='PATH',
+                                  help='Write the output to this file instead of stdout. The file is compressed with gzip if its name ends with .gz.') #pylint: disable=line-too-long
         global_group.add_argument('--verbose', dest='_log_verbosity_verbose', action='store_true',
                                   help='Increase logging verbosity. Use --debug for full debug logs.') #pylint: disable=line-too-long
         global_group.add_argument('--debug', dest='_log_verbosity_debug', action='store_true',
                                   help='Increase logging verbosity to show all debug logs.')
+        global_group.add_argument('--profile-startup', dest='_profile_startup',
+                                  action='store_true',
+                                  help='Write the time taken by each phase of the command and by each module import to stderr as JSON.') #pylint: disable=line-too-long
 
     def _handle_builtin_arguments(self, **kwargs):
         args = kwargs['args']
         self.configuration.output_format = args._output_format #pylint: disable=protected-access
         del args._output_format
+        self.configuration.output_file = args._output_file #pylint: disable=protected-access
+        del args._output_file
 
 def _validate_arguments(args, **_):
     for validator in getattr(args, '_validators', []):
@@ -8,23 +8,27 @@ import sys
 import json
 import time
 import traceback
+import weakref
 from importlib import import_module
 from collections import OrderedDict, defaultdict
-from pip import get_installed_distributions
 from msrest.paging import Paged
 from msrest.exceptions import ClientException
 from msrestazure.azure_operation import AzureOperationPoller
-from azure.cli._util import CLIError
+from azure.cli._util import CLIError, ResultStream
+from azure.cli._component_registry import get_installed_command_modules
+from azure.cli.help_files import helps
+from azure.cli._completion import build_completion_index, save_completion_index
+from azure.cli._profiling import phase
 import azure.cli._logging as _logging
 
 from ._introspection import extract_args_from_signature
+from ._command_index import CommandIndex, is_command_index_enabled, get_index_file_path
 
 logger = _logging.get_az_logger(__name__)
 
 # Find our command modules, they start with 'azure-cli-'
-INSTALLED_COMMAND_MODULES = [dist.key.replace('azure-cli-', '')
-                             for dist in get_installed_distributions(local_only=True)
-                             if dist.key.startswith('azure-cli-')]
+INSTALLED_COMMAND_MODULE_VERSIONS = get_installed_command_modules()
+INSTALLED_COMMAND_MODULES = list(INSTALLED_COMMAND_MODULE_VERSIONS)
 
 logger.info('Installed command modules %s', INSTALLED_COMMAND_MODULES)
 
@@ -135,13 +139,21 @@ class CommandTable(dict):
 
 class CliCommand(object):
 
-    def __init__(self, name, handler, description=None, simple_output_query=None):
+    def __init__(self, name, handler, description=None, simple_output_query=None,
+                 query_filter_arguments=None, page_size_argument=None):
         self.name = name
         self.handler = handler
         self.description = description
         self.help = None
         self.arguments = {}
         self.simple_output_query = simple_output_query
+        # Field of the result items -> argument that filters the items on that field
+        # on the server, used to push down the filters of --query
+        self.query_filter_arguments = query_filter_arguments or {}
+        # Argument that sets the number of items per page of the result ($top), set
+        # with --page-size
+        self.page_size_argument = page_size_argument
+        self.operation = None
 
     def add_argument(self, param_name, *option_strings, **kwargs):
         argument = CliCommandArgument(
@@ -156,6 +168,11 @@ class CliCommand(object):
         return self.handler(**kwargs)
 
 command_table = CommandTable()
+_updated_commands = weakref.WeakSet()
+
+# Table the command index has just been built from. Its completion index is saved once
+# extensions have processed it (e.g. added the --ids arguments).
+_pending_completion_index = None
 
 def get_command_table(module_name=None):
     '''Loads command table(s)
@@ -163,10 +180,12 @@ def get_command_table(module_name=None):
     When `module_name` is specified, only commands from that module will be loaded.
     If the module is not found, all commands are loaded.
     '''
+    global _pending_completion_index # pylint: disable=global-statement
     loaded = False
     if module_name:
         try:
-            import_module('azure.cli.command_modules.' + module_name)
+            with phase('import command module ' + module_name):
+                import_module('azure.cli.command_modules.' + module_name)
             logger.info("Successfully loaded command table from module '%s'.", module_name)
             loaded = True
         except ImportError:
@@ -177,21 +196,76 @@ def get_command_table(module_name=None):
             # We don't log anything here as we will log below when we try and load all.
             pass
 
+    command_owners = {}
+    help_owners = {}
+    can_index = not loaded
     if not loaded:
         logger.info('Loading command tables from all installed modules.')
         for mod in INSTALLED_COMMAND_MODULES:
+            module_path = 'azure.cli.command_modules.' + mod
+            # Commands of a module imported earlier in this process can't be attributed to it
+            can_index = can_index and module_path not in sys.modules
+            known_commands = set(command_table)
+            known_helps = set(helps)
             try:
-                import_module('azure.cli.command_modules.' + mod)
+                with phase('import command module ' + mod):
+                    import_module(module_path)
             except Exception: #pylint: disable=broad-except
                 # Changing this error message requires updating CI script that checks for failed
                 # module loading.
                 logger.error("Error loading command module '%s'", mod)
                 logger.debug(traceback.format_exc())
-
-    _update_command_definitions(command_table)
+                can_index = False
+            command_owners.update((name, mod) for name in command_table
+                                  if name not in known_commands)
+            help_owners.update((key, mod) for key in helps if key not in known_helps)
+
+    # Registry overrides were already applied to commands returned by an earlier call
+    with phase('update command definitions'):
+        _update_command_definitions({name: command for name, command in command_table.items()
+                                     if command not in _updated_commands})
+    _updated_commands.update(command_table.values())
     ordered_commands = OrderedDict(command_table)
+
+    # Only index a table in which every command can be attributed to its command module
+    can_index = can_index and len(command_owners) == len(command_table)
+    if can_index and is_command_index_enabled() and not load_command_index():
+        logger.info('Saving command index for modules %s', INSTALLED_COMMAND_MODULE_VERSIONS)
+        with phase('save command index'):
+            CommandIndex.build(ordered_commands, command_owners, help_owners, helps,
+                               INSTALLED_COMMAND_MODULE_VERSIONS).save()
+        _pending_completion_index = ordered_commands
     return ordered_commands
 
+def save_pending_completion_index(command_table, global_actions, other_commands=None):
+    '''Save the completion index of a command table, if the command index has just been
+    built from it. `global_actions` are the argparse actions of the global arguments and
+    `other_commands` the commands the parser offers besides those of the table.
+    '''
+    global _pending_completion_index # pylint: disable=global-statement
+    if command_table is not _pending_completion_index:
+        return
+    _pending_completion_index = None
+    commands = OrderedDict(command_table)
+    for name, command in (other_commands or {}).items():
+        commands.setdefault(name, command)
+    with phase('save completion index'):
+        save_completion_index(build_completion_index(commands, global_actions,
+                                                     get_index_file_path()))
+
+def load_command_index():
+    '''Load the persisted command index.
+
+    Returns None if the index is disabled, missing or out of date with respect to the
+    installed command modules.
+    '''
+    if not is_command_index_enabled():
+        return None
+    index = CommandIndex.load()
+    if index and index.is_valid(INSTALLED_COMMAND_MODULE_VERSIONS):
+        return index
+    return None
+
 def register_cli_argument(scope, dest, arg_type=None, **kwargs):
     '''Specify CLI specific metadata for a given argument for a given scope.
     '''
@@ -203,12 +277,33 @@ def register_extra_cli_argument(command, dest, **kwargs):
     '''
     _cli_extra_argument_registry[command][dest] = CliCommandArgument(dest, **kwargs)
 
-def cli_command(name, operation, client_factory=None, transform=None, simple_output_query=None):
-    """ Registers a default Azure CLI command. These commands require no special parameters. """
+def cli_command(name, operation, client_factory=None, transform=None, simple_output_query=None,
+                query_filter_arguments=None, page_size_argument=None):
+    """ Registers a default Azure CLI command. These commands require no special parameters.
+
+    `query_filter_arguments` maps fields of the items the command lists to arguments that
+    make the server return only the items with a given value of that field (or a superset
+    of them). E.g. {'location': 'location'} lets --query "[?location=='westus']" be sent
+    to the server as the location argument.
+
+    `page_size_argument` names the argument that sets the number of items the server
+    returns per page (e.g. 'top' for $top), which --page-size sets.
+    """
     command_table[name] = create_command(name, operation, transform, simple_output_query,
-                                         client_factory)
+                                         client_factory, query_filter_arguments,
+                                         page_size_argument)
 
-def create_command(name, operation, transform_result, simple_output_query, client_factory):
+def create_command(name, operation, transform_result, simple_output_query, client_factory,
+                   query_filter_arguments=None, page_size_argument=None):
+
+    def _stream_items(paged):
+        # Further pages are requested while the result is written
+        try:
+            for item in paged:
+                yield item
+        except ClientException as client_exception:
+            message = getattr(client_exception, 'message', client_exception)
+            raise CLIError(message)
 
     def _execute_command(kwargs):
         client = client_factory(kwargs) if client_factory else None
@@ -222,7 +317,7 @@ def create_command(name, operation, transform_result, simple_output_query, clien
             if isinstance(result, AzureOperationPoller):
                 return LongRunningOperation('Starting {}'.format(name))(result)
             elif isinstance(result, Paged):
-                return list(result)
+                return ResultStream(_stream_items(result))
             else:
                 return result
         except ClientException as client_exception:
@@ -230,7 +325,10 @@ def create_command(name, operation, transform_result, simple_output_query, clien
             raise CLIError(message)
 
     name = ' '.join(name.split())
-    cmd = CliCommand(name, _execute_command, simple_output_query=simple_output_query)
+    cmd = CliCommand(name, _execute_command, simple_output_query=simple_output_query,
+                     query_filter_arguments=query_filter_arguments,
+                     page_size_argument=page_size_argument)
+    cmd.operation = operation
     cmd.arguments.update(extract_args_from_signature(operation))
     return cmd
 
@@ -241,34 +339,85 @@ def _get_cli_argument(command, argname):
 def _get_cli_extra_arguments(command):
     return _cli_extra_argument_registry[command].items()
 
+class _ScopeNode(object):
+
+    def __init__(self):
+        self.children = {}
+        self.arguments = {}
+
 class _ArgumentRegistry(object):
+    """Argument settings registered for command scopes.
+
+    Scopes are stored as a trie of their words. The settings resolved for each
+    (scope, dest) pair are cached, so resolving the arguments of a whole command table
+    merges the settings of every scope only once. Registering clears the cache.
+    """
 
     def __init__(self):
-        self.arguments = defaultdict(lambda: {})
+        self._root = _ScopeNode()
+        self._resolved = {}
 
     def register_cli_argument(self, scope, dest, argtype, **kwargs):
         argument = CliArgumentType(overrides=argtype,
                                    **kwargs)
-        self.arguments[scope][dest] = argument
+        node = self._root
+        for part in scope.split():
+            node = node.children.setdefault(part, _ScopeNode())
+        node.arguments[dest] = argument
+        self._resolved.clear()
 
     def get_cli_argument(self, command, name):
-        parts = command.split()
+        return self._get_argument(self._get_scope_path(command), name)
+
+    def get_cli_arguments(self, command, names):
+        """Yield (name, CliArgumentType) for several arguments of the same command."""
+        path = self._get_scope_path(command)
+        for name in names:
+            yield name, self._get_argument(path, name)
+
+    def _get_scope_path(self, command):
+        # Scopes registered along the command name, from the outermost (global) one
+        path = [self._root]
+        for part in command.split():
+            node = path[-1].children.get(part)
+            if node is None:
+                break
+            path.append(node)
+        return path
+
+    def _get_argument(self, path, name):
+        settings = self._resolved.get((path[-1], name))
+        if settings is None:
+            settings = self._resolve(path, name)
         result = CliArgumentType()
-        for index in range(0, len(parts) + 1):
-            probe = ' '.join(parts[0:index])
-            override = self.arguments.get(probe, {}).get(name, None)
-            if override:
-                result.update(override)
+        result.settings.update(settings)
         return result
 
+    def _resolve(self, path, name):
+        # The settings of a scope are those of its parent updated with its own
+        settings = {}
+        for node in path:
+            key = (node, name)
+            resolved = self._resolved.get(key)
+            if resolved is None:
+                override = node.arguments.get(name)
+                if override:
+                    settings = dict(settings)
+                    settings.update(override.settings)
+                self._resolved[key] = settings
+            else:
+                settings = resolved
+        return settings
+
 _cli_argument_registry = _ArgumentRegistry()
 _cli_extra_argument_registry = defaultdict(lambda: {})
 
 def _update_command_definitions(command_table_to_update):
     for command_name, command in command_table_to_update.items():
-        for argument_name in command.arguments:
-            overrides = _get_cli_argument(command_name, argument_name)
-            command.update_argument(argument_name, overrides)
+        for argument_name, overrides in _cli_argument_registry.get_cli_arguments(
+                command_name, list(command.arguments)):
+            if overrides.settings:
+                command.update_argument(argument_name, overrides)
 
         # Add any arguments explicitly registered for this command
         for argument_name, argument_definition in _get_cli_extra_arguments(command_name):
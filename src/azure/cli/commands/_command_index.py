@@ -0,0 +1,229 @@
+#---------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+#---------------------------------------------------------------------------------------------
+
+import json
+import os
+from codecs import open as codecs_open
+from collections import OrderedDict
+
+import azure.cli as cli
+import azure.cli._logging as _logging
+from azure.cli.commands._introspection import get_operation_path
+
+logger = _logging.get_az_logger(__name__)
+
+DISABLE_COMMAND_INDEX_VARIABLE_NAME = 'AZURE_CLI_DISABLE_COMMAND_INDEX'
+
+INDEX_FORMAT_VERSION = 4
+INDEX_FILE_NAME = 'commandIndex.json'
+
+_STRINGS = (str,)
+try:
+    _STRINGS = _STRINGS + (unicode,) # pylint: disable=undefined-variable
+except NameError:
+    pass
+_PRIMITIVES = _STRINGS + (int, float, bool, type(None))
+
+def get_index_file_path():
+    return os.path.join(os.path.expanduser('~/.azure'), INDEX_FILE_NAME)
+
+def is_command_index_enabled():
+    return not os.environ.get(DISABLE_COMMAND_INDEX_VARIABLE_NAME)
+
+def invalidate_command_index(file_path=None):
+    '''Remove the persisted index so it is rebuilt on the next full load of the command
+    modules. Call this after installing, upgrading or removing a command module.
+    '''
+    try:
+        os.remove(file_path or get_index_file_path())
+    except OSError:
+        pass
+
+def _is_serializable(value):
+    if isinstance(value, (list, tuple)):
+        return all(_is_serializable(v) for v in value)
+    if isinstance(value, dict):
+        return all(isinstance(k, _STRINGS) and _is_serializable(v) for k, v in value.items())
+    return isinstance(value, _PRIMITIVES)
+
+def _get_handler_path(command):
+    operation = getattr(command, 'operation', None)
+    if operation is None:
+        return None
+    return get_operation_path(operation)
+
+def _serialize_argument(argument):
+    options = {key: value for key, value in argument.options.items()
+               if key != 'dest' and _is_serializable(value)}
+    return {
+        'options_list': list(argument.options_list or []),
+        'options': options,
+        'id_part': argument.id_part if _is_serializable(argument.id_part) else None,
+        'completer': argument.completer is not None,
+        'validator': argument.validator is not None
+        }
+
+def _serialize_help(delimiters, text, module):
+    from azure.cli.help_files import _compile_help
+    entry = {'module': module, 'text': text}
+    try:
+        data = _compile_help(delimiters, text)
+    except Exception: # pylint: disable=broad-except
+        # Reported when the help is displayed
+        return entry
+    if _is_serializable(data):
+        entry['data'] = data
+    return entry
+
+class CommandIndex(object):
+    '''A serialized view of the command table.
+
+    Records, for every command, the command module that owns it, the import path of the
+    operation that backs it and its argument metadata after registry overrides have been
+    applied. This allows the owning module of a command to be found (and loaded) without
+    importing every installed command module. Help entries are stored parsed, so help can
+    be displayed without parsing their YAML again.
+    '''
+
+    def __init__(self, data):
+        self.data = data
+        self.commands = data.get('commands', {})
+        self.help = data.get('help', {})
+        self.groups = set()
+        for name in self.commands:
+            parts = name.split()
+            for length in range(1, len(parts)):
+                self.groups.add(' '.join(parts[:length]))
+
+    @classmethod
+    def build(cls, command_table, command_owners, help_owners, helps, module_versions):
+        commands = {}
+        for name, command in command_table.items():
+            commands[name] = {
+                'module': command_owners.get(name),
+                'handler': _get_handler_path(command),
+                'description': command.description
+                               if _is_serializable(command.description) else None,
+                'simple_output_query': command.simple_output_query
+                                       if _is_serializable(command.simple_output_query)
+                                       else None,
+                'query_filter_arguments': command.query_filter_arguments
+                                          if _is_serializable(command.query_filter_arguments)
+                                          else {},
+                'page_size_argument': command.page_size_argument,
+                'arguments': {dest: _serialize_argument(argument)
+                              for dest, argument in command.arguments.items()}
+                }
+        help_entries = {key: _serialize_help(key, helps[key], help_owners.get(key))
+                        for key in helps
+                        if _is_serializable(helps[key])}
+        return cls({
+            'formatVersion': INDEX_FORMAT_VERSION,
+            'cliVersion': cli.__version__,
+            'modules': dict(module_versions),
+            'commands': commands,
+            'help': help_entries
+            })
+
+    @classmethod
+    def load(cls, file_path=None):
+        file_path = file_path or get_index_file_path()
+        try:
+            with codecs_open(file_path, 'r', encoding='utf-8') as f:
+                return cls(json.load(f))
+        except (OSError, IOError, ValueError):
+            return None
+
+    def save(self, file_path=None):
+        file_path = file_path or get_index_file_path()
+        temp_path = '{}.{}.tmp'.format(file_path, os.getpid())
+        try:
+            with codecs_open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.data, f)
+            if os.path.exists(file_path):
+                os.remove(file_path)
+            os.rename(temp_path, file_path)
+        except (OSError, IOError) as ex:
+            logger.debug("Unable to save command index '%s': %s", file_path, ex)
+            invalidate_command_index(temp_path)
+
+    def is_valid(self, module_versions):
+        return (self.data.get('formatVersion') == INDEX_FORMAT_VERSION and
+                self.data.get('cliVersion') == cli.__version__ and
+                self.data.get('modules') == dict(module_versions))
+
+    def resolve_module(self, argv):
+        '''Find the command module that owns the command named on the command line.
+
+        Returns None if no indexed command or group matches, or if a matched group
+        spans several command modules.
+        '''
+        words = [a for a in argv if not a.startswith('-')]
+        for start in range(len(words)):
+            matched_command = None
+            matched_group = None
+            for end in range(start + 1, len(words) + 1):
+                name = ' '.join(words[start:end])
+                if name in self.commands:
+                    matched_command = name
+                elif name in self.groups:
+                    matched_group = name
+                else:
+                    break
+            if matched_command:
+                return self.commands[matched_command]['module']
+            if matched_group:
+                prefix = matched_group + ' '
+                owners = set(entry['module'] for name, entry in self.commands.items()
+                             if name.startswith(prefix))
+                return owners.pop() if len(owners) == 1 else None
+        return None
+
+    def register_help(self, module_name=None):
+        '''Register the indexed help entries (of one command module, if given) along with
+        their parsed content.
+        '''
+        from azure.cli.help_files import helps, _register_compiled_help
+
+        for key, entry in self.help.items():
+            if module_name and entry['module'] != module_name:
+                continue
+            if 'data' in entry:
+                _register_compiled_help(key, entry['text'], entry['data'])
+            else:
+                helps.setdefault(key, entry['text'])
+
+    def get_command_table(self):
+        '''Build a command table from the index without importing any command module.
+
+        Executing a command from this table imports the owning module and dispatches
+        to the real handler.
+        '''
+        from azure.cli.commands import CliCommand, CliCommandArgument
+
+        self.register_help()
+        table = OrderedDict()
+        for name in sorted(self.commands):
+            entry = self.commands[name]
+            command = CliCommand(name,
+                                 _create_indexed_handler(name, entry['module']),
+                                 description=entry['description'],
+                                 simple_output_query=entry['simple_output_query'],
+                                 query_filter_arguments=entry['query_filter_arguments'],
+                                 page_size_argument=entry['page_size_argument'])
+            for dest, argument in entry['arguments'].items():
+                command.arguments[dest] = CliCommandArgument(
+                    dest, options_list=argument['options_list'], id_part=argument['id_part'],
+                    **argument['options'])
+            table[name] = command
+        return table
+
+def _create_indexed_handler(command_name, module_name):
+    def _execute_command(kwargs):
+        from azure.cli.commands import get_command_table
+        logger.info("Loading module '%s' to execute indexed command '%s'",
+                    module_name, command_name)
+        return get_command_table(module_name)[command_name].handler(kwargs)
+    return _execute_command
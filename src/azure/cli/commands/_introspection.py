@@ -5,6 +5,8 @@
 
 import inspect
 import re
+import sys
+import zlib
 
 def _option_descriptions(operation):
     """Pull out parameter help from doccomments of the command
@@ -41,9 +43,82 @@ def _option_descriptions(operation):
 EXCLUDED_PARAMS = frozenset(['self', 'raw', 'custom_headers', 'operation_config',
                              'content_version', 'kwargs', 'client'])
 
+# Argument metadata extracted at build time by scripts/sdk_command_gen/gen_signatures.py,
+# keyed by operation path ('module#Class.method')
+_precomputed_signatures = {}
+
+def register_signatures(signatures):
+    """ Registers precomputed argument metadata for operations. Command modules do this
+    before defining their commands. """
+    _precomputed_signatures.update(signatures)
+
+def get_operation_path(operation):
+    name = getattr(operation, '__qualname__', None)
+    if name is None:
+        name = getattr(operation, '__name__', None)
+        owner = getattr(operation, 'im_class', None)
+        if name and owner:
+            # python2 unbound methods don't have __qualname__
+            name = '{}.{}'.format(owner.__name__, name)
+    module = getattr(operation, '__module__', None)
+    return '{}#{}'.format(module, name) if module and name else None
+
+def get_operation_version(operation):
+    """ Version of the package an operation is defined in, e.g. the version of its SDK.
+    Only packages that are already imported are considered. """
+    parts = (getattr(operation, '__module__', None) or '').split('.')
+    while parts:
+        module = sys.modules.get('.'.join(parts))
+        version = getattr(module, 'VERSION', None) or getattr(module, '__version__', None)
+        if version:
+            return str(version)
+        parts.pop()
+    return None
+
+def get_operation_parameters(operation):
+    """ Parameter names and default values of an operation, read without inspecting
+    its signature. """
+    func = getattr(operation, '__func__', operation)
+    code = getattr(func, '__code__', None)
+    if code is None:
+        return None
+    return {'names': list(code.co_varnames[:code.co_argcount]),
+            'defaults': list(getattr(func, '__defaults__', None) or [])}
+
+def get_operation_doc_hash(operation):
+    """ Checksum of the docstring of an operation, which the help of its arguments is
+    extracted from. """
+    doc = getattr(operation, '__doc__', None)
+    if doc is None:
+        return None
+    if not isinstance(doc, bytes):
+        doc = doc.encode('utf-8')
+    return '{:08x}'.format(zlib.crc32(doc) & 0xffffffff)
+
+def _get_precomputed_arguments(operation):
+    signature = _precomputed_signatures.get(get_operation_path(operation))
+    if (signature is None or
+            signature['version'] != get_operation_version(operation) or
+            signature['parameters'] != get_operation_parameters(operation) or
+            signature.get('doc') != get_operation_doc_hash(operation)):
+        return None
+    return signature['arguments']
+
 def extract_args_from_signature(operation):
-    """ Extracts basic argument data from an operation's signature and docstring """
+    """ Extracts basic argument data from an operation's signature and docstring.
+    Uses the metadata precomputed for the operation when it is still current. """
     from azure.cli.commands import CliCommandArgument
+    arguments = _get_precomputed_arguments(operation)
+    if arguments is None:
+        arguments = _introspect_arguments(operation)
+    for arg_name, settings in arguments:
+        yield (arg_name, CliCommandArgument(arg_name,
+                                            options_list=['--' + arg_name.replace('_', '-')],
+                                            **settings))
+
+def _introspect_arguments(operation):
+    """ Yields the name and settings of every argument of an operation, from its signature
+    and docstring """
     args = []
     try:
         # only supported in python3 - falling back to argspec if not available
@@ -75,10 +150,8 @@ def extract_args_from_signature(operation):
         except AttributeError:
             pass
 
-        yield (arg_name, CliCommandArgument(arg_name,
-                                            options_list=['--' + arg_name.replace('_', '-')],
-                                            required=required,
-                                            default=default,
-                                            help=arg_docstring_help.get(arg_name),
-                                            action=action))
+        yield (arg_name, {'required': required,
+                          'default': default,
+                          'help': arg_docstring_help.get(arg_name),
+                          'action': action})
 
@@ -3,7 +3,10 @@
 # Licensed under the MIT License. See License.txt in the project root for license information.
 #---------------------------------------------------------------------------------------------
 
-from .._profile import Profile
+import threading
+
+from .._http import configure_service_client, create_session
+from .._profile import Profile, get_shared_creds_cache
 import azure.cli._debug as _debug
 import azure.cli as cli
 import azure.cli._logging as _logging
@@ -11,6 +14,10 @@ from azure.cli.application import APPLICATION
 
 logger = _logging.get_az_logger(__name__)
 
+# Management clients created by each thread, which set the headers of the command the
+# thread executes
+_thread_state = threading.local()
+
 def get_mgmt_service_client(client_type):
     client, _ = _get_mgmt_service_client(client_type)
     return client
@@ -23,6 +30,10 @@ def configure_common_settings(client):
 
     client.config.add_user_agent("AZURECLI/{}".format(cli.__version__))
 
+    configure_service_client(client)
+    _configure_command_settings(client)
+
+def _configure_command_settings(client):
     for header, value in APPLICATION.session['headers'].items():
         # We are working with the autorest team to expose the add_header
         # functionality of the generated client to avoid having to access
@@ -37,14 +48,28 @@ def configure_common_settings(client):
 
 def _get_mgmt_service_client(client_type, subscription_bound=True):
     logger.info('Getting management service client client_type=%s', client_type.__name__)
-    profile = Profile()
+    profile = Profile(creds_cache=get_shared_creds_cache())
     cred, subscription_id, _ = profile.get_login_credentials()
+
+    # Clients are reused while the credentials of the account they were created for are
+    # current, i.e. until login, logout, 'account set' or a change of the token file
+    clients = getattr(_thread_state, 'clients', None)
+    if clients is None:
+        clients = _thread_state.clients = {}
+    key = (client_type, subscription_bound, subscription_id,
+           _debug.should_disable_connection_verify())
+    client_cred, client = clients.get(key, (None, None))
+    if client_cred is cred:
+        _configure_command_settings(client)
+        return (client, subscription_id)
+
     if subscription_bound:
         client = client_type(cred, subscription_id)
     else:
         client = client_type(cred)
 
     configure_common_settings(client)
+    clients[key] = (cred, client)
 
     return (client, subscription_id)
 
@@ -54,11 +79,12 @@ def get_data_service_client(service_type, account_name, account_key, connection_
     client = service_type(account_name=account_name,
                           account_key=account_key,
                           connection_string=connection_string,
-                          sas_token=sas_token)
+                          sas_token=sas_token,
+                          request_session=create_session())
     # TODO: enable Fiddler and user agent (task #115270703, #115270881)
     return client
 
 def get_subscription_id():
-    profile = Profile()
+    profile = Profile(creds_cache=get_shared_creds_cache())
     _, subscription_id, _ = profile.get_login_credentials()
     return subscription_id
@@ -4,8 +4,10 @@
 #---------------------------------------------------------------------------------------------
 
 from .query import register as register_query
+from .paging import register as register_paging
 from .transform import register as register_transform
 
 def register_extensions(application):
     register_query(application)
+    register_paging(application)
     register_transform(application)
@@ -0,0 +1,70 @@
+#---------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+#---------------------------------------------------------------------------------------------
+
+from itertools import islice
+
+from azure.cli._util import ResultStream
+import azure.cli._logging as _logging
+
+logger = _logging.get_az_logger(__name__)
+
+def positive_int_type(value):
+    '''Parse a number of items. Raises ValueError, which argparse reports, if it isn't
+       a positive integer.
+    '''
+    number = int(value)
+    if number < 1:
+        raise ValueError
+    return number
+
+def limit_result(result, max_items):
+    '''Return the first max_items items of a list result. The items of a stream after
+       those aren't read, so further pages of a Paged result aren't requested.
+    '''
+    if isinstance(result, ResultStream):
+        return ResultStream(islice(result, max_items))
+    if isinstance(result, list):
+        return result[:max_items]
+    return result
+
+def _register_global_parameters(global_group):
+    positive_int_type.__name__ = 'number'
+    global_group.add_argument('--max-items', dest='_max_items', metavar='N',
+                              type=positive_int_type,
+                              help='Maximum number of items to list. Further pages are not '\
+                                   'requested once they are listed. --query is applied to '\
+                                   'the items listed.')
+    global_group.add_argument('--page-size', dest='_page_size', metavar='N',
+                              type=positive_int_type,
+                              help='Number of items to request per page, for commands that '\
+                                   'support it.')
+
+def register(application):
+    def handle_paging_parameters(**kwargs):
+        args = kwargs['args']
+        max_items = args._max_items # pylint: disable=protected-access
+        page_size = args._page_size # pylint: disable=protected-access
+        del args._max_items
+        del args._page_size
+        application.session['max_items'] = max_items
+        if page_size:
+            command = kwargs.get('command_metadata')
+            dest = getattr(command, 'page_size_argument', None)
+            if not dest:
+                logger.warning("'%s' doesn't support --page-size, which is ignored.",
+                               kwargs['command'])
+            elif getattr(args, dest, None) is None:
+                setattr(args, dest, page_size)
+
+    def limit_output(**kwargs):
+        max_items = application.session.pop('max_items', None)
+        if max_items:
+            kwargs['event_data']['result'] = limit_result(kwargs['event_data']['result'],
+                                                          max_items)
+
+    application.register(application.GLOBAL_PARSER_CREATED, _register_global_parameters)
+    application.register(application.COMMAND_PARSER_PARSED, handle_paging_parameters)
+    # Registered before the transform extension, so only the items listed are transformed
+    application.register(application.TRANSFORM_RESULT, limit_output)
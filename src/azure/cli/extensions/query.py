@@ -5,6 +5,34 @@
 
 import collections
 
+from six import string_types
+
+from azure.cli._util import ResultStream
+import azure.cli._logging as _logging
+
+logger = _logging.get_az_logger(__name__)
+
+# Arguments every command has, which don't filter its result
+_COMMON_DESTS = ('func', 'command', 'subcommand')
+
+# Expressions and functions whose value doesn't depend on fields they don't read. Others
+# (e.g. '*', length(@), keys(@)) see every field of an object.
+_FIELD_WISE_NODE_TYPES = frozenset([
+    'and_expression', 'comparator', 'current', 'expref', 'field', 'filter_projection',
+    'flatten', 'function_expression', 'identity', 'index', 'index_expression',
+    'key_val_pair', 'literal', 'multi_select_dict', 'multi_select_list', 'not_expression',
+    'or_expression', 'pipe', 'projection', 'slice', 'subexpression'])
+_FIELD_WISE_FUNCTIONS = frozenset([
+    'abs', 'avg', 'ceil', 'contains', 'ends_with', 'floor', 'join', 'map', 'max', 'max_by',
+    'min', 'min_by', 'not_null', 'reverse', 'sort', 'sort_by', 'starts_with', 'sum',
+    'to_array', 'to_number', 'type'])
+
+class QueryResultDict(collections.OrderedDict):
+    '''Objects created by the query (e.g. by '{name: name}'), as opposed to objects of the
+       result it selects.
+    '''
+    pass
+
 def jmespath_type(raw_query):
     '''Compile the query with JMESPath and return the compiled result.
        JMESPath raises exceptions which subclass from ValueError.
@@ -18,6 +46,98 @@ def jmespath_type(raw_query):
         # Raise a ValueError which argparse can handle
         raise ValueError
 
+def is_item_wise(query_expression):
+    '''Whether the query applied to a list gives the concatenation of the query applied
+       to each item as a single item list, e.g. '[].name' or '[?type=='x']'. Such queries
+       can be applied to the items of a stream as they arrive.
+    '''
+    node = query_expression.parsed
+    if node['type'] not in ('projection', 'filter_projection'):
+        return False
+    source = node['children'][0]
+    if source['type'] == 'flatten':
+        source = source['children'][0]
+    return source['type'] == 'identity'
+
+def is_independent_of_fields(query_expression, fields):
+    '''Whether the query gives the same result whether or not the given fields are added
+       to the objects it is applied to, other than in the objects it selects, e.g. '[].name'
+       but not '[?resourceGroup=='x']' or '[].length(@)'. Fields such queries don't read
+       only have to be added to the objects of their result.
+    '''
+    pending = [query_expression.parsed]
+    while pending:
+        node = pending.pop()
+        node_type = node['type']
+        if node_type not in _FIELD_WISE_NODE_TYPES or \
+                (node_type == 'field' and node['value'] in fields) or \
+                (node_type == 'function_expression' and
+                 node['value'] not in _FIELD_WISE_FUNCTIONS) or \
+                (node_type == 'literal' and isinstance(node['value'], (dict, list))):
+            return False
+        # The children of slices are their optional start, stop and step
+        pending.extend(child for child in node['children'] if isinstance(child, dict))
+    return True
+
+def _get_field_path(node):
+    if node['type'] == 'field':
+        return node['value']
+    if node['type'] == 'subexpression':
+        paths = [_get_field_path(child) for child in node['children']]
+        return None if None in paths else '.'.join(paths)
+    return None
+
+def _collect_equality_conditions(node, conditions):
+    if node['type'] == 'and_expression':
+        for child in node['children']:
+            _collect_equality_conditions(child, conditions)
+    elif node['type'] == 'comparator' and node['value'] == 'eq':
+        for field, literal in (node['children'], reversed(node['children'])):
+            path = _get_field_path(field)
+            if path and literal['type'] == 'literal' and \
+                    isinstance(literal['value'], string_types):
+                conditions.setdefault(path, set()).add(literal['value'])
+
+def get_query_filters(query_expression):
+    '''Return the values fields must have for an item of a list to be selected by the
+       query, e.g. {'location': 'westus'} for "[?location=='westus'].name". Only the
+       conditions of a filter applied to the whole list are returned; conditions joined
+       by || and other expressions are left to the query.
+    '''
+    node = query_expression.parsed
+    while node['type'] == 'pipe':
+        node = node['children'][0]
+    if node['type'] != 'filter_projection' or node['children'][0]['type'] != 'identity':
+        return {}
+    conditions = {}
+    _collect_equality_conditions(node['children'][2], conditions)
+    return {path: values.pop() for path, values in conditions.items() if len(values) == 1}
+
+def push_down_query_filters(query_expression, args, command):
+    '''Set the arguments of the command that filter its result on the server to the
+       values the query selects, so fewer items are transferred and converted. The query
+       is still applied to the result, so the server only has to return a superset of the
+       selected items. Arguments given on the command line are left unchanged, and filters
+       are only pushed down if no other argument was given, as the server may not support
+       combining them.
+    '''
+    query_filter_arguments = getattr(command, 'query_filter_arguments', None)
+    if not query_filter_arguments:
+        return
+    parser = getattr(args, '_parser', None)
+    given = [dest for dest, value in vars(args).items()
+             if not dest.startswith('_') and dest not in _COMMON_DESTS and
+             (parser is None or value != parser.get_default(dest))]
+    if any(dest not in query_filter_arguments.values() for dest in given):
+        return
+    for path, value in get_query_filters(query_expression).items():
+        dest = query_filter_arguments.get(path)
+        # The values are quoted in OData filters without escaping
+        if dest and getattr(args, dest, None) is None and "'" not in value:
+            logger.info("Filtering the result of '%s' on the server with %s=%s",
+                        command.name, dest, value)
+            setattr(args, dest, value)
+
 def _register_global_parameter(global_group):
     # Argparse uses __name__ of the function used for 'type' when generating error message.
     # We set __name__ for our function here.
@@ -34,14 +154,26 @@ def register(application):
         query_expression = args._jmespath_query # pylint: disable=protected-access
         del args._jmespath_query
         if query_expression:
-            def filter_output(**kwargs):
-                from jmespath import search, Options
-                kwargs['event_data']['result'] = query_expression.search(
-                    kwargs['event_data']['result'], Options(collections.OrderedDict))
-                application.remove(application.FILTER_RESULT, filter_output)
-            application.register(application.FILTER_RESULT, filter_output)
+            # Kept in the session as commands may be executed concurrently
+            application.session['query_expression'] = query_expression
             application.session['query_active'] = True
+            command = kwargs.get('command_metadata')
+            if command:
+                push_down_query_filters(query_expression, args, command)
+
+    def filter_output(**kwargs):
+        from jmespath import Options
+        query_expression = application.session.pop('query_expression', None)
+        if query_expression:
+            result = kwargs['event_data']['result']
+            options = Options(QueryResultDict)
+            if isinstance(result, ResultStream) and is_item_wise(query_expression):
+                kwargs['event_data']['result'] = result.expand(
+                    lambda item: query_expression.search([item], options))
+            else:
+                kwargs['event_data']['result'] = query_expression.search(
+                    ResultStream.materialize(result), options)
 
     application.register(application.GLOBAL_PARSER_CREATED, _register_global_parameter)
     application.register(application.COMMAND_PARSER_PARSED, handle_query_parameter)
-
+    application.register(application.FILTER_RESULT, filter_output)
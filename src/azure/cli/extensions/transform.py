@@ -3,14 +3,34 @@
 # Licensed under the MIT License. See License.txt in the project root for license information.
 #---------------------------------------------------------------------------------------------
 
-import re
+from six import string_types
+
+from azure.cli._util import ResultStream
+from azure.cli.extensions.query import QueryResultDict, is_independent_of_fields
+
+# Fields added to the objects of a result, which a query may read
+_ADDED_FIELDS = ('resourceGroup',)
 
 def register(application):
-    application.register(application.TRANSFORM_RESULT, _resource_group_transform)
+    def _transform_result(**kwargs):
+        query_expression = application.session.get('query_expression')
+        if query_expression and is_independent_of_fields(query_expression, _ADDED_FIELDS):
+            # Only the objects the query selects are transformed, once it is applied
+            application.session['transform_deferred'] = True
+        else:
+            _resource_group_transform(**kwargs)
+
+    def _transform_query_result(**kwargs):
+        if application.session.pop('transform_deferred', False):
+            _resource_group_transform(skip_type=QueryResultDict, **kwargs)
+
+    application.register(application.TRANSFORM_RESULT, _transform_result)
+    # Registered after the query extension, so this runs after the query is applied
+    application.register(application.FILTER_RESULT, _transform_query_result)
 
 def _parse_id(strid):
     parsed = {}
-    parts = re.split('/', strid)
+    parts = strid.split('/')
     if parts[3] != 'resourceGroups':
         raise KeyError()
 
@@ -18,20 +38,42 @@ def _parse_id(strid):
     parsed['name'] = parts[8]
     return parsed
 
-def _add_resource_group(obj):
-    if isinstance(obj, list):
-        for array_item in obj:
-            _add_resource_group(array_item)
-    elif isinstance(obj, dict):
-        try:
-            if 'resourceGroup' not in obj:
-                if obj['id']:
-                    obj['resourceGroup'] = _parse_id(obj['id'])['resource-group']
-        except (KeyError, IndexError):
-            pass
-        for item_key in obj:
-            _add_resource_group(obj[item_key])
+def _get_resource_group(resource_id):
+    '''The resource group _parse_id would return, or None, without splitting the whole id.'''
+    parts = resource_id.split('/', 5)
+    if len(parts) == 6 and parts[3] == 'resourceGroups' and parts[5].count('/') >= 3:
+        return parts[4]
+    return None
 
-def _resource_group_transform(**kwargs):
-    _add_resource_group(kwargs['event_data']['result'])
+def _add_resource_group(obj, skip_type=None):
+    '''Add the resource group in the id of every object in obj that has none. Objects of
+       skip_type are searched but not changed.
+    '''
+    skip_type = skip_type or ()
+    pending = [obj] if isinstance(obj, (dict, list)) else []
+    while pending:
+        obj = pending.pop()
+        if isinstance(obj, dict):
+            if 'resourceGroup' not in obj:
+                resource_id = obj.get('id')
+                if resource_id and isinstance(resource_id, string_types) and \
+                        not isinstance(obj, skip_type):
+                    resource_group = _get_resource_group(resource_id)
+                    if resource_group is not None:
+                        obj['resourceGroup'] = resource_group
+            values = obj.values()
+        else:
+            values = obj
+        for value in values:
+            if isinstance(value, (dict, list)):
+                pending.append(value)
 
+def _resource_group_transform(skip_type=None, **kwargs):
+    result = kwargs['event_data']['result']
+    if isinstance(result, ResultStream):
+        def _add_resource_group_to_item(item):
+            _add_resource_group(item, skip_type)
+            return item
+        kwargs['event_data']['result'] = result.map(_add_resource_group_to_item)
+    else:
+        _add_resource_group(result, skip_type)
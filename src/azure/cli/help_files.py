@@ -3,13 +3,31 @@
 # Licensed under the MIT License. See License.txt in the project root for license information.
 #---------------------------------------------------------------------------------------------
 
-import yaml
-
 # modules should add entries to helps in the form: "group command": "YAML help"
 helps = {}
 
+# delimiters -> (YAML help, parsed help) for the entries that have been parsed, either in
+# this process or when the command index was built
+_compiled_helps = {}
+
+def _compile_help(delimiters, text):
+    compiled = _compiled_helps.get(delimiters)
+    if compiled is None or compiled[0] != text:
+        import yaml
+        compiled = (text, yaml.load(text))
+        _compiled_helps[delimiters] = compiled
+    return compiled[1]
+
+def _register_compiled_help(delimiters, text, data):
+    '''Add a help entry along with its parsed content, unless a command module has
+    registered the entry already.
+    '''
+    if helps.setdefault(delimiters, text) == text:
+        _compiled_helps[delimiters] = (text, data)
+
 def _load_help_file(delimiters):
+    '''Return the parsed help entry. The result is shared and must not be modified.'''
     if delimiters in helps:
-        return yaml.load(helps[delimiters])
+        return _compile_help(delimiters, helps[delimiters])
     else:
         return None
@@ -8,8 +8,12 @@ import sys
 
 from azure.cli.application import APPLICATION, Configuration
 import azure.cli._logging as _logging
+from ._batch import run_batch
+from ._daemon import find_command, run_daemon_command
+from ._http import counters as http_counters
 from ._session import Session
-from ._output import OutputProducer
+from ._output import OutputProducer, open_output_file
+from ._profiling import PROFILE_STARTUP_ARGUMENT, phase, start_profiling, stop_profiling
 from ._util import CLIError, show_version_info_exit
 
 logger = _logging.get_az_logger(__name__)
@@ -24,6 +28,16 @@ CONFIG = Session()
 # SESSION provides read-write session variables
 SESSION = Session()
 
+def flush_sessions():
+    '''Save the changes to the account, configuration and session files, which are saved
+    when the process exits otherwise.
+    '''
+    for session in (ACCOUNT, CONFIG, SESSION):
+        try:
+            session.flush()
+        except (OSError, IOError) as ex:
+            logger.warning("Unable to save '%s': %s", session.filename, ex)
+
 def _handle_exception(ex):
     #For error code, follow guidelines at https://docs.python.org/2/library/sys.html#sys.exit,
     if isinstance(ex, CLIError):
@@ -35,30 +49,77 @@ def _handle_exception(ex):
         logger.exception(ex)
         return 1
 
+def _write_output(cmd_result, file): #pylint: disable=redefined-builtin
+    # Commands can return a dictionary/list of results
+    # If they do, we print the results.
+    if cmd_result and cmd_result.result:
+        formatter = OutputProducer.get_formatter(APPLICATION.configuration.output_format)
+        OutputProducer(formatter=formatter, file=file).out(cmd_result)
+
 def main(args, file=sys.stdout): #pylint: disable=redefined-builtin
-    _logging.configure_logging(args)
+    if PROFILE_STARTUP_ARGUMENT not in args:
+        return _main(args, file)
+    start_profiling()
+    try:
+        return _main([a for a in args if a != PROFILE_STARTUP_ARGUMENT], file)
+    finally:
+        stop_profiling()
+
+def _main(args, file): #pylint: disable=redefined-builtin
+    with phase('configure logging'):
+        _logging.configure_logging(args)
 
     if len(args) > 0 and args[0] == '--version':
         show_version_info_exit(file)
 
+    # Commands of the CLI itself, which don't need the command table. Global arguments
+    # may precede them.
+    command_index = find_command(args)
+    command = args[command_index] if command_index is not None else None
+    if command == 'daemon':
+        return run_daemon_command(args[command_index + 1:])
+
     azure_folder = os.path.expanduser('~/.azure')
     if not os.path.exists(azure_folder):
         os.makedirs(azure_folder)
-    ACCOUNT.load(os.path.join(azure_folder, 'azureProfile.json'))
-    CONFIG.load(os.path.join(azure_folder, 'az.json'))
-    SESSION.load(os.path.join(azure_folder, 'az.sess'), max_age=3600)
+    with phase('load azureProfile.json'):
+        ACCOUNT.load(os.path.join(azure_folder, 'azureProfile.json'))
+    with phase('load az.json'):
+        CONFIG.load(os.path.join(azure_folder, 'az.json'))
+    with phase('load az.sess'):
+        SESSION.load(os.path.join(azure_folder, 'az.sess'), max_age=3600)
+
+    if command == 'batch':
+        try:
+            return run_batch(args[command_index + 1:], file)
+        except CLIError as ex:
+            return _handle_exception(ex)
 
     config = Configuration(args)
     APPLICATION.initialize(config)
 
+    opened, requests = http_counters.snapshot()
     try:
-        cmd_result = APPLICATION.execute(args)
-        # Commands can return a dictionary/list of results
-        # If they do, we print the results.
-        if cmd_result and cmd_result.result:
-            formatter = OutputProducer.get_formatter(APPLICATION.configuration.output_format)
-            OutputProducer(formatter=formatter, file=file).out(cmd_result)
+        with phase('execute command'):
+            cmd_result = APPLICATION.execute(args)
+        output_file_path = APPLICATION.configuration.output_file
+        if output_file_path:
+            # The file is created even if there is no output, as by a shell redirection
+            with phase('format output'), open_output_file(output_file_path) as output_file:
+                _write_output(cmd_result, output_file)
+        else:
+            with phase('format output'):
+                _write_output(cmd_result, file)
     except Exception as ex: # pylint: disable=broad-except
         error_code = _handle_exception(ex)
         return error_code
+    finally:
+        _log_http_connections(opened, requests)
+
+def _log_http_connections(opened_before, requests_before):
+    opened, requests = http_counters.snapshot()
+    opened, requests = opened - opened_before, requests - requests_before
+    if requests:
+        logger.debug('HTTP connections: %s opened, %s reused for %s requests',
+                     opened, max(requests - opened, 0), requests)
 
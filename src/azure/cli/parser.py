@@ -4,6 +4,7 @@
 #---------------------------------------------------------------------------------------------
 
 import argparse
+import threading
 import argcomplete
 import azure.cli._help as _help
 from azure.cli._util import CLIError
@@ -30,6 +31,77 @@ def enable_autocomplete(parser):
     argcomplete.autocomplete = EmptyDefaultCompletionFinder()
     argcomplete.autocomplete(parser, validator=lambda c, p: c.lower().startswith(p.lower()))
 
+class _LazyParserMap(dict):
+    """Maps names to parsers, creating each parser from a factory the first time
+    it is looked up.
+
+    Parsers may be looked up concurrently (e.g. by 'az batch'), so lookups wait while
+    another thread creates a parser.
+    """
+    def __init__(self):
+        super(_LazyParserMap, self).__init__()
+        self._factories = {}
+        self._lock = threading.RLock()
+
+    def add_factory(self, name, factory):
+        with self._lock:
+            self._factories[name] = factory
+            dict.__setitem__(self, name, None)
+
+    def _materialize(self, name):
+        if name not in self._factories:
+            return
+        with self._lock:
+            factory = self._factories.get(name)
+            if factory:
+                # argparse refuses to add a parser under a name that is in use, so the
+                # name is missing until the factory registers the real parser. Other
+                # threads don't notice, as they wait for the lock to look it up.
+                dict.__delitem__(self, name)
+                factory()
+                del self._factories[name]
+
+    def __contains__(self, name):
+        with self._lock:
+            return dict.__contains__(self, name)
+
+    def __iter__(self):
+        with self._lock:
+            return iter(list(dict.__iter__(self)))
+
+    def keys(self):
+        with self._lock:
+            return list(dict.keys(self))
+
+    def __getitem__(self, name):
+        self._materialize(name)
+        return dict.__getitem__(self, name)
+
+    def get(self, name, default=None):
+        return self[name] if name in self else default
+
+    def values(self):
+        for name in list(self._factories):
+            self._materialize(name)
+        return dict.values(self)
+
+    def items(self):
+        for name in list(self._factories):
+            self._materialize(name)
+        return dict.items(self)
+
+class _LazySubParsersAction(argparse._SubParsersAction): # pylint: disable=protected-access
+    """Subparsers action that supports parsers which are only built when the command
+    line descends into them (or help/completion needs to enumerate them).
+    """
+    def __init__(self, *args, **kwargs):
+        super(_LazySubParsersAction, self).__init__(*args, **kwargs)
+        self._name_parser_map = _LazyParserMap()
+        self.choices = self._name_parser_map
+
+    def add_lazy_parser(self, name, factory):
+        self._name_parser_map.add_factory(name, factory)
+
 class AzCliCommandParser(argparse.ArgumentParser):
     """ArgumentParser implementation specialized for the
     Azure CLI utility.
@@ -38,10 +110,17 @@ class AzCliCommandParser(argparse.ArgumentParser):
         self.subparsers = {}
         self.parents = kwargs.get('parents', [])
         self.help_file = kwargs.pop('help_file', None)
+        self._command_metadata = {}
         super(AzCliCommandParser, self).__init__(**kwargs)
+        self.register('action', 'parsers', _LazySubParsersAction)
 
     def load_command_table(self, command_table):
         """Load a command table into our parser.
+
+        Only the group structure is built here. The parser for each command (with its
+        arguments, validators and completers) is created when it is first needed.
+        Commands already loaded from the same metadata are skipped, so a long-running
+        process can load its command table again for every command it executes.
         """
         # If we haven't already added a subparser, we
         # better do it.
@@ -51,11 +130,21 @@ class AzCliCommandParser(argparse.ArgumentParser):
             self.subparsers = {(): sp}
 
         for command_name, metadata in command_table.items():
+            # The parser binds the handler, which may have been replaced since
+            loaded = self._command_metadata.get(command_name)
+            if loaded and loaded[0] is metadata and loaded[1] is metadata.handler:
+                continue
+            self._command_metadata[command_name] = (metadata, metadata.handler)
             subparser = self._get_subparser(command_name.split())
+            subparser.add_lazy_parser(command_name.split()[-1],
+                                      self._command_parser_factory(subparser,
+                                                                   command_name,
+                                                                   metadata))
+        enable_autocomplete(self)
+
+    def _command_parser_factory(self, subparser, command_name, metadata):
+        def _create_command_parser():
             command_verb = command_name.split()[-1]
-            # To work around http://bugs.python.org/issue9253, we artificially add any new
-            # parsers we add to the "choices" section of the subparser.
-            subparser.choices[command_verb] = command_verb
             command_parser = subparser.add_parser(command_verb,
                                                   description=metadata.description,
                                                   parents=self.parents, conflict_handler='error',
@@ -73,7 +162,8 @@ class AzCliCommandParser(argparse.ArgumentParser):
                                         command=command_name,
                                         _validators=argument_validators,
                                         _parser=command_parser)
-        enable_autocomplete(self)
+            return command_parser
+        return _create_command_parser
 
     def _get_subparser(self, path):
         """For each part of the path, walk down the tree of
@@ -5,7 +5,9 @@
 
 import unittest
 from six import StringIO
-from azure.cli.extensions.transform import _parse_id, _add_resource_group
+from azure.cli.extensions.query import QueryResultDict
+from azure.cli.extensions.transform import (_parse_id, _add_resource_group,
+                                           _get_resource_group)
 
 class TestResourceGroupTransform(unittest.TestCase):
 
@@ -79,5 +81,40 @@ class TestResourceGroupTransform(unittest.TestCase):
             })
 
 
+    def test_get_resource_group_as_parsed(self):
+        for resource_id in (TestResourceGroupTransform.CORRECT_ID,
+                            TestResourceGroupTransform.NON_RG_ID,
+                            TestResourceGroupTransform.BOGUS_ID,
+                            '/subscriptions/sub/resourceGroups/rg/providers/p/t',
+                            '/subscriptions/sub/resourceGroups/rg/providers/p/t/n',
+                            '/subscriptions/sub/resourceGroups'):
+            try:
+                expected = _parse_id(resource_id)['resource-group']
+            except (KeyError, IndexError):
+                expected = None
+            self.assertEqual(_get_resource_group(resource_id), expected, resource_id)
+
+    def test_add_nested_resourcegroup_ids(self):
+        nic = {
+            'id': TestResourceGroupTransform.CORRECT_ID,
+            'ipConfigurations': [{'id': TestResourceGroupTransform.CORRECT_ID,
+                                  'subnet': {'id': TestResourceGroupTransform.CORRECT_ID}}],
+            'tags': {'id': None}
+            }
+        _add_resource_group([[nic], nic])
+        self.assertEqual(nic['resourceGroup'], 'REsourceGROUPname')
+        self.assertEqual(nic['ipConfigurations'][0]['resourceGroup'], 'REsourceGROUPname')
+        self.assertEqual(nic['ipConfigurations'][0]['subnet']['resourceGroup'],
+                         'REsourceGROUPname')
+        self.assertDictEqual(nic['tags'], {'id': None})
+
+    def test_skip_objects_of_type(self):
+        selected = {'id': TestResourceGroupTransform.CORRECT_ID}
+        created = QueryResultDict([('id', TestResourceGroupTransform.CORRECT_ID),
+                                   ('vm', selected)])
+        _add_resource_group([created], skip_type=QueryResultDict)
+        self.assertNotIn('resourceGroup', created)
+        self.assertEqual(selected['resourceGroup'], 'REsourceGROUPname')
+
 if __name__ == '__main__':
     unittest.main()
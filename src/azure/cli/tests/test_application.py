@@ -9,6 +9,7 @@ from six import StringIO
 
 from azure.cli.application import Application, Configuration, IterateAction
 from azure.cli.commands import CliCommand
+from azure.cli._util import ResultStream
 
 class TestApplication(unittest.TestCase):
 
@@ -79,6 +80,120 @@ class TestApplication(unittest.TestCase):
         self.assertEqual(hellos[0]['something'], 'else')
         self.assertEqual(hellos[1]['hello'], 'sir')
         self.assertEqual(hellos[1]['something'], 'else')
+    def test_streamed_result(self):
+        received = []
+
+        def _items():
+            for i in range(3):
+                received.append(i)
+                yield {'id': '/subscriptions/sub/resourceGroups/rg{}/providers/p/t/n'.format(i),
+                       'index': i}
+
+        command = CliCommand('test command', lambda args: ResultStream(_items()))
+        cmd_table = {'test command': command}
+
+        argv = 'az test command --query [?index>`0`].resourceGroup'.split()
+        config = Configuration(argv)
+        config.get_command_table = lambda: cmd_table
+        application = Application(config)
+        result = application.execute(argv[1:]).result
+
+        self.assertIsInstance(result, ResultStream)
+        self.assertEqual(received, [])
+        self.assertEqual(list(result), ['rg1', 'rg2'])
+        self.assertEqual(received, [0, 1, 2])
+    def test_query_filters_pushed_down(self):
+        calls = []
+
+        def handler(args):
+            calls.append(args)
+            return [{'location': 'westus', 'name': 'a'}, {'location': 'eastus', 'name': 'b'}]
+
+        command = CliCommand('test list', handler,
+                             query_filter_arguments={'location': 'location', 'name': 'name'})
+        command.add_argument('location', '--location')
+        command.add_argument('name', '--name')
+        command.add_argument('tag', '--tag')
+        cmd_table = {'test list': command}
+
+        def _execute(command_line):
+            argv = command_line.split()
+            config = Configuration(argv)
+            config.get_command_table = lambda: cmd_table
+            return Application(config).execute(argv[1:]).result
+
+        result = _execute("az test list --name a --query [?location=='westus'].name")
+        self.assertEqual(result, ['a'])
+        self.assertEqual((calls[-1]['location'], calls[-1]['name']), ('westus', 'a'))
+
+        # Arguments given on the command line are kept
+        _execute("az test list --location eastus --query [?location=='westus']")
+        self.assertEqual(calls[-1]['location'], 'eastus')
+
+        # Other arguments might not combine with the filters on the server
+        _execute("az test list --tag x --query [?location=='westus']")
+        self.assertIsNone(calls[-1]['location'])
+
+    def test_result_transformed_after_query(self):
+        resource_id = '/subscriptions/sub/resourceGroups/rg{}/providers/p/t/n'
+
+        def handler(_):
+            return [{'id': resource_id.format(i), 'name': 'n{}'.format(i)} for i in range(3)]
+
+        cmd_table = {'test list': CliCommand('test list', handler)}
+
+        def _execute(command_line):
+            argv = command_line.split()
+            config = Configuration(argv)
+            config.get_command_table = lambda: cmd_table
+            return Application(config).execute(argv[1:]).result
+
+        # Only the objects the query selects are transformed
+        self.assertEqual(_execute('az test list --query [1]')['resourceGroup'], 'rg1')
+        self.assertEqual(_execute('az test list --query [1].{n:name,i:id}'),
+                         {'n': 'n1', 'i': resource_id.format(1)})
+
+        # Queries that read the added fields are applied to the transformed result
+        self.assertEqual(_execute("az test list --query [?resourceGroup=='rg2'].name"), ['n2'])
+        self.assertEqual(_execute('az test list --query [1].keys(@)'),
+                         ['id', 'name', 'resourceGroup'])
+
+    def test_max_items_and_page_size(self):
+        received = []
+        calls = []
+
+        def handler(args):
+            calls.append(args)
+
+            def _items():
+                for i in range(10):
+                    received.append(i)
+                    yield {'name': 'n{}'.format(i), 'index': i}
+            return ResultStream(_items())
+
+        command = CliCommand('test list', handler, page_size_argument='top')
+        command.add_argument('top', '--top', type=int)
+        cmd_table = {'test list': command,
+                     'test other': CliCommand('test other', lambda args: [1, 2, 3])}
+
+        def _execute(command_line):
+            argv = command_line.split()
+            config = Configuration(argv)
+            config.get_command_table = lambda: cmd_table
+            return ResultStream.materialize(Application(config).execute(argv[1:]).result)
+
+        # Items after the first ones aren't read
+        self.assertEqual(_execute('az test list --max-items 2 --page-size 5 --query [].name'),
+                         ['n0', 'n1'])
+        self.assertEqual(received, [0, 1])
+        self.assertEqual(calls[-1]['top'], 5)
+
+        self.assertEqual(_execute('az test list --top 3 --page-size 5 --query length(@)'), 10)
+        self.assertEqual(calls[-1]['top'], 3)
+        self.assertEqual(_execute('az test other --max-items 2 --page-size 5'), [1, 2])
+
+        with self.assertRaises(SystemExit):
+            _execute('az test list --max-items 0')
 
 if __name__ == '__main__':
     unittest.main()
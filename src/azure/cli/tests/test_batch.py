@@ -0,0 +1,116 @@
+#---------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+#---------------------------------------------------------------------------------------------
+
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+import mock
+from six import StringIO
+
+from azure.cli._batch import run_batch
+from azure.cli._util import CLIError
+from azure.cli.application import APPLICATION
+from azure.cli.commands import CliCommand
+
+def _create_command_table():
+    def show(args):
+        # Long enough for other commands to be executing at the same time
+        time.sleep(0.05)
+        return {'name': args['name'], 'command': APPLICATION.session['command'],
+                'thread': threading.current_thread().name}
+
+    def fail(_):
+        raise CLIError('bad request')
+
+    batch_show = CliCommand('batchtest show', show)
+    batch_show.add_argument('name', '--name', '-n')
+    return {'batchtest show': batch_show,
+            'batchtest fail': CliCommand('batchtest fail', fail)}
+
+class TestBatch(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.command_table = _create_command_table()
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.input_file = os.path.join(self.temp_dir, 'commands.txt')
+        # Loading the command table runs one-shot handlers other tests rely on
+        self.event_handlers = {name: list(handlers) for name, handlers # pylint: disable=protected-access
+                               in APPLICATION._event_handlers.items()}
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+        APPLICATION._event_handlers.clear() # pylint: disable=protected-access
+        APPLICATION._event_handlers.update(self.event_handlers) # pylint: disable=protected-access
+
+    def _run(self, lines, workers=1):
+        with open(self.input_file, 'w') as f:
+            f.write('\n'.join(lines))
+        output = StringIO()
+        with mock.patch('azure.cli._batch.BatchConfiguration.get_command_table',
+                        return_value=self.command_table):
+            exit_code = run_batch(['--file', self.input_file, '--workers', str(workers)],
+                                  output)
+        return exit_code, [json.loads(l) for l in output.getvalue().splitlines()]
+
+    def test_batch_records(self):
+        exit_code, records = self._run([
+            '# comment',
+            'batchtest show -n one',
+            'az batchtest show --name "two words" --query name',
+            '',
+            'batchtest fail',
+            'batchtest show "unterminated'])
+
+        self.assertEqual(exit_code, 1)
+        self.assertEqual([r['line'] for r in records], [2, 3, 5, 6])
+        self.assertEqual(records[0]['exit_code'], 0)
+        self.assertEqual(records[0]['command'], 'batchtest show -n one')
+        self.assertEqual(records[0]['result']['name'], 'one')
+        self.assertEqual(records[1]['result'], 'two words')
+        self.assertEqual(records[2]['exit_code'], 1)
+        self.assertEqual(records[2]['error'], 'bad request')
+        self.assertEqual(records[3]['exit_code'], 2)
+
+    def test_batch_concurrent_sessions(self):
+        lines = ['batchtest show -n {} --query "[name, command]"'.format(i) for i in range(8)]
+        exit_code, records = self._run(lines, workers=4)
+
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(sorted(r['line'] for r in records), list(range(1, 9)))
+        # Each command sees its own session and its own --query
+        for record in records:
+            self.assertEqual(record['result'], [str(record['line'] - 1), 'batchtest show'])
+
+    def test_batch_help_and_usage_in_records(self):
+        with mock.patch('sys.stdout', new_callable=StringIO) as stdout, \
+                mock.patch('sys.stderr', new_callable=StringIO):
+            exit_code, records = self._run(['batchtest show -h',
+                                            'batchtest show --unknown',
+                                            'batchtest show -n one'], workers=2)
+
+        # Only records are written to stdout
+        self.assertEqual(stdout.getvalue(), '')
+        self.assertEqual(exit_code, 1)
+        self.assertEqual(records[0]['exit_code'], 0)
+        self.assertIn('--name', records[0]['result'])
+        self.assertEqual(records[1]['exit_code'], 2)
+        self.assertIn('usage:', records[1]['error'])
+        self.assertIn('--unknown', records[1]['error'])
+        self.assertEqual(records[2]['result']['name'], 'one')
+
+    def test_batch_missing_file(self):
+        with self.assertRaises(CLIError):
+            run_batch(['--file', os.path.join(self.temp_dir, 'missing.txt')])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+#---------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+#---------------------------------------------------------------------------------------------
+
+import threading
+import unittest
+import mock
+
+from azure.cli.application import APPLICATION
+import azure.cli.commands.client_factory as client_factory
+
+class _ClientStub(object): # pylint: disable=too-few-public-methods
+    def __init__(self, cred, subscription_id=None):
+        self.cred = cred
+        self.subscription_id = subscription_id
+        self.config = mock.MagicMock()
+        self._client = mock.MagicMock()
+
+class TestClientFactory(unittest.TestCase):
+
+    def setUp(self):
+        self.credentials = {'cred': object(), 'subscription_id': 'sub1'}
+        profile_patcher = mock.patch('azure.cli.commands.client_factory.Profile', autospec=True)
+        profile = profile_patcher.start()
+        profile.return_value.get_login_credentials.side_effect = lambda: (
+            self.credentials['cred'], self.credentials['subscription_id'], 'tenant')
+        self.addCleanup(profile_patcher.stop)
+        creds_cache_patcher = mock.patch(
+            'azure.cli.commands.client_factory.get_shared_creds_cache', autospec=True)
+        creds_cache_patcher.start()
+        self.addCleanup(creds_cache_patcher.stop)
+        self.addCleanup(client_factory._thread_state.__dict__.clear) # pylint: disable=protected-access
+        self.addCleanup(APPLICATION.new_session)
+
+    def test_client_reused(self):
+        APPLICATION.session['command'] = 'vm create'
+        client = client_factory.get_mgmt_service_client(_ClientStub)
+        self.assertEqual(client.subscription_id, 'sub1')
+        client.config.add_user_agent.assert_called_once_with(mock.ANY)
+
+        APPLICATION.session['command'] = 'vm show'
+        self.assertIs(client_factory.get_mgmt_service_client(_ClientStub), client)
+        client.config.add_user_agent.assert_called_once_with(mock.ANY)
+        client._client.add_header.assert_called_with('CommandName', 'vm show') # pylint: disable=protected-access
+        self.assertIsNot(client_factory.get_subscription_service_client(_ClientStub)[0], client)
+
+    def test_client_not_reused_for_other_account(self):
+        client = client_factory.get_mgmt_service_client(_ClientStub)
+
+        self.credentials['subscription_id'] = 'sub2'
+        other_client = client_factory.get_mgmt_service_client(_ClientStub)
+        self.assertIsNot(other_client, client)
+        self.assertEqual(other_client.subscription_id, 'sub2')
+
+        # e.g. after login
+        self.credentials['cred'] = object()
+        self.assertIsNot(client_factory.get_mgmt_service_client(_ClientStub), other_client)
+
+    def test_client_not_shared_by_threads(self):
+        client = client_factory.get_mgmt_service_client(_ClientStub)
+        clients = []
+        thread = threading.Thread(
+            target=lambda: clients.append(client_factory.get_mgmt_service_client(_ClientStub)))
+        thread.start()
+        thread.join()
+        self.assertIsNot(clients[0], client)
+
+if __name__ == '__main__':
+    unittest.main()
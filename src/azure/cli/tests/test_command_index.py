@@ -0,0 +1,116 @@
+#---------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+#---------------------------------------------------------------------------------------------
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import mock
+
+from azure.cli.commands import CliCommand, CliArgumentType
+from azure.cli.commands._command_index import CommandIndex
+from azure.cli.help_files import helps, _compiled_helps, _load_help_file # pylint: disable=protected-access
+
+def sample_list(resource_group_name=None):
+    pass
+
+class TestCommandIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.original_helps = dict(helps)
+        self.temp_dir = tempfile.mkdtemp()
+        self.index_file = os.path.join(self.temp_dir, 'commandIndex.json')
+
+        vm_list = CliCommand('vm list', lambda kwargs: None,
+                             simple_output_query='[*].{Name:name}',
+                             query_filter_arguments={'resourceGroup': 'resource_group_name'},
+                             page_size_argument='top')
+        vm_list.operation = sample_list
+        vm_list.add_argument('resource_group_name', '--resource-group', '-g',
+                             help='Name of resource group', type=str.lower)
+        vm_list.update_argument('resource_group_name',
+                                CliArgumentType(completer=lambda prefix, **kwargs: []))
+        group_list = CliCommand('group list', lambda kwargs: None)
+        group_show = CliCommand('group show', lambda kwargs: None)
+        self.command_table = {'vm list': vm_list,
+                              'group list': group_list,
+                              'group show': group_show}
+        self.owners = {'vm list': 'vm', 'group list': 'resource', 'group show': 'resource'}
+        self.versions = {'vm': '0.0.9', 'resource': '0.0.9'}
+
+    def tearDown(self):
+        helps.clear()
+        helps.update(self.original_helps)
+        shutil.rmtree(self.temp_dir)
+
+    def _build(self):
+        return CommandIndex.build(self.command_table, self.owners,
+                                  {'vm': 'vm'}, {'vm': 'short-summary: Manage VMs'},
+                                  self.versions)
+
+    def test_command_index_round_trip(self):
+        self._build().save(self.index_file)
+        index = CommandIndex.load(self.index_file)
+
+        self.assertTrue(index.is_valid(self.versions))
+        entry = index.commands['vm list']
+        self.assertEqual(entry['module'], 'vm')
+        self.assertTrue(entry['handler'].endswith('#sample_list'))
+        argument = entry['arguments']['resource_group_name']
+        self.assertEqual(argument['options_list'], ['--resource-group', '-g'])
+        self.assertEqual(argument['options']['help'], 'Name of resource group')
+        self.assertNotIn('type', argument['options'])
+        self.assertTrue(argument['completer'])
+        self.assertEqual(index.help['vm'], {'module': 'vm', 'text': 'short-summary: Manage VMs',
+                                            'data': {'short-summary': 'Manage VMs'}})
+
+    def test_command_index_invalid_on_module_version_change(self):
+        index = self._build()
+        self.assertFalse(index.is_valid({'vm': '0.1.0', 'resource': '0.0.9'}))
+        self.assertFalse(index.is_valid({'vm': '0.0.9'}))
+
+    def test_command_index_load_missing_or_corrupt(self):
+        self.assertIsNone(CommandIndex.load(self.index_file))
+        with open(self.index_file, 'w') as f:
+            f.write('{not json')
+        self.assertIsNone(CommandIndex.load(self.index_file))
+
+    def test_command_index_resolve_module(self):
+        index = self._build()
+        self.assertEqual(index.resolve_module(['vm', 'list', '-g', 'rg']), 'vm')
+        self.assertEqual(index.resolve_module(['--query', '[0]', 'group', 'show']), 'resource')
+        self.assertEqual(index.resolve_module(['group', '-h']), 'resource')
+        self.assertIsNone(index.resolve_module([]))
+        self.assertIsNone(index.resolve_module(['unknown', 'command']))
+
+    def test_command_index_get_command_table(self):
+        table = self._build().get_command_table()
+
+        self.assertEqual(list(table), ['group list', 'group show', 'vm list'])
+        command = table['vm list']
+        self.assertEqual(command.simple_output_query, '[*].{Name:name}')
+        self.assertEqual(command.query_filter_arguments,
+                         {'resourceGroup': 'resource_group_name'})
+        self.assertEqual(command.page_size_argument, 'top')
+        argument = command.arguments['resource_group_name']
+        self.assertEqual(argument.options_list, ['--resource-group', '-g'])
+        self.assertEqual(argument.options['dest'], 'resource_group_name')
+        self.assertEqual(argument.options['help'], 'Name of resource group')
+
+    def test_command_index_help_not_parsed_again(self):
+        index = CommandIndex.build(self.command_table, self.owners, {'indextest': 'vm'},
+                                   {'indextest': 'short-summary: Indexed help'}, self.versions)
+        index.save(self.index_file)
+        helps.pop('indextest', None)
+        _compiled_helps.pop('indextest', None)
+
+        with mock.patch('yaml.load') as yaml_load:
+            CommandIndex.load(self.index_file).get_command_table()
+            self.assertEqual(_load_help_file('indextest'), {'short-summary': 'Indexed help'})
+            self.assertFalse(yaml_load.called)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,7 +6,15 @@
 import logging
 import unittest
 
-from azure.cli.commands import _update_command_definitions
+from azure.cli.commands import _update_command_definitions, _ArgumentRegistry
+from azure.cli.commands._introspection import ( # pylint: disable=protected-access
+    _precomputed_signatures,
+    extract_args_from_signature,
+    get_operation_doc_hash,
+    get_operation_path,
+    get_operation_parameters,
+    get_operation_version,
+    register_signatures)
 from azure.cli.commands import (
     command_table,
     CliArgumentType,
@@ -101,6 +109,34 @@ class Test_command_registration(unittest.TestCase):
         self.assertEqual(command_metadata.arguments['resource_group_name'].options_list,
                          ['--resource-group-name'])
 
+    def test_extract_args_from_precomputed_signature(self):
+        operation = Test_command_registration.sample_vm_get
+        live = dict(extract_args_from_signature(operation))
+        signature = {'version': get_operation_version(operation),
+                     'parameters': get_operation_parameters(operation),
+                     'doc': get_operation_doc_hash(operation),
+                     'arguments': [('vm_name', {'required': True, 'default': None,
+                                                'help': 'precomputed', 'action': None})]}
+        try:
+            register_signatures({get_operation_path(operation): signature})
+            precomputed = dict(extract_args_from_signature(operation))
+            self.assertEqual(list(precomputed), ['vm_name'])
+            self.assertEqual(precomputed['vm_name'].options_list, ['--vm-name'])
+            self.assertEqual(precomputed['vm_name'].options['help'], 'precomputed')
+
+            # Metadata extracted from a different version of the operation isn't used
+            signature['version'] = 'other'
+            self.assertEqual(list(dict(extract_args_from_signature(operation))), list(live))
+            signature['version'] = get_operation_version(operation)
+            signature['parameters'] = {'names': ['vm_name'], 'defaults': []}
+            self.assertEqual(list(dict(extract_args_from_signature(operation))), list(live))
+            # Nor is the help extracted from a different docstring
+            signature['parameters'] = get_operation_parameters(operation)
+            signature['doc'] = 'other'
+            self.assertEqual(list(dict(extract_args_from_signature(operation))), list(live))
+        finally:
+            _precomputed_signatures.pop(get_operation_path(operation), None)
+
     def test_register_cli_argument_with_overrides(self):
         command_table.clear()
 
@@ -261,5 +297,29 @@ class Test_command_registration(unittest.TestCase):
         self.assertFalse('required' in cmd_arg.options)
         self.assertFalse('help' in cmd_arg.options)
 
+    def test_argument_registry_scope_precedence(self):
+        registry = _ArgumentRegistry()
+        registry.register_cli_argument('', 'name', None, help='global', metavar='NAME')
+        registry.register_cli_argument('vm', 'name', None, help='vm')
+        registry.register_cli_argument('vm create', 'name', None, required=True)
+
+        self.assertEqual(registry.get_cli_argument('vm create', 'name').settings,
+                         {'help': 'vm', 'metavar': 'NAME', 'required': True})
+        self.assertEqual(registry.get_cli_argument('vm list', 'name').settings,
+                         {'help': 'vm', 'metavar': 'NAME'})
+        self.assertEqual(registry.get_cli_argument('network vnet list', 'name').settings,
+                         {'help': 'global', 'metavar': 'NAME'})
+        self.assertEqual(registry.get_cli_argument('vm list', 'other').settings, {})
+        self.assertEqual(dict(registry.get_cli_arguments('vm create', ['name', 'other'])
+                              )['name'].settings['required'], True)
+
+        # Resolved settings are recomputed after a registration
+        registry.register_cli_argument('vm list', 'name', None, help='vm list')
+        self.assertEqual(registry.get_cli_argument('vm list', 'name').settings['help'], 'vm list')
+
+        # Callers get their own copy of the settings
+        registry.get_cli_argument('vm list', 'name').settings['help'] = 'changed'
+        self.assertEqual(registry.get_cli_argument('vm list', 'name').settings['help'], 'vm list')
+
 if __name__ == '__main__':
     unittest.main()
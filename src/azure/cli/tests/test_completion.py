@@ -0,0 +1,139 @@
+#---------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+#---------------------------------------------------------------------------------------------
+
+import argparse
+import os
+import shutil
+import tempfile
+import unittest
+
+import mock
+
+from azure.cli.application import APPLICATION
+from azure.cli._completion import (build_completion_index, get_completions,
+                                   load_completion_index, quote_completions,
+                                   save_completion_index)
+from azure.cli.commands import CliCommand
+from azure.cli.commands.arm import add_id_parameters
+
+def _create_command_table():
+    vm_create = CliCommand('vm create', lambda kwargs: None)
+    vm_create.add_argument('name', '--name', '-n')
+    vm_create.add_argument('resource_group_name', '--resource-group', '-g',
+                           completer=lambda prefix, **kwargs: [])
+    vm_create.add_argument('caching', '--caching', choices=['ReadOnly', 'ReadWrite'])
+    vm_create.add_argument('no_wait', '--no-wait', action='store_true')
+    vm_create.add_argument('tags', '--tags', nargs='+')
+    vm_create.add_argument('secret', '--secret', help=argparse.SUPPRESS)
+    return {'vm create': vm_create,
+            'vm list': CliCommand('vm list', lambda kwargs: None),
+            'network vnet list': CliCommand('network vnet list', lambda kwargs: None)}
+
+def _create_global_actions():
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument('--output', '-o', choices=['json', 'table'])
+    parser.add_argument('--debug', action='store_true')
+    return parser._actions # pylint: disable=protected-access
+
+class TestCompletion(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.command_index = os.path.join(self.temp_dir, 'commandIndex.json')
+        self.completion_index = os.path.join(self.temp_dir, 'completionIndex.json')
+        with open(self.command_index, 'w') as f:
+            f.write('{}')
+        self.index = build_completion_index(_create_command_table(), _create_global_actions(),
+                                            self.command_index)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _complete(self, line):
+        return get_completions(self.index, line, len(line))
+
+    def test_complete_command_names(self):
+        self.assertEqual(self._complete('az ')[:2], ['network', 'vm'])
+        self.assertIn('--output', self._complete('az '))
+        self.assertEqual(self._complete('az v'), ['vm'])
+        self.assertEqual(self._complete('az vm '),
+                         ['create', 'list', '--help', '-h', '--output', '-o', '--debug'])
+        self.assertEqual(self._complete('az --debug network vnet l'), ['list'])
+        self.assertEqual(self._complete('az unknown '), None)
+
+    def test_complete_option_names(self):
+        self.assertEqual(self._complete('az vm create --n'), ['--name', '--no-wait'])
+        self.assertEqual(self._complete('az vm create -n myvm --re'), ['--resource-group'])
+        self.assertNotIn('--secret', self._complete('az vm create --'))
+        self.assertEqual(self._complete('az vm create --unknown x --n'), None)
+
+    def test_complete_option_values(self):
+        self.assertEqual(self._complete('az vm create --caching read'), ['ReadOnly', 'ReadWrite'])
+        self.assertEqual(self._complete('az vm create -o t'), ['table'])
+        self.assertEqual(self._complete('az vm create --no-wait --c'), ['--caching'])
+        self.assertEqual(self._complete('az vm create --name '), [])
+        self.assertEqual(self._complete('az vm create --tags a b --caching '),
+                         ['ReadOnly', 'ReadWrite'])
+        # Values that need a completer are left to argcomplete
+        self.assertIsNone(self._complete('az vm create -g '))
+        self.assertIsNone(self._complete('az vm create --name "my'))
+
+    def test_complete_middle_of_line(self):
+        line = 'az vm cr --name myvm'
+        self.assertEqual(get_completions(self.index, line, len('az vm cr')), ['create'])
+
+    def test_quote_completions(self):
+        self.assertEqual(quote_completions(['create'], ' '), ['create '])
+        self.assertEqual(quote_completions(['a b', 'c'], ' '), ['a\\ b', 'c'])
+
+    def test_completion_index_invalid_after_command_index_change(self):
+        save_completion_index(self.index, self.completion_index)
+        self.assertIsNotNone(load_completion_index(self.completion_index))
+
+        os.utime(self.command_index, (0, 0))
+        self.assertIsNone(load_completion_index(self.completion_index))
+        os.remove(self.command_index)
+        self.assertIsNone(load_completion_index(self.completion_index))
+
+class TestCompletionIndexSaving(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.command_index = os.path.join(self.temp_dir, 'commandIndex.json')
+        self.completion_index = os.path.join(self.temp_dir, 'completionIndex.json')
+        with open(self.command_index, 'w') as f:
+            f.write('{}')
+        self.event_handlers = {name: list(handlers) for name, handlers # pylint: disable=protected-access
+                               in APPLICATION._event_handlers.items()}
+
+    def tearDown(self):
+        APPLICATION._event_handlers.clear() # pylint: disable=protected-access
+        APPLICATION._event_handlers.update(self.event_handlers) # pylint: disable=protected-access
+        shutil.rmtree(self.temp_dir)
+
+    def test_completion_index_has_arguments_added_on_command_table_loaded(self):
+        vm_show = CliCommand('vm show', lambda kwargs: None)
+        vm_show.add_argument('resource_group_name', '--resource-group', '-g',
+                             id_part='resource_group')
+        vm_show.add_argument('vm_name', '--name', '-n', id_part='name')
+        command_table = {'vm show': vm_show}
+        # add_id_parameters removes itself once it has run
+        APPLICATION._event_handlers[APPLICATION.COMMAND_TABLE_LOADED] = [add_id_parameters] # pylint: disable=protected-access
+
+        with mock.patch('azure.cli.commands._pending_completion_index', command_table), \
+                mock.patch('azure.cli.commands.get_index_file_path',
+                           return_value=self.command_index), \
+                mock.patch('azure.cli._completion.get_completion_index_path',
+                           return_value=self.completion_index):
+            APPLICATION.load_command_table(command_table)
+
+        index = load_completion_index(self.completion_index, self.command_index)
+        line = 'az vm show --i'
+        self.assertEqual(get_completions(index, line, len(line)), ['--ids'])
+        line = 'az '
+        self.assertIn('daemon', get_completions(index, line, len(line)))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+#---------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+#---------------------------------------------------------------------------------------------
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import mock
+
+import azure.cli._component_registry as registry
+
+FAKE_COMPONENTS = {
+    'azure-cli': {'version': '0.0.1', 'metadata': None, 'mtime': None},
+    'azure-cli-vm': {'version': '0.0.9', 'metadata': None, 'mtime': None},
+    'azure-cli-network': {'version': '0.0.8', 'metadata': None, 'mtime': None},
+}
+
+class TestComponentRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_file = os.path.join(self.temp_dir, registry.COMPONENT_CACHE_FILE_NAME)
+        registry._installed_components = None # pylint: disable=protected-access
+
+    def tearDown(self):
+        registry._installed_components = None # pylint: disable=protected-access
+        shutil.rmtree(self.temp_dir)
+
+    @mock.patch('azure.cli._component_registry._discover_components', autospec=True)
+    def test_installed_components_cached_across_processes(self, discover):
+        discover.return_value = FAKE_COMPONENTS
+
+        expected = {'azure-cli': '0.0.1', 'azure-cli-vm': '0.0.9', 'azure-cli-network': '0.0.8'}
+        self.assertEqual(registry.get_installed_components(cache_file=self.cache_file), expected)
+        self.assertTrue(os.path.isfile(self.cache_file))
+
+        # simulate a new process - the cache file is used instead of a scan
+        registry._installed_components = None # pylint: disable=protected-access
+        self.assertEqual(registry.get_installed_components(cache_file=self.cache_file), expected)
+        self.assertEqual(discover.call_count, 1)
+
+    @mock.patch('azure.cli._component_registry._get_path_fingerprint', autospec=True)
+    @mock.patch('azure.cli._component_registry._discover_components', autospec=True)
+    def test_installed_components_rescanned_on_path_change(self, discover, fingerprint):
+        discover.return_value = FAKE_COMPONENTS
+        fingerprint.return_value = [['/site-packages', 1.0]]
+        registry.get_installed_components(cache_file=self.cache_file)
+
+        registry._installed_components = None # pylint: disable=protected-access
+        fingerprint.return_value = [['/site-packages', 2.0]]
+        registry.get_installed_components(cache_file=self.cache_file)
+        self.assertEqual(discover.call_count, 2)
+
+    @mock.patch('azure.cli._component_registry._discover_components', autospec=True)
+    def test_installed_command_modules(self, discover):
+        discover.return_value = FAKE_COMPONENTS
+        with mock.patch('azure.cli._component_registry._get_cache_file_path',
+                        return_value=self.cache_file):
+            self.assertEqual(registry.get_installed_command_modules(),
+                             {'vm': '0.0.9', 'network': '0.0.8'})
+
+    @mock.patch('azure.cli._component_registry._running_under_virtualenv', return_value=True)
+    def test_discover_components_in_virtualenv(self, _):
+        import pkg_resources
+        prefix = os.path.join(self.temp_dir, 'venv')
+        site_dir = os.path.join(prefix, 'lib', 'site-packages')
+        os.makedirs(site_dir)
+        # Installed in development mode from a source tree outside of the virtualenv
+        with open(os.path.join(site_dir, 'azure-cli-vm.egg-link'), 'w') as f:
+            f.write('/src/azure-cli-vm\n.')
+        working_set = [
+            pkg_resources.Distribution(site_dir, project_name='azure-cli', version='0.0.1'),
+            pkg_resources.Distribution('/src/azure-cli-vm', project_name='azure-cli-vm',
+                                       version='0.0.9'),
+            pkg_resources.Distribution('/usr/lib/site-packages', project_name='azure-cli-network',
+                                       version='0.0.8'),
+            pkg_resources.Distribution(prefix + '2', project_name='azure-cli-redis',
+                                       version='0.0.7'),
+            pkg_resources.Distribution(site_dir, project_name='requests', version='2.0.0')]
+
+        with mock.patch('pkg_resources.working_set', working_set), \
+                mock.patch('sys.prefix', prefix), mock.patch('sys.path', [site_dir]):
+            components = registry._discover_components() # pylint: disable=protected-access
+        self.assertEqual({key: c['version'] for key, c in components.items()},
+                         {'azure-cli': '0.0.1', 'azure-cli-vm': '0.0.9'})
+
+    def test_invalidate_installed_components(self):
+        with open(self.cache_file, 'w') as f:
+            f.write('{}')
+        registry._installed_components = {} # pylint: disable=protected-access
+        registry.invalidate_installed_components(self.cache_file)
+        self.assertFalse(os.path.exists(self.cache_file))
+        self.assertIsNone(registry._installed_components) # pylint: disable=protected-access
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+#---------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+#---------------------------------------------------------------------------------------------
+
+from __future__ import print_function
+import json
+import os
+import socket
+import sys
+import threading
+import unittest
+
+import mock
+
+import azure.cli as cli
+import azure.cli._daemon as daemon
+from azure.cli.application import APPLICATION
+
+_executed = []
+
+def _fake_main(args, file=None): #pylint: disable=redefined-builtin
+    _executed.append((threading.current_thread(), dict(APPLICATION.session)))
+    APPLICATION.session['command'] = ' '.join(args)
+    APPLICATION.session['query_active'] = True
+    APPLICATION.register(APPLICATION.FILTER_RESULT, lambda **kwargs: None)
+    print('cwd={} var={}'.format(os.getcwd(), os.environ.get('DAEMON_TEST_VAR')), file=file)
+    print('warning', file=sys.stderr)
+    return 3
+
+@unittest.skipUnless(daemon.is_daemon_supported(), 'requires UNIX sockets')
+class TestDaemon(unittest.TestCase):
+
+    def setUp(self):
+        self.server = daemon.CommandServer(socket_path='unused')
+        self.server._event_handlers = {name: list(handlers) for name, handlers # pylint: disable=protected-access
+                                       in APPLICATION._event_handlers.items()} # pylint: disable=protected-access
+        self.addCleanup(self.server.close)
+        del _executed[:]
+
+    def _send(self, request):
+        '''Hand a request to the server and return the client end of the connection.'''
+        client, server = socket.socketpair()
+        client.sendall((json.dumps(request) + '\n').encode('utf-8'))
+        self.assertTrue(self.server.handle_connection(server))
+        return client
+
+    def _request(self, request):
+        client = self._send(request)
+        try:
+            return list(daemon._read_frames(client)) # pylint: disable=protected-access
+        finally:
+            client.close()
+
+    @staticmethod
+    def _run_request(argv):
+        return {'command': 'run', 'version': cli.__version__, 'argv': argv,
+                'env': dict(os.environ), 'cwd': os.getcwd()}
+
+    def test_daemon_not_running(self):
+        self.assertIsNone(daemon.forward_to_daemon(['vm', 'list'],
+                                                   socket_path='/nonexistent/az.sock'))
+
+    def test_daemon_in_process_commands(self):
+        with mock.patch('azure.cli._daemon._connect') as connect:
+            for argv in [['login'], ['--debug', 'login'], ['-o', 'json', 'login'],
+                         ['--output=json', 'login'], ['--query', '[0]', 'login'],
+                         ['--verbose', 'batch', '--file', '-']]:
+                self.assertIsNone(daemon.forward_to_daemon(argv), argv)
+            self.assertFalse(connect.called)
+
+    def test_daemon_find_command(self):
+        self.assertEqual(daemon.find_command(['vm', 'list']), 0)
+        self.assertEqual(daemon.find_command(['--debug', '-o', 'login', 'vm']), 3)
+        self.assertEqual(daemon.find_command(['--output-file', 'out.json', 'vm']), 2)
+        self.assertEqual(daemon.find_command(['--output=json', 'vm']), 1)
+        self.assertIsNone(daemon.find_command(['--debug']))
+        self.assertIsNone(daemon.find_command([]))
+
+    @mock.patch('azure.cli.main.main', side_effect=_fake_main)
+    def test_daemon_executes_in_client_context(self, _):
+        cwd = os.getcwd()
+        handlers = dict((name, list(h)) for name, h in APPLICATION._event_handlers.items()) # pylint: disable=protected-access
+        env = dict(os.environ, DAEMON_TEST_VAR='1')
+
+        frames = self._request({'command': 'run', 'version': cli.__version__,
+                                'argv': ['vm', 'list'], 'env': env, 'cwd': os.path.dirname(cwd)})
+
+        self.assertEqual(frames[-1], {'exit_code': 3})
+        stdout = ''.join(f.get('stdout', '') for f in frames)
+        stderr = ''.join(f.get('stderr', '') for f in frames)
+        self.assertEqual(stdout, 'cwd={} var=1\n'.format(os.path.dirname(cwd)))
+        self.assertEqual(stderr, 'warning\n')
+
+        # The state of the daemon process is restored after the command
+        self.assertEqual(os.getcwd(), cwd)
+        self.assertNotIn('DAEMON_TEST_VAR', os.environ)
+        self.assertEqual(dict(APPLICATION._event_handlers), handlers) # pylint: disable=protected-access
+
+        # Commands are executed by the same thread, each with a new session
+        self._request(self._run_request(['vm', 'show']))
+        (first_thread, first_session), (second_thread, second_session) = _executed
+        self.assertIs(first_thread, second_thread)
+        self.assertIsNot(first_thread, threading.current_thread())
+        self.assertEqual(first_session['command'], 'unknown')
+        self.assertFalse(second_session['query_active'])
+        self.assertEqual(self.server.requests_served, 2)
+
+    def test_daemon_busy(self):
+        started, release = threading.Event(), threading.Event()
+        def blocking_main(args, file=None): #pylint: disable=redefined-builtin,unused-argument
+            started.set()
+            release.wait(10)
+            return 0
+
+        with mock.patch('azure.cli.main.main', side_effect=blocking_main):
+            client = self._send(self._run_request(['vm', 'list']))
+            try:
+                self.assertTrue(started.wait(10))
+                # Other commands are executed by their clients until it completes
+                self.assertEqual(self._request(self._run_request(['vm', 'show'])),
+                                 [{'fallback': 'busy'}])
+                status = self._request({'command': 'status'})[0]
+                self.assertTrue(status['busy'])
+                release.set()
+                self.assertEqual(list(daemon._read_frames(client)), [{'exit_code': 0}]) # pylint: disable=protected-access
+            finally:
+                release.set()
+                client.close()
+            self.assertEqual(self._request(self._run_request(['vm', 'show'])),
+                             [{'exit_code': 0}])
+        self.assertFalse(self._request({'command': 'status'})[0]['busy'])
+
+    def test_daemon_version_mismatch(self):
+        frames = self._request({'command': 'run', 'version': 'other', 'argv': []})
+        self.assertIn('fallback', frames[0])
+
+    def test_daemon_status(self):
+        frames = self._request({'command': 'status'})
+        self.assertEqual(frames[0]['pid'], os.getpid())
+        self.assertEqual(frames[0]['requests_served'], 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,7 +5,8 @@
 
 import unittest
 
-from azure.cli.extensions.query import jmespath_type
+from azure.cli.extensions.query import (jmespath_type, is_item_wise, get_query_filters,
+                                       is_independent_of_fields)
 
 class TestQuery(unittest.TestCase):
     '''Tests for the values that can be passed to the --query parameter.
@@ -53,6 +54,46 @@ class TestQuery(unittest.TestCase):
         query = "length([?contains('id', 'Publishers'])"
         with self.assertRaises(ValueError):
             jmespath_type(query)
+    def test_query_item_wise(self):
+        items = [{'name': 'a', 'tags': ['x', 'y'], 'size': 1},
+                 {'name': 'b', 'tags': [], 'size': 2},
+                 {'tags': ['z'], 'size': 3}]
+        for query in ('[].name', '[*].name', '[]', "[?size>`1`]", "[?size>`1`].name",
+                      '[].{n: name, s: size}'):
+            expression = jmespath_type(query)
+            self.assertTrue(is_item_wise(expression), query)
+            self.assertEqual([r for item in items for r in expression.search([item])],
+                             expression.search(items), query)
+
+        for query in ('[0]', 'length(@)', '[].tags[]', '[].name | [0]', 'sort_by(@, &size)'):
+            self.assertFalse(is_item_wise(jmespath_type(query)), query)
+    def test_query_filters(self):
+        def _filters(query):
+            return get_query_filters(jmespath_type(query))
+
+        self.assertEqual(_filters("[?location=='westus'].name"), {'location': 'westus'})
+        self.assertEqual(_filters("[?'westus'==location && properties.roleName==`\"Owner\"`]"),
+                         {'location': 'westus', 'properties.roleName': 'Owner'})
+        self.assertEqual(_filters("[?location=='westus' && (name=='a' || name=='b')] | [0]"),
+                         {'location': 'westus'})
+        self.assertEqual(_filters("[?location=='westus' && location=='eastus']"), {})
+        self.assertEqual(_filters("[?location!='westus']"), {})
+        self.assertEqual(_filters("[?size==`1`]"), {})
+        self.assertEqual(_filters("value[?location=='westus']"), {})
+        self.assertEqual(_filters("[].name"), {})
+
+    def test_query_independent_of_fields(self):
+        def _independent(query):
+            return is_independent_of_fields(jmespath_type(query), ('resourceGroup',))
+
+        for query in ('[].name', '[0]', "[?location=='westus'].{n: name, id: id}",
+                      'sort_by(@, &name)[-1:]', '[].[name, tags.owner] | [0]',
+                      "[?contains(name, 'a') && !disabled]", 'max_by(@, &size).id'):
+            self.assertTrue(_independent(query), query)
+
+        for query in ('[].resourceGroup', "[?resourceGroup=='rg']", '[].*', 'length([0])',
+                      '[].keys(@)', "[?@ == `{\"id\": \"x\"}`]", '[].to_string(@)'):
+            self.assertFalse(_independent(query), query)
 
 if __name__ == '__main__':
     unittest.main()
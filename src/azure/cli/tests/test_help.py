@@ -59,6 +59,21 @@ class HelpTest(unittest.TestCase):
         with self.assertRaises(SystemExit):
             app.execute('n1 --help'.split())
 
+    @redirect_io
+    def test_help_lists_builtin_commands(self):
+        config = Configuration([])
+        config.get_command_table = lambda: {}
+        app = Application(config)
+
+        with self.assertRaises(SystemExit):
+            app.execute('-h'.split())
+        self.assertIn('batch', io.getvalue())
+        self.assertIn('daemon', io.getvalue())
+
+        with self.assertRaises(SystemExit):
+            app.execute('daemon -h'.split())
+        self.assertIn('start', io.getvalue())
+
     @redirect_io
     def test_help_plain_short_description(self):
         def test_handler():
@@ -494,6 +509,33 @@ Global Arguments
 
         self.assertEqual(s, io.getvalue())
 
+    def test_help_parsed_once(self):
+        helps = azure.cli.help_files.helps
+        helps['test_group1 test_parsed'] = """
+            type: command
+            short-summary: this module does xyz one-line or so
+            examples:
+                - name: foo example
+                  text: example details
+            """
+        try:
+            azure.cli.help_files._compiled_helps.clear() # pylint: disable=protected-access
+            parsed = {key: azure.cli.help_files._load_help_file(key) for key in helps} # pylint: disable=protected-access
+
+            with mock.patch('yaml.load') as yaml_load:
+                for key in helps:
+                    self.assertIs(azure.cli.help_files._load_help_file(key), parsed[key]) # pylint: disable=protected-access
+                self.assertFalse(yaml_load.called)
+            self.assertEqual(parsed['test_group1 test_parsed']['short-summary'],
+                             'this module does xyz one-line or so')
+
+            # Changed entries are parsed again
+            helps['test_group1 test_parsed'] = 'short-summary: changed'
+            self.assertEqual(azure.cli.help_files._load_help_file('test_group1 test_parsed'), # pylint: disable=protected-access
+                             {'short-summary': 'changed'})
+        finally:
+            del helps['test_group1 test_parsed']
+
     def test_help_loads(self):
         parser_dict = {}
         _store_parsers(APPLICATION.parser, parser_dict)
@@ -0,0 +1,89 @@
+#---------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+#---------------------------------------------------------------------------------------------
+
+import threading
+import unittest
+import mock
+from msrest import Configuration, ServiceClient
+from six.moves import BaseHTTPServer, socketserver # pylint: disable=import-error
+
+from azure.cli._http import counters, create_session, configure_service_client
+from azure.cli.adal_authentication import AdalAuthentication
+
+class _KeepAliveHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self): # pylint: disable=invalid-name
+        body = self.headers.get('Authorization', '').encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args): # pylint: disable=arguments-differ
+        pass
+
+class _Server(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+class _SdkClient(object): # pylint: disable=too-few-public-methods
+    '''Laid out like the clients of the Azure SDK.'''
+
+    def __init__(self, credentials, base_url):
+        self.config = Configuration(base_url)
+        self._client = ServiceClient(credentials, self.config)
+
+class TestHttp(unittest.TestCase):
+
+    def setUp(self):
+        self.server = _Server(('127.0.0.1', 0), _KeepAliveHandler)
+        thread = threading.Thread(target=self.server.serve_forever)
+        thread.daemon = True
+        thread.start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.url = 'http://127.0.0.1:{}/'.format(self.server.server_address[1])
+
+    def test_connection_shared_by_sessions(self):
+        opened, requests = counters.snapshot()
+        first, second = create_session(), create_session()
+        self.assertIs(first.get_adapter(self.url), second.get_adapter(self.url))
+        first.get(self.url).close()
+        first.close()
+        second.get(self.url).close()
+        second.get(self.url).close()
+        self.assertEqual(counters.snapshot(), (opened + 1, requests + 3))
+
+    def test_signed_session_injection(self):
+        session = create_session()
+        auth = AdalAuthentication(lambda: ('Bearer', 'token1'))
+        self.assertIs(auth.signed_session(session), session)
+        self.assertEqual(session.get(self.url).text, 'Bearer token1')
+        self.assertIsNot(auth.signed_session(), session)
+
+    def test_configure_service_client(self):
+        client = mock.MagicMock()
+        configure_service_client(client)
+        self.assertTrue(client.config.keep_alive)
+        session = client._client._session # pylint: disable=protected-access
+        self.assertIs(session.get_adapter('https://management.azure.com'),
+                      create_session().get_adapter('https://graph.windows.net'))
+
+    def test_service_client_sends_through_configured_session(self):
+        auth = AdalAuthentication(lambda: ('Bearer', 'token1'))
+        clients = [_SdkClient(auth, self.url) for _ in range(2)]
+        for client in clients:
+            configure_service_client(client)
+        opened, requests = counters.snapshot()
+        for client in clients:
+            service_client = client._client # pylint: disable=protected-access
+            response = service_client.send(service_client.get('/'))
+            self.assertEqual(response.text, 'Bearer token1')
+            response.close()
+        # Only the shared connection pool counts connections and requests
+        self.assertEqual(counters.snapshot(), (opened + 1, requests + 2))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,12 +4,27 @@
 #---------------------------------------------------------------------------------------------
 
 import unittest
+import mock
 
 from azure.cli.main import main as cli
+from azure.cli.commands._command_index import DISABLE_COMMAND_INDEX_VARIABLE_NAME
 
 class TestMain(unittest.TestCase):
 
+    # Loading every command module must not write the index into ~/.azure
+    @mock.patch.dict('os.environ', {DISABLE_COMMAND_INDEX_VARIABLE_NAME: '1'})
     def test_exit_code_on_CLIError(self):
         #the 'login' command should fail for missing --tenant
         error_code = cli(['login', '--service-principal', '-u', 'foo', '-p', 'bar'])
         self.assertEqual(1, error_code)
+
+    @mock.patch('azure.cli.main.run_batch', autospec=True, return_value=0)
+    @mock.patch('azure.cli.main.run_daemon_command', autospec=True, return_value=0)
+    def test_builtin_commands_after_global_arguments(self, run_daemon_command, run_batch):
+        self.assertEqual(cli(['--debug', 'daemon', 'start']), 0)
+        run_daemon_command.assert_called_once_with(['start'])
+
+        with mock.patch('azure.cli.main.ACCOUNT'), mock.patch('azure.cli.main.CONFIG'), \
+                mock.patch('azure.cli.main.SESSION'), mock.patch('os.makedirs'):
+            self.assertEqual(cli(['-o', 'json', 'batch', '-f', 'x'], file=None), 0)
+        run_batch.assert_called_once_with(['-f', 'x'], None)
@@ -5,11 +5,17 @@
 
 from __future__ import print_function
  # pylint: disable=protected-access, bad-continuation, too-many-public-methods, trailing-whitespace
+import gzip
+import io
+import os
+import shutil
+import tempfile
 import unittest
 from six import StringIO
 
-from azure.cli._output import (OutputProducer, format_json, format_table, format_list,
-                               format_tsv, ListOutput, CommandResultItem)
+from azure.cli._output import (OutputProducer, format_json, format_json_compact, format_jsonl,
+                               format_table, format_list, format_tsv, ListOutput,
+                               CommandResultItem, open_output_file)
 import azure.cli._util as util
 
 class TestOutput(unittest.TestCase):
@@ -108,6 +114,47 @@ asdf
         with self.assertRaises(util.CLIError):
             output_producer.out(result_item)
 
+    def test_out_streamed_table_sample(self):
+        os.environ['AZURE_CLI_TABLE_SAMPLE_SIZE'] = '2'
+        self.addCleanup(os.environ.pop, 'AZURE_CLI_TABLE_SAMPLE_SIZE')
+        output_producer = OutputProducer(formatter=format_table, file=self.io)
+        result_item = CommandResultItem(util.ResultStream([{'name': 'qwerty', 'id': '0b1f6472'},
+                                                           {'name': 'asdf', 'id': '0b1f'},
+                                                           {'name': 'a', 'other': 'b'},
+                                                           {'name': 'zxcvbnm', 'id': '0'}]),
+                                        simple_output_query='[*].{Name:name, Id:id}')
+        output_producer.out(result_item)
+        self.assertEqual(util.normalize_newlines(self.io.getvalue()), util.normalize_newlines(
+""" Name  |    Id   
+-------|---------
+qwerty | 0b1f6472
+asdf   | 0b1f    
+a      | None    
+zxcvbnm | 0       
+"""))
+
+    def test_out_streamed_table_sorted_query(self):
+        output_producer = OutputProducer(formatter=format_table, file=self.io)
+        result_item = CommandResultItem(util.ResultStream([{'name': 'qwerty'}, {'name': 'asdf'}]),
+                                        simple_output_query='[*].{Name:name} | sort_by(@, &Name)')
+        output_producer.out(result_item)
+        self.assertEqual(util.normalize_newlines(self.io.getvalue()), util.normalize_newlines(
+""" Name 
+------
+asdf  
+qwerty
+"""))
+
+    def test_out_streamed_table_complex_obj(self):
+        os.environ['AZURE_CLI_TABLE_SAMPLE_SIZE'] = '1'
+        self.addCleanup(os.environ.pop, 'AZURE_CLI_TABLE_SAMPLE_SIZE')
+        output_producer = OutputProducer(formatter=format_table, file=self.io)
+        result_item = CommandResultItem(util.ResultStream([{'name': 'qwerty'},
+                                                           {'name': 'asdf', 'sub': ['1']}]),
+                                        is_query_active=True)
+        with self.assertRaises(util.CLIError):
+            output_producer.out(result_item)
+
     def test_out_table_complex_obj(self):
         output_producer = OutputProducer(formatter=format_table, file=self.io)
         result_item = CommandResultItem([{'name': 'qwerty', 'id': '0b1f6472qwerty', 'sub': {'1'}}])
@@ -214,6 +261,30 @@ Myarray :
    4
 
 
+"""))
+
+    def test_out_list_valid_nested_objects(self):
+        output_producer = OutputProducer(formatter=format_list, file=self.io)
+        output_producer.out(CommandResultItem([
+            {'tags': {'b': None, 'a': '1'}, 'ids': [{'id': 1}, 2], 'name': 'qwerty', '~~z': 'y'},
+            {'name': 'asdf', 'tags': {}, 'ids': []}]))
+        self.assertEqual(util.normalize_newlines(self.io.getvalue()), util.normalize_newlines(
+"""Name : qwerty
+Ids  :
+   Id : 1
+   2
+Tags :
+   A : 1
+   B : None
+~~Z  : y
+
+Name : asdf
+Ids  :
+   None
+Tags :
+   None
+
+
 """))
 
     def test_out_list_format_key_simple(self):
@@ -274,6 +345,83 @@ Myarray :
         obj2['B'] = 4
         result = format_tsv(CommandResultItem([obj1, obj2]))
         self.assertEqual(result, '1\t2\n3\t4\n')
+    def _assert_streamed_output_equal(self, formatter, result):
+        buffered = formatter(CommandResultItem(result, is_query_active=True))
+        OutputProducer(formatter=formatter, file=self.io).out(
+            CommandResultItem(util.ResultStream(iter(result)), is_query_active=True))
+        self.assertEqual(self.io.getvalue(), buffered)
+
+    def test_out_streamed_json(self):
+        self._assert_streamed_output_equal(format_json, [{'name': 'qwerty', 'tags': {'a': 'b'}},
+                                                         {'name': 'asdf', 'ids': [1, 2]}])
+
+    def test_out_json_compact(self):
+        output_producer = OutputProducer(formatter=format_json_compact, file=self.io)
+        output_producer.out(CommandResultItem({'b': [1, None], 'a': b'0b1f6472'}))
+        self.assertEqual(self.io.getvalue(), '{"b":[1,null],"a":"0b1f6472"}\n')
+
+    def test_out_json_compact_list(self):
+        output_producer = OutputProducer(formatter=format_json_compact, file=self.io)
+        output_producer.out(CommandResultItem([{'b': 1, 'a': 2}, {'c': 'd'}]))
+        self.assertEqual(self.io.getvalue(), '[{"b":1,"a":2},{"c":"d"}]\n')
+
+    def test_out_streamed_json_compact(self):
+        self._assert_streamed_output_equal(format_json_compact,
+                                           [{'name': 'qwerty', 'tags': {'a': 'b'}},
+                                            {'name': 'asdf', 'ids': [1, 2]}])
+
+    def test_out_jsonl(self):
+        output_producer = OutputProducer(formatter=format_jsonl, file=self.io)
+        output_producer.out(CommandResultItem([{'tags': {'a': 'b'}},
+                                               {'contents': b'0b1f6472'}]))
+        self.assertEqual(self.io.getvalue(),
+                         '{"tags":{"a":"b"}}\n{"contents":"0b1f6472"}\n')
+
+    def test_out_jsonl_single_item(self):
+        output_producer = OutputProducer(formatter=format_jsonl, file=self.io)
+        output_producer.out(CommandResultItem({'active': True}))
+        self.assertEqual(self.io.getvalue(), '{"active":true}\n')
+
+    def test_out_streamed_jsonl(self):
+        self._assert_streamed_output_equal(format_jsonl, [{'name': 'qwerty', 'tags': {'a': 'b'}},
+                                                          {'name': 'asdf', 'ids': [1, 2]}])
+
+    def test_out_streamed_list(self):
+        self._assert_streamed_output_equal(format_list, [{'name': 'qwerty', 'tags': {'a': 'b'}},
+                                                         {'name': 'asdf', 'ids': [1, 2]}])
+
+    def test_out_streamed_tsv(self):
+        self._assert_streamed_output_equal(format_tsv, [{'name': 'qwerty', 'count': 1},
+                                                        {'name': 'asdf', 'count': 2}])
+
+    def test_out_streamed_table(self):
+        self._assert_streamed_output_equal(format_table, [{'name': 'qwerty', 'id': '1'},
+                                                          {'name': 'asdf', 'id': '0b1f6472'}])
+
+    def test_out_empty_stream(self):
+        for formatter in (format_json, format_json_compact, format_jsonl, format_list, format_tsv,
+                          format_table):
+            OutputProducer(formatter=formatter, file=self.io).out(
+                CommandResultItem(util.ResultStream([])))
+        self.assertEqual(self.io.getvalue(), '')
+
+    def test_out_file(self):
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        result = [{'name': 'qwerty', 'value': '\u00e9'}, {'name': 'asdf', 'value': '0b1f6472'}]
+        OutputProducer(formatter=format_json, file=self.io).out(CommandResultItem(result))
+
+        for name, open_file in (('out.json', io.open), ('out.json.gz', gzip.open)):
+            path = os.path.join(temp_dir, name)
+            with open_output_file(path) as output_file:
+                OutputProducer(formatter=format_json, file=output_file).out(
+                    CommandResultItem(util.ResultStream(iter(result))))
+            with open_file(path, 'rb') as f:
+                self.assertEqual(f.read().decode('utf-8'), self.io.getvalue(), name)
+
+    def test_out_file_invalid_path(self):
+        with self.assertRaises(util.CLIError):
+            open_output_file(os.path.join(tempfile.gettempdir(), 'missing', 'dir', 'out.json'))
 
 if __name__ == '__main__':
     unittest.main()
@@ -3,6 +3,7 @@
 # Licensed under the MIT License. See License.txt in the project root for license information.
 #---------------------------------------------------------------------------------------------
 
+import threading
 import unittest
 from six import StringIO
 from azure.cli.parser import AzCliCommandParser
@@ -75,6 +76,66 @@ class TestParser(unittest.TestCase):
         parser.parse_args('test command -req yep'.split())
         self.assertTrue(AzCliCommandParser.error.called)
 
+    def test_command_parsers_created_on_demand(self):
+        def test_handler():
+            pass
+
+        command = CliCommand('test command', test_handler)
+        command.add_argument('req', '--req', required=True)
+        command2 = CliCommand('test other-command', test_handler)
+        command2.add_argument('req', '--req', required=True)
+        cmd_table = {'test command': command, 'test other-command': command2}
+
+        parser = AzCliCommandParser()
+        parser.load_command_table(cmd_table)
+        pending = parser.subparsers[('test',)].choices._factories # pylint: disable=protected-access
+        self.assertEqual(sorted(pending), ['command', 'other-command'])
+
+        args = parser.parse_args('test command --req yep'.split())
+        self.assertEqual(args.req, 'yep')
+        self.assertEqual(list(pending), ['other-command'])
+
+        # Enumerating the group (as help and completion do) creates the remaining parsers
+        self.assertTrue(all(isinstance(p, AzCliCommandParser)
+                            for p in parser.subparsers[('test',)].choices.values()))
+        self.assertEqual(list(pending), [])
+
+    def test_command_parser_created_while_parsing_concurrently(self):
+        def test_handler():
+            pass
+
+        command = CliCommand('test command', test_handler)
+        command.add_argument('req', '--req', required=True)
+        parser = AzCliCommandParser()
+        parser.load_command_table({'test command': command})
+
+        # Keep the first thread creating the parser until the second one has parsed
+        factories = parser.subparsers[('test',)].choices._factories # pylint: disable=protected-access
+        create_parser = factories['command']
+        started, release = threading.Event(), threading.Event()
+        def _create_parser_slowly():
+            started.set()
+            release.wait(10)
+            create_parser()
+        factories['command'] = _create_parser_slowly
+
+        results = {}
+        def _parse(name):
+            try:
+                results[name] = parser.parse_args('test command --req {}'.format(name).split()).req
+            except SystemExit:
+                results[name] = 'invalid command'
+        first = threading.Thread(target=_parse, args=('first',))
+        first.start()
+        self.assertTrue(started.wait(10))
+        second = threading.Thread(target=_parse, args=('second',))
+        second.start()
+        second.join(0.5)
+        release.set()
+        first.join()
+        second.join()
+        self.assertEqual(results, {'first': 'first', 'second': 'second'})
+
 class VerifyError(object): # pylint: disable=too-few-public-methods
 
     def __init__(self, test, substr=None):
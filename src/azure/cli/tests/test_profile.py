@@ -4,11 +4,17 @@
 #---------------------------------------------------------------------------------------------
 
 # pylint: disable=protected-access, unsubscriptable-object
+from datetime import datetime, timedelta
 import json
+import threading
+import time
 import unittest
 import mock
-from azure.cli._profile import Profile, CredsCache, SubscriptionFinder
+from azure.cli._profile import (Profile, CredsCache, SubscriptionFinder,
+                                get_shared_creds_cache, invalidate_shared_creds_cache,
+                                _run_for_tenants)
 from azure.cli._azure_env import ENV_DEFAULT
+from azure.cli._util import CLIError
 
 class Test_Profile(unittest.TestCase):
 
@@ -234,6 +240,43 @@ class Test_Profile(unittest.TestCase):
                                                'https://management.core.windows.net/')
         self.assertEqual(mock_get_token.call_count, 1)
 
+    @mock.patch('azure.cli._profile._read_file_content', autospec=True)
+    def test_get_login_credentials_reused(self, mock_read_cred_file):
+        mock_read_cred_file.return_value = json.dumps([Test_Profile.token_entry1])
+        storage_mock = {'subscriptions': None}
+        creds_cache = CredsCache()
+        profile = Profile(storage_mock, creds_cache=creds_cache)
+        profile._set_subscriptions(Profile._normalize_properties(
+            self.user1, [self.subscription1], False, ENV_DEFAULT))
+
+        cred, _, _ = profile.get_login_credentials()
+        self.assertIs(Profile(storage_mock, creds_cache=creds_cache).get_login_credentials()[0],
+                      cred)
+        self.assertIsNot(profile.get_login_credentials(for_graph_client=True)[0], cred)
+        self.assertIsNot(Profile(storage_mock).get_login_credentials()[0], cred)
+
+    @mock.patch('azure.cli._profile._read_file_content', return_value=None)
+    @mock.patch('azure.cli._profile._get_file_stat', autospec=True)
+    def test_shared_creds_cache(self, mock_get_file_stat, mock_read_file):
+        mock_get_file_stat.return_value = (1.0, 10)
+        invalidate_shared_creds_cache()
+        creds_cache = get_shared_creds_cache()
+        self.assertIs(get_shared_creds_cache(), creds_cache)
+        self.assertEqual(mock_read_file.call_count, 1)
+
+        # Changed by another process
+        mock_get_file_stat.return_value = (2.0, 10)
+        self.assertIsNot(get_shared_creds_cache(), creds_cache)
+
+        # Invalidated by 'account set'
+        creds_cache = get_shared_creds_cache()
+        profile = Profile({'subscriptions': None})
+        profile._set_subscriptions(Profile._normalize_properties(
+            self.user1, [self.subscription1], False, ENV_DEFAULT))
+        profile.set_active_subscription('1')
+        self.assertIsNot(get_shared_creds_cache(), creds_cache)
+        invalidate_shared_creds_cache()
+
     @mock.patch('azure.cli._profile._read_file_content', autospec=True)
     @mock.patch('azure.cli._profile.CredsCache.retrieve_token_for_user', autospec=True)
     def test_get_login_credentials_for_graph_client(self, mock_get_token, mock_read_cred_file):
@@ -364,6 +407,89 @@ class Test_Profile(unittest.TestCase):
         mock_auth_context.acquire_token_with_client_credentials.assert_called_once_with(
             mgmt_resource, 'my app', 'my secret')
 
+    @mock.patch('adal.AuthenticationContext', autospec=True)
+    def test_find_subscriptions_in_tenants(self, mock_auth_context):
+        def acquire_token(resource, user_id, client_id): # pylint: disable=unused-argument
+            if mock_auth_context.authority.endswith('tenant2'):
+                raise ValueError('no token')
+            return {'accessToken': mock_auth_context.authority}
+        def create_auth_context(authority, _):
+            mock_auth_context.authority = authority
+            return mock_auth_context
+        def create_arm_client(token_credential):
+            client = mock.MagicMock()
+            tenant = token_credential.token['access_token'].rpartition('/')[2]
+            client.subscriptions.list.return_value = [
+                SubscriptionStub('subscriptions/' + tenant, tenant, self.state1, None)]
+            return client
+        mock_auth_context.acquire_token.side_effect = acquire_token
+        finder = SubscriptionFinder(create_auth_context, None, create_arm_client)
+        finder.user_id = self.user1
+
+        #the auth context is shared, so the tenants are listed one at a time
+        with mock.patch('azure.cli._profile.MAX_TENANT_WORKERS', 1):
+            subs, failed_tenants = finder.find_in_tenants(['tenant1', 'tenant2', 'tenant3'],
+                                                          'https://management.core.windows.net/')
+
+        self.assertEqual([(s.id, s.tenant_id) for s in subs],
+                         [('subscriptions/tenant1', 'tenant1'),
+                          ('subscriptions/tenant3', 'tenant3')])
+        self.assertEqual(failed_tenants, ['tenant2'])
+
+    @mock.patch('azure.cli._profile.TENANT_TIMEOUT_SECONDS', 0.2)
+    def test_run_for_tenants_timeout(self):
+        def find_in_tenant(tenant):
+            if tenant == 'slow':
+                time.sleep(1)
+            return tenant.upper()
+
+        outcomes = list(_run_for_tenants(['a', 'slow', 'b'], find_in_tenant))
+
+        self.assertEqual([(t, r) for t, r, _ in outcomes],
+                         [('a', 'A'), ('slow', None), ('b', 'B')])
+        self.assertIn('Timed out', str(outcomes[1][2]))
+        self.assertEqual(list(_run_for_tenants([], find_in_tenant)), [])
+
+    def test_refresh_accounts(self):
+        storage_mock = {'subscriptions': None}
+        creds_cache = mock.MagicMock()
+        profile = Profile(storage_mock, creds_cache=creds_cache)
+        profile._set_subscriptions(
+            Profile._normalize_properties(self.user1, [self.subscription1], False, ENV_DEFAULT) +
+            Profile._normalize_properties(self.user2, [self.subscription2], False, ENV_DEFAULT) +
+            Profile._normalize_properties(
+                self.user1, [SubscriptionStub('subscriptions/3', 'gone', self.state1, 'tenant2')],
+                False, ENV_DEFAULT))
+        profile.set_active_subscription('2')
+
+        new_subscription = SubscriptionStub('subscriptions/4', 'new', self.state1, None)
+        renamed_subscription2 = SubscriptionStub(self.id2, 'renamed', self.state2, None)
+        def create_arm_client(token_credential):
+            client = mock.MagicMock()
+            client.subscriptions.list.side_effect = lambda: {
+                self.tenant_id: [renamed_subscription2],
+                'tenant2': [new_subscription]
+            }[token_credential.token['access_token']]
+            return client
+        profile._subscription_finder = SubscriptionFinder(None, None, create_arm_client)
+        def retrieve_token_for_user(user, tenant, resource): # pylint: disable=unused-argument
+            if user == self.user1 and tenant == self.tenant_id:
+                raise CLIError('no token')
+            return ('Bearer', tenant)
+        creds_cache.retrieve_token_for_user.side_effect = retrieve_token_for_user
+
+        #action
+        subscriptions = profile.refresh_accounts()
+
+        #verify the subscriptions of the tenant which failed are kept
+        self.assertEqual([(s['id'], s['name'], s['isDefault']) for s in subscriptions],
+                         [('1', self.display_name1, False),
+                          ('2', 'renamed', True),
+                          ('4', 'new', False)])
+        self.assertEqual(storage_mock['subscriptions'], subscriptions)
+        self.assertEqual(subscriptions[2]['tenantId'], 'tenant2')
+        self.assertFalse(creds_cache.retrieve_token_for_service_principal.called)
+
     @mock.patch('azure.cli._profile._read_file_content', autospec=True)
     def test_credscache_load_tokens_and_sp_creds(self, mock_read_file):
         test_sp = {
@@ -382,9 +508,8 @@ class Test_Profile(unittest.TestCase):
         self.assertEqual(creds_cache._service_principal_creds, [test_sp])
 
     @mock.patch('azure.cli._profile._read_file_content', autospec=True)
-    @mock.patch('os.fdopen', autospec=True)
-    @mock.patch('os.open', autospec=True)
-    def test_credscache_add_new_sp_creds(self, _, mock_open_for_write, mock_read_file):
+    @mock.patch('azure.cli._profile.write_file_atomically', autospec=True)
+    def test_credscache_add_new_sp_creds(self, mock_write_file, mock_read_file):
         test_sp = {
             "servicePrincipalId": "myapp",
             "servicePrincipalTenant": "mytenant",
@@ -395,7 +520,6 @@ class Test_Profile(unittest.TestCase):
             "servicePrincipalTenant": "mytenant2",
             "accessToken": "Secret2"
         }
-        mock_open_for_write.return_value = FileHandleStub()
         mock_read_file.return_value = json.dumps([self.token_entry1, test_sp])
         creds_cache = CredsCache()
 
@@ -409,18 +533,18 @@ class Test_Profile(unittest.TestCase):
         token_entries = [entry for _, entry in creds_cache.adal_token_cache.read_items()]
         self.assertEqual(token_entries, [self.token_entry1])
         self.assertEqual(creds_cache._service_principal_creds, [test_sp, test_sp2])
-        mock_open_for_write.assert_called_with(mock.ANY, 'w+')
+        mock_write_file.assert_called_once_with(mock.ANY, mock.ANY)
+        self.assertEqual(json.loads(mock_write_file.call_args[0][1]),
+                         [self.token_entry1, test_sp, test_sp2])
 
     @mock.patch('azure.cli._profile._read_file_content', autospec=True)
-    @mock.patch('os.fdopen', autospec=True)
-    @mock.patch('os.open', autospec=True)
-    def test_credscache_remove_creds(self, _, mock_open_for_write, mock_read_file):
+    @mock.patch('azure.cli._profile.write_file_atomically', autospec=True)
+    def test_credscache_remove_creds(self, mock_write_file, mock_read_file):
         test_sp = {
             "servicePrincipalId": "myapp",
             "servicePrincipalTenant": "mytenant",
             "accessToken": "Secret"
         }
-        mock_open_for_write.return_value = FileHandleStub()
         mock_read_file.return_value = json.dumps([self.token_entry1, test_sp])
         creds_cache = CredsCache()
 
@@ -437,14 +561,16 @@ class Test_Profile(unittest.TestCase):
         #assert #2
         self.assertEqual(creds_cache._service_principal_creds, [])
 
-        mock_open_for_write.assert_called_with(mock.ANY, 'w+')
-        self.assertEqual(mock_open_for_write.call_count, 2)
+        self.assertEqual(mock_write_file.call_count, 2)
+        self.assertEqual(json.loads(mock_write_file.call_args[0][1]), [])
 
     @mock.patch('azure.cli._profile._read_file_content', autospec=True)
-    @mock.patch('os.fdopen', autospec=True)
-    @mock.patch('os.open', autospec=True)
+    @mock.patch('azure.cli._profile.write_file_atomically', autospec=True)
+    @mock.patch('azure.cli._profile.file_lock', mock.MagicMock())
+    @mock.patch('azure.cli._profile._get_file_stat', return_value=None)
+    @mock.patch('atexit.register', autospec=True)
     @mock.patch('adal.AuthenticationContext', autospec=True)
-    def test_credscache_new_token_added_by_adal(self, mock_adal_auth_context, _, mock_open_for_write, mock_read_file): # pylint: disable=line-too-long
+    def test_credscache_new_token_added_by_adal(self, mock_adal_auth_context, mock_atexit_register, _, mock_write_file, mock_read_file): # pylint: disable=line-too-long
         token_entry2 = {
             "accessToken": "new token",
             "tokenType": "Bearer",
@@ -458,7 +584,6 @@ class Test_Profile(unittest.TestCase):
             return mock_adal_auth_context
 
         mock_adal_auth_context.acquire_token.side_effect = acquire_token_side_effect
-        mock_open_for_write.return_value = FileHandleStub()
         mock_read_file.return_value = json.dumps([self.token_entry1])
         creds_cache = CredsCache(auth_ctx_factory=get_auth_context)
 
@@ -472,17 +597,185 @@ class Test_Profile(unittest.TestCase):
             mock.ANY)
 
         #assert
-        mock_open_for_write.assert_called_with(mock.ANY, 'w+')
         self.assertEqual(token, 'new token')
         self.assertEqual(token_type, token_entry2['tokenType'])
+        #the token file is written once, when the process exits
+        self.assertFalse(mock_write_file.called)
+        mock_atexit_register.assert_called_once_with(creds_cache.flush)
+        creds_cache.flush()
+        self.assertEqual(mock_write_file.call_count, 1)
+        creds_cache.flush()
+        self.assertEqual(mock_write_file.call_count, 1)
+
+    def _create_creds_cache_with_auth_context(self, mock_read_file, auth_context):
+        def get_auth_context(authority, cache=None): # pylint: disable=unused-argument
+            auth_context.cache = cache
+            return auth_context
+        mock_read_file.return_value = json.dumps([self.token_entry1])
+        return CredsCache(auth_ctx_factory=get_auth_context)
+
+    @staticmethod
+    def _token_entry(access_token, expires_in):
+        return {'tokenType': 'Bearer',
+                'accessToken': access_token,
+                'expiresOn': str(datetime.now() + timedelta(seconds=expires_in))}
+
+    @mock.patch('azure.cli._profile._read_file_content', autospec=True)
+    @mock.patch('azure.cli._profile.write_file_atomically', autospec=True)
+    @mock.patch('azure.cli._profile._background_token_refresh', False)
+    def test_credscache_token_reused_until_about_to_expire(self, _, mock_read_file):
+        auth_context = mock.MagicMock()
+        creds_cache = self._create_creds_cache_with_auth_context(mock_read_file, auth_context)
+        auth_context.acquire_token.side_effect = [self._token_entry('token1', 3600),
+                                                  self._token_entry('token2', 120),
+                                                  self._token_entry('token3', 3600)]
+        mgmt_resource = 'https://management.core.windows.net/'
+
+        for _ in range(2):
+            self.assertEqual(creds_cache.retrieve_token_for_user(
+                self.user1, self.tenant_id, mgmt_resource), ('Bearer', 'token1'))
+        self.assertEqual(auth_context.acquire_token.call_count, 1)
+
+        self.assertEqual(creds_cache.retrieve_token_for_user(
+            self.user1, self.tenant_id, 'https://graph.windows.net/'), ('Bearer', 'token2'))
+        self.assertEqual(creds_cache.retrieve_token_for_user(
+            self.user1, self.tenant_id, 'https://graph.windows.net/'), ('Bearer', 'token3'))
+        self.assertEqual(auth_context.acquire_token.call_count, 3)
+
+        creds_cache.remove_cached_creds(self.user1)
+        auth_context.acquire_token.side_effect = [self._token_entry('token4', 3600)]
+        self.assertEqual(creds_cache.retrieve_token_for_user(
+            self.user1, self.tenant_id, mgmt_resource), ('Bearer', 'token4'))
+
+    @mock.patch('azure.cli._profile._read_file_content', autospec=True)
+    def test_credscache_service_principal_token_cached(self, mock_read_file):
+        test_sp = {
+            "servicePrincipalId": "myapp",
+            "servicePrincipalTenant": "mytenant",
+            "accessToken": "Secret"
+        }
+        auth_context = mock.MagicMock()
+        creds_cache = self._create_creds_cache_with_auth_context(mock_read_file, auth_context)
+        creds_cache._service_principal_creds.append(test_sp)
+        auth_context.acquire_token_with_client_credentials.return_value = \
+            self._token_entry('token1', 3600)
+
+        for _ in range(2):
+            self.assertEqual(creds_cache.retrieve_token_for_service_principal(
+                'myapp', 'https://management.core.windows.net/'), ('Bearer', 'token1'))
+        auth_context.acquire_token_with_client_credentials.assert_called_once_with(
+            'https://management.core.windows.net/', 'myapp', 'Secret')
+        #adal caches the token with the others, so it is persisted
+        self.assertIs(auth_context.cache, creds_cache.adal_token_cache)
+
+    @mock.patch('azure.cli._profile._read_file_content', autospec=True)
+    @mock.patch('azure.cli._profile._background_token_refresh', True)
+    @mock.patch('threading.Thread', autospec=True)
+    def test_credscache_token_refreshed_in_background(self, mock_thread, mock_read_file):
+        auth_context = mock.MagicMock()
+        creds_cache = self._create_creds_cache_with_auth_context(mock_read_file, auth_context)
+        auth_context.acquire_token.side_effect = [self._token_entry('token1', 180),
+                                                  self._token_entry('token2', 3600)]
+        mgmt_resource = 'https://management.core.windows.net/'
+
+        self.assertEqual(creds_cache.retrieve_token_for_user(
+            self.user1, self.tenant_id, mgmt_resource), ('Bearer', 'token1'))
+        #the token is about to expire, so it is used while a new one is acquired
+        for _ in range(2):
+            self.assertEqual(creds_cache.retrieve_token_for_user(
+                self.user1, self.tenant_id, mgmt_resource), ('Bearer', 'token1'))
+        mock_thread.assert_called_once_with(target=mock.ANY)
+        mock_thread.call_args[1]['target']()
+        self.assertEqual(creds_cache.retrieve_token_for_user(
+            self.user1, self.tenant_id, mgmt_resource), ('Bearer', 'token2'))
+        self.assertEqual(auth_context.acquire_token.call_count, 2)
+
+    @mock.patch('azure.cli._profile._read_file_content', autospec=True)
+    @mock.patch('azure.cli._profile._background_token_refresh', True)
+    def test_credscache_refresh_does_not_block_other_threads(self, mock_read_file):
+        auth_context = mock.MagicMock()
+        creds_cache = self._create_creds_cache_with_auth_context(mock_read_file, auth_context)
+        mgmt_resource = 'https://management.core.windows.net/'
+        graph_resource = 'https://graph.windows.net/'
+        refresh_started = threading.Event()
+        release_refresh = threading.Event()
+        tokens = {mgmt_resource: [self._token_entry('token1', 180)]}
+
+        def acquire_token(resource, username, client_id): # pylint: disable=unused-argument
+            if resource == graph_resource:
+                return self._token_entry('graph1', 3600)
+            if tokens[resource]:
+                return tokens[resource].pop()
+            refresh_started.set()
+            release_refresh.wait(10)
+            return self._token_entry('token2', 3600)
+        auth_context.acquire_token.side_effect = acquire_token
+
+        self.assertEqual(creds_cache.retrieve_token_for_user(
+            self.user1, self.tenant_id, mgmt_resource), ('Bearer', 'token1'))
+        self.assertEqual(creds_cache.retrieve_token_for_user(
+            self.user1, self.tenant_id, mgmt_resource), ('Bearer', 'token1'))
+        self.assertTrue(refresh_started.wait(10))
+
+        #while the refresh waits on AAD, other threads get their tokens
+        results = []
+        def retrieve_tokens():
+            for resource in [mgmt_resource, graph_resource]:
+                results.append(creds_cache.retrieve_token_for_user(
+                    self.user1, self.tenant_id, resource))
+        thread = threading.Thread(target=retrieve_tokens)
+        thread.start()
+        thread.join(10)
+        blocked = thread.is_alive()
+        release_refresh.set()
+        thread.join()
+        self.assertFalse(blocked)
+        self.assertEqual(results, [('Bearer', 'token1'), ('Bearer', 'graph1')])
+
+    @mock.patch('azure.cli._profile._read_file_content', autospec=True)
+    @mock.patch('azure.cli._profile._background_token_refresh', False)
+    def test_credscache_token_acquired_once_by_concurrent_threads(self, mock_read_file):
+        auth_context = mock.MagicMock()
+        creds_cache = self._create_creds_cache_with_auth_context(mock_read_file, auth_context)
+        mgmt_resource = 'https://management.core.windows.net/'
+        acquire_started = threading.Event()
+        release_acquire = threading.Event()
+
+        def acquire_token(*_):
+            acquire_started.set()
+            release_acquire.wait(10)
+            return self._token_entry('token1', 3600)
+        auth_context.acquire_token.side_effect = acquire_token
+
+        results = []
+        def retrieve_token():
+            results.append(creds_cache.retrieve_token_for_user(
+                self.user1, self.tenant_id, mgmt_resource))
+        threads = [threading.Thread(target=retrieve_token) for _ in range(2)]
+        threads[0].start()
+        self.assertTrue(acquire_started.wait(10))
+        threads[1].start()
+        release_acquire.set()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, [('Bearer', 'token1')] * 2)
+        self.assertEqual(auth_context.acquire_token.call_count, 1)
+
+    @mock.patch('azure.cli._profile._read_file_content', autospec=True)
+    @mock.patch('azure.cli._profile.write_file_atomically', autospec=True)
+    @mock.patch('azure.cli._profile.file_lock', mock.MagicMock())
+    @mock.patch('azure.cli._profile._get_file_stat', autospec=True)
+    def test_credscache_flush_skipped_if_file_changed(self, mock_get_file_stat, mock_write_file,
+                                                      mock_read_file):
+        mock_get_file_stat.return_value = (1.0, 10)
+        mock_read_file.return_value = json.dumps([self.token_entry1])
+        creds_cache = CredsCache()
+        creds_cache.adal_token_cache.has_state_changed = True
 
-class FileHandleStub(object): # pylint: disable=too-few-public-methods
-    def write(self, content):
-        pass
-    def __enter__(self):
-        return self
-    def __exit__(self, _2, _3, _4):
-        pass
+        mock_get_file_stat.return_value = (2.0, 10)
+        creds_cache.flush()
+        self.assertFalse(mock_write_file.called)
+        self.assertFalse(creds_cache.adal_token_cache.has_state_changed)
 
 class SubscriptionStub(object): # pylint: disable=too-few-public-methods
     def __init__(self, id, display_name, state, tenant_id): # pylint: disable=redefined-builtin,
@@ -0,0 +1,91 @@
+#---------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+#---------------------------------------------------------------------------------------------
+
+import errno
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from six import StringIO
+
+import azure.cli._profiling as profiling
+
+class TestProfiling(unittest.TestCase):
+
+    def tearDown(self):
+        profiling.stop_profiling(StringIO())
+
+    def _stop(self):
+        output = StringIO()
+        profiling.stop_profiling(output)
+        return json.loads(output.getvalue())
+
+    def test_phase_not_recorded_when_not_profiling(self):
+        self.assertFalse(profiling.is_profiling())
+        self.assertIs(profiling.phase('a'), profiling.phase('b'))
+        with profiling.phase('a'):
+            pass
+
+    def test_profile_phases(self):
+        profiling.start_profiling()
+        self.assertTrue(profiling.is_profiling())
+        with profiling.phase('outer'):
+            with profiling.phase('inner'):
+                pass
+        with profiling.phase('next'):
+            pass
+        profile = self._stop()
+
+        self.assertFalse(profiling.is_profiling())
+        self.assertEqual([(p['name'], p['depth']) for p in profile['phases']],
+                         [('outer', 0), ('inner', 1), ('next', 0)])
+        outer, inner, _ = profile['phases']
+        self.assertGreaterEqual(outer['duration'], inner['duration'])
+        self.assertGreaterEqual(profile['total'], outer['duration'])
+
+    def test_phase_recorded_on_error(self):
+        profiling.start_profiling()
+        with self.assertRaises(ValueError):
+            with profiling.phase('failing'):
+                raise ValueError()
+        self.assertIn('duration', self._stop()['phases'][0])
+
+    def test_stop_profiling_output_closed(self):
+        class ClosedOutput(object): # pylint: disable=too-few-public-methods
+            def write(self, _):
+                raise IOError(errno.EPIPE, 'Broken pipe')
+
+        profiling.start_profiling()
+        profiling.stop_profiling(ClosedOutput())
+        self.assertFalse(profiling.is_profiling())
+
+    @unittest.skipIf(sys.version_info < (3, 4), 'Imports are only profiled on Python 3.4+')
+    def test_profile_imports(self):
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        with open(os.path.join(temp_dir, 'profiled_parent.py'), 'w') as f:
+            f.write('import profiled_child\n')
+        with open(os.path.join(temp_dir, 'profiled_child.py'), 'w') as f:
+            f.write('VALUE = 1\n')
+        sys.path.insert(0, temp_dir)
+        self.addCleanup(sys.path.remove, temp_dir)
+        self.addCleanup(sys.modules.pop, 'profiled_parent', None)
+        self.addCleanup(sys.modules.pop, 'profiled_child', None)
+
+        profiling.start_profiling()
+        import profiled_parent # pylint: disable=import-error,unused-variable
+        profile = self._stop()
+
+        imports = {i['module']: i for i in profile['imports']}
+        parent, child = imports['profiled_parent'], imports['profiled_child']
+        self.assertGreaterEqual(parent['cumulative'], child['cumulative'])
+        self.assertAlmostEqual(parent['self'], parent['cumulative'] - child['cumulative'])
+        self.assertFalse([f for f in sys.meta_path
+                          if isinstance(f, profiling._ImportTimer)]) # pylint: disable=protected-access
+
+if __name__ == '__main__':
+    unittest.main()
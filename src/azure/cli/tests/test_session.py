@@ -0,0 +1,116 @@
+#---------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+#---------------------------------------------------------------------------------------------
+
+import json
+import os
+import shutil
+import stat
+import tempfile
+import time
+import unittest
+import mock
+
+from azure.cli._session import Session, write_file_atomically
+
+class TestSession(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir)
+        self.file_path = os.path.join(self.temp_dir, 'az.json')
+        atexit_patcher = mock.patch('atexit.register', autospec=True)
+        self.mock_atexit_register = atexit_patcher.start()
+        self.addCleanup(atexit_patcher.stop)
+
+    def _write(self, data):
+        with open(self.file_path, 'w') as f:
+            json.dump(data, f)
+
+    def _read(self):
+        with open(self.file_path) as f:
+            return json.load(f)
+
+    def _load(self, max_age=0):
+        session = Session('ascii')
+        session.load(self.file_path, max_age)
+        return session
+
+    def test_missing_file_not_created(self):
+        session = self._load()
+        self.assertEqual(len(session), 0)
+        self.assertEqual(session.get('key'), None)
+        session.flush()
+        self.assertFalse(os.path.exists(self.file_path))
+
+    def test_changes_saved_once(self):
+        session = self._load()
+        session['a'] = 1
+        session['b'] = 2
+        self.assertFalse(os.path.exists(self.file_path))
+        self.mock_atexit_register.assert_called_once_with(session.flush)
+
+        session.flush()
+        self.assertEqual(self._read(), {'a': 1, 'b': 2})
+        self.assertEqual(sorted(os.listdir(self.temp_dir)), ['az.json', 'az.json.lock'])
+
+    def test_changes_merged_into_file(self):
+        self._write({'a': 1, 'b': 2, 'c': 3})
+        first, second = self._load(), self._load()
+        first['a'] = 10
+        second['c'] = 30
+        del second['b']
+        first.flush()
+        second.flush()
+        self.assertEqual(self._read(), {'a': 10, 'c': 30})
+
+    def test_indirect_modifications_saved(self):
+        self._write({'a': {'x': 1}})
+        session = self._load()
+        session['a']['x'] = 2
+        session.save()
+        self.assertEqual(self._read(), {'a': {'x': 2}})
+
+    def test_expired_file_replaced(self):
+        self._write({'a': 1})
+        expired = time.time() - 7200
+        os.utime(self.file_path, (expired, expired))
+        session = self._load(max_age=3600)
+        self.assertEqual(len(session), 0)
+        self.assertEqual(self._read(), {'a': 1})
+
+        session['b'] = 2
+        session.flush()
+        self.assertEqual(self._read(), {'b': 2})
+        self.assertEqual(self._load(max_age=3600).data, {'b': 2})
+
+    def test_corrupt_file_replaced(self):
+        with open(self.file_path, 'w') as f:
+            f.write('{"a": ')
+        session = self._load()
+        self.assertEqual(len(session), 0)
+        session['b'] = 2
+        session.flush()
+        self.assertEqual(self._read(), {'b': 2})
+
+    def test_load_saves_changes_to_previous_file(self):
+        session = self._load()
+        session['a'] = 1
+        session.load(os.path.join(self.temp_dir, 'az.sess'))
+        self.assertEqual(self._read(), {'a': 1})
+
+    def test_write_file_atomically(self):
+        with open(self.file_path, 'w') as f:
+            f.write('previous')
+
+        write_file_atomically(self.file_path, '[]')
+
+        with open(self.file_path) as f:
+            self.assertEqual(f.read(), '[]')
+        self.assertEqual(os.listdir(self.temp_dir), ['az.json'])
+        if os.name != 'nt':
+            self.assertEqual(stat.S_IMODE(os.stat(self.file_path).st_mode), 0o600)
+
+if __name__ == '__main__':
+    unittest.main()
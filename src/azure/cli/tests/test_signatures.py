@@ -0,0 +1,49 @@
+#---------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+#---------------------------------------------------------------------------------------------
+
+import os
+import pkgutil
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from codecs import open as codecs_open
+
+import azure.cli.command_modules
+
+GEN_SIGNATURES_SCRIPT = os.path.join(os.path.dirname(__file__), '..', '..', '..', '..',
+                                     'scripts', 'sdk_command_gen', 'gen_signatures.py')
+
+def _get_signature_files():
+    '''Yield (command module name, path) for every command module with a _signatures.py.'''
+    for _, name, _ in pkgutil.iter_modules(azure.cli.command_modules.__path__):
+        for directory in azure.cli.command_modules.__path__:
+            path = os.path.join(directory, name, '_signatures.py')
+            if os.path.isfile(path):
+                yield name, path
+                break
+
+@unittest.skipUnless(os.path.isfile(GEN_SIGNATURES_SCRIPT), 'requires the source tree')
+class TestSignatures(unittest.TestCase):
+
+    def test_signatures_up_to_date(self):
+        home = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, home)
+        # Don't read or change the configuration of the user
+        env = dict(os.environ, HOME=home, USERPROFILE=home)
+
+        stale = []
+        for name, path in _get_signature_files():
+            generated = subprocess.check_output([sys.executable, GEN_SIGNATURES_SCRIPT, name],
+                                                env=env).decode('utf-8')
+            with codecs_open(path, 'r', encoding='utf-8') as f:
+                if f.read().replace('\r\n', '\n') != generated.replace('\r\n', '\n'):
+                    stale.append(path)
+        self.assertEqual(stale, [], 'Regenerate these files with {}'.format(
+            os.path.normpath(GEN_SIGNATURES_SCRIPT)))
+
+if __name__ == '__main__':
+    unittest.main()
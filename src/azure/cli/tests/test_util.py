@@ -4,12 +4,20 @@
 #---------------------------------------------------------------------------------------------
 
 # pylint: disable=line-too-long
-from collections import namedtuple
+from collections import namedtuple, OrderedDict
+from datetime import datetime, timedelta
+from enum import Enum
 import unittest
 import tempfile
 
 from azure.cli._util import get_file_json, todict
 
+class MyEnum(Enum):
+    small = 'Small'
+
+class MyList(list):
+    pass
+
 class TestUtils(unittest.TestCase):
 
     def test_application_todict_none(self):
@@ -51,6 +59,29 @@ class TestUtils(unittest.TestCase):
         expected = {'a': {'a': 'x', 'b': 'y'}}
         self.assertEqual(actual, expected)
 
+    def test_application_todict_model(self):
+        class MyModel(object): # pylint: disable=too-few-public-methods
+            def __init__(self, **kwargs):
+                self.__dict__.update(kwargs)
+                self._private = 'p'
+
+            def method(self):
+                pass
+
+        the_input = [MyModel(resource_group='rg', os_profile=MyModel(admin_user_name='u')),
+                     MyModel(resource_group=None, when=datetime(2016, 7, 1), size=MyEnum.small)]
+        actual = todict(the_input)
+        expected = [{'resourceGroup': 'rg', 'osProfile': {'adminUserName': 'u'}},
+                    {'resourceGroup': None, 'when': '2016-07-01T00:00:00', 'size': 'Small'}]
+        self.assertEqual(actual, expected)
+
+    def test_application_todict_subclasses(self):
+        the_input = OrderedDict([('a', MyList([timedelta(seconds=1)]))])
+        actual = todict(the_input)
+        self.assertEqual(type(actual), dict)
+        self.assertEqual(type(actual['a']), list)
+        self.assertEqual(actual, {'a': ['0:00:01']})
+
     def test_load_json_from_file(self):
         _, pathname = tempfile.mkstemp()
 
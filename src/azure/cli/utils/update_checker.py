@@ -5,12 +5,10 @@
 
 import os
 import re
-import imp
 import requests
-import pip
-from pip import get_installed_distributions
 from pip._vendor.packaging import version as packaging_version
 from azure.cli._util import CLIError
+from azure.cli._component_registry import get_installed_components
 
 PRIVATE_PYPI_URL_ENV_NAME = 'AZURE_CLI_PRIVATE_PYPI_URL'
 PRIVATE_PYPI_URL = os.environ.get(PRIVATE_PYPI_URL_ENV_NAME)
@@ -55,14 +53,11 @@ def _get_latest_version_public(pkg_name):
     return sorted_versions[-1] if sorted_versions else None
 
 def _get_current_version(pkg_name):
-    # workaround for getting up-to-date distributions
-    # https://github.com/pypa/pip/issues/2695#issuecomment-96380041
-    pip.utils.pkg_resources = imp.reload(pip.utils.pkg_resources)
-    current_dist = [dist for dist in get_installed_distributions(local_only=True)
-                    if dist.key == pkg_name]
-    if not current_dist:
+    # Bypass the cached component list to get up-to-date versions
+    current_version = get_installed_components(refresh=True).get(pkg_name)
+    if not current_version:
         raise UpdateCheckError("Component not installed.")
-    return packaging_version.parse(current_dist[0].version)
+    return packaging_version.parse(current_version)
 
 def _check_for_update(pkg_name, private=False):
     current_version = _get_current_version(pkg_name)
@@ -5,6 +5,7 @@
 
 # pylint: disable=unused-import
 
+import azure.cli.command_modules.component._signatures
 import azure.cli.command_modules.component._params
 import azure.cli.command_modules.component.generated
 import azure.cli.command_modules.component.custom
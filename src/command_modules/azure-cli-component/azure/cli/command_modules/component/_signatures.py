@@ -0,0 +1,68 @@
+#---------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+#---------------------------------------------------------------------------------------------
+
+# This file is generated by scripts/sdk_command_gen/gen_signatures.py. Do not modify it by hand.
+# pylint: skip-file
+
+from azure.cli.commands._introspection import register_signatures
+
+register_signatures({
+    'azure.cli.command_modules.component.custom#check_component': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['component_name', 'private'], 'defaults': [False]},
+        'doc': None,
+        'arguments': [
+            ('component_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('private', {'required': False, 'default': False, 'help': None, 'action': 'store_true'}),
+        ]},
+    'azure.cli.command_modules.component.custom#install': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['component_name', 'link', 'private', 'version'], 'defaults': [None, False, None]},
+        'doc': None,
+        'arguments': [
+            ('component_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('link', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('private', {'required': False, 'default': False, 'help': None, 'action': 'store_true'}),
+            ('version', {'required': False, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.component.custom#list_components': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': [], 'defaults': []},
+        'doc': None,
+        'arguments': [
+        ]},
+    'azure.cli.command_modules.component.custom#remove': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['component_name', 'force'], 'defaults': [False]},
+        'doc': None,
+        'arguments': [
+            ('component_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('force', {'required': False, 'default': False, 'help': None, 'action': 'store_true'}),
+        ]},
+    'azure.cli.command_modules.component.custom#update': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['component_name', 'link', 'private'], 'defaults': [None, False]},
+        'doc': None,
+        'arguments': [
+            ('component_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('link', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('private', {'required': False, 'default': False, 'help': None, 'action': 'store_true'}),
+        ]},
+    'azure.cli.command_modules.component.custom#update_all': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['link', 'private'], 'defaults': [None, False]},
+        'doc': None,
+        'arguments': [
+            ('link', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('private', {'required': False, 'default': False, 'help': None, 'action': 'store_true'}),
+        ]},
+    'azure.cli.command_modules.component.custom#update_self': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['private'], 'defaults': [False]},
+        'doc': None,
+        'arguments': [
+            ('private', {'required': False, 'default': False, 'help': None, 'action': 'store_true'}),
+        ]},
+})
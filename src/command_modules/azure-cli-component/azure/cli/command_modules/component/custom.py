@@ -12,6 +12,9 @@ from six.moves import input #pylint: disable=redefined-builtin
 from azure.cli.parser import IncorrectUsageError
 from azure.cli.help_files import helps
 from azure.cli.utils.update_checker import check_for_component_update
+from azure.cli.commands._command_index import invalidate_command_index
+from azure.cli._component_registry import (get_installed_components,
+                                           invalidate_installed_components)
 from azure.cli._util import CLIError
 
 CLI_PACKAGE_NAME = 'azure-cli'
@@ -25,8 +28,7 @@ PRIVATE_PYPI_HOST = os.environ.get(PRIVATE_PYPI_HOST_ENV_NAME)
 def _install_or_update(component_name, version, link, private, upgrade=False):
     if not component_name:
         raise IncorrectUsageError('Specify a component name.')
-    found = bool([dist for dist in pip.get_installed_distributions(local_only=True)
-                  if dist.key == COMPONENT_PREFIX + component_name])
+    found = COMPONENT_PREFIX + component_name in get_installed_components()
     if found and not upgrade:
         raise CLIError("Component already installed.")
     else:
@@ -48,14 +50,16 @@ def _install_or_update(component_name, version, link, private, upgrade=False):
                                   '--trusted-host', PRIVATE_PYPI_HOST]
         pip.main(['install'] + options + [COMPONENT_PREFIX + component_name+version_no]
                  + pkg_index_options)
+        invalidate_installed_components()
+        invalidate_command_index()
 
 helps['component list'] = """
     short-summary: List the installed components
 """
 def list_components():
-    return sorted([{'name': dist.key.replace(COMPONENT_PREFIX, ''), 'version': dist.version}
-                   for dist in pip.get_installed_distributions(local_only=True)
-                   if dist.key.startswith(COMPONENT_PREFIX)], key=lambda x: x['name'])
+    return sorted([{'name': name.replace(COMPONENT_PREFIX, ''), 'version': version}
+                   for name, version in get_installed_components().items()
+                   if name.startswith(COMPONENT_PREFIX)], key=lambda x: x['name'])
 
 helps['component install'] = """
     short-summary: Install a component
@@ -91,14 +95,16 @@ def update_self(private=False):
                               '--trusted-host', PRIVATE_PYPI_HOST]
     pip.main(['install', '--quiet', '--isolated', '--disable-pip-version-check', '--upgrade']
              + [CLI_PACKAGE_NAME] + pkg_index_options)
+    invalidate_installed_components()
+    invalidate_command_index()
 
 helps['component update-all'] = """
     short-summary: Update all components
 """
 def update_all(link=None, private=False):
-    component_names = [dist.key.replace(COMPONENT_PREFIX, '')
-                       for dist in pip.get_installed_distributions(local_only=True)
-                       if dist.key.startswith(COMPONENT_PREFIX)]
+    component_names = [name.replace(COMPONENT_PREFIX, '')
+                       for name in get_installed_components()
+                       if name.startswith(COMPONENT_PREFIX)]
     for name in component_names:
         _install_or_update(name, None, link, private, upgrade=True)
 
@@ -109,8 +115,7 @@ helps['component check'] = """
           short-summary: The component name to check.
 """
 def check_component(component_name, private=False):
-    found = bool([dist for dist in pip.get_installed_distributions(local_only=True)
-                  if dist.key == COMPONENT_PREFIX + component_name])
+    found = COMPONENT_PREFIX + component_name in get_installed_components()
     if not found:
         raise CLIError("Component not installed.")
     update_status = check_for_component_update(component_name, private)
@@ -128,8 +133,7 @@ helps['component remove'] = """
 """
 def remove(component_name, force=False):
     prompt_for_delete = force is None
-    found = bool([dist for dist in pip.get_installed_distributions(local_only=True)
-                  if dist.key == COMPONENT_PREFIX + component_name])
+    found = COMPONENT_PREFIX + component_name in get_installed_components()
     if found:
         if prompt_for_delete:
             ans = input("Really delete '{}'? [y/N] ".format(component_name))
@@ -137,5 +141,7 @@ def remove(component_name, force=False):
                 return
         pip.main(['uninstall', '--quiet', '--isolated', '--yes',
                   '--disable-pip-version-check', COMPONENT_PREFIX + component_name])
+        invalidate_installed_components()
+        invalidate_command_index()
     else:
         raise CLIError("Component not installed.")
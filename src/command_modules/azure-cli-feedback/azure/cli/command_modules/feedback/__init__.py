@@ -42,13 +42,13 @@ def _prompt_net_promoter_score():
             logger.warning('Valid values are %s', list(range(11)))
 
 def _get_version_info():
-    from pip import get_installed_distributions
-    installed_dists = get_installed_distributions(local_only=True)
+    from azure.cli._component_registry import get_installed_components
+    installed_components = get_installed_components()
 
-    component_version_info = sorted([{'name': dist.key.replace(COMPONENT_PREFIX, ''),
-                                      'version': dist.version}
-                                     for dist in installed_dists
-                                     if dist.key.startswith(COMPONENT_PREFIX)],
+    component_version_info = sorted([{'name': name.replace(COMPONENT_PREFIX, ''),
+                                      'version': version}
+                                     for name, version in installed_components.items()
+                                     if name.startswith(COMPONENT_PREFIX)],
                                     key=lambda x: x['name'])
     return str(component_version_info), sys.version
 
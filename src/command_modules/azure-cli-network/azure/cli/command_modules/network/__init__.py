@@ -5,6 +5,7 @@
 
 # pylint: disable=unused-import
 
+import azure.cli.command_modules.network._signatures
 import azure.cli.command_modules.network._params
 import azure.cli.command_modules.network.generated
 import azure.cli.command_modules.network.custom
@@ -0,0 +1,1056 @@
+#---------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+#---------------------------------------------------------------------------------------------
+
+# This file is generated by scripts/sdk_command_gen/gen_signatures.py. Do not modify it by hand.
+# pylint: skip-file
+
+from azure.cli.commands._introspection import register_signatures
+
+register_signatures({
+    'azure.cli.command_modules.network.custom#add_nic_ip_config_address_pool': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'network_interface_name', 'ip_config_name', 'backend_address_pool', 'load_balancer_name'], 'defaults': [None]},
+        'doc': None,
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('network_interface_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('ip_config_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('backend_address_pool', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('load_balancer_name', {'required': False, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.network.custom#add_nic_ip_config_inbound_nat_rule': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'network_interface_name', 'ip_config_name', 'inbound_nat_rule', 'load_balancer_name'], 'defaults': [None]},
+        'doc': None,
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('network_interface_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('ip_config_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('inbound_nat_rule', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('load_balancer_name', {'required': False, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.network.custom#create_lb_backend_address_pool': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'load_balancer_name', 'item_name'], 'defaults': []},
+        'doc': None,
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('load_balancer_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('item_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.network.custom#create_lb_frontend_ip_configuration': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'load_balancer_name', 'item_name', 'public_ip_address', 'subnet', 'virtual_network_name', 'private_ip_address', 'private_ip_address_allocation'], 'defaults': [None, None, None, None, 'dynamic']},
+        'doc': None,
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('load_balancer_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('item_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('public_ip_address', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('subnet', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('virtual_network_name', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('private_ip_address', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('private_ip_address_allocation', {'required': False, 'default': 'dynamic', 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.network.custom#create_lb_inbound_nat_pool': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'load_balancer_name', 'item_name', 'protocol', 'frontend_port_range_start', 'frontend_port_range_end', 'backend_port', 'frontend_ip_name'], 'defaults': [None]},
+        'doc': None,
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('load_balancer_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('item_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('protocol', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('frontend_port_range_start', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('frontend_port_range_end', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('backend_port', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('frontend_ip_name', {'required': False, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.network.custom#create_lb_inbound_nat_rule': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'load_balancer_name', 'item_name', 'protocol', 'frontend_port', 'frontend_ip_name', 'backend_port', 'floating_ip', 'idle_timeout'], 'defaults': ['false', None]},
+        'doc': None,
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('load_balancer_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('item_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('protocol', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('frontend_port', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('frontend_ip_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('backend_port', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('floating_ip', {'required': False, 'default': 'false', 'help': None, 'action': None}),
+            ('idle_timeout', {'required': False, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.network.custom#create_lb_probe': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'load_balancer_name', 'item_name', 'protocol', 'port', 'path', 'interval', 'threshold'], 'defaults': [None, None, None]},
+        'doc': None,
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('load_balancer_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('item_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('protocol', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('port', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('path', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('interval', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('threshold', {'required': False, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.network.custom#create_lb_rule': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'load_balancer_name', 'item_name', 'protocol', 'frontend_port', 'backend_port', 'frontend_ip_name', 'backend_address_pool_name', 'probe_name', 'load_distribution', 'floating_ip', 'idle_timeout'], 'defaults': [None, 'default', 'false', None]},
+        'doc': None,
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('load_balancer_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('item_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('protocol', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('frontend_port', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('backend_port', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('frontend_ip_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('backend_address_pool_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('probe_name', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('load_distribution', {'required': False, 'default': 'default', 'help': None, 'action': None}),
+            ('floating_ip', {'required': False, 'default': 'false', 'help': None, 'action': None}),
+            ('idle_timeout', {'required': False, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.network.custom#create_nic_ip_config': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'network_interface_name', 'ip_config_name', 'subnet', 'virtual_network_name', 'public_ip_address', 'load_balancer_name', 'load_balancer_backend_address_pool_ids', 'load_balancer_inbound_nat_rule_ids', 'private_ip_address', 'private_ip_address_allocation', 'private_ip_address_version'], 'defaults': [None, None, None, None, None, None, None, 'dynamic', 'ipv4']},
+        'doc': '95931438',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group. The name is case insensitive.', 'action': None}),
+            ('network_interface_name', {'required': True, 'default': None, 'help': 'Name of the new NIC.', 'action': None}),
+            ('ip_config_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('subnet', {'required': False, 'default': None, 'help': 'Name or ID of an existing subnet to associate with the NIC.', 'action': None}),
+            ('virtual_network_name', {'required': False, 'default': None, 'help': 'Virtual network to associate with the NIC.', 'action': None}),
+            ('public_ip_address', {'required': False, 'default': None, 'help': 'Name or ID an existing public IP address to associate with the NIC.', 'action': None}),
+            ('load_balancer_name', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('load_balancer_backend_address_pool_ids', {'required': False, 'default': None, 'help': 'Array of load balancer backend address pool IDs.', 'action': None}),
+            ('load_balancer_inbound_nat_rule_ids', {'required': False, 'default': None, 'help': 'Array of load balancer inbound NAT rule IDs.', 'action': None}),
+            ('private_ip_address', {'required': False, 'default': None, 'help': 'Static private IP address to use.', 'action': None}),
+            ('private_ip_address_allocation', {'required': False, 'default': 'dynamic', 'help': "Private IP address allocation method. Possible values include: 'dynamic', 'static'", 'action': None}),
+            ('private_ip_address_version', {'required': False, 'default': 'ipv4', 'help': "The private IP address version to use. Possible values include: 'ipv4', 'ipv6'", 'action': None}),
+        ]},
+    'azure.cli.command_modules.network.custom#create_nsg_rule': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'network_security_group_name', 'security_rule_name', 'protocol', 'source_address_prefix', 'destination_address_prefix', 'access', 'direction', 'source_port_range', 'destination_port_range', 'description', 'priority'], 'defaults': [None, None]},
+        'doc': 'dc3fb3fc',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('network_security_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('security_rule_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('protocol', {'required': True, 'default': None, 'help': "Gets or sets Network protocol this rule applies to. Can be Tcp, Udp or All(*). Possible values include: 'Tcp', 'Udp', '*'", 'action': None}),
+            ('source_address_prefix', {'required': True, 'default': None, 'help': "Gets or sets source address prefix. CIDR or source IP range. Asterix '*' can also be used to match all source IPs. Default tags such as 'VirtualNetwork', 'AzureLoadBalancer' and 'Internet' can also be used. If this is an ingress rule, specifies where network traffic originates from.", 'action': None}),
+            ('destination_address_prefix', {'required': True, 'default': None, 'help': "Gets or sets destination address prefix. CIDR or source IP range. Asterix '*' can also be used to match all source IPs. Default tags such as 'VirtualNetwork', 'AzureLoadBalancer' and 'Internet' can also be used.", 'action': None}),
+            ('access', {'required': True, 'default': None, 'help': "Gets or sets network traffic is allowed or denied. Possible values are 'Allow' and 'Deny'. Possible values include: 'Allow', 'Deny'", 'action': None}),
+            ('direction', {'required': True, 'default': None, 'help': "Gets or sets the direction of the rule.InBound or Outbound. The direction specifies if rule will be evaluated on incoming or outcoming traffic. Possible values include: 'Inbound', 'Outbound'", 'action': None}),
+            ('source_port_range', {'required': True, 'default': None, 'help': "Gets or sets Source Port or Range. Integer or range between 0 and 65535. Asterix '*' can also be used to match all ports.", 'action': None}),
+            ('destination_port_range', {'required': True, 'default': None, 'help': "Gets or sets Destination Port or Range. Integer or range between 0 and 65535. Asterix '*' can also be used to match all ports.", 'action': None}),
+            ('description', {'required': False, 'default': None, 'help': 'Gets or sets a description for this rule. Restricted to 140 chars.', 'action': None}),
+            ('priority', {'required': False, 'default': None, 'help': 'Gets or sets the priority of the rule. The value can be between 100 and 4096. The priority number must be unique for each rule in the collection. The lower the priority number, the higher the priority of the rule.', 'action': None}),
+        ]},
+    'azure.cli.command_modules.network.custom#create_subnet': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'virtual_network_name', 'subnet_name', 'address_prefix', 'network_security_group'], 'defaults': ['10.0.0.0/24', None]},
+        'doc': '06cac719',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('virtual_network_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('subnet_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('address_prefix', {'required': False, 'default': '10.0.0.0/24', 'help': 'address prefix in CIDR format.', 'action': None}),
+            ('network_security_group', {'required': False, 'default': None, 'help': 'attach with existing network security group, both name or id are accepted.', 'action': None}),
+        ]},
+    'azure.cli.command_modules.network.custom#list_application_gateways': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name'], 'defaults': [None]},
+        'doc': None,
+        'arguments': [
+            ('resource_group_name', {'required': False, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.network.custom#list_express_route_circuits': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name'], 'defaults': [None]},
+        'doc': None,
+        'arguments': [
+            ('resource_group_name', {'required': False, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.network.custom#list_lbs': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name'], 'defaults': [None]},
+        'doc': None,
+        'arguments': [
+            ('resource_group_name', {'required': False, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.network.custom#list_nics': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name'], 'defaults': [None]},
+        'doc': None,
+        'arguments': [
+            ('resource_group_name', {'required': False, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.network.custom#list_nsgs': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name'], 'defaults': [None]},
+        'doc': None,
+        'arguments': [
+            ('resource_group_name', {'required': False, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.network.custom#list_public_ips': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name'], 'defaults': [None]},
+        'doc': None,
+        'arguments': [
+            ('resource_group_name', {'required': False, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.network.custom#list_route_tables': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name'], 'defaults': [None]},
+        'doc': None,
+        'arguments': [
+            ('resource_group_name', {'required': False, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.network.custom#list_vnet': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name'], 'defaults': [None]},
+        'doc': None,
+        'arguments': [
+            ('resource_group_name', {'required': False, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.network.custom#remove_nic_ip_config_address_pool': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'network_interface_name', 'ip_config_name', 'backend_address_pool', 'load_balancer_name'], 'defaults': [None]},
+        'doc': None,
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('network_interface_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('ip_config_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('backend_address_pool', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('load_balancer_name', {'required': False, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.network.custom#remove_nic_ip_config_inbound_nat_rule': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'network_interface_name', 'ip_config_name', 'inbound_nat_rule', 'load_balancer_name'], 'defaults': [None]},
+        'doc': None,
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('network_interface_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('ip_config_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('inbound_nat_rule', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('load_balancer_name', {'required': False, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.network.custom#set_lb_frontend_ip_configuration': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'load_balancer_name', 'item_name', 'private_ip_address', 'private_ip_address_allocation', 'public_ip_address', 'subnet', 'virtual_network_name'], 'defaults': [None, None, None, None, None]},
+        'doc': None,
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('load_balancer_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('item_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('private_ip_address', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('private_ip_address_allocation', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('public_ip_address', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('subnet', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('virtual_network_name', {'required': False, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.network.custom#set_lb_inbound_nat_pool': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'load_balancer_name', 'item_name', 'protocol', 'frontend_port_range_start', 'frontend_port_range_end', 'backend_port', 'frontend_ip_name'], 'defaults': [None, None, None, None, None]},
+        'doc': None,
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('load_balancer_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('item_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('protocol', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('frontend_port_range_start', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('frontend_port_range_end', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('backend_port', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('frontend_ip_name', {'required': False, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.network.custom#set_lb_inbound_nat_rule': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'load_balancer_name', 'item_name', 'protocol', 'frontend_port', 'frontend_ip_name', 'backend_port', 'floating_ip', 'idle_timeout'], 'defaults': [None, None, None, None, None, None]},
+        'doc': None,
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('load_balancer_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('item_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('protocol', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('frontend_port', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('frontend_ip_name', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('backend_port', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('floating_ip', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('idle_timeout', {'required': False, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.network.custom#set_lb_probe': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'load_balancer_name', 'item_name', 'protocol', 'port', 'path', 'interval', 'threshold'], 'defaults': [None, None, None, None, None]},
+        'doc': None,
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('load_balancer_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('item_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('protocol', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('port', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('path', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('interval', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('threshold', {'required': False, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.network.custom#set_lb_rule': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'load_balancer_name', 'item_name', 'protocol', 'frontend_port', 'frontend_ip_name', 'backend_port', 'backend_address_pool_name', 'probe_name', 'load_distribution', 'floating_ip', 'idle_timeout'], 'defaults': [None, None, None, None, None, None, 'default', None, None]},
+        'doc': None,
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('load_balancer_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('item_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('protocol', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('frontend_port', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('frontend_ip_name', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('backend_port', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('backend_address_pool_name', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('probe_name', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('load_distribution', {'required': False, 'default': 'default', 'help': None, 'action': None}),
+            ('floating_ip', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('idle_timeout', {'required': False, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.network.custom#set_nic': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'network_interface_name', 'network_security_group', 'enable_ip_forwarding', 'internal_dns_name_label'], 'defaults': [None, None, None]},
+        'doc': '95931438',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group. The name is case insensitive.', 'action': None}),
+            ('network_interface_name', {'required': True, 'default': None, 'help': 'Name of the new NIC.', 'action': None}),
+            ('network_security_group', {'required': False, 'default': None, 'help': 'Name or ID of an existing network security group to associate with the NIC.', 'action': None}),
+            ('enable_ip_forwarding', {'required': False, 'default': None, 'help': 'Enable IP forwarding.', 'action': None}),
+            ('internal_dns_name_label', {'required': False, 'default': None, 'help': 'The internal DNS name label.', 'action': None}),
+        ]},
+    'azure.cli.command_modules.network.custom#set_nic_ip_config': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'network_interface_name', 'ip_config_name', 'subnet', 'virtual_network_name', 'public_ip_address', 'load_balancer_name', 'load_balancer_backend_address_pool_ids', 'load_balancer_inbound_nat_rule_ids', 'private_ip_address', 'private_ip_address_allocation', 'private_ip_address_version'], 'defaults': [None, None, None, None, None, None, None, None, 'ipv4']},
+        'doc': '95931438',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group. The name is case insensitive.', 'action': None}),
+            ('network_interface_name', {'required': True, 'default': None, 'help': 'Name of the new NIC.', 'action': None}),
+            ('ip_config_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('subnet', {'required': False, 'default': None, 'help': 'Name or ID of an existing subnet to associate with the NIC.', 'action': None}),
+            ('virtual_network_name', {'required': False, 'default': None, 'help': 'Virtual network to associate with the NIC.', 'action': None}),
+            ('public_ip_address', {'required': False, 'default': None, 'help': 'Name or ID an existing public IP address to associate with the NIC.', 'action': None}),
+            ('load_balancer_name', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('load_balancer_backend_address_pool_ids', {'required': False, 'default': None, 'help': 'Array of load balancer backend address pool IDs.', 'action': None}),
+            ('load_balancer_inbound_nat_rule_ids', {'required': False, 'default': None, 'help': 'Array of load balancer inbound NAT rule IDs.', 'action': None}),
+            ('private_ip_address', {'required': False, 'default': None, 'help': 'Static private IP address to use.', 'action': None}),
+            ('private_ip_address_allocation', {'required': False, 'default': None, 'help': "Private IP address allocation method. Possible values include: 'dynamic', 'static'", 'action': None}),
+            ('private_ip_address_version', {'required': False, 'default': 'ipv4', 'help': "The private IP address version to use. Possible values include: 'ipv4', 'ipv6'", 'action': None}),
+        ]},
+    'azure.cli.command_modules.network.custom#update_nsg_rule': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'network_security_group_name', 'security_rule_name', 'protocol', 'source_address_prefix', 'destination_address_prefix', 'access', 'direction', 'description', 'source_port_range', 'destination_port_range', 'priority'], 'defaults': [None, None, None, None, None, None, None, None, None]},
+        'doc': 'dc3fb3fc',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('network_security_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('security_rule_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('protocol', {'required': False, 'default': None, 'help': "Gets or sets Network protocol this rule applies to. Can be Tcp, Udp or All(*). Possible values include: 'Tcp', 'Udp', '*'", 'action': None}),
+            ('source_address_prefix', {'required': False, 'default': None, 'help': "Gets or sets source address prefix. CIDR or source IP range. Asterix '*' can also be used to match all source IPs. Default tags such as 'VirtualNetwork', 'AzureLoadBalancer' and 'Internet' can also be used. If this is an ingress rule, specifies where network traffic originates from.", 'action': None}),
+            ('destination_address_prefix', {'required': False, 'default': None, 'help': "Gets or sets destination address prefix. CIDR or source IP range. Asterix '*' can also be used to match all source IPs. Default tags such as 'VirtualNetwork', 'AzureLoadBalancer' and 'Internet' can also be used.", 'action': None}),
+            ('access', {'required': False, 'default': None, 'help': "Gets or sets network traffic is allowed or denied. Possible values are 'Allow' and 'Deny'. Possible values include: 'Allow', 'Deny'", 'action': None}),
+            ('direction', {'required': False, 'default': None, 'help': "Gets or sets the direction of the rule.InBound or Outbound. The direction specifies if rule will be evaluated on incoming or outcoming traffic. Possible values include: 'Inbound', 'Outbound'", 'action': None}),
+            ('description', {'required': False, 'default': None, 'help': 'Gets or sets a description for this rule. Restricted to 140 chars.', 'action': None}),
+            ('source_port_range', {'required': False, 'default': None, 'help': "Gets or sets Source Port or Range. Integer or range between 0 and 65535. Asterix '*' can also be used to match all ports.", 'action': None}),
+            ('destination_port_range', {'required': False, 'default': None, 'help': "Gets or sets Destination Port or Range. Integer or range between 0 and 65535. Asterix '*' can also be used to match all ports.", 'action': None}),
+            ('priority', {'required': False, 'default': None, 'help': 'Gets or sets the priority of the rule. The value can be between 100 and 4096. The priority number must be unique for each rule in the collection. The lower the priority number, the higher the priority of the rule.', 'action': None}),
+        ]},
+    'azure.cli.command_modules.network.custom#update_subnet': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'virtual_network_name', 'subnet_name', 'address_prefix', 'network_security_group'], 'defaults': [None, None]},
+        'doc': '29b6ffce',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('virtual_network_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('subnet_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('address_prefix', {'required': False, 'default': None, 'help': 'New address prefix in CIDR format, for example 10.0.0.0/24.', 'action': None}),
+            ('network_security_group', {'required': False, 'default': None, 'help': 'attach with existing network security group, both name or id are accepted. Use empty string "" to detach it.', 'action': None}),
+        ]},
+    'azure.cli.command_modules.network.custom#update_vnet': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'virtual_network_name', 'address_prefixes'], 'defaults': []},
+        'doc': 'fa7da137',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('virtual_network_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('address_prefixes', {'required': True, 'default': None, 'help': 'update address spaces. Use space separated address prefixes, for example, "10.0.0.0/24 10.0.1.0/24"', 'action': None}),
+        ]},
+    'azure.cli.command_modules.network.mgmt_app_gateway.lib.operations.app_gateway_operations#AppGatewayOperations.create_or_update': {
+        'version': '2015-11-01',
+        'parameters': {'names': ['self', 'resource_group_name', 'deployment_name', 'application_gateway_name', 'content_version', 'capacity', 'cert_data', 'cert_password', 'frontend_port', 'frontend_type', 'http_listener_protocol', 'http_settings_cookie_based_affinity', 'http_settings_port', 'http_settings_protocol', 'location', 'private_ip_address', 'private_ip_address_allocation', 'public_ip', 'public_ip_address_allocation', 'public_ip_type', 'routing_rule_type', 'servers', 'sku_name', 'sku_tier', 'subnet', 'subnet_address_prefix', 'subnet_type', 'tags', 'virtual_network_name', 'vnet_address_prefix', 'custom_headers', 'raw'], 'defaults': [None, 2, None, None, None, 'privateIp', 'http', 'disabled', 80, 'http', None, None, 'dynamic', None, 'dynamic', 'none', 'Basic', None, 'Standard_Medium', 'Standard', 'default', '10.0.0.0/24', 'new', None, None, '10.0.0.0/16', None, False]},
+        'doc': 'b225b689',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group. The name is case insensitive.', 'action': None}),
+            ('deployment_name', {'required': True, 'default': None, 'help': 'The name of the deployment.', 'action': None}),
+            ('application_gateway_name', {'required': True, 'default': None, 'help': 'The name of the application gateway.', 'action': None}),
+            ('capacity', {'required': False, 'default': 2, 'help': 'The number of instances to use with the application gateway.', 'action': None}),
+            ('cert_data', {'required': False, 'default': None, 'help': 'The contents of the PFX certificate file.', 'action': None}),
+            ('cert_password', {'required': False, 'default': None, 'help': 'The certificate password.', 'action': None}),
+            ('frontend_port', {'required': False, 'default': None, 'help': 'The front end port number.', 'action': None}),
+            ('frontend_type', {'required': False, 'default': 'privateIp', 'help': "Specify which kind of frontend configuration to create. Possible values include: 'publicIp', 'privateIp'", 'action': None}),
+            ('http_listener_protocol', {'required': False, 'default': 'http', 'help': "The HTTP listener protocol. Possible values include: 'http', 'https'", 'action': None}),
+            ('http_settings_cookie_based_affinity', {'required': False, 'default': 'disabled', 'help': "Enable or disable HTTP settings cookie based affinity. Possible values include: 'enabled', 'disabled'", 'action': None}),
+            ('http_settings_port', {'required': False, 'default': 80, 'help': 'The HTTP settings port.', 'action': None}),
+            ('http_settings_protocol', {'required': False, 'default': 'http', 'help': "The HTTP settings protocol. Possible values include: 'http', 'https'", 'action': None}),
+            ('location', {'required': False, 'default': None, 'help': 'The location in which to create the application gateway.', 'action': None}),
+            ('private_ip_address', {'required': False, 'default': None, 'help': 'The static private IP address to associate with the application gateway frontend.', 'action': None}),
+            ('private_ip_address_allocation', {'required': False, 'default': 'dynamic', 'help': "Specify the kind of private IP allocation. Possible values include: 'dynamic', 'static'", 'action': None}),
+            ('public_ip', {'required': False, 'default': None, 'help': 'The name or ID of the public IP address.', 'action': None}),
+            ('public_ip_address_allocation', {'required': False, 'default': 'dynamic', 'help': "Specify the kind of public IP allocation for new public IPs. Possible values include: 'dynamic', 'static'", 'action': None}),
+            ('public_ip_type', {'required': False, 'default': 'none', 'help': "Specify the type of public IP address. Possible values include: 'none', 'new', 'existingName', 'existingId'", 'action': None}),
+            ('routing_rule_type', {'required': False, 'default': 'Basic', 'help': "The request routing rule type. Possible values include: 'Basic', 'PathBasedRouting'", 'action': None}),
+            ('servers', {'required': False, 'default': None, 'help': 'The list of IP addresses or DNS names corresponding to backend servers.', 'action': None}),
+            ('sku_name', {'required': False, 'default': 'Standard_Medium', 'help': 'The name of the SKU. (Standard_Small, Standard_Medium, Standard_Large).', 'action': None}),
+            ('sku_tier', {'required': False, 'default': 'Standard', 'help': 'The SKU tier.', 'action': None}),
+            ('subnet', {'required': False, 'default': 'default', 'help': 'The name or ID of the subnet.', 'action': None}),
+            ('subnet_address_prefix', {'required': False, 'default': '10.0.0.0/24', 'help': 'The subnet prefix in CIDR format.', 'action': None}),
+            ('subnet_type', {'required': False, 'default': 'new', 'help': "Use a new or existing subnet. Possible values include: 'new', 'existingId', 'existingName'", 'action': None}),
+            ('tags', {'required': False, 'default': None, 'help': 'Tags object.', 'action': None}),
+            ('virtual_network_name', {'required': False, 'default': None, 'help': 'The name of the virtual network (VNet) associated with the subnet.', 'action': None}),
+            ('vnet_address_prefix', {'required': False, 'default': '10.0.0.0/16', 'help': 'The virtual network address range in CIDR format.', 'action': None}),
+        ]},
+    'azure.cli.command_modules.network.mgmt_lb.lib.operations.lb_operations#LbOperations.create_or_update': {
+        'version': '2015-11-01',
+        'parameters': {'names': ['self', 'resource_group_name', 'deployment_name', 'load_balancer_name', 'content_version', 'backend_pool_name', 'dns_name_type', 'frontend_ip_name', 'location', 'private_ip_address', 'private_ip_address_allocation', 'public_ip_address', 'public_ip_address_allocation', 'public_ip_address_type', 'public_ip_dns_name', 'subnet', 'subnet_address_prefix', 'subnet_type', 'tags', 'virtual_network_name', 'vnet_address_prefix', 'custom_headers', 'raw'], 'defaults': [None, None, 'none', 'LoadBalancerFrontEnd', None, None, 'dynamic', None, 'dynamic', 'new', None, None, '10.0.0.0/24', 'none', None, None, '10.0.0.0/16', None, False]},
+        'doc': '1a29eb2b',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group. The name is case insensitive.', 'action': None}),
+            ('deployment_name', {'required': True, 'default': None, 'help': 'The name of the deployment.', 'action': None}),
+            ('load_balancer_name', {'required': True, 'default': None, 'help': 'Name for load balancer.', 'action': None}),
+            ('backend_pool_name', {'required': False, 'default': None, 'help': 'Name of load balancer backend pool.', 'action': None}),
+            ('dns_name_type', {'required': False, 'default': 'none', 'help': "Associate VMs with a public IP address to a DNS name. Possible values include: 'none', 'new'", 'action': None}),
+            ('frontend_ip_name', {'required': False, 'default': 'LoadBalancerFrontEnd', 'help': 'Name of the frontend IP configuration.', 'action': None}),
+            ('location', {'required': False, 'default': None, 'help': 'Location for load balancer resource.', 'action': None}),
+            ('private_ip_address', {'required': False, 'default': None, 'help': 'Static private IP address to use.', 'action': None}),
+            ('private_ip_address_allocation', {'required': False, 'default': 'dynamic', 'help': "Private IP address allocation method. Possible values include: 'dynamic', 'static'", 'action': None}),
+            ('public_ip_address', {'required': False, 'default': None, 'help': 'Name or ID of the public IP address to use.', 'action': None}),
+            ('public_ip_address_allocation', {'required': False, 'default': 'dynamic', 'help': "Public IP address allocation method. Possible values include: 'dynamic', 'static'", 'action': None}),
+            ('public_ip_address_type', {'required': False, 'default': 'new', 'help': "Type of Public IP Address to associate with the load balancer. Possible values include: 'none', 'new', 'existingName', 'existingId'", 'action': None}),
+            ('public_ip_dns_name', {'required': False, 'default': None, 'help': 'Globally unique DNS Name for the Public IP used to access the Virtual Machine (new public IP only).', 'action': None}),
+            ('subnet', {'required': False, 'default': None, 'help': 'The subnet name or ID to associate with the load balancer. Cannot be used in conjunction with a Public IP.', 'action': None}),
+            ('subnet_address_prefix', {'required': False, 'default': '10.0.0.0/24', 'help': 'The subnet address prefix in CIDR format (new subnet only).', 'action': None}),
+            ('subnet_type', {'required': False, 'default': 'none', 'help': "Use new, existing or no subnet. Possible values include: 'none', 'new', 'existingName', 'existingId'", 'action': None}),
+            ('tags', {'required': False, 'default': None, 'help': 'Tags object.', 'action': None}),
+            ('virtual_network_name', {'required': False, 'default': None, 'help': 'The VNet name containing the subnet. Cannot be used in conjunction with a Public IP.', 'action': None}),
+            ('vnet_address_prefix', {'required': False, 'default': '10.0.0.0/16', 'help': 'The virtual network IP address prefix in CIDR format (new subnet only).', 'action': None}),
+        ]},
+    'azure.cli.command_modules.network.mgmt_nic.lib.operations.nic_operations#NicOperations.create_or_update': {
+        'version': '2015-11-01',
+        'parameters': {'names': ['self', 'resource_group_name', 'deployment_name', 'network_interface_name', 'subnet', 'enable_ip_forwarding', 'content_version', 'internal_dns_name_label', 'load_balancer_backend_address_pool_ids', 'load_balancer_inbound_nat_rule_ids', 'location', 'network_security_group', 'network_security_group_type', 'private_ip_address', 'private_ip_address_allocation', 'private_ip_address_version', 'public_ip_address', 'public_ip_address_type', 'subnet_type', 'tags', 'use_dns_settings', 'virtual_network_name', 'custom_headers', 'raw'], 'defaults': [False, None, None, None, None, None, None, 'none', None, 'dynamic', 'ipv4', None, 'none', 'existingName', None, 'false', None, None, False]},
+        'doc': '95931438',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group. The name is case insensitive.', 'action': None}),
+            ('deployment_name', {'required': True, 'default': None, 'help': 'The name of the deployment.', 'action': None}),
+            ('network_interface_name', {'required': True, 'default': None, 'help': 'Name of the new NIC.', 'action': None}),
+            ('subnet', {'required': True, 'default': None, 'help': 'Name or ID of an existing subnet to associate with the NIC.', 'action': None}),
+            ('enable_ip_forwarding', {'required': False, 'default': False, 'help': 'Enable IP forwarding.', 'action': 'store_true'}),
+            ('internal_dns_name_label', {'required': False, 'default': None, 'help': 'The internal DNS name label.', 'action': None}),
+            ('load_balancer_backend_address_pool_ids', {'required': False, 'default': None, 'help': 'Array of load balancer backend address pool IDs.', 'action': None}),
+            ('load_balancer_inbound_nat_rule_ids', {'required': False, 'default': None, 'help': 'Array of load balancer inbound NAT rule IDs.', 'action': None}),
+            ('location', {'required': False, 'default': None, 'help': 'Location for NIC resource.', 'action': None}),
+            ('network_security_group', {'required': False, 'default': None, 'help': 'Name or ID of an existing network security group to associate with the NIC.', 'action': None}),
+            ('network_security_group_type', {'required': False, 'default': 'none', 'help': "Identifies whether to use an existing NSG. Possible values include: 'none', 'existingName', 'existingId'", 'action': None}),
+            ('private_ip_address', {'required': False, 'default': None, 'help': 'Static private IP address to use.', 'action': None}),
+            ('private_ip_address_allocation', {'required': False, 'default': 'dynamic', 'help': "Private IP address allocation method. Possible values include: 'dynamic', 'static'", 'action': None}),
+            ('private_ip_address_version', {'required': False, 'default': 'ipv4', 'help': "The private IP address version to use. Possible values include: 'ipv4', 'ipv6'", 'action': None}),
+            ('public_ip_address', {'required': False, 'default': None, 'help': 'Name or ID an existing public IP address to associate with the NIC.', 'action': None}),
+            ('public_ip_address_type', {'required': False, 'default': 'none', 'help': "Specify whether to associate an existing public IP address with the NIC. Possible values include: 'none', 'existingName', 'existingId'", 'action': None}),
+            ('subnet_type', {'required': False, 'default': 'existingName', 'help': "Specify whether supplied subnet is by name or ID. Possible values include: 'existingName', 'existingId'", 'action': None}),
+            ('tags', {'required': False, 'default': None, 'help': 'Tags object.', 'action': None}),
+            ('use_dns_settings', {'required': False, 'default': 'false', 'help': "Flag to specify whether to use DNS settings. Possible values include: 'true', 'false'", 'action': None}),
+            ('virtual_network_name', {'required': False, 'default': None, 'help': 'Virtual network to associate with the NIC.', 'action': None}),
+        ]},
+    'azure.cli.command_modules.network.mgmt_nsg.lib.operations.nsg_operations#NsgOperations.create_or_update': {
+        'version': '2015-11-01',
+        'parameters': {'names': ['self', 'resource_group_name', 'deployment_name', 'name', 'content_version', 'location', 'tags', 'custom_headers', 'raw'], 'defaults': [None, None, None, None, False]},
+        'doc': '084696c2',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group. The name is case insensitive.', 'action': None}),
+            ('deployment_name', {'required': True, 'default': None, 'help': 'The name of the deployment.', 'action': None}),
+            ('name', {'required': True, 'default': None, 'help': 'Name of the network security group.', 'action': None}),
+            ('location', {'required': False, 'default': None, 'help': 'Location for the network security group.', 'action': None}),
+            ('tags', {'required': False, 'default': None, 'help': 'Tags object.', 'action': None}),
+        ]},
+    'azure.cli.command_modules.network.mgmt_public_ip.lib.operations.public_ip_operations#PublicIpOperations.create_or_update': {
+        'version': '2015-11-01',
+        'parameters': {'names': ['self', 'resource_group_name', 'deployment_name', 'name', 'content_version', 'allocation_method', 'dns_name', 'dns_name_type', 'location', 'tags', 'custom_headers', 'raw'], 'defaults': [None, 'dynamic', None, 'none', None, None, None, False]},
+        'doc': 'e4bdc20a',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group. The name is case insensitive.', 'action': None}),
+            ('deployment_name', {'required': True, 'default': None, 'help': 'The name of the deployment.', 'action': None}),
+            ('name', {'required': True, 'default': None, 'help': 'Name of the Public IP address.', 'action': None}),
+            ('allocation_method', {'required': False, 'default': 'dynamic', 'help': "IP address Allocation method. Possible values include: 'dynamic', 'static'", 'action': None}),
+            ('dns_name', {'required': False, 'default': None, 'help': 'Globally unique DNS entry.', 'action': None}),
+            ('dns_name_type', {'required': False, 'default': 'none', 'help': "Whether to include a DNS entry or not. Possible values include: 'new', 'none'", 'action': None}),
+            ('location', {'required': False, 'default': None, 'help': 'Location (e.g. eastus).', 'action': None}),
+            ('tags', {'required': False, 'default': None, 'help': 'Tags object.', 'action': None}),
+        ]},
+    'azure.cli.command_modules.network.mgmt_vnet.lib.operations.vnet_operations#VnetOperations.create_or_update': {
+        'version': '2015-11-01',
+        'parameters': {'names': ['self', 'resource_group_name', 'deployment_name', 'virtual_network_name', 'content_version', 'location', 'subnet_name', 'subnet_prefix', 'tags', 'virtual_network_prefix', 'custom_headers', 'raw'], 'defaults': [None, None, 'Subnet1', '10.0.0.0/24', None, '10.0.0.0/16', None, False]},
+        'doc': 'c6d36afb',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group. The name is case insensitive.', 'action': None}),
+            ('deployment_name', {'required': True, 'default': None, 'help': 'The name of the deployment.', 'action': None}),
+            ('virtual_network_name', {'required': True, 'default': None, 'help': 'Name of the virtual network.', 'action': None}),
+            ('location', {'required': False, 'default': None, 'help': 'Virtual network location.', 'action': None}),
+            ('subnet_name', {'required': False, 'default': 'Subnet1', 'help': 'Name of the subnet.', 'action': None}),
+            ('subnet_prefix', {'required': False, 'default': '10.0.0.0/24', 'help': 'IP address for the subnet.', 'action': None}),
+            ('tags', {'required': False, 'default': None, 'help': 'Tags object.', 'action': None}),
+            ('virtual_network_prefix', {'required': False, 'default': '10.0.0.0/16', 'help': 'IP address prefix for the virtual network.', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.application_gateways_operations#ApplicationGatewaysOperations.create_or_update': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'application_gateway_name', 'parameters', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': 'cb330f1a',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('application_gateway_name', {'required': True, 'default': None, 'help': 'The name of the ApplicationGateway.', 'action': None}),
+            ('parameters', {'required': True, 'default': None, 'help': 'Parameters supplied to the create/delete ApplicationGateway operation', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.application_gateways_operations#ApplicationGatewaysOperations.delete': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'application_gateway_name', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': '61865061',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('application_gateway_name', {'required': True, 'default': None, 'help': 'The name of the applicationgateway.', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.application_gateways_operations#ApplicationGatewaysOperations.get': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'application_gateway_name', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': '9ee21d2b',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('application_gateway_name', {'required': True, 'default': None, 'help': 'The name of the applicationgateway.', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.application_gateways_operations#ApplicationGatewaysOperations.start': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'application_gateway_name', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': '4d98f0a6',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('application_gateway_name', {'required': True, 'default': None, 'help': 'The name of the application gateway.', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.application_gateways_operations#ApplicationGatewaysOperations.stop': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'application_gateway_name', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': '987f81b5',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('application_gateway_name', {'required': True, 'default': None, 'help': 'The name of the application gateway.', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.express_route_circuit_authorizations_operations#ExpressRouteCircuitAuthorizationsOperations.create_or_update': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'circuit_name', 'authorization_name', 'authorization_parameters', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': 'af101409',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('circuit_name', {'required': True, 'default': None, 'help': 'The name of the express route circuit.', 'action': None}),
+            ('authorization_name', {'required': True, 'default': None, 'help': 'The name of the authorization.', 'action': None}),
+            ('authorization_parameters', {'required': True, 'default': None, 'help': 'Parameters supplied to the create/update ExpressRouteCircuitAuthorization operation', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.express_route_circuit_authorizations_operations#ExpressRouteCircuitAuthorizationsOperations.delete': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'circuit_name', 'authorization_name', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': '015d8440',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('circuit_name', {'required': True, 'default': None, 'help': 'The name of the express route circuit.', 'action': None}),
+            ('authorization_name', {'required': True, 'default': None, 'help': 'The name of the authorization.', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.express_route_circuit_authorizations_operations#ExpressRouteCircuitAuthorizationsOperations.get': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'circuit_name', 'authorization_name', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': '27f1313d',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('circuit_name', {'required': True, 'default': None, 'help': 'The name of the express route circuit.', 'action': None}),
+            ('authorization_name', {'required': True, 'default': None, 'help': 'The name of the authorization.', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.express_route_circuit_authorizations_operations#ExpressRouteCircuitAuthorizationsOperations.list': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'circuit_name', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': 'decbdf35',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('circuit_name', {'required': True, 'default': None, 'help': 'The name of the curcuit.', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.express_route_circuit_peerings_operations#ExpressRouteCircuitPeeringsOperations.create_or_update': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'circuit_name', 'peering_name', 'peering_parameters', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': '4b9d659d',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('circuit_name', {'required': True, 'default': None, 'help': 'The name of the express route circuit.', 'action': None}),
+            ('peering_name', {'required': True, 'default': None, 'help': 'The name of the peering.', 'action': None}),
+            ('peering_parameters', {'required': True, 'default': None, 'help': 'Parameters supplied to the create/update ExpressRouteCircuit Peering operation', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.express_route_circuit_peerings_operations#ExpressRouteCircuitPeeringsOperations.delete': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'circuit_name', 'peering_name', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': '85e5ffcc',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('circuit_name', {'required': True, 'default': None, 'help': 'The name of the express route circuit.', 'action': None}),
+            ('peering_name', {'required': True, 'default': None, 'help': 'The name of the peering.', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.express_route_circuit_peerings_operations#ExpressRouteCircuitPeeringsOperations.get': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'circuit_name', 'peering_name', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': '991d772c',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('circuit_name', {'required': True, 'default': None, 'help': 'The name of the express route circuit.', 'action': None}),
+            ('peering_name', {'required': True, 'default': None, 'help': 'The name of the peering.', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.express_route_circuit_peerings_operations#ExpressRouteCircuitPeeringsOperations.list': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'circuit_name', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': 'd76b2818',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('circuit_name', {'required': True, 'default': None, 'help': 'The name of the curcuit.', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.express_route_circuits_operations#ExpressRouteCircuitsOperations.create_or_update': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'circuit_name', 'parameters', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': 'faa5c9c1',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('circuit_name', {'required': True, 'default': None, 'help': 'The name of the circuit.', 'action': None}),
+            ('parameters', {'required': True, 'default': None, 'help': 'Parameters supplied to the create/delete ExpressRouteCircuit operation', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.express_route_circuits_operations#ExpressRouteCircuitsOperations.delete': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'circuit_name', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': 'b5dd46a2',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('circuit_name', {'required': True, 'default': None, 'help': 'The name of the express route Circuit.', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.express_route_circuits_operations#ExpressRouteCircuitsOperations.get': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'circuit_name', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': '49dcb102',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('circuit_name', {'required': True, 'default': None, 'help': 'The name of the circuit.', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.express_route_circuits_operations#ExpressRouteCircuitsOperations.get_stats': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'circuit_name', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': '82d36d7e',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('circuit_name', {'required': True, 'default': None, 'help': 'The name of the circuit.', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.express_route_circuits_operations#ExpressRouteCircuitsOperations.list_arp_table': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'circuit_name', 'peering_name', 'device_path', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': '49262ebf',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('circuit_name', {'required': True, 'default': None, 'help': 'The name of the circuit.', 'action': None}),
+            ('peering_name', {'required': True, 'default': None, 'help': 'The name of the peering.', 'action': None}),
+            ('device_path', {'required': True, 'default': None, 'help': 'The path of the device.', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.express_route_circuits_operations#ExpressRouteCircuitsOperations.list_routes_table': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'circuit_name', 'peering_name', 'device_path', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': 'd7d61fa0',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('circuit_name', {'required': True, 'default': None, 'help': 'The name of the circuit.', 'action': None}),
+            ('peering_name', {'required': True, 'default': None, 'help': 'The name of the peering.', 'action': None}),
+            ('device_path', {'required': True, 'default': None, 'help': 'The path of the device.', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.express_route_service_providers_operations#ExpressRouteServiceProvidersOperations.list': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': '566ce9db',
+        'arguments': [
+        ]},
+    'azure.mgmt.network.operations.load_balancers_operations#LoadBalancersOperations.create_or_update': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'load_balancer_name', 'parameters', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': 'a625eae8',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('load_balancer_name', {'required': True, 'default': None, 'help': 'The name of the loadBalancer.', 'action': None}),
+            ('parameters', {'required': True, 'default': None, 'help': 'Parameters supplied to the create/delete LoadBalancer operation', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.load_balancers_operations#LoadBalancersOperations.delete': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'load_balancer_name', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': 'aad75117',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('load_balancer_name', {'required': True, 'default': None, 'help': 'The name of the loadBalancer.', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.load_balancers_operations#LoadBalancersOperations.get': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'load_balancer_name', 'expand', 'custom_headers', 'raw'], 'defaults': [None, None, False]},
+        'doc': 'd0270725',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('load_balancer_name', {'required': True, 'default': None, 'help': 'The name of the loadBalancer.', 'action': None}),
+            ('expand', {'required': False, 'default': None, 'help': 'expand references resources.', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.local_network_gateways_operations#LocalNetworkGatewaysOperations.create_or_update': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'local_network_gateway_name', 'parameters', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': 'eca08381',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('local_network_gateway_name', {'required': True, 'default': None, 'help': 'The name of the local network gateway.', 'action': None}),
+            ('parameters', {'required': True, 'default': None, 'help': 'Parameters supplied to the Begin Create or update Local Network Gateway operation through Network resource provider.', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.local_network_gateways_operations#LocalNetworkGatewaysOperations.delete': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'local_network_gateway_name', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': '9e714e63',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('local_network_gateway_name', {'required': True, 'default': None, 'help': 'The name of the local network gateway.', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.local_network_gateways_operations#LocalNetworkGatewaysOperations.get': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'local_network_gateway_name', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': 'cb47622d',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('local_network_gateway_name', {'required': True, 'default': None, 'help': 'The name of the local network gateway.', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.local_network_gateways_operations#LocalNetworkGatewaysOperations.list': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': '2a5e04ea',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.network_interfaces_operations#NetworkInterfacesOperations.delete': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'network_interface_name', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': 'dec57125',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('network_interface_name', {'required': True, 'default': None, 'help': 'The name of the network interface.', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.network_interfaces_operations#NetworkInterfacesOperations.get': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'network_interface_name', 'expand', 'custom_headers', 'raw'], 'defaults': [None, None, False]},
+        'doc': 'b27d9515',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('network_interface_name', {'required': True, 'default': None, 'help': 'The name of the network interface.', 'action': None}),
+            ('expand', {'required': False, 'default': None, 'help': 'expand references resources.', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.network_interfaces_operations#NetworkInterfacesOperations.get_virtual_machine_scale_set_network_interface': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'virtual_machine_scale_set_name', 'virtualmachine_index', 'network_interface_name', 'expand', 'custom_headers', 'raw'], 'defaults': [None, None, False]},
+        'doc': '726677d1',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('virtual_machine_scale_set_name', {'required': True, 'default': None, 'help': 'The name of the virtual machine scale set.', 'action': None}),
+            ('virtualmachine_index', {'required': True, 'default': None, 'help': 'The virtual machine index.', 'action': None}),
+            ('network_interface_name', {'required': True, 'default': None, 'help': 'The name of the network interface.', 'action': None}),
+            ('expand', {'required': False, 'default': None, 'help': 'expand references resources.', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.network_interfaces_operations#NetworkInterfacesOperations.list_virtual_machine_scale_set_network_interfaces': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'virtual_machine_scale_set_name', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': '5e5fc7bf',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('virtual_machine_scale_set_name', {'required': True, 'default': None, 'help': 'The name of the virtual machine scale set.', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.network_interfaces_operations#NetworkInterfacesOperations.list_virtual_machine_scale_set_vm_network_interfaces': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'virtual_machine_scale_set_name', 'virtualmachine_index', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': 'bf73f83a',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('virtual_machine_scale_set_name', {'required': True, 'default': None, 'help': 'The name of the virtual machine scale set.', 'action': None}),
+            ('virtualmachine_index', {'required': True, 'default': None, 'help': 'The virtual machine index.', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.network_security_groups_operations#NetworkSecurityGroupsOperations.create_or_update': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'network_security_group_name', 'parameters', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': 'f7a2be0d',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('network_security_group_name', {'required': True, 'default': None, 'help': 'The name of the network security group.', 'action': None}),
+            ('parameters', {'required': True, 'default': None, 'help': 'Parameters supplied to the create/update Network Security Group operation', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.network_security_groups_operations#NetworkSecurityGroupsOperations.delete': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'network_security_group_name', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': 'cbff1abd',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('network_security_group_name', {'required': True, 'default': None, 'help': 'The name of the network security group.', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.network_security_groups_operations#NetworkSecurityGroupsOperations.get': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'network_security_group_name', 'expand', 'custom_headers', 'raw'], 'defaults': [None, None, False]},
+        'doc': '9ba051d2',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('network_security_group_name', {'required': True, 'default': None, 'help': 'The name of the network security group.', 'action': None}),
+            ('expand', {'required': False, 'default': None, 'help': 'expand references resources.', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.public_ip_addresses_operations#PublicIPAddressesOperations.create_or_update': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'public_ip_address_name', 'parameters', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': '19b5eb0f',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('public_ip_address_name', {'required': True, 'default': None, 'help': 'The name of the publicIpAddress.', 'action': None}),
+            ('parameters', {'required': True, 'default': None, 'help': 'Parameters supplied to the create/update PublicIPAddress operation', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.public_ip_addresses_operations#PublicIPAddressesOperations.delete': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'public_ip_address_name', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': '8172343f',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('public_ip_address_name', {'required': True, 'default': None, 'help': 'The name of the subnet.', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.public_ip_addresses_operations#PublicIPAddressesOperations.get': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'public_ip_address_name', 'expand', 'custom_headers', 'raw'], 'defaults': [None, None, False]},
+        'doc': '09d715b6',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('public_ip_address_name', {'required': True, 'default': None, 'help': 'The name of the subnet.', 'action': None}),
+            ('expand', {'required': False, 'default': None, 'help': 'expand references resources.', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.route_tables_operations#RouteTablesOperations.create_or_update': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'route_table_name', 'parameters', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': '8bc4ddab',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('route_table_name', {'required': True, 'default': None, 'help': 'The name of the route table.', 'action': None}),
+            ('parameters', {'required': True, 'default': None, 'help': 'Parameters supplied to the create/update Route Table operation', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.route_tables_operations#RouteTablesOperations.delete': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'route_table_name', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': 'bfd1a88e',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('route_table_name', {'required': True, 'default': None, 'help': 'The name of the route table.', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.route_tables_operations#RouteTablesOperations.get': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'route_table_name', 'expand', 'custom_headers', 'raw'], 'defaults': [None, None, False]},
+        'doc': '1410a695',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('route_table_name', {'required': True, 'default': None, 'help': 'The name of the route table.', 'action': None}),
+            ('expand', {'required': False, 'default': None, 'help': 'expand references resources.', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.routes_operations#RoutesOperations.create_or_update': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'route_table_name', 'route_name', 'route_parameters', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': '54dcd6b0',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('route_table_name', {'required': True, 'default': None, 'help': 'The name of the route table.', 'action': None}),
+            ('route_name', {'required': True, 'default': None, 'help': 'The name of the route.', 'action': None}),
+            ('route_parameters', {'required': True, 'default': None, 'help': 'Parameters supplied to the create/update routeoperation', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.routes_operations#RoutesOperations.delete': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'route_table_name', 'route_name', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': 'dd45d331',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('route_table_name', {'required': True, 'default': None, 'help': 'The name of the route table.', 'action': None}),
+            ('route_name', {'required': True, 'default': None, 'help': 'The name of the route.', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.routes_operations#RoutesOperations.get': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'route_table_name', 'route_name', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': '3661b2b2',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('route_table_name', {'required': True, 'default': None, 'help': 'The name of the route table.', 'action': None}),
+            ('route_name', {'required': True, 'default': None, 'help': 'The name of the route.', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.routes_operations#RoutesOperations.list': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'route_table_name', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': '67cbcf93',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('route_table_name', {'required': True, 'default': None, 'help': 'The name of the route table.', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.security_rules_operations#SecurityRulesOperations.delete': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'network_security_group_name', 'security_rule_name', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': 'ffaade35',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('network_security_group_name', {'required': True, 'default': None, 'help': 'The name of the network security group.', 'action': None}),
+            ('security_rule_name', {'required': True, 'default': None, 'help': 'The name of the security rule.', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.security_rules_operations#SecurityRulesOperations.get': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'network_security_group_name', 'security_rule_name', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': '306fa2f4',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('network_security_group_name', {'required': True, 'default': None, 'help': 'The name of the network security group.', 'action': None}),
+            ('security_rule_name', {'required': True, 'default': None, 'help': 'The name of the security rule.', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.security_rules_operations#SecurityRulesOperations.list': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'network_security_group_name', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': 'cda6e986',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('network_security_group_name', {'required': True, 'default': None, 'help': 'The name of the network security group.', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.subnets_operations#SubnetsOperations.delete': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'virtual_network_name', 'subnet_name', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': '374a7354',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('virtual_network_name', {'required': True, 'default': None, 'help': 'The name of the virtual network.', 'action': None}),
+            ('subnet_name', {'required': True, 'default': None, 'help': 'The name of the subnet.', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.subnets_operations#SubnetsOperations.get': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'virtual_network_name', 'subnet_name', 'expand', 'custom_headers', 'raw'], 'defaults': [None, None, False]},
+        'doc': '7388be92',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('virtual_network_name', {'required': True, 'default': None, 'help': 'The name of the virtual network.', 'action': None}),
+            ('subnet_name', {'required': True, 'default': None, 'help': 'The name of the subnet.', 'action': None}),
+            ('expand', {'required': False, 'default': None, 'help': 'expand references resources.', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.subnets_operations#SubnetsOperations.list': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'virtual_network_name', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': '203050b6',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('virtual_network_name', {'required': True, 'default': None, 'help': 'The name of the virtual network.', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.usages_operations#UsagesOperations.list': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'location', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': '878cd522',
+        'arguments': [
+            ('location', {'required': True, 'default': None, 'help': 'The location upon which resource usage is queried.', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.virtual_network_gateway_connections_operations#VirtualNetworkGatewayConnectionsOperations.delete': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'virtual_network_gateway_connection_name', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': '2c9758ee',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('virtual_network_gateway_connection_name', {'required': True, 'default': None, 'help': 'The name of the virtual network gateway connection.', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.virtual_network_gateway_connections_operations#VirtualNetworkGatewayConnectionsOperations.get': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'virtual_network_gateway_connection_name', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': 'afdee0a1',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('virtual_network_gateway_connection_name', {'required': True, 'default': None, 'help': 'The name of the virtual network gateway connection.', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.virtual_network_gateway_connections_operations#VirtualNetworkGatewayConnectionsOperations.get_shared_key': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'connection_shared_key_name', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': '2298c4f5',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('connection_shared_key_name', {'required': True, 'default': None, 'help': 'The virtual network gateway connection shared key name.', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.virtual_network_gateway_connections_operations#VirtualNetworkGatewayConnectionsOperations.list': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': '95990724',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.virtual_network_gateway_connections_operations#VirtualNetworkGatewayConnectionsOperations.reset_shared_key': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'virtual_network_gateway_connection_name', 'key_length', 'custom_headers', 'raw'], 'defaults': [None, None, False]},
+        'doc': '606d4193',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('virtual_network_gateway_connection_name', {'required': True, 'default': None, 'help': 'The virtual network gateway connection reset shared key Name.', 'action': None}),
+            ('key_length', {'required': False, 'default': None, 'help': 'The virtual network connection reset shared key length', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.virtual_network_gateway_connections_operations#VirtualNetworkGatewayConnectionsOperations.set_shared_key': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'virtual_network_gateway_connection_name', 'value', 'custom_headers', 'raw'], 'defaults': [None, None, False]},
+        'doc': '40258cf6',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('virtual_network_gateway_connection_name', {'required': True, 'default': None, 'help': 'The virtual network gateway connection name.', 'action': None}),
+            ('value', {'required': False, 'default': None, 'help': 'The virtual network connection shared key value', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.virtual_network_gateways_operations#VirtualNetworkGatewaysOperations.create_or_update': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'virtual_network_gateway_name', 'parameters', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': '86f4803c',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('virtual_network_gateway_name', {'required': True, 'default': None, 'help': 'The name of the virtual network gateway.', 'action': None}),
+            ('parameters', {'required': True, 'default': None, 'help': 'Parameters supplied to the Begin Create or update Virtual Network Gateway operation through Network resource provider.', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.virtual_network_gateways_operations#VirtualNetworkGatewaysOperations.delete': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'virtual_network_gateway_name', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': 'dccb86fd',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('virtual_network_gateway_name', {'required': True, 'default': None, 'help': 'The name of the virtual network gateway.', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.virtual_network_gateways_operations#VirtualNetworkGatewaysOperations.get': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'virtual_network_gateway_name', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': 'a2e3a226',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('virtual_network_gateway_name', {'required': True, 'default': None, 'help': 'The name of the virtual network gateway.', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.virtual_network_gateways_operations#VirtualNetworkGatewaysOperations.list': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': '75c9e597',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.virtual_networks_operations#VirtualNetworksOperations.delete': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'virtual_network_name', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': '7f0a3673',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('virtual_network_name', {'required': True, 'default': None, 'help': 'The name of the virtual network.', 'action': None}),
+        ]},
+    'azure.mgmt.network.operations.virtual_networks_operations#VirtualNetworksOperations.get': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'virtual_network_name', 'expand', 'custom_headers', 'raw'], 'defaults': [None, None, False]},
+        'doc': 'c32b14bd',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('virtual_network_name', {'required': True, 'default': None, 'help': 'The name of the virtual network.', 'action': None}),
+            ('expand', {'required': False, 'default': None, 'help': 'expand references resources.', 'action': None}),
+        ]},
+})
@@ -5,6 +5,7 @@
 
 # pylint: disable=unused-import
 
+import azure.cli.command_modules.profile._signatures
 import azure.cli.command_modules.profile._params
 import azure.cli.command_modules.profile.generated
 import azure.cli.command_modules.profile.custom
@@ -55,6 +55,7 @@ register_cli_argument('logout', 'username', username_type,
                       help='account user, if missing, logout the current active account')
 
 register_cli_argument('account', 'subscription_name_or_id', subscription_name_or_id_type)
+register_cli_argument('account list', 'refresh', action='store_true')
 
 register_cli_argument('account create-sp', 'name', sp_name_type)
 register_cli_argument('account reset-sp-credentials', 'name', sp_name_type)
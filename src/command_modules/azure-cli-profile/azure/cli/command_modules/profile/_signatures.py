@@ -0,0 +1,73 @@
+#---------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+#---------------------------------------------------------------------------------------------
+
+# This file is generated by scripts/sdk_command_gen/gen_signatures.py. Do not modify it by hand.
+# pylint: skip-file
+
+from azure.cli.commands._introspection import register_signatures
+
+register_signatures({
+    'azure.cli.command_modules.profile.custom#account_clear': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': [], 'defaults': []},
+        'doc': '5ab0c3c7',
+        'arguments': [
+        ]},
+    'azure.cli.command_modules.profile.custom#create_service_principal': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['name', 'secret', 'years'], 'defaults': [None, None, 1]},
+        'doc': 'a002d7da',
+        'arguments': [
+            ('name', {'required': False, 'default': None, 'help': 'an unique uri. If missing, the command will generate one.', 'action': None}),
+            ('secret', {'required': False, 'default': None, 'help': 'the secret used to login. If missing, command will generate one.', 'action': None}),
+            ('years', {'required': False, 'default': 1, 'help': 'Years the secret will be valid.', 'action': None}),
+        ]},
+    'azure.cli.command_modules.profile.custom#list_location': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': [], 'defaults': []},
+        'doc': None,
+        'arguments': [
+        ]},
+    'azure.cli.command_modules.profile.custom#list_subscriptions': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['refresh'], 'defaults': [False]},
+        'doc': 'e0e8d459',
+        'arguments': [
+            ('refresh', {'required': False, 'default': False, 'help': 'List the subscriptions of the tenants of the accounts logged in again, to add new subscriptions and update or remove the others.', 'action': 'store_true'}),
+        ]},
+    'azure.cli.command_modules.profile.custom#login': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['username', 'password', 'service_principal', 'tenant'], 'defaults': [None, None, None, None]},
+        'doc': '8b0cdc2a',
+        'arguments': [
+            ('username', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('password', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('service_principal', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('tenant', {'required': False, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.profile.custom#logout': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['username'], 'defaults': [None]},
+        'doc': 'f873c08b',
+        'arguments': [
+            ('username', {'required': False, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.profile.custom#reset_service_principal_credential': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['name', 'secret', 'years'], 'defaults': [None, 1]},
+        'doc': 'd8bc431f',
+        'arguments': [
+            ('name', {'required': True, 'default': None, 'help': 'the uri representing the name of the service principal', 'action': None}),
+            ('secret', {'required': False, 'default': None, 'help': 'the secret used to login. If missing, command will generate one.', 'action': None}),
+            ('years', {'required': False, 'default': 1, 'help': 'Years the secret will be valid.', 'action': None}),
+        ]},
+    'azure.cli.command_modules.profile.custom#set_active_subscription': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['subscription_name_or_id'], 'defaults': []},
+        'doc': '07a90706',
+        'arguments': [
+            ('subscription_name_or_id', {'required': True, 'default': None, 'help': None, 'action': None}),
+        ]},
+})
@@ -28,9 +28,13 @@ def load_subscriptions():
     subscriptions = profile.load_cached_subscriptions()
     return subscriptions
 
-def list_subscriptions():
-    '''List the imported subscriptions.'''
-    subscriptions = load_subscriptions()
+def list_subscriptions(refresh=False):
+    '''List the imported subscriptions.
+
+    :param bool refresh: List the subscriptions of the tenants of the accounts logged in
+        again, to add new subscriptions and update or remove the others.
+    '''
+    subscriptions = Profile().refresh_accounts() if refresh else load_subscriptions()
     if not subscriptions:
         logger.warning('Please run "az login" to access your accounts.')
     return subscriptions
@@ -5,6 +5,7 @@
 
 # pylint: disable=unused-import
 
+import azure.cli.command_modules.redis._signatures
 import azure.cli.command_modules.redis.custom
 import azure.cli.command_modules.redis._params
 import azure.cli.command_modules.redis.generated
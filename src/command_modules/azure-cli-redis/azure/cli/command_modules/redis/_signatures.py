@@ -0,0 +1,123 @@
+#---------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+#---------------------------------------------------------------------------------------------
+
+# This file is generated by scripts/sdk_command_gen/gen_signatures.py. Do not modify it by hand.
+# pylint: skip-file
+
+from azure.cli.commands._introspection import register_signatures
+
+register_signatures({
+    'azure.cli.command_modules.redis.custom#cli_redis_export': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['client', 'resource_group_name', 'name', 'prefix', 'container', 'file_format'], 'defaults': [None]},
+        'doc': None,
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('prefix', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('container', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('file_format', {'required': False, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.redis.custom#cli_redis_import_method': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['client', 'resource_group_name', 'name', 'file_format', 'files'], 'defaults': []},
+        'doc': None,
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('file_format', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('files', {'required': True, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.redis.custom#cli_redis_update_settings': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['client', 'resource_group_name', 'name', 'redis_configuration'], 'defaults': []},
+        'doc': None,
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('redis_configuration', {'required': True, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.mgmt.redis.operations.patch_schedules_operations#PatchSchedulesOperations.create_or_update': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'name', 'schedule_entries', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': '76125fb0',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('name', {'required': True, 'default': None, 'help': 'The name of the redis cache.', 'action': None}),
+            ('schedule_entries', {'required': True, 'default': None, 'help': 'List of patch schedules for redis cache.', 'action': None}),
+        ]},
+    'azure.mgmt.redis.operations.patch_schedules_operations#PatchSchedulesOperations.delete': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'name', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': 'fa69955e',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('name', {'required': True, 'default': None, 'help': 'The name of the redis cache.', 'action': None}),
+        ]},
+    'azure.mgmt.redis.operations.patch_schedules_operations#PatchSchedulesOperations.get': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'name', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': '19504a9e',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('name', {'required': True, 'default': None, 'help': 'The name of the redis cache.', 'action': None}),
+        ]},
+    'azure.mgmt.redis.operations.redis_operations#RedisOperations.delete': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'name', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': '2f77f3ca',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('name', {'required': True, 'default': None, 'help': 'The name of the redis cache.', 'action': None}),
+        ]},
+    'azure.mgmt.redis.operations.redis_operations#RedisOperations.force_reboot': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'name', 'reboot_type', 'shard_id', 'custom_headers', 'raw'], 'defaults': [None, None, False]},
+        'doc': '998bf5ad',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('name', {'required': True, 'default': None, 'help': 'The name of the redis cache.', 'action': None}),
+            ('reboot_type', {'required': True, 'default': None, 'help': "Which redis node(s) to reboot. Depending on this value data loss is possible. Possible values include: 'PrimaryNode', 'SecondaryNode', 'AllNodes'", 'action': None}),
+            ('shard_id', {'required': False, 'default': None, 'help': 'In case of cluster cache, this specifies shard id which should be rebooted.', 'action': None}),
+        ]},
+    'azure.mgmt.redis.operations.redis_operations#RedisOperations.get': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'name', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': '0d673397',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('name', {'required': True, 'default': None, 'help': 'The name of the redis cache.', 'action': None}),
+        ]},
+    'azure.mgmt.redis.operations.redis_operations#RedisOperations.list': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': '527a0aab',
+        'arguments': [
+        ]},
+    'azure.mgmt.redis.operations.redis_operations#RedisOperations.list_by_resource_group': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': '2a1e3025',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+        ]},
+    'azure.mgmt.redis.operations.redis_operations#RedisOperations.list_keys': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'name', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': 'a794a8a0',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('name', {'required': True, 'default': None, 'help': 'The name of the redis cache.', 'action': None}),
+        ]},
+    'azure.mgmt.redis.operations.redis_operations#RedisOperations.regenerate_key': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'name', 'key_type', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': '5a66f972',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('name', {'required': True, 'default': None, 'help': 'The name of the redis cache.', 'action': None}),
+            ('key_type', {'required': True, 'default': None, 'help': "Which redis access key to reset. Possible values include: 'Primary', 'Secondary'", 'action': None}),
+        ]},
+})
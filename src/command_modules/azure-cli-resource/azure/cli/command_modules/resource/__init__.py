@@ -5,6 +5,7 @@
 
 # pylint: disable=unused-import
 
+import azure.cli.command_modules.resource._signatures
 import azure.cli.command_modules.resource._params
 import azure.cli.command_modules.resource.generated
 import azure.cli.command_modules.resource.custom
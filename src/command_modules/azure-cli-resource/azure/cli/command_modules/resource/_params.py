@@ -36,6 +36,7 @@ register_cli_argument('resource', 'parent_resource_path', CliArgumentType(help='
 register_cli_argument('resource', 'tag', tag_type)
 register_cli_argument('resource', 'tags', tags_type)
 register_cli_argument('resource list', 'name', resource_name_type)
+register_cli_argument('resource list', 'top', CliArgumentType(help=argparse.SUPPRESS))
 register_cli_argument('resource move', 'ids', nargs='+')
 
 
@@ -53,6 +54,7 @@ register_cli_argument('resource group deployment', 'mode', CliArgumentType(
 register_cli_argument('resource group export', 'include_comments', CliArgumentType(action='store_true'))
 register_cli_argument('resource group export', 'include_parameter_default_value', CliArgumentType(action='store_true'))
 register_cli_argument('resource group create', 'resource_group_name', completer=None)
+register_cli_argument('resource group list', 'top', CliArgumentType(help=argparse.SUPPRESS))
 
 register_cli_argument('tag', 'tag_name', CliArgumentType(options_list=('--name', '-n')))
 register_cli_argument('tag', 'tag_value', CliArgumentType(options_list=('--value',)))
@@ -0,0 +1,286 @@
+#---------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+#---------------------------------------------------------------------------------------------
+
+# This file is generated by scripts/sdk_command_gen/gen_signatures.py. Do not modify it by hand.
+# pylint: skip-file
+
+from azure.cli.commands._introspection import register_signatures
+
+register_signatures({
+    'azure.cli.command_modules.resource.custom#create_resource_group': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'location', 'tags'], 'defaults': [None]},
+        'doc': 'b8511eb0',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'the desired resource group name', 'action': None}),
+            ('location', {'required': True, 'default': None, 'help': 'the resource group location', 'action': None}),
+            ('tags', {'required': False, 'default': None, 'help': "tags in 'a=b;c' format", 'action': None}),
+        ]},
+    'azure.cli.command_modules.resource.custom#deploy_arm_template': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'deployment_name', 'template_file_path', 'parameters_file_path', 'mode'], 'defaults': [None, 'incremental']},
+        'doc': '740f9ecb',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'resource group for deployment', 'action': None}),
+            ('deployment_name', {'required': True, 'default': None, 'help': 'name for deployment (use different values for simultaneous deployments)', 'action': None}),
+            ('template_file_path', {'required': True, 'default': None, 'help': 'path to deployment template JSON file', 'action': None}),
+            ('parameters_file_path', {'required': False, 'default': None, 'help': 'path to deployment parameters JSON file', 'action': None}),
+            ('mode', {'required': False, 'default': 'incremental', 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.resource.custom#export_deployment_as_template': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'deployment_name'], 'defaults': []},
+        'doc': None,
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('deployment_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.resource.custom#export_group_as_template': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'include_comments', 'include_parameter_default_value'], 'defaults': [False, False]},
+        'doc': '3ed8a5d4',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'the name of the resoruce group.', 'action': None}),
+            ('include_comments', {'required': False, 'default': False, 'help': 'export template with comments.', 'action': 'store_true'}),
+            ('include_parameter_default_value', {'required': False, 'default': False, 'help': 'export template parameter with default value.', 'action': 'store_true'}),
+        ]},
+    'azure.cli.command_modules.resource.custom#list_resource_groups': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['tag', 'top'], 'defaults': [None, None]},
+        'doc': '825c669d',
+        'arguments': [
+            ('tag', {'required': False, 'default': None, 'help': "tag to filter by in 'key[=value]' format", 'action': None}),
+            ('top', {'required': False, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.resource.custom#list_resources': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['location', 'resource_type', 'resource_group_name', 'tag', 'name', 'top'], 'defaults': [None, None, None, None, None, None]},
+        'doc': '4dad5724',
+        'arguments': [
+            ('location', {'required': False, 'default': None, 'help': 'filter by resource location', 'action': None}),
+            ('resource_type', {'required': False, 'default': None, 'help': 'filter by resource type', 'action': None}),
+            ('resource_group_name', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('tag', {'required': False, 'default': None, 'help': "filter by tag in 'a=b;c' format", 'action': None}),
+            ('name', {'required': False, 'default': None, 'help': 'filter by resource name', 'action': None}),
+            ('top', {'required': False, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.resource.custom#move_resource': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['ids', 'destination_group', 'destination_subscription_id'], 'defaults': [None]},
+        'doc': 'faae8207',
+        'arguments': [
+            ('ids', {'required': True, 'default': None, 'help': 'the space separated resource ids to be moved', 'action': None}),
+            ('destination_group', {'required': True, 'default': None, 'help': 'the destination resource group name', 'action': None}),
+            ('destination_subscription_id', {'required': False, 'default': None, 'help': 'the destination subscription identifier', 'action': None}),
+        ]},
+    'azure.cli.command_modules.resource.custom#register_provider': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_provider_namespace'], 'defaults': []},
+        'doc': None,
+        'arguments': [
+            ('resource_provider_namespace', {'required': True, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.resource.custom#tag_resource': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'resource_name', 'resource_type', 'tags', 'parent_resource_path', 'api_version', 'resource_provider_namespace'], 'defaults': [None, None, None]},
+        'doc': '13439002',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('resource_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('resource_type', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('tags', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('parent_resource_path', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('api_version', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('resource_provider_namespace', {'required': False, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.resource.custom#unregister_provider': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_provider_namespace'], 'defaults': []},
+        'doc': None,
+        'arguments': [
+            ('resource_provider_namespace', {'required': True, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.resource.custom#validate_arm_template': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'template_file_path', 'parameters_file_path', 'mode'], 'defaults': [None, 'incremental']},
+        'doc': 'e151a391',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'resource group for deployment', 'action': None}),
+            ('template_file_path', {'required': True, 'default': None, 'help': 'path to deployment template JSON file', 'action': None}),
+            ('parameters_file_path', {'required': False, 'default': None, 'help': 'path to deployment parameters JSON file', 'action': None}),
+            ('mode', {'required': False, 'default': 'incremental', 'help': None, 'action': None}),
+        ]},
+    'azure.mgmt.resource.resources.operations.deployment_operations_operations#DeploymentOperationsOperations.get': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'deployment_name', 'operation_id', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': 'd49b65c7',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group. The name is case insensitive.', 'action': None}),
+            ('deployment_name', {'required': True, 'default': None, 'help': 'The name of the deployment.', 'action': None}),
+            ('operation_id', {'required': True, 'default': None, 'help': 'Operation Id.', 'action': None}),
+        ]},
+    'azure.mgmt.resource.resources.operations.deployment_operations_operations#DeploymentOperationsOperations.list': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'deployment_name', 'top', 'custom_headers', 'raw'], 'defaults': [None, None, False]},
+        'doc': '0c45ccf2',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group. The name is case insensitive.', 'action': None}),
+            ('deployment_name', {'required': True, 'default': None, 'help': 'The name of the deployment.', 'action': None}),
+            ('top', {'required': False, 'default': None, 'help': 'Query parameters.', 'action': None}),
+        ]},
+    'azure.mgmt.resource.resources.operations.deployments_operations#DeploymentsOperations.check_existence': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'deployment_name', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': 'b6322b08',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group to check. The name is case insensitive.', 'action': None}),
+            ('deployment_name', {'required': True, 'default': None, 'help': 'The name of the deployment.', 'action': None}),
+        ]},
+    'azure.mgmt.resource.resources.operations.deployments_operations#DeploymentsOperations.get': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'deployment_name', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': 'ebc8b98a',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group to get. The name is case insensitive.', 'action': None}),
+            ('deployment_name', {'required': True, 'default': None, 'help': 'The name of the deployment.', 'action': None}),
+        ]},
+    'azure.mgmt.resource.resources.operations.deployments_operations#DeploymentsOperations.list': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'filter', 'top', 'custom_headers', 'raw'], 'defaults': [None, None, None, False]},
+        'doc': 'cefb775c',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group to filter by. The name is case insensitive.', 'action': None}),
+            ('filter', {'required': False, 'default': None, 'help': 'The filter to apply on the operation.', 'action': None}),
+            ('top', {'required': False, 'default': None, 'help': 'Query parameters. If null is passed returns all deployments.', 'action': None}),
+        ]},
+    'azure.mgmt.resource.resources.operations.providers_operations#ProvidersOperations.get': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_provider_namespace', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': 'b15f85eb',
+        'arguments': [
+            ('resource_provider_namespace', {'required': True, 'default': None, 'help': 'Namespace of the resource provider.', 'action': None}),
+        ]},
+    'azure.mgmt.resource.resources.operations.providers_operations#ProvidersOperations.list': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'top', 'custom_headers', 'raw'], 'defaults': [None, None, False]},
+        'doc': 'df0c9874',
+        'arguments': [
+            ('top', {'required': False, 'default': None, 'help': 'Query parameters. If null is passed returns all deployments.', 'action': None}),
+        ]},
+    'azure.mgmt.resource.resources.operations.resource_groups_operations#ResourceGroupsOperations.check_existence': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': '5db3e174',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group to check. The name is case insensitive.', 'action': None}),
+        ]},
+    'azure.mgmt.resource.resources.operations.resource_groups_operations#ResourceGroupsOperations.create_or_update': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'parameters', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': '8561d29f',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group to be created or updated.', 'action': None}),
+            ('parameters', {'required': True, 'default': None, 'help': 'Parameters supplied to the create or update resource group service operation.', 'action': None}),
+        ]},
+    'azure.mgmt.resource.resources.operations.resource_groups_operations#ResourceGroupsOperations.delete': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': 'c128f795',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group to be deleted. The name is case insensitive.', 'action': None}),
+        ]},
+    'azure.mgmt.resource.resources.operations.resource_groups_operations#ResourceGroupsOperations.get': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': '728c2bab',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group to get. The name is case insensitive.', 'action': None}),
+        ]},
+    'azure.mgmt.resource.resources.operations.resources_operations#ResourcesOperations.check_existence': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'resource_provider_namespace', 'parent_resource_path', 'resource_type', 'resource_name', 'api_version', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': '75fcae83',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group. The name is case insensitive.', 'action': None}),
+            ('resource_provider_namespace', {'required': True, 'default': None, 'help': 'Resource identity.', 'action': None}),
+            ('parent_resource_path', {'required': True, 'default': None, 'help': 'Resource identity.', 'action': None}),
+            ('resource_type', {'required': True, 'default': None, 'help': 'Resource identity.', 'action': None}),
+            ('resource_name', {'required': True, 'default': None, 'help': 'Resource identity.', 'action': None}),
+            ('api_version', {'required': True, 'default': None, 'help': '', 'action': None}),
+        ]},
+    'azure.mgmt.resource.resources.operations.resources_operations#ResourcesOperations.create_or_update': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'resource_provider_namespace', 'parent_resource_path', 'resource_type', 'resource_name', 'api_version', 'parameters', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': '4b08a437',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group. The name is case insensitive.', 'action': None}),
+            ('resource_provider_namespace', {'required': True, 'default': None, 'help': 'Resource identity.', 'action': None}),
+            ('parent_resource_path', {'required': True, 'default': None, 'help': 'Resource identity.', 'action': None}),
+            ('resource_type', {'required': True, 'default': None, 'help': 'Resource identity.', 'action': None}),
+            ('resource_name', {'required': True, 'default': None, 'help': 'Resource identity.', 'action': None}),
+            ('api_version', {'required': True, 'default': None, 'help': '', 'action': None}),
+            ('parameters', {'required': True, 'default': None, 'help': 'Create or update resource parameters.', 'action': None}),
+        ]},
+    'azure.mgmt.resource.resources.operations.resources_operations#ResourcesOperations.delete': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'resource_provider_namespace', 'parent_resource_path', 'resource_type', 'resource_name', 'api_version', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': '70a1db14',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group. The name is case insensitive.', 'action': None}),
+            ('resource_provider_namespace', {'required': True, 'default': None, 'help': 'Resource identity.', 'action': None}),
+            ('parent_resource_path', {'required': True, 'default': None, 'help': 'Resource identity.', 'action': None}),
+            ('resource_type', {'required': True, 'default': None, 'help': 'Resource identity.', 'action': None}),
+            ('resource_name', {'required': True, 'default': None, 'help': 'Resource identity.', 'action': None}),
+            ('api_version', {'required': True, 'default': None, 'help': '', 'action': None}),
+        ]},
+    'azure.mgmt.resource.resources.operations.resources_operations#ResourcesOperations.get': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'resource_provider_namespace', 'parent_resource_path', 'resource_type', 'resource_name', 'api_version', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': 'c0f899f8',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group. The name is case insensitive.', 'action': None}),
+            ('resource_provider_namespace', {'required': True, 'default': None, 'help': 'Resource identity.', 'action': None}),
+            ('parent_resource_path', {'required': True, 'default': None, 'help': 'Resource identity.', 'action': None}),
+            ('resource_type', {'required': True, 'default': None, 'help': 'Resource identity.', 'action': None}),
+            ('resource_name', {'required': True, 'default': None, 'help': 'Resource identity.', 'action': None}),
+            ('api_version', {'required': True, 'default': None, 'help': '', 'action': None}),
+        ]},
+    'azure.mgmt.resource.resources.operations.tags_operations#TagsOperations.create_or_update': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'tag_name', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': '981885af',
+        'arguments': [
+            ('tag_name', {'required': True, 'default': None, 'help': 'The name of the tag.', 'action': None}),
+        ]},
+    'azure.mgmt.resource.resources.operations.tags_operations#TagsOperations.create_or_update_value': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'tag_name', 'tag_value', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': 'a49e2d77',
+        'arguments': [
+            ('tag_name', {'required': True, 'default': None, 'help': 'The name of the tag.', 'action': None}),
+            ('tag_value', {'required': True, 'default': None, 'help': 'The value of the tag.', 'action': None}),
+        ]},
+    'azure.mgmt.resource.resources.operations.tags_operations#TagsOperations.delete': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'tag_name', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': 'c258fa70',
+        'arguments': [
+            ('tag_name', {'required': True, 'default': None, 'help': 'The name of the tag.', 'action': None}),
+        ]},
+    'azure.mgmt.resource.resources.operations.tags_operations#TagsOperations.delete_value': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'tag_name', 'tag_value', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': '80b8ec20',
+        'arguments': [
+            ('tag_name', {'required': True, 'default': None, 'help': 'The name of the tag.', 'action': None}),
+            ('tag_value', {'required': True, 'default': None, 'help': 'The value of the tag.', 'action': None}),
+        ]},
+    'azure.mgmt.resource.resources.operations.tags_operations#TagsOperations.list': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': '99177d92',
+        'arguments': [
+        ]},
+})
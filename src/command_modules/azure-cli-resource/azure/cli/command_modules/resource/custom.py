@@ -58,7 +58,7 @@ def _list_resources_odata_filter_builder(location=None, resource_type=None,
                     filters.append("tagvalue eq '%s'" % tag_value)
     return ' and '.join(filters)
 
-def list_resource_groups(tag=None): # pylint: disable=no-self-use
+def list_resource_groups(tag=None, top=None): # pylint: disable=no-self-use
     ''' List resource groups, optionally filtered by a tag.
     :param str tag:tag to filter by in 'key[=value]' format
     '''
@@ -72,8 +72,7 @@ def list_resource_groups(tag=None): # pylint: disable=no-self-use
 
     filter_text = ' and '.join(filters) if len(filters) > 0 else None
 
-    groups = rcf.resource_groups.list(filter=filter_text)
-    return list(groups)
+    return rcf.resource_groups.list(filter=filter_text, top=top)
 
 def create_resource_group(resource_group_name, location, tags=None):
     ''' Create a new resource group.
@@ -121,7 +120,8 @@ def export_group_as_template(
     print(json.dumps(result.template, indent=2))
 
 def list_resources(
-        location=None, resource_type=None, resource_group_name=None, tag=None, name=None):
+        location=None, resource_type=None, resource_group_name=None, tag=None, name=None,
+        top=None):
     ''' List resources
         EXAMPLES:
             az resource list --location westus
@@ -138,8 +138,7 @@ def list_resources(
     rcf = _resource_client_factory()
     odata_filter = _list_resources_odata_filter_builder(
         location, resource_type, resource_group_name, tag, name)
-    resources = rcf.resources.list(filter=odata_filter)
-    return list(resources)
+    return rcf.resources.list(filter=odata_filter, top=top)
 
 def deploy_arm_template(
         resource_group_name, deployment_name, template_file_path,
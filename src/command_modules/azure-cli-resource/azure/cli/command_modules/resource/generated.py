@@ -28,7 +28,7 @@ factory = lambda _: _resource_client_factory().resource_groups
 cli_command('resource group delete', ResourceGroupsOperations.delete, factory)
 cli_command('resource group show', ResourceGroupsOperations.get, factory)
 cli_command('resource group exists', ResourceGroupsOperations.check_existence, factory)
-cli_command('resource group list', list_resource_groups)
+cli_command('resource group list', list_resource_groups, page_size_argument='top')
 cli_command('resource group create', create_resource_group)
 cli_command('resource group export', export_group_as_template)
 
@@ -37,7 +37,10 @@ factory = lambda _: _resource_client_factory().resources
 cli_command('resource exists', ResourcesOperations.check_existence, factory)
 cli_command('resource delete', ResourcesOperations.delete, factory)
 cli_command('resource show', ResourcesOperations.get, factory)
-cli_command('resource list', list_resources)
+cli_command('resource list', list_resources,
+            query_filter_arguments={'location': 'location', 'name': 'name',
+                                    'resourceGroup': 'resource_group_name'},
+            page_size_argument='top')
 cli_command('resource tag', tag_resource)
 cli_command('resource move', move_resource)
 
@@ -5,5 +5,6 @@
 
 # pylint: disable=unused-import
 
+import azure.cli.command_modules.role._signatures
 import azure.cli.command_modules.role.generated
 import azure.cli.command_modules.role._params
@@ -0,0 +1,203 @@
+#---------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+#---------------------------------------------------------------------------------------------
+
+# This file is generated by scripts/sdk_command_gen/gen_signatures.py. Do not modify it by hand.
+# pylint: skip-file
+
+from azure.cli.commands._introspection import register_signatures
+
+register_signatures({
+    'azure.cli.command_modules.role.custom#create_role_assignment': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['role', 'assignee', 'resource_group_name', 'resource_id'], 'defaults': [None, None]},
+        'doc': None,
+        'arguments': [
+            ('role', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('assignee', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('resource_group_name', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('resource_id', {'required': False, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.role.custom#create_role_definition': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['role_definition'], 'defaults': []},
+        'doc': None,
+        'arguments': [
+            ('role_definition', {'required': True, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.role.custom#create_user': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['client', 'user_principal_name', 'display_name', 'password', 'mail_nickname', 'immutable_id', 'force_change_password_next_login'], 'defaults': [None, None, False]},
+        'doc': 'e98b774f',
+        'arguments': [
+            ('user_principal_name', {'required': True, 'default': None, 'help': 'The user principal name (someuser@contoso.com). It must contain one of the verified domains for the tenant.', 'action': None}),
+            ('display_name', {'required': True, 'default': None, 'help': 'User display name', 'action': None}),
+            ('password', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('mail_nickname', {'required': False, 'default': None, 'help': 'The mail alias for the user', 'action': None}),
+            ('immutable_id', {'required': False, 'default': None, 'help': "Needs to be specified if you are using a federated domain for the user's userPrincipalName (UPN) property while creating a new user account. It is used to associate an on-premises Active Directory user account to their Azure AD user object.", 'action': None}),
+            ('force_change_password_next_login', {'required': False, 'default': False, 'help': None, 'action': 'store_true'}),
+        ]},
+    'azure.cli.command_modules.role.custom#delete_role_assignments': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['ids', 'assignee', 'role', 'resource_group_name', 'resource_id', 'include_inherited'], 'defaults': [None, None, None, None, None, False]},
+        'doc': None,
+        'arguments': [
+            ('ids', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('assignee', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('role', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('resource_group_name', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('resource_id', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('include_inherited', {'required': False, 'default': False, 'help': None, 'action': 'store_true'}),
+        ]},
+    'azure.cli.command_modules.role.custom#delete_role_definition': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['name', 'resource_group_name', 'resource_id', 'custom_role_only'], 'defaults': [None, None, False]},
+        'doc': None,
+        'arguments': [
+            ('name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('resource_group_name', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('resource_id', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('custom_role_only', {'required': False, 'default': False, 'help': None, 'action': 'store_true'}),
+        ]},
+    'azure.cli.command_modules.role.custom#list_apps': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['client', 'app_id', 'display_name', 'identifier_uri', 'query_filter'], 'defaults': [None, None, None, None]},
+        'doc': None,
+        'arguments': [
+            ('app_id', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('display_name', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('identifier_uri', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('query_filter', {'required': False, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.role.custom#list_groups': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['client', 'display_name', 'query_filter'], 'defaults': [None, None]},
+        'doc': None,
+        'arguments': [
+            ('display_name', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('query_filter', {'required': False, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.role.custom#list_role_assignments': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['assignee', 'role', 'resource_group_name', 'resource_id', 'include_inherited', 'show_all', 'include_groups'], 'defaults': [None, None, None, None, False, False, False]},
+        'doc': '5f82d53a',
+        'arguments': [
+            ('assignee', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('role', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('resource_group_name', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('resource_id', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('include_inherited', {'required': False, 'default': False, 'help': None, 'action': 'store_true'}),
+            ('show_all', {'required': False, 'default': False, 'help': None, 'action': 'store_true'}),
+            ('include_groups', {'required': False, 'default': False, 'help': 'include extra assignments to the groups of which the user is a member(transitively). Supported only for a user principal.', 'action': 'store_true'}),
+        ]},
+    'azure.cli.command_modules.role.custom#list_role_definitions': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['name', 'resource_group_name', 'resource_id', 'custom_role_only'], 'defaults': [None, None, None, False]},
+        'doc': None,
+        'arguments': [
+            ('name', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('resource_group_name', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('resource_id', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('custom_role_only', {'required': False, 'default': False, 'help': None, 'action': 'store_true'}),
+        ]},
+    'azure.cli.command_modules.role.custom#list_sps': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['client', 'spn', 'display_name', 'query_filter'], 'defaults': [None, None, None]},
+        'doc': None,
+        'arguments': [
+            ('spn', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('display_name', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('query_filter', {'required': False, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.role.custom#list_users': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['client', 'upn', 'display_name', 'query_filter'], 'defaults': [None, None, None]},
+        'doc': None,
+        'arguments': [
+            ('upn', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('display_name', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('query_filter', {'required': False, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.graphrbac.operations.applications_operations#ApplicationsOperations.delete': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'application_object_id', 'api_version', 'custom_headers', 'raw'], 'defaults': ['1.6', None, False]},
+        'doc': '771ab9f4',
+        'arguments': [
+            ('application_object_id', {'required': True, 'default': None, 'help': 'Application object id', 'action': None}),
+            ('api_version', {'required': False, 'default': '1.6', 'help': 'Client Api Version.', 'action': None}),
+        ]},
+    'azure.graphrbac.operations.applications_operations#ApplicationsOperations.get': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'application_object_id', 'api_version', 'custom_headers', 'raw'], 'defaults': ['1.6', None, False]},
+        'doc': '3769cdb4',
+        'arguments': [
+            ('application_object_id', {'required': True, 'default': None, 'help': 'Application object id', 'action': None}),
+            ('api_version', {'required': False, 'default': '1.6', 'help': 'Client Api Version.', 'action': None}),
+        ]},
+    'azure.graphrbac.operations.groups_operations#GroupsOperations.delete': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'group_object_id', 'api_version', 'custom_headers', 'raw'], 'defaults': ['1.6', None, False]},
+        'doc': 'ee0f2a1b',
+        'arguments': [
+            ('group_object_id', {'required': True, 'default': None, 'help': 'Object id', 'action': None}),
+            ('api_version', {'required': False, 'default': '1.6', 'help': 'Client Api Version.', 'action': None}),
+        ]},
+    'azure.graphrbac.operations.groups_operations#GroupsOperations.get': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'object_id', 'api_version', 'custom_headers', 'raw'], 'defaults': ['1.6', None, False]},
+        'doc': '25eef3ad',
+        'arguments': [
+            ('object_id', {'required': True, 'default': None, 'help': 'User objectId to get group information.', 'action': None}),
+            ('api_version', {'required': False, 'default': '1.6', 'help': 'Client Api Version.', 'action': None}),
+        ]},
+    'azure.graphrbac.operations.service_principals_operations#ServicePrincipalsOperations.delete': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'object_id', 'api_version', 'custom_headers', 'raw'], 'defaults': ['1.6', None, False]},
+        'doc': 'd16de325',
+        'arguments': [
+            ('object_id', {'required': True, 'default': None, 'help': 'Object id to delete service principal information.', 'action': None}),
+            ('api_version', {'required': False, 'default': '1.6', 'help': 'Client Api Version.', 'action': None}),
+        ]},
+    'azure.graphrbac.operations.service_principals_operations#ServicePrincipalsOperations.get': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'object_id', 'api_version', 'custom_headers', 'raw'], 'defaults': ['1.6', None, False]},
+        'doc': '49ee6681',
+        'arguments': [
+            ('object_id', {'required': True, 'default': None, 'help': 'Object id to get service principal information.', 'action': None}),
+            ('api_version', {'required': False, 'default': '1.6', 'help': 'Client Api Version.', 'action': None}),
+        ]},
+    'azure.graphrbac.operations.users_operations#UsersOperations.delete': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'upn_or_object_id', 'api_version', 'custom_headers', 'raw'], 'defaults': ['1.6', None, False]},
+        'doc': 'd54d6665',
+        'arguments': [
+            ('upn_or_object_id', {'required': True, 'default': None, 'help': 'user object id or user principal name (upn)', 'action': None}),
+            ('api_version', {'required': False, 'default': '1.6', 'help': 'Client Api Version.', 'action': None}),
+        ]},
+    'azure.graphrbac.operations.users_operations#UsersOperations.get': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'upn_or_object_id', 'api_version', 'custom_headers', 'raw'], 'defaults': ['1.6', None, False]},
+        'doc': 'e077a26c',
+        'arguments': [
+            ('upn_or_object_id', {'required': True, 'default': None, 'help': 'User object Id or user principal name to get user information.', 'action': None}),
+            ('api_version', {'required': False, 'default': '1.6', 'help': 'Client Api Version.', 'action': None}),
+        ]},
+    'azure.mgmt.authorization.operations.role_definitions_operations#RoleDefinitionsOperations.create_or_update': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'scope', 'role_definition_id', 'role_definition', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': 'd3736953',
+        'arguments': [
+            ('scope', {'required': True, 'default': None, 'help': 'Scope', 'action': None}),
+            ('role_definition_id', {'required': True, 'default': None, 'help': 'Role definition id.', 'action': None}),
+            ('role_definition', {'required': True, 'default': None, 'help': 'Role definition.', 'action': None}),
+        ]},
+    'azure.mgmt.authorization.operations.role_definitions_operations#RoleDefinitionsOperations.get': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'scope', 'role_definition_id', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': '9ad71fb6',
+        'arguments': [
+            ('scope', {'required': True, 'default': None, 'help': 'Scope', 'action': None}),
+            ('role_definition_id', {'required': True, 'default': None, 'help': 'Role definition Id', 'action': None}),
+        ]},
+})
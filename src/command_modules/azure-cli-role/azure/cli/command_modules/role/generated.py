@@ -19,7 +19,8 @@ from .custom import (create_role_assignment, list_role_assignments, delete_role_
 
 factory = lambda _: _auth_client_factory().role_definitions
 simple_output_query = '[*].{Name:properties.roleName, Id:name, Type:properties.type}'
-cli_command('role list', list_role_definitions, simple_output_query=simple_output_query)
+cli_command('role list', list_role_definitions, simple_output_query=simple_output_query,
+            query_filter_arguments={'properties.roleName': 'name'})
 cli_command('role delete', delete_role_definition)
 cli_command('role create', create_role_definition, simple_output_query=simple_output_query)
 register_generic_update('role update',
@@ -36,23 +37,27 @@ cli_command('role assignment create', create_role_assignment, simple_output_quer
 factory = lambda _: _graph_client_factory().applications
 cli_command('ad app delete', ApplicationsOperations.delete, factory)
 cli_command('ad app show', ApplicationsOperations.get, factory)
-cli_command('ad app list', list_apps, factory)
+cli_command('ad app list', list_apps, factory,
+            query_filter_arguments={'appId': 'app_id', 'displayName': 'display_name'})
 
 factory = lambda _: _graph_client_factory().service_principals
 cli_command('ad sp delete', ServicePrincipalsOperations.delete, factory)
 cli_command('ad sp show', ServicePrincipalsOperations.get, factory)
 #paging is broken at SDK https://github.com/Azure/azure-cli/issues/540
-cli_command('ad sp list', list_sps, factory)
+cli_command('ad sp list', list_sps, factory,
+            query_filter_arguments={'displayName': 'display_name'})
 
 factory = lambda _: _graph_client_factory().users
 cli_command('ad user delete', UsersOperations.delete, factory)
 cli_command('ad user show', UsersOperations.get, factory)
 #paging is broken at SDK https://github.com/Azure/azure-cli/issues/540
-cli_command('ad user list', list_users, factory)
+cli_command('ad user list', list_users, factory,
+            query_filter_arguments={'userPrincipalName': 'upn', 'displayName': 'display_name'})
 cli_command('ad user create', create_user, factory)
 
 factory = lambda _: _graph_client_factory().groups
 cli_command('ad group delete', GroupsOperations.delete, factory)
 cli_command('ad group show', GroupsOperations.get, factory)
 #paging is broken at SDK https://github.com/Azure/azure-cli/issues/540
-cli_command('ad group list', list_groups, factory)
+cli_command('ad group list', list_groups, factory,
+            query_filter_arguments={'displayName': 'display_name'})
@@ -5,6 +5,7 @@
 
 # pylint: disable=unused-import
 
+import azure.cli.command_modules.storage._signatures
 import azure.cli.command_modules.storage._params
 import azure.cli.command_modules.storage.generated
 import azure.cli.command_modules.storage.custom
@@ -0,0 +1,921 @@
+#---------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+#---------------------------------------------------------------------------------------------
+
+# This file is generated by scripts/sdk_command_gen/gen_signatures.py. Do not modify it by hand.
+# pylint: skip-file
+
+from azure.cli.commands._introspection import register_signatures
+
+register_signatures({
+    'azure.cli.command_modules.storage.custom#blob_exists': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['client', 'container_name', 'blob_name', 'snapshot', 'timeout'], 'defaults': [None, None]},
+        'doc': '428cfeb2',
+        'arguments': [
+            ('container_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('blob_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('snapshot', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('timeout', {'required': False, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.storage.custom#container_exists': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['client', 'container_name', 'snapshot', 'timeout'], 'defaults': [None, None]},
+        'doc': '269ba725',
+        'arguments': [
+            ('container_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('snapshot', {'required': False, 'default': None, 'help': 'UTC datetime value which specifies a snapshot', 'action': None}),
+            ('timeout', {'required': False, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.storage.custom#create_acl_policy': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['client', 'container_name', 'policy_name', 'start', 'expiry', 'permission'], 'defaults': [None, None, None]},
+        'doc': '18a190e8',
+        'arguments': [
+            ('container_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('policy_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('start', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('expiry', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('permission', {'required': False, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.storage.custom#create_storage_account': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'account_name', 'location', 'account_type', 'tags'], 'defaults': [None]},
+        'doc': '4225d4af',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('account_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('location', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('account_type', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('tags', {'required': False, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.storage.custom#delete_acl_policy': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['client', 'container_name', 'policy_name'], 'defaults': []},
+        'doc': 'fc655035',
+        'arguments': [
+            ('container_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('policy_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.storage.custom#dir_exists': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['client', 'share_name', 'directory_name'], 'defaults': []},
+        'doc': '75d74fb2',
+        'arguments': [
+            ('share_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('directory_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.storage.custom#download_blob': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['client', 'container_name', 'blob_name', 'download_to'], 'defaults': []},
+        'doc': '93a72c93',
+        'arguments': [
+            ('container_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('blob_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('download_to', {'required': True, 'default': None, 'help': 'the file path to download to', 'action': None}),
+        ]},
+    'azure.cli.command_modules.storage.custom#download_file': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['client', 'share_name', 'file_name', 'local_file_name', 'directory_name'], 'defaults': [None]},
+        'doc': '95121749',
+        'arguments': [
+            ('share_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('file_name', {'required': True, 'default': None, 'help': 'the file name', 'action': None}),
+            ('local_file_name', {'required': True, 'default': None, 'help': 'the path to the local file to download to', 'action': None}),
+            ('directory_name', {'required': False, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.storage.custom#file_exists': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['client', 'share_name', 'file_name', 'directory_name'], 'defaults': [None]},
+        'doc': 'c10bad7e',
+        'arguments': [
+            ('share_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('file_name', {'required': True, 'default': None, 'help': 'the file name to check', 'action': None}),
+            ('directory_name', {'required': False, 'default': None, 'help': 'subdirectory path to the file', 'action': None}),
+        ]},
+    'azure.cli.command_modules.storage.custom#get_acl_policy': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['client', 'container_name', 'policy_name'], 'defaults': []},
+        'doc': '6562e8bd',
+        'arguments': [
+            ('container_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('policy_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.storage.custom#list_acl_policies': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['client', 'container_name'], 'defaults': []},
+        'doc': '8e68720d',
+        'arguments': [
+            ('container_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.storage.custom#list_storage_accounts': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name'], 'defaults': [None]},
+        'doc': 'bed9d1cb',
+        'arguments': [
+            ('resource_group_name', {'required': False, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.storage.custom#renew_storage_account_keys': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'account_name', 'key'], 'defaults': [None]},
+        'doc': 'ffaab647',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('account_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('key', {'required': False, 'default': None, 'help': 'Key to renew.', 'action': None}),
+        ]},
+    'azure.cli.command_modules.storage.custom#set_acl_policy': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['client', 'container_name', 'policy_name', 'start', 'expiry', 'permission'], 'defaults': [None, None, None]},
+        'doc': 'c45d3a06',
+        'arguments': [
+            ('container_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('policy_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('start', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('expiry', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('permission', {'required': False, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.storage.custom#set_storage_account_properties': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'account_name', 'account_type', 'tags', 'custom_domain'], 'defaults': [None, '', None]},
+        'doc': '6e1ed7b7',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('account_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('account_type', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('tags', {'required': False, 'default': '', 'help': None, 'action': None}),
+            ('custom_domain', {'required': False, 'default': None, 'help': 'the custom domain name', 'action': None}),
+        ]},
+    'azure.cli.command_modules.storage.custom#share_exists': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['client', 'share_name'], 'defaults': []},
+        'doc': '5339b252',
+        'arguments': [
+            ('share_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.storage.custom#show_storage_account_connection_string': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'account_name', 'use_http'], 'defaults': ['https']},
+        'doc': 'd7f83b1c',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('account_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('use_http', {'required': False, 'default': 'https', 'help': 'use http as the default endpoint protocol', 'action': None}),
+        ]},
+    'azure.cli.command_modules.storage.custom#show_storage_account_usage': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': [], 'defaults': []},
+        'doc': '7c74f70c',
+        'arguments': [
+        ]},
+    'azure.cli.command_modules.storage.custom#upload_blob': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['client', 'container_name', 'blob_name', 'blob_type', 'upload_from', 'content_type', 'content_disposition', 'content_encoding', 'content_language', 'content_md5', 'content_cache_control'], 'defaults': [None, None, None, None, None, None]},
+        'doc': '0b50a47d',
+        'arguments': [
+            ('container_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('blob_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('blob_type', {'required': True, 'default': None, 'help': 'type of blob to upload', 'action': None}),
+            ('upload_from', {'required': True, 'default': None, 'help': 'local path to upload from', 'action': None}),
+            ('content_type', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('content_disposition', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('content_encoding', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('content_language', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('content_md5', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('content_cache_control', {'required': False, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.storage.custom#upload_file': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['client', 'share_name', 'file_name', 'local_file_name', 'directory_name'], 'defaults': [None]},
+        'doc': '972a47b5',
+        'arguments': [
+            ('share_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('file_name', {'required': True, 'default': None, 'help': 'the destination file name', 'action': None}),
+            ('local_file_name', {'required': True, 'default': None, 'help': 'the path and file name to upload', 'action': None}),
+            ('directory_name', {'required': False, 'default': None, 'help': 'the destination directory to upload to', 'action': None}),
+        ]},
+    'azure.mgmt.storage.operations.storage_accounts_operations#StorageAccountsOperations.check_name_availability': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'name', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': 'b5bc7f5f',
+        'arguments': [
+            ('name', {'required': True, 'default': None, 'help': '', 'action': None}),
+        ]},
+    'azure.mgmt.storage.operations.storage_accounts_operations#StorageAccountsOperations.delete': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'account_name', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': '25fd3971',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': "The name of the resource group within the user's subscription.", 'action': None}),
+            ('account_name', {'required': True, 'default': None, 'help': 'The name of the storage account within the specified resource group. Storage account names must be between 3 and 24 characters in length and use numbers and lower-case letters only.', 'action': None}),
+        ]},
+    'azure.mgmt.storage.operations.storage_accounts_operations#StorageAccountsOperations.get_properties': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'account_name', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': '2130147a',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': "The name of the resource group within the user's subscription.", 'action': None}),
+            ('account_name', {'required': True, 'default': None, 'help': 'The name of the storage account within the specified resource group. Storage account names must be between 3 and 24 characters in length and use numbers and lower-case letters only.', 'action': None}),
+        ]},
+    'azure.mgmt.storage.operations.storage_accounts_operations#StorageAccountsOperations.list_keys': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'account_name', 'custom_headers', 'raw'], 'defaults': [None, False]},
+        'doc': '055c7028',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('account_name', {'required': True, 'default': None, 'help': 'The name of the storage account.', 'action': None}),
+        ]},
+    'azure.storage.blob.baseblobservice#BaseBlobService.abort_copy_blob': {
+        'version': '0.32.0',
+        'parameters': {'names': ['self', 'container_name', 'blob_name', 'copy_id', 'lease_id', 'timeout'], 'defaults': [None, None]},
+        'doc': '7c2b3fb0',
+        'arguments': [
+            ('container_name', {'required': True, 'default': None, 'help': ' Name of destination container.', 'action': None}),
+            ('blob_name', {'required': True, 'default': None, 'help': ' Name of destination blob.', 'action': None}),
+            ('copy_id', {'required': True, 'default': None, 'help': ' Copy identifier provided in the copy.id of the original copy_blob operation.', 'action': None}),
+            ('lease_id', {'required': False, 'default': None, 'help': ' Required if the destination blob has an active infinite lease.', 'action': None}),
+            ('timeout', {'required': False, 'default': None, 'help': ' The timeout parameter is expressed in seconds.', 'action': None}),
+        ]},
+    'azure.storage.blob.baseblobservice#BaseBlobService.acquire_blob_lease': {
+        'version': '0.32.0',
+        'parameters': {'names': ['self', 'container_name', 'blob_name', 'lease_duration', 'proposed_lease_id', 'if_modified_since', 'if_unmodified_since', 'if_match', 'if_none_match', 'timeout'], 'defaults': [-1, None, None, None, None, None, None]},
+        'doc': '0a1c4c4a',
+        'arguments': [
+            ('container_name', {'required': True, 'default': None, 'help': ' Name of existing container.', 'action': None}),
+            ('blob_name', {'required': True, 'default': None, 'help': ' Name of existing blob.', 'action': None}),
+            ('lease_duration', {'required': False, 'default': -1, 'help': ' Specifies the duration of the lease, in seconds, or negative one (-1) for a lease that never expires. A non-infinite lease can be between 15 and 60 seconds. A lease duration cannot be changed using renew or change. Default is -1 (infinite lease).', 'action': None}),
+            ('proposed_lease_id', {'required': False, 'default': None, 'help': ' Proposed lease ID, in a GUID string format. The Blob service returns 400 (Invalid request) if the proposed lease ID is not in the correct format.', 'action': None}),
+            ('if_modified_since', {'required': False, 'default': None, 'help': ' A DateTime value. Azure expects the date value passed in to be UTC. If timezone is included, any non-UTC datetimes will be converted to UTC. If a date is passed in without timezone info, it is assumed to be UTC. Specify this header to perform the operation only if the resource has been modified since the specified time.', 'action': None}),
+            ('if_unmodified_since', {'required': False, 'default': None, 'help': ' A DateTime value. Azure expects the date value passed in to be UTC. If timezone is included, any non-UTC datetimes will be converted to UTC. If a date is passed in without timezone info, it is assumed to be UTC. Specify this header to perform the operation only if the resource has not been modified since the specified date/time.', 'action': None}),
+            ('if_match', {'required': False, 'default': None, 'help': " An ETag value, or the wildcard character (*). Specify this header to perform the operation only if the resource's ETag matches the value specified.", 'action': None}),
+            ('if_none_match', {'required': False, 'default': None, 'help': " An ETag value, or the wildcard character (*). Specify this header to perform the operation only if the resource's ETag does not match the value specified. Specify the wildcard character (*) to perform the operation only if the resource does not exist, and fail the operation if it does exist.", 'action': None}),
+            ('timeout', {'required': False, 'default': None, 'help': ' The timeout parameter is expressed in seconds.', 'action': None}),
+        ]},
+    'azure.storage.blob.baseblobservice#BaseBlobService.acquire_container_lease': {
+        'version': '0.32.0',
+        'parameters': {'names': ['self', 'container_name', 'lease_duration', 'proposed_lease_id', 'if_modified_since', 'if_unmodified_since', 'timeout'], 'defaults': [-1, None, None, None, None]},
+        'doc': 'db55bbab',
+        'arguments': [
+            ('container_name', {'required': True, 'default': None, 'help': ' Name of existing container.', 'action': None}),
+            ('lease_duration', {'required': False, 'default': -1, 'help': ' Specifies the duration of the lease, in seconds, or negative one (-1) for a lease that never expires. A non-infinite lease can be between 15 and 60 seconds. A lease duration cannot be changed using renew or change. Default is -1 (infinite lease).', 'action': None}),
+            ('proposed_lease_id', {'required': False, 'default': None, 'help': ' Proposed lease ID, in a GUID string format. The Blob service returns 400 (Invalid request) if the proposed lease ID is not in the correct format.', 'action': None}),
+            ('if_modified_since', {'required': False, 'default': None, 'help': ' A DateTime value. Azure expects the date value passed in to be UTC. If timezone is included, any non-UTC datetimes will be converted to UTC. If a date is passed in without timezone info, it is assumed to be UTC. Specify this header to perform the operation only if the resource has been modified since the specified time.', 'action': None}),
+            ('if_unmodified_since', {'required': False, 'default': None, 'help': ' A DateTime value. Azure expects the date value passed in to be UTC. If timezone is included, any non-UTC datetimes will be converted to UTC. If a date is passed in without timezone info, it is assumed to be UTC. Specify this header to perform the operation only if the resource has not been modified since the specified date/time.', 'action': None}),
+            ('timeout', {'required': False, 'default': None, 'help': ' The timeout parameter is expressed in seconds.', 'action': None}),
+        ]},
+    'azure.storage.blob.baseblobservice#BaseBlobService.break_blob_lease': {
+        'version': '0.32.0',
+        'parameters': {'names': ['self', 'container_name', 'blob_name', 'lease_break_period', 'if_modified_since', 'if_unmodified_since', 'if_match', 'if_none_match', 'timeout'], 'defaults': [None, None, None, None, None, None]},
+        'doc': '7cd77d1f',
+        'arguments': [
+            ('container_name', {'required': True, 'default': None, 'help': ' Name of existing container.', 'action': None}),
+            ('blob_name', {'required': True, 'default': None, 'help': ' Name of existing blob.', 'action': None}),
+            ('lease_break_period', {'required': False, 'default': None, 'help': ' For a break operation, this is the proposed duration of seconds that the lease should continue before it is broken, between 0 and 60 seconds. This break period is only used if it is shorter than the time remaining on the lease. If longer, the time remaining on the lease is used. A new lease will not be available before the break period has expired, but the lease may be held for longer than the break period. If this header does not appear with a break operation, a fixed-duration lease breaks after the remaining lease period elapses, and an infinite lease breaks immediately.', 'action': None}),
+            ('if_modified_since', {'required': False, 'default': None, 'help': ' A DateTime value. Azure expects the date value passed in to be UTC. If timezone is included, any non-UTC datetimes will be converted to UTC. If a date is passed in without timezone info, it is assumed to be UTC. Specify this header to perform the operation only if the resource has been modified since the specified time.', 'action': None}),
+            ('if_unmodified_since', {'required': False, 'default': None, 'help': ' A DateTime value. Azure expects the date value passed in to be UTC. If timezone is included, any non-UTC datetimes will be converted to UTC. If a date is passed in without timezone info, it is assumed to be UTC. Specify this header to perform the operation only if the resource has not been modified since the specified date/time.', 'action': None}),
+            ('if_match', {'required': False, 'default': None, 'help': " An ETag value, or the wildcard character (*). Specify this header to perform the operation only if the resource's ETag matches the value specified.", 'action': None}),
+            ('if_none_match', {'required': False, 'default': None, 'help': " An ETag value, or the wildcard character (*). Specify this header to perform the operation only if the resource's ETag does not match the value specified. Specify the wildcard character (*) to perform the operation only if the resource does not exist, and fail the operation if it does exist.", 'action': None}),
+            ('timeout', {'required': False, 'default': None, 'help': ' The timeout parameter is expressed in seconds.', 'action': None}),
+        ]},
+    'azure.storage.blob.baseblobservice#BaseBlobService.break_container_lease': {
+        'version': '0.32.0',
+        'parameters': {'names': ['self', 'container_name', 'lease_break_period', 'if_modified_since', 'if_unmodified_since', 'timeout'], 'defaults': [None, None, None, None]},
+        'doc': 'a8f8bcee',
+        'arguments': [
+            ('container_name', {'required': True, 'default': None, 'help': ' Name of existing container.', 'action': None}),
+            ('lease_break_period', {'required': False, 'default': None, 'help': ' This is the proposed duration of seconds that the lease should continue before it is broken, between 0 and 60 seconds. This break period is only used if it is shorter than the time remaining on the lease. If longer, the time remaining on the lease is used. A new lease will not be available before the break period has expired, but the lease may be held for longer than the break period. If this header does not appear with a break operation, a fixed-duration lease breaks after the remaining lease period elapses, and an infinite lease breaks immediately.', 'action': None}),
+            ('if_modified_since', {'required': False, 'default': None, 'help': ' A DateTime value. Azure expects the date value passed in to be UTC. If timezone is included, any non-UTC datetimes will be converted to UTC. If a date is passed in without timezone info, it is assumed to be UTC. Specify this header to perform the operation only if the resource has been modified since the specified time.', 'action': None}),
+            ('if_unmodified_since', {'required': False, 'default': None, 'help': ' A DateTime value. Azure expects the date value passed in to be UTC. If timezone is included, any non-UTC datetimes will be converted to UTC. If a date is passed in without timezone info, it is assumed to be UTC. Specify this header to perform the operation only if the resource has not been modified since the specified date/time.', 'action': None}),
+            ('timeout', {'required': False, 'default': None, 'help': ' The timeout parameter is expressed in seconds.', 'action': None}),
+        ]},
+    'azure.storage.blob.baseblobservice#BaseBlobService.change_blob_lease': {
+        'version': '0.32.0',
+        'parameters': {'names': ['self', 'container_name', 'blob_name', 'lease_id', 'proposed_lease_id', 'if_modified_since', 'if_unmodified_since', 'if_match', 'if_none_match', 'timeout'], 'defaults': [None, None, None, None, None]},
+        'doc': '25f5e784',
+        'arguments': [
+            ('container_name', {'required': True, 'default': None, 'help': ' Name of existing container.', 'action': None}),
+            ('blob_name', {'required': True, 'default': None, 'help': ' Name of existing blob.', 'action': None}),
+            ('lease_id', {'required': True, 'default': None, 'help': ' Required if the blob has an active lease.', 'action': None}),
+            ('proposed_lease_id', {'required': True, 'default': None, 'help': ' Proposed lease ID, in a GUID string format. The Blob service returns 400 (Invalid request) if the proposed lease ID is not in the correct format.', 'action': None}),
+            ('if_modified_since', {'required': False, 'default': None, 'help': ' A DateTime value. Azure expects the date value passed in to be UTC. If timezone is included, any non-UTC datetimes will be converted to UTC. If a date is passed in without timezone info, it is assumed to be UTC. Specify this header to perform the operation only if the resource has been modified since the specified time.', 'action': None}),
+            ('if_unmodified_since', {'required': False, 'default': None, 'help': ' A DateTime value. Azure expects the date value passed in to be UTC. If timezone is included, any non-UTC datetimes will be converted to UTC. If a date is passed in without timezone info, it is assumed to be UTC. Specify this header to perform the operation only if the resource has not been modified since the specified date/time.', 'action': None}),
+            ('if_match', {'required': False, 'default': None, 'help': " An ETag value, or the wildcard character (*). Specify this header to perform the operation only if the resource's ETag matches the value specified.", 'action': None}),
+            ('if_none_match', {'required': False, 'default': None, 'help': " An ETag value, or the wildcard character (*). Specify this header to perform the operation only if the resource's ETag does not match the value specified. Specify the wildcard character (*) to perform the operation only if the resource does not exist, and fail the operation if it does exist.", 'action': None}),
+            ('timeout', {'required': False, 'default': None, 'help': ' The timeout parameter is expressed in seconds.', 'action': None}),
+        ]},
+    'azure.storage.blob.baseblobservice#BaseBlobService.change_container_lease': {
+        'version': '0.32.0',
+        'parameters': {'names': ['self', 'container_name', 'lease_id', 'proposed_lease_id', 'if_modified_since', 'if_unmodified_since', 'timeout'], 'defaults': [None, None, None]},
+        'doc': 'f5bfe8b1',
+        'arguments': [
+            ('container_name', {'required': True, 'default': None, 'help': ' Name of existing container.', 'action': None}),
+            ('lease_id', {'required': True, 'default': None, 'help': ' Lease ID for active lease.', 'action': None}),
+            ('proposed_lease_id', {'required': True, 'default': None, 'help': ' Proposed lease ID, in a GUID string format. The Blob service returns 400 (Invalid request) if the proposed lease ID is not in the correct format.', 'action': None}),
+            ('if_modified_since', {'required': False, 'default': None, 'help': ' A DateTime value. Azure expects the date value passed in to be UTC. If timezone is included, any non-UTC datetimes will be converted to UTC. If a date is passed in without timezone info, it is assumed to be UTC. Specify this header to perform the operation only if the resource has been modified since the specified time.', 'action': None}),
+            ('if_unmodified_since', {'required': False, 'default': None, 'help': ' A DateTime value. Azure expects the date value passed in to be UTC. If timezone is included, any non-UTC datetimes will be converted to UTC. If a date is passed in without timezone info, it is assumed to be UTC. Specify this header to perform the operation only if the resource has not been modified since the specified date/time.', 'action': None}),
+            ('timeout', {'required': False, 'default': None, 'help': ' The timeout parameter is expressed in seconds.', 'action': None}),
+        ]},
+    'azure.storage.blob.baseblobservice#BaseBlobService.copy_blob': {
+        'version': '0.32.0',
+        'parameters': {'names': ['self', 'container_name', 'blob_name', 'copy_source', 'metadata', 'source_if_modified_since', 'source_if_unmodified_since', 'source_if_match', 'source_if_none_match', 'destination_if_modified_since', 'destination_if_unmodified_since', 'destination_if_match', 'destination_if_none_match', 'destination_lease_id', 'source_lease_id', 'timeout'], 'defaults': [None, None, None, None, None, None, None, None, None, None, None, None]},
+        'doc': '32625109',
+        'arguments': [
+            ('container_name', {'required': True, 'default': None, 'help': ' Name of the destination container. The container must exist.', 'action': None}),
+            ('blob_name', {'required': True, 'default': None, 'help': ' Name of the destination blob. If the destination blob exists, it will be overwritten. Otherwise, it will be created.', 'action': None}),
+            ('copy_source', {'required': True, 'default': None, 'help': ' A URL of up to 2 KB in length that specifies an Azure file or blob. The value should be URL-encoded as it would appear in a request URI. If the source is in another account, the source must either be public or must be authenticated via a shared access signature. If the source is public, no authentication is required. Examples: https://myaccount.blob.core.windows.net/mycontainer/myblob https://myaccount.blob.core.windows.net/mycontainer/myblob?snapshot=<DateTime> https://otheraccount.blob.core.windows.net/mycontainer/myblob?sastoken', 'action': None}),
+            ('metadata', {'required': False, 'default': None, 'help': ' Name-value pairs associated with the blob as metadata. If no name-value pairs are specified, the operation will copy the metadata from the source blob or file to the destination blob. If one or more name-value pairs are specified, the destination blob is created with the specified metadata, and metadata is not copied from the source blob or file.', 'action': None}),
+            ('source_if_modified_since', {'required': False, 'default': None, 'help': ' A DateTime value. Azure expects the date value passed in to be UTC. If timezone is included, any non-UTC datetimes will be converted to UTC. If a date is passed in without timezone info, it is assumed to be UTC. Specify this conditional header to copy the blob only if the source blob has been modified since the specified date/time.', 'action': None}),
+            ('source_if_unmodified_since', {'required': False, 'default': None, 'help': ' A DateTime value. Azure expects the date value passed in to be UTC. If timezone is included, any non-UTC datetimes will be converted to UTC. If a date is passed in without timezone info, it is assumed to be UTC. Specify this conditional header to copy the blob only if the source blob has not been modified since the specified date/time.', 'action': None}),
+            ('source_if_match', {'required': False, 'default': None, 'help': ' An ETag value, or the wildcard character (*). Specify this conditional header to copy the source blob only if its ETag matches the value specified. If the ETag values do not match, the Blob service returns status code 412 (Precondition Failed). This header cannot be specified if the source is an Azure File.', 'action': None}),
+            ('source_if_none_match', {'required': False, 'default': None, 'help': ' An ETag value, or the wildcard character (*). Specify this conditional header to copy the blob only if its ETag does not match the value specified. If the values are identical, the Blob service returns status code 412 (Precondition Failed). This header cannot be specified if the source is an Azure File.', 'action': None}),
+            ('destination_if_modified_since', {'required': False, 'default': None, 'help': ' A DateTime value. Azure expects the date value passed in to be UTC. If timezone is included, any non-UTC datetimes will be converted to UTC. If a date is passed in without timezone info, it is assumed to be UTC. Specify this conditional header to copy the blob only if the destination blob has been modified since the specified date/time. If the destination blob has not been modified, the Blob service returns status code 412 (Precondition Failed).', 'action': None}),
+            ('destination_if_unmodified_since', {'required': False, 'default': None, 'help': ' A DateTime value. Azure expects the date value passed in to be UTC. If timezone is included, any non-UTC datetimes will be converted to UTC. If a date is passed in without timezone info, it is assumed to be UTC. Specify this conditional header to copy the blob only if the destination blob has not been modified since the specified date/time. If the destination blob has been modified, the Blob service returns status code 412 (Precondition Failed).', 'action': None}),
+            ('destination_if_match', {'required': False, 'default': None, 'help': ' An ETag value, or the wildcard character (*). Specify an ETag value for this conditional header to copy the blob only if the specified ETag value matches the ETag value for an existing destination blob. If the ETag for the destination blob does not match the ETag specified for If-Match, the Blob service returns status code 412 (Precondition Failed).', 'action': None}),
+            ('destination_if_none_match', {'required': False, 'default': None, 'help': " An ETag value, or the wildcard character (*). Specify an ETag value for this conditional header to copy the blob only if the specified ETag value does not match the ETag value for the destination blob. Specify the wildcard character (*) to perform the operation only if the destination blob does not exist. If the specified condition isn't met, the Blob service returns status code 412 (Precondition Failed).", 'action': None}),
+            ('destination_lease_id', {'required': False, 'default': None, 'help': ' The lease ID specified for this header must match the lease ID of the destination blob. If the request does not include the lease ID or it is not valid, the operation fails with status code 412 (Precondition Failed).', 'action': None}),
+            ('source_lease_id', {'required': False, 'default': None, 'help': ' Specify this to perform the Copy Blob operation only if the lease ID given matches the active lease ID of the source blob.', 'action': None}),
+            ('timeout', {'required': False, 'default': None, 'help': ' The timeout parameter is expressed in seconds.', 'action': None}),
+        ]},
+    'azure.storage.blob.baseblobservice#BaseBlobService.create_container': {
+        'version': '0.32.0',
+        'parameters': {'names': ['self', 'container_name', 'metadata', 'public_access', 'fail_on_exist', 'timeout'], 'defaults': [None, None, False, None]},
+        'doc': 'aa85ba1c',
+        'arguments': [
+            ('container_name', {'required': True, 'default': None, 'help': ' Name of container to create.', 'action': None}),
+            ('metadata', {'required': False, 'default': None, 'help': " A dict with name_value pairs to associate with the container as metadata. Example:{'Category':'test'}", 'action': None}),
+            ('public_access', {'required': False, 'default': None, 'help': ' Possible values include: container, blob.', 'action': None}),
+            ('fail_on_exist', {'required': False, 'default': False, 'help': ' Specify whether to throw an exception when the container exists.', 'action': 'store_true'}),
+            ('timeout', {'required': False, 'default': None, 'help': ' The timeout parameter is expressed in seconds.', 'action': None}),
+        ]},
+    'azure.storage.blob.baseblobservice#BaseBlobService.delete_blob': {
+        'version': '0.32.0',
+        'parameters': {'names': ['self', 'container_name', 'blob_name', 'snapshot', 'lease_id', 'delete_snapshots', 'if_modified_since', 'if_unmodified_since', 'if_match', 'if_none_match', 'timeout'], 'defaults': [None, None, None, None, None, None, None, None]},
+        'doc': '000bbd31',
+        'arguments': [
+            ('container_name', {'required': True, 'default': None, 'help': ' Name of existing container.', 'action': None}),
+            ('blob_name', {'required': True, 'default': None, 'help': ' Name of existing blob.', 'action': None}),
+            ('snapshot', {'required': False, 'default': None, 'help': ' The snapshot parameter is an opaque DateTime value that, when present, specifies the blob snapshot to delete.', 'action': None}),
+            ('lease_id', {'required': False, 'default': None, 'help': ' Required if the blob has an active lease.', 'action': None}),
+            ('delete_snapshots', {'required': False, 'default': None, 'help': ' Required if the blob has associated snapshots.', 'action': None}),
+            ('if_modified_since', {'required': False, 'default': None, 'help': ' A DateTime value. Azure expects the date value passed in to be UTC. If timezone is included, any non-UTC datetimes will be converted to UTC. If a date is passed in without timezone info, it is assumed to be UTC. Specify this header to perform the operation only if the resource has been modified since the specified time.', 'action': None}),
+            ('if_unmodified_since', {'required': False, 'default': None, 'help': ' A DateTime value. Azure expects the date value passed in to be UTC. If timezone is included, any non-UTC datetimes will be converted to UTC. If a date is passed in without timezone info, it is assumed to be UTC. Specify this header to perform the operation only if the resource has not been modified since the specified date/time.', 'action': None}),
+            ('if_match', {'required': False, 'default': None, 'help': " An ETag value, or the wildcard character (*). Specify this header to perform the operation only if the resource's ETag matches the value specified.", 'action': None}),
+            ('if_none_match', {'required': False, 'default': None, 'help': " An ETag value, or the wildcard character (*). Specify this header to perform the operation only if the resource's ETag does not match the value specified. Specify the wildcard character (*) to perform the operation only if the resource does not exist, and fail the operation if it does exist.", 'action': None}),
+            ('timeout', {'required': False, 'default': None, 'help': ' The timeout parameter is expressed in seconds.', 'action': None}),
+        ]},
+    'azure.storage.blob.baseblobservice#BaseBlobService.delete_container': {
+        'version': '0.32.0',
+        'parameters': {'names': ['self', 'container_name', 'fail_not_exist', 'lease_id', 'if_modified_since', 'if_unmodified_since', 'timeout'], 'defaults': [False, None, None, None, None]},
+        'doc': '24730e67',
+        'arguments': [
+            ('container_name', {'required': True, 'default': None, 'help': ' Name of container to delete.', 'action': None}),
+            ('fail_not_exist', {'required': False, 'default': False, 'help': " Specify whether to throw an exception when the container doesn't exist.", 'action': 'store_true'}),
+            ('lease_id', {'required': False, 'default': None, 'help': " If specified, delete_container only succeeds if the container's lease is active and matches this ID. Required if the container has an active lease.", 'action': None}),
+            ('if_modified_since', {'required': False, 'default': None, 'help': ' A DateTime value. Azure expects the date value passed in to be UTC. If timezone is included, any non-UTC datetimes will be converted to UTC. If a date is passed in without timezone info, it is assumed to be UTC. Specify this header to perform the operation only if the resource has been modified since the specified time.', 'action': None}),
+            ('if_unmodified_since', {'required': False, 'default': None, 'help': ' A DateTime value. Azure expects the date value passed in to be UTC. If timezone is included, any non-UTC datetimes will be converted to UTC. If a date is passed in without timezone info, it is assumed to be UTC. Specify this header to perform the operation only if the resource has not been modified since the specified date/time.', 'action': None}),
+            ('timeout', {'required': False, 'default': None, 'help': ' The timeout parameter is expressed in seconds.', 'action': None}),
+        ]},
+    'azure.storage.blob.baseblobservice#BaseBlobService.generate_blob_shared_access_signature': {
+        'version': '0.32.0',
+        'parameters': {'names': ['self', 'container_name', 'blob_name', 'permission', 'expiry', 'start', 'id', 'ip', 'protocol', 'cache_control', 'content_disposition', 'content_encoding', 'content_language', 'content_type'], 'defaults': [None, None, None, None, None, None, None, None, None, None, None]},
+        'doc': '398e0888',
+        'arguments': [
+            ('container_name', {'required': True, 'default': None, 'help': ' Name of container.', 'action': None}),
+            ('blob_name', {'required': True, 'default': None, 'help': ' Name of blob.', 'action': None}),
+            ('permission', {'required': False, 'default': None, 'help': ' The permissions associated with the shared access signature. The user is restricted to operations allowed by the permissions. Permissions must be ordered read, write, delete, list. Required unless an id is given referencing a stored access policy which contains this field. This field must be omitted if it has been specified in an associated stored access policy.', 'action': None}),
+            ('expiry', {'required': False, 'default': None, 'help': ' The time at which the shared access signature becomes invalid. Required unless an id is given referencing a stored access policy which contains this field. This field must be omitted if it has been specified in an associated stored access policy. Azure will always convert values to UTC. If a date is passed in without timezone info, it is assumed to be UTC.', 'action': None}),
+            ('start', {'required': False, 'default': None, 'help': ' The time at which the shared access signature becomes valid. If omitted, start time for this call is assumed to be the time when the storage service receives the request. Azure will always convert values to UTC. If a date is passed in without timezone info, it is assumed to be UTC.', 'action': None}),
+            ('id', {'required': False, 'default': None, 'help': ' A unique value up to 64 characters in length that correlates to a stored access policy. To create a stored access policy, use set_blob_service_properties.', 'action': None}),
+            ('ip', {'required': False, 'default': None, 'help': ' Specifies an IP address or a range of IP addresses from which to accept requests. If the IP address from which the request originates does not match the IP address or address range specified on the SAS token, the request is not authenticated. For example, specifying sip=168.1.5.65 or sip=168.1.5.60-168.1.5.70 on the SAS restricts the request to those IP addresses.', 'action': None}),
+            ('protocol', {'required': False, 'default': None, 'help': ' Specifies the protocol permitted for a request made. The default value is https,http. See :class:`~azure.storage.models.Protocol` for possible values.', 'action': None}),
+            ('cache_control', {'required': False, 'default': None, 'help': ' Response header value for Cache-Control when resource is accessed using this shared access signature.', 'action': None}),
+            ('content_disposition', {'required': False, 'default': None, 'help': ' Response header value for Content-Disposition when resource is accessed using this shared access signature.', 'action': None}),
+            ('content_encoding', {'required': False, 'default': None, 'help': ' Response header value for Content-Encoding when resource is accessed using this shared access signature.', 'action': None}),
+            ('content_language', {'required': False, 'default': None, 'help': ' Response header value for Content-Language when resource is accessed using this shared access signature.', 'action': None}),
+            ('content_type', {'required': False, 'default': None, 'help': ' Response header value for Content-Type when resource is accessed using this shared access signature.', 'action': None}),
+        ]},
+    'azure.storage.blob.baseblobservice#BaseBlobService.generate_container_shared_access_signature': {
+        'version': '0.32.0',
+        'parameters': {'names': ['self', 'container_name', 'permission', 'expiry', 'start', 'id', 'ip', 'protocol', 'cache_control', 'content_disposition', 'content_encoding', 'content_language', 'content_type'], 'defaults': [None, None, None, None, None, None, None, None, None, None, None]},
+        'doc': '43c8a755',
+        'arguments': [
+            ('container_name', {'required': True, 'default': None, 'help': ' Name of container.', 'action': None}),
+            ('permission', {'required': False, 'default': None, 'help': ' The permissions associated with the shared access signature. The user is restricted to operations allowed by the permissions. Permissions must be ordered read, write, delete, list. Required unless an id is given referencing a stored access policy which contains this field. This field must be omitted if it has been specified in an associated stored access policy.', 'action': None}),
+            ('expiry', {'required': False, 'default': None, 'help': ' The time at which the shared access signature becomes invalid. Required unless an id is given referencing a stored access policy which contains this field. This field must be omitted if it has been specified in an associated stored access policy. Azure will always convert values to UTC. If a date is passed in without timezone info, it is assumed to be UTC.', 'action': None}),
+            ('start', {'required': False, 'default': None, 'help': ' The time at which the shared access signature becomes valid. If omitted, start time for this call is assumed to be the time when the storage service receives the request. Azure will always convert values to UTC. If a date is passed in without timezone info, it is assumed to be UTC.', 'action': None}),
+            ('id', {'required': False, 'default': None, 'help': ' A unique value up to 64 characters in length that correlates to a stored access policy. To create a stored access policy, use set_blob_service_properties.', 'action': None}),
+            ('ip', {'required': False, 'default': None, 'help': ' Specifies an IP address or a range of IP addresses from which to accept requests. If the IP address from which the request originates does not match the IP address or address range specified on the SAS token, the request is not authenticated. For example, specifying sip=168.1.5.65 or sip=168.1.5.60-168.1.5.70 on the SAS restricts the request to those IP addresses.', 'action': None}),
+            ('protocol', {'required': False, 'default': None, 'help': ' Specifies the protocol permitted for a request made. The default value is https,http. See :class:`~azure.storage.models.Protocol` for possible values.', 'action': None}),
+            ('cache_control', {'required': False, 'default': None, 'help': ' Response header value for Cache-Control when resource is accessed using this shared access signature.', 'action': None}),
+            ('content_disposition', {'required': False, 'default': None, 'help': ' Response header value for Content-Disposition when resource is accessed using this shared access signature.', 'action': None}),
+            ('content_encoding', {'required': False, 'default': None, 'help': ' Response header value for Content-Encoding when resource is accessed using this shared access signature.', 'action': None}),
+            ('content_language', {'required': False, 'default': None, 'help': ' Response header value for Content-Language when resource is accessed using this shared access signature.', 'action': None}),
+            ('content_type', {'required': False, 'default': None, 'help': ' Response header value for Content-Type when resource is accessed using this shared access signature.', 'action': None}),
+        ]},
+    'azure.storage.blob.baseblobservice#BaseBlobService.get_blob_metadata': {
+        'version': '0.32.0',
+        'parameters': {'names': ['self', 'container_name', 'blob_name', 'snapshot', 'lease_id', 'if_modified_since', 'if_unmodified_since', 'if_match', 'if_none_match', 'timeout'], 'defaults': [None, None, None, None, None, None, None]},
+        'doc': 'ac2eadfd',
+        'arguments': [
+            ('container_name', {'required': True, 'default': None, 'help': ' Name of existing container.', 'action': None}),
+            ('blob_name', {'required': True, 'default': None, 'help': ' Name of existing blob.', 'action': None}),
+            ('snapshot', {'required': False, 'default': None, 'help': ' The snapshot parameter is an opaque value that, when present, specifies the blob snapshot to retrieve.', 'action': None}),
+            ('lease_id', {'required': False, 'default': None, 'help': ' Required if the blob has an active lease.', 'action': None}),
+            ('if_modified_since', {'required': False, 'default': None, 'help': ' A DateTime value. Azure expects the date value passed in to be UTC. If timezone is included, any non-UTC datetimes will be converted to UTC. If a date is passed in without timezone info, it is assumed to be UTC. Specify this header to perform the operation only if the resource has been modified since the specified time.', 'action': None}),
+            ('if_unmodified_since', {'required': False, 'default': None, 'help': ' A DateTime value. Azure expects the date value passed in to be UTC. If timezone is included, any non-UTC datetimes will be converted to UTC. If a date is passed in without timezone info, it is assumed to be UTC. Specify this header to perform the operation only if the resource has not been modified since the specified date/time.', 'action': None}),
+            ('if_match', {'required': False, 'default': None, 'help': " An ETag value, or the wildcard character (*). Specify this header to perform the operation only if the resource's ETag matches the value specified.", 'action': None}),
+            ('if_none_match', {'required': False, 'default': None, 'help': " An ETag value, or the wildcard character (*). Specify this header to perform the operation only if the resource's ETag does not match the value specified. Specify the wildcard character (*) to perform the operation only if the resource does not exist, and fail the operation if it does exist.", 'action': None}),
+            ('timeout', {'required': False, 'default': None, 'help': ' The timeout parameter is expressed in seconds.', 'action': None}),
+        ]},
+    'azure.storage.blob.baseblobservice#BaseBlobService.get_blob_properties': {
+        'version': '0.32.0',
+        'parameters': {'names': ['self', 'container_name', 'blob_name', 'snapshot', 'lease_id', 'if_modified_since', 'if_unmodified_since', 'if_match', 'if_none_match', 'timeout'], 'defaults': [None, None, None, None, None, None, None]},
+        'doc': '55aceea8',
+        'arguments': [
+            ('container_name', {'required': True, 'default': None, 'help': ' Name of existing container.', 'action': None}),
+            ('blob_name', {'required': True, 'default': None, 'help': ' Name of existing blob.', 'action': None}),
+            ('snapshot', {'required': False, 'default': None, 'help': ' The snapshot parameter is an opaque DateTime value that, when present, specifies the blob snapshot to retrieve.', 'action': None}),
+            ('lease_id', {'required': False, 'default': None, 'help': ' Required if the blob has an active lease.', 'action': None}),
+            ('if_modified_since', {'required': False, 'default': None, 'help': ' A DateTime value. Azure expects the date value passed in to be UTC. If timezone is included, any non-UTC datetimes will be converted to UTC. If a date is passed in without timezone info, it is assumed to be UTC. Specify this header to perform the operation only if the resource has been modified since the specified time.', 'action': None}),
+            ('if_unmodified_since', {'required': False, 'default': None, 'help': ' A DateTime value. Azure expects the date value passed in to be UTC. If timezone is included, any non-UTC datetimes will be converted to UTC. If a date is passed in without timezone info, it is assumed to be UTC. Specify this header to perform the operation only if the resource has not been modified since the specified date/time.', 'action': None}),
+            ('if_match', {'required': False, 'default': None, 'help': " An ETag value, or the wildcard character (*). Specify this header to perform the operation only if the resource's ETag matches the value specified.", 'action': None}),
+            ('if_none_match', {'required': False, 'default': None, 'help': " An ETag value, or the wildcard character (*). Specify this header to perform the operation only if the resource's ETag does not match the value specified. Specify the wildcard character (*) to perform the operation only if the resource does not exist, and fail the operation if it does exist.", 'action': None}),
+            ('timeout', {'required': False, 'default': None, 'help': ' The timeout parameter is expressed in seconds.', 'action': None}),
+        ]},
+    'azure.storage.blob.baseblobservice#BaseBlobService.get_blob_service_properties': {
+        'version': '0.32.0',
+        'parameters': {'names': ['self', 'timeout'], 'defaults': [None]},
+        'doc': '54707fd1',
+        'arguments': [
+            ('timeout', {'required': False, 'default': None, 'help': ' The timeout parameter is expressed in seconds.', 'action': None}),
+        ]},
+    'azure.storage.blob.baseblobservice#BaseBlobService.get_container_metadata': {
+        'version': '0.32.0',
+        'parameters': {'names': ['self', 'container_name', 'lease_id', 'timeout'], 'defaults': [None, None]},
+        'doc': 'bb1847a1',
+        'arguments': [
+            ('container_name', {'required': True, 'default': None, 'help': ' Name of existing container.', 'action': None}),
+            ('lease_id', {'required': False, 'default': None, 'help': " If specified, get_container_metadata only succeeds if the container's lease is active and matches this ID.", 'action': None}),
+            ('timeout', {'required': False, 'default': None, 'help': ' The timeout parameter is expressed in seconds.', 'action': None}),
+        ]},
+    'azure.storage.blob.baseblobservice#BaseBlobService.get_container_properties': {
+        'version': '0.32.0',
+        'parameters': {'names': ['self', 'container_name', 'lease_id', 'timeout'], 'defaults': [None, None]},
+        'doc': 'a27ad5d9',
+        'arguments': [
+            ('container_name', {'required': True, 'default': None, 'help': ' Name of existing container.', 'action': None}),
+            ('lease_id', {'required': False, 'default': None, 'help': " If specified, get_container_properties only succeeds if the container's lease is active and matches this ID.", 'action': None}),
+            ('timeout', {'required': False, 'default': None, 'help': ' The timeout parameter is expressed in seconds.', 'action': None}),
+        ]},
+    'azure.storage.blob.baseblobservice#BaseBlobService.list_blobs': {
+        'version': '0.32.0',
+        'parameters': {'names': ['self', 'container_name', 'prefix', 'num_results', 'include', 'delimiter', 'marker', 'timeout'], 'defaults': [None, None, None, None, None, None]},
+        'doc': 'da2098fc',
+        'arguments': [
+            ('container_name', {'required': True, 'default': None, 'help': ' Name of existing container.', 'action': None}),
+            ('prefix', {'required': False, 'default': None, 'help': ' Filters the results to return only blobs whose names begin with the specified prefix.', 'action': None}),
+            ('num_results', {'required': False, 'default': None, 'help': ' Specifies the maximum number of blobs to return, including all :class:`BlobPrefix` elements. If the request does not specify num_results or specifies a value greater than 5,000, the server will return up to 5,000 items. Setting num_results to a value less than or equal to zero results in error response code 400 (Bad Request).', 'action': None}),
+            ('include', {'required': False, 'default': None, 'help': ' Specifies one or more additional datasets to include in the response.', 'action': None}),
+            ('delimiter', {'required': False, 'default': None, 'help': ' When the request includes this parameter, the operation returns a :class:`~azure.storage.blob.models.BlobPrefix` element in the result list that acts as a placeholder for all blobs whose names begin with the same substring up to the appearance of the delimiter character. The delimiter may be a single character or a string.', 'action': None}),
+            ('marker', {'required': False, 'default': None, 'help': ' An opaque continuation token. This value can be retrieved from the next_marker field of a previous generator object if num_results was specified and that generator has finished enumerating results. If specified, this generator will begin returning results from the point where the previous generator stopped.', 'action': None}),
+            ('timeout', {'required': False, 'default': None, 'help': ' The timeout parameter is expressed in seconds.', 'action': None}),
+        ]},
+    'azure.storage.blob.baseblobservice#BaseBlobService.list_containers': {
+        'version': '0.32.0',
+        'parameters': {'names': ['self', 'prefix', 'num_results', 'include_metadata', 'marker', 'timeout'], 'defaults': [None, None, False, None, None]},
+        'doc': 'e57fb1d8',
+        'arguments': [
+            ('prefix', {'required': False, 'default': None, 'help': ' Filters the results to return only containers whose names begin with the specified prefix.', 'action': None}),
+            ('num_results', {'required': False, 'default': None, 'help': ' Specifies the maximum number of containers to return. A single list request may return up to 1000 contianers and potentially a continuation token which should be followed to get additional resutls.', 'action': None}),
+            ('include_metadata', {'required': False, 'default': False, 'help': ' Specifies that container metadata be returned in the response.', 'action': 'store_true'}),
+            ('marker', {'required': False, 'default': None, 'help': ' An opaque continuation token. This value can be retrieved from the next_marker field of a previous generator object if num_results was specified and that generator has finished enumerating results. If specified, this generator will begin returning results from the point where the previous generator stopped.', 'action': None}),
+            ('timeout', {'required': False, 'default': None, 'help': ' The timeout parameter is expressed in seconds.', 'action': None}),
+        ]},
+    'azure.storage.blob.baseblobservice#BaseBlobService.make_blob_url': {
+        'version': '0.32.0',
+        'parameters': {'names': ['self', 'container_name', 'blob_name', 'protocol', 'sas_token'], 'defaults': [None, None]},
+        'doc': '5bd3a584',
+        'arguments': [
+            ('container_name', {'required': True, 'default': None, 'help': ' Name of container.', 'action': None}),
+            ('blob_name', {'required': True, 'default': None, 'help': ' Name of blob.', 'action': None}),
+            ('protocol', {'required': False, 'default': None, 'help': " Protocol to use: 'http' or 'https'. If not specified, uses the protocol specified when BaseBlobService was initialized.", 'action': None}),
+            ('sas_token', {'required': False, 'default': None, 'help': ' Shared access signature token created with generate_shared_access_signature.', 'action': None}),
+        ]},
+    'azure.storage.blob.baseblobservice#BaseBlobService.release_blob_lease': {
+        'version': '0.32.0',
+        'parameters': {'names': ['self', 'container_name', 'blob_name', 'lease_id', 'if_modified_since', 'if_unmodified_since', 'if_match', 'if_none_match', 'timeout'], 'defaults': [None, None, None, None, None]},
+        'doc': '5a71fc4d',
+        'arguments': [
+            ('container_name', {'required': True, 'default': None, 'help': ' Name of existing container.', 'action': None}),
+            ('blob_name', {'required': True, 'default': None, 'help': ' Name of existing blob.', 'action': None}),
+            ('lease_id', {'required': True, 'default': None, 'help': ' Lease ID for active lease.', 'action': None}),
+            ('if_modified_since', {'required': False, 'default': None, 'help': ' A DateTime value. Azure expects the date value passed in to be UTC. If timezone is included, any non-UTC datetimes will be converted to UTC. If a date is passed in without timezone info, it is assumed to be UTC. Specify this header to perform the operation only if the resource has been modified since the specified time.', 'action': None}),
+            ('if_unmodified_since', {'required': False, 'default': None, 'help': ' A DateTime value. Azure expects the date value passed in to be UTC. If timezone is included, any non-UTC datetimes will be converted to UTC. If a date is passed in without timezone info, it is assumed to be UTC. Specify this header to perform the operation only if the resource has not been modified since the specified date/time.', 'action': None}),
+            ('if_match', {'required': False, 'default': None, 'help': " An ETag value, or the wildcard character (*). Specify this header to perform the operation only if the resource's ETag matches the value specified.", 'action': None}),
+            ('if_none_match', {'required': False, 'default': None, 'help': " An ETag value, or the wildcard character (*). Specify this header to perform the operation only if the resource's ETag does not match the value specified. Specify the wildcard character (*) to perform the operation only if the resource does not exist, and fail the operation if it does exist.", 'action': None}),
+            ('timeout', {'required': False, 'default': None, 'help': ' The timeout parameter is expressed in seconds.', 'action': None}),
+        ]},
+    'azure.storage.blob.baseblobservice#BaseBlobService.release_container_lease': {
+        'version': '0.32.0',
+        'parameters': {'names': ['self', 'container_name', 'lease_id', 'if_modified_since', 'if_unmodified_since', 'timeout'], 'defaults': [None, None, None]},
+        'doc': '8230215e',
+        'arguments': [
+            ('container_name', {'required': True, 'default': None, 'help': ' Name of existing container.', 'action': None}),
+            ('lease_id', {'required': True, 'default': None, 'help': ' Lease ID for active lease.', 'action': None}),
+            ('if_modified_since', {'required': False, 'default': None, 'help': ' A DateTime value. Azure expects the date value passed in to be UTC. If timezone is included, any non-UTC datetimes will be converted to UTC. If a date is passed in without timezone info, it is assumed to be UTC. Specify this header to perform the operation only if the resource has been modified since the specified time.', 'action': None}),
+            ('if_unmodified_since', {'required': False, 'default': None, 'help': ' A DateTime value. Azure expects the date value passed in to be UTC. If timezone is included, any non-UTC datetimes will be converted to UTC. If a date is passed in without timezone info, it is assumed to be UTC. Specify this header to perform the operation only if the resource has not been modified since the specified date/time.', 'action': None}),
+            ('timeout', {'required': False, 'default': None, 'help': ' The timeout parameter is expressed in seconds.', 'action': None}),
+        ]},
+    'azure.storage.blob.baseblobservice#BaseBlobService.renew_blob_lease': {
+        'version': '0.32.0',
+        'parameters': {'names': ['self', 'container_name', 'blob_name', 'lease_id', 'if_modified_since', 'if_unmodified_since', 'if_match', 'if_none_match', 'timeout'], 'defaults': [None, None, None, None, None]},
+        'doc': '23218ea3',
+        'arguments': [
+            ('container_name', {'required': True, 'default': None, 'help': ' Name of existing container.', 'action': None}),
+            ('blob_name', {'required': True, 'default': None, 'help': ' Name of existing blob.', 'action': None}),
+            ('lease_id', {'required': True, 'default': None, 'help': ' Lease ID for active lease.', 'action': None}),
+            ('if_modified_since', {'required': False, 'default': None, 'help': ' A DateTime value. Azure expects the date value passed in to be UTC. If timezone is included, any non-UTC datetimes will be converted to UTC. If a date is passed in without timezone info, it is assumed to be UTC. Specify this header to perform the operation only if the resource has been modified since the specified time.', 'action': None}),
+            ('if_unmodified_since', {'required': False, 'default': None, 'help': ' A DateTime value. Azure expects the date value passed in to be UTC. If timezone is included, any non-UTC datetimes will be converted to UTC. If a date is passed in without timezone info, it is assumed to be UTC. Specify this header to perform the operation only if the resource has not been modified since the specified date/time.', 'action': None}),
+            ('if_match', {'required': False, 'default': None, 'help': " An ETag value, or the wildcard character (*). Specify this header to perform the operation only if the resource's ETag matches the value specified.", 'action': None}),
+            ('if_none_match', {'required': False, 'default': None, 'help': " An ETag value, or the wildcard character (*). Specify this header to perform the operation only if the resource's ETag does not match the value specified. Specify the wildcard character (*) to perform the operation only if the resource does not exist, and fail the operation if it does exist.", 'action': None}),
+            ('timeout', {'required': False, 'default': None, 'help': ' The timeout parameter is expressed in seconds.', 'action': None}),
+        ]},
+    'azure.storage.blob.baseblobservice#BaseBlobService.renew_container_lease': {
+        'version': '0.32.0',
+        'parameters': {'names': ['self', 'container_name', 'lease_id', 'if_modified_since', 'if_unmodified_since', 'timeout'], 'defaults': [None, None, None]},
+        'doc': '34294917',
+        'arguments': [
+            ('container_name', {'required': True, 'default': None, 'help': ' Name of existing container.', 'action': None}),
+            ('lease_id', {'required': True, 'default': None, 'help': ' Lease ID for active lease.', 'action': None}),
+            ('if_modified_since', {'required': False, 'default': None, 'help': ' A DateTime value. Azure expects the date value passed in to be UTC. If timezone is included, any non-UTC datetimes will be converted to UTC. If a date is passed in without timezone info, it is assumed to be UTC. Specify this header to perform the operation only if the resource has been modified since the specified time.', 'action': None}),
+            ('if_unmodified_since', {'required': False, 'default': None, 'help': ' A DateTime value. Azure expects the date value passed in to be UTC. If timezone is included, any non-UTC datetimes will be converted to UTC. If a date is passed in without timezone info, it is assumed to be UTC. Specify this header to perform the operation only if the resource has not been modified since the specified date/time.', 'action': None}),
+            ('timeout', {'required': False, 'default': None, 'help': ' The timeout parameter is expressed in seconds.', 'action': None}),
+        ]},
+    'azure.storage.blob.baseblobservice#BaseBlobService.set_blob_metadata': {
+        'version': '0.32.0',
+        'parameters': {'names': ['self', 'container_name', 'blob_name', 'metadata', 'lease_id', 'if_modified_since', 'if_unmodified_since', 'if_match', 'if_none_match', 'timeout'], 'defaults': [None, None, None, None, None, None, None]},
+        'doc': 'be47ad8d',
+        'arguments': [
+            ('container_name', {'required': True, 'default': None, 'help': ' Name of existing container.', 'action': None}),
+            ('blob_name', {'required': True, 'default': None, 'help': ' Name of existing blob.', 'action': None}),
+            ('metadata', {'required': False, 'default': None, 'help': ' Dict containing name and value pairs. Each call to this operation replaces all existing metadata attached to the blob. To remove all metadata from the blob, call this operation with no metadata headers.', 'action': None}),
+            ('lease_id', {'required': False, 'default': None, 'help': ' Required if the blob has an active lease.', 'action': None}),
+            ('if_modified_since', {'required': False, 'default': None, 'help': ' A DateTime value. Azure expects the date value passed in to be UTC. If timezone is included, any non-UTC datetimes will be converted to UTC. If a date is passed in without timezone info, it is assumed to be UTC. Specify this header to perform the operation only if the resource has been modified since the specified time.', 'action': None}),
+            ('if_unmodified_since', {'required': False, 'default': None, 'help': ' A DateTime value. Azure expects the date value passed in to be UTC. If timezone is included, any non-UTC datetimes will be converted to UTC. If a date is passed in without timezone info, it is assumed to be UTC. Specify this header to perform the operation only if the resource has not been modified since the specified date/time.', 'action': None}),
+            ('if_match', {'required': False, 'default': None, 'help': " An ETag value, or the wildcard character (*). Specify this header to perform the operation only if the resource's ETag matches the value specified.", 'action': None}),
+            ('if_none_match', {'required': False, 'default': None, 'help': " An ETag value, or the wildcard character (*). Specify this header to perform the operation only if the resource's ETag does not match the value specified. Specify the wildcard character (*) to perform the operation only if the resource does not exist, and fail the operation if it does exist.", 'action': None}),
+            ('timeout', {'required': False, 'default': None, 'help': ' The timeout parameter is expressed in seconds.', 'action': None}),
+        ]},
+    'azure.storage.blob.baseblobservice#BaseBlobService.set_blob_properties': {
+        'version': '0.32.0',
+        'parameters': {'names': ['self', 'container_name', 'blob_name', 'content_settings', 'lease_id', 'if_modified_since', 'if_unmodified_since', 'if_match', 'if_none_match', 'timeout'], 'defaults': [None, None, None, None, None, None, None]},
+        'doc': '44081335',
+        'arguments': [
+            ('container_name', {'required': True, 'default': None, 'help': ' Name of existing container.', 'action': None}),
+            ('blob_name', {'required': True, 'default': None, 'help': ' Name of existing blob.', 'action': None}),
+            ('content_settings', {'required': False, 'default': None, 'help': ' ContentSettings object used to set blob properties.', 'action': None}),
+            ('lease_id', {'required': False, 'default': None, 'help': ' Required if the blob has an active lease.', 'action': None}),
+            ('if_modified_since', {'required': False, 'default': None, 'help': ' A DateTime value. Azure expects the date value passed in to be UTC. If timezone is included, any non-UTC datetimes will be converted to UTC. If a date is passed in without timezone info, it is assumed to be UTC. Specify this header to perform the operation only if the resource has been modified since the specified time.', 'action': None}),
+            ('if_unmodified_since', {'required': False, 'default': None, 'help': ' A DateTime value. Azure expects the date value passed in to be UTC. If timezone is included, any non-UTC datetimes will be converted to UTC. If a date is passed in without timezone info, it is assumed to be UTC. Specify this header to perform the operation only if the resource has not been modified since the specified date/time.', 'action': None}),
+            ('if_match', {'required': False, 'default': None, 'help': " An ETag value, or the wildcard character (*). Specify this header to perform the operation only if the resource's ETag matches the value specified.", 'action': None}),
+            ('if_none_match', {'required': False, 'default': None, 'help': " An ETag value, or the wildcard character (*). Specify this header to perform the operation only if the resource's ETag does not match the value specified. Specify the wildcard character (*) to perform the operation only if the resource does not exist, and fail the operation if it does exist.", 'action': None}),
+            ('timeout', {'required': False, 'default': None, 'help': ' The timeout parameter is expressed in seconds.', 'action': None}),
+        ]},
+    'azure.storage.blob.baseblobservice#BaseBlobService.set_blob_service_properties': {
+        'version': '0.32.0',
+        'parameters': {'names': ['self', 'logging', 'hour_metrics', 'minute_metrics', 'cors', 'target_version', 'timeout'], 'defaults': [None, None, None, None, None, None]},
+        'doc': '8e97a22d',
+        'arguments': [
+            ('logging', {'required': False, 'default': None, 'help': ' Groups the Azure Analytics Logging settings.', 'action': None}),
+            ('hour_metrics', {'required': False, 'default': None, 'help': ' The hour metrics settings provide a summary of request statistics grouped by API in hourly aggregates for blobs.', 'action': None}),
+            ('minute_metrics', {'required': False, 'default': None, 'help': ' The minute metrics settings provide request statistics for each minute for blobs.', 'action': None}),
+            ('cors', {'required': False, 'default': None, 'help': ' You can include up to five CorsRule elements in the list. If an empty list is specified, all CORS rules will be deleted, and CORS will be disabled for the service.', 'action': None}),
+            ('target_version', {'required': False, 'default': None, 'help': " Indicates the default version to use for requests if an incoming request's version is not specified.", 'action': None}),
+            ('timeout', {'required': False, 'default': None, 'help': ' The timeout parameter is expressed in seconds.', 'action': None}),
+        ]},
+    'azure.storage.blob.baseblobservice#BaseBlobService.set_container_metadata': {
+        'version': '0.32.0',
+        'parameters': {'names': ['self', 'container_name', 'metadata', 'lease_id', 'if_modified_since', 'timeout'], 'defaults': [None, None, None, None]},
+        'doc': 'bbc1d7c2',
+        'arguments': [
+            ('container_name', {'required': True, 'default': None, 'help': ' Name of existing container.', 'action': None}),
+            ('metadata', {'required': False, 'default': None, 'help': " A dict containing name-value pairs to associate with the container as metadata. Example: {'category':'test'}", 'action': None}),
+            ('lease_id', {'required': False, 'default': None, 'help': " If specified, set_container_metadata only succeeds if the container's lease is active and matches this ID.", 'action': None}),
+            ('if_modified_since', {'required': False, 'default': None, 'help': ' A DateTime value. Azure expects the date value passed in to be UTC. If timezone is included, any non-UTC datetimes will be converted to UTC. If a date is passed in without timezone info, it is assumed to be UTC. Specify this header to perform the operation only if the resource has been modified since the specified time.', 'action': None}),
+            ('timeout', {'required': False, 'default': None, 'help': ' The timeout parameter is expressed in seconds.', 'action': None}),
+        ]},
+    'azure.storage.blob.baseblobservice#BaseBlobService.snapshot_blob': {
+        'version': '0.32.0',
+        'parameters': {'names': ['self', 'container_name', 'blob_name', 'metadata', 'if_modified_since', 'if_unmodified_since', 'if_match', 'if_none_match', 'lease_id', 'timeout'], 'defaults': [None, None, None, None, None, None, None]},
+        'doc': '79696366',
+        'arguments': [
+            ('container_name', {'required': True, 'default': None, 'help': ' Name of existing container.', 'action': None}),
+            ('blob_name', {'required': True, 'default': None, 'help': ' Name of existing blob.', 'action': None}),
+            ('metadata', {'required': False, 'default': None, 'help': ' Specifies a user-defined name-value pair associated with the blob. If no name-value pairs are specified, the operation will copy the base blob metadata to the snapshot. If one or more name-value pairs are specified, the snapshot is created with the specified metadata, and metadata is not copied from the base blob.', 'action': None}),
+            ('if_modified_since', {'required': False, 'default': None, 'help': ' A DateTime value. Azure expects the date value passed in to be UTC. If timezone is included, any non-UTC datetimes will be converted to UTC. If a date is passed in without timezone info, it is assumed to be UTC. Specify this header to perform the operation only if the resource has been modified since the specified time.', 'action': None}),
+            ('if_unmodified_since', {'required': False, 'default': None, 'help': ' A DateTime value. Azure expects the date value passed in to be UTC. If timezone is included, any non-UTC datetimes will be converted to UTC. If a date is passed in without timezone info, it is assumed to be UTC. Specify this header to perform the operation only if the resource has not been modified since the specified date/time.', 'action': None}),
+            ('if_match', {'required': False, 'default': None, 'help': " An ETag value, or the wildcard character (*). Specify this header to perform the operation only if the resource's ETag matches the value specified.", 'action': None}),
+            ('if_none_match', {'required': False, 'default': None, 'help': " An ETag value, or the wildcard character (*). Specify this header to perform the operation only if the resource's ETag does not match the value specified. Specify the wildcard character (*) to perform the operation only if the resource does not exist, and fail the operation if it does exist.", 'action': None}),
+            ('lease_id', {'required': False, 'default': None, 'help': ' Required if the blob has an active lease.', 'action': None}),
+            ('timeout', {'required': False, 'default': None, 'help': ' The timeout parameter is expressed in seconds.', 'action': None}),
+        ]},
+    'azure.storage.cloudstorageaccount#CloudStorageAccount.generate_shared_access_signature': {
+        'version': '0.32.0',
+        'parameters': {'names': ['self', 'services', 'resource_types', 'permission', 'expiry', 'start', 'ip', 'protocol'], 'defaults': [None, None, None]},
+        'doc': '3c87bc6d',
+        'arguments': [
+            ('services', {'required': True, 'default': None, 'help': ' Specifies the services accessible with the account SAS. You can combine values to provide access to more than one service.', 'action': None}),
+            ('resource_types', {'required': True, 'default': None, 'help': ' Specifies the resource types that are accessible with the account SAS. You can combine values to provide access to more than one resource type.', 'action': None}),
+            ('permission', {'required': True, 'default': None, 'help': ' The permissions associated with the shared access signature. The user is restricted to operations allowed by the permissions. Required unless an id is given referencing a stored access policy which contains this field. This field must be omitted if it has been specified in an associated stored access policy. You can combine values to provide more than one permission.', 'action': None}),
+            ('expiry', {'required': True, 'default': None, 'help': ' The time at which the shared access signature becomes invalid. Required unless an id is given referencing a stored access policy which contains this field. This field must be omitted if it has been specified in an associated stored access policy. Azure will always convert values to UTC. If a date is passed in without timezone info, it is assumed to be UTC.', 'action': None}),
+            ('start', {'required': False, 'default': None, 'help': ' The time at which the shared access signature becomes valid. If omitted, start time for this call is assumed to be the time when the storage service receives the request. Azure will always convert values to UTC. If a date is passed in without timezone info, it is assumed to be UTC.', 'action': None}),
+            ('ip', {'required': False, 'default': None, 'help': ' Specifies an IP address or a range of IP addresses from which to accept requests. If the IP address from which the request originates does not match the IP address or address range specified on the SAS token, the request is not authenticated. For example, specifying sip=168.1.5.65 or sip=168.1.5.60-168.1.5.70 on the SAS restricts the request to those IP addresses.', 'action': None}),
+            ('protocol', {'required': False, 'default': None, 'help': ' Specifies the protocol permitted for a request made. Possible values are both HTTPS and HTTP (https,http) or HTTPS only (https). The default value is https,http. Note that HTTP only is not a permitted value.', 'action': None}),
+        ]},
+    'azure.storage.file.fileservice#FileService.abort_copy_file': {
+        'version': '0.32.0',
+        'parameters': {'names': ['self', 'share_name', 'directory_name', 'file_name', 'copy_id', 'timeout'], 'defaults': [None]},
+        'doc': 'e966617f',
+        'arguments': [
+            ('share_name', {'required': True, 'default': None, 'help': ' Name of destination share.', 'action': None}),
+            ('directory_name', {'required': True, 'default': None, 'help': ' The path to the directory.', 'action': None}),
+            ('file_name', {'required': True, 'default': None, 'help': ' Name of destination file.', 'action': None}),
+            ('copy_id', {'required': True, 'default': None, 'help': ' Copy identifier provided in the copy.id of the original copy_file operation.', 'action': None}),
+            ('timeout', {'required': False, 'default': None, 'help': ' The timeout parameter is expressed in seconds.', 'action': None}),
+        ]},
+    'azure.storage.file.fileservice#FileService.copy_file': {
+        'version': '0.32.0',
+        'parameters': {'names': ['self', 'share_name', 'directory_name', 'file_name', 'copy_source', 'metadata', 'timeout'], 'defaults': [None, None]},
+        'doc': '7b5d8c87',
+        'arguments': [
+            ('share_name', {'required': True, 'default': None, 'help': ' Name of the destination share. The share must exist.', 'action': None}),
+            ('directory_name', {'required': True, 'default': None, 'help': ' Name of the destination directory. The directory must exist.', 'action': None}),
+            ('file_name', {'required': True, 'default': None, 'help': ' Name of the destination file. If the destination file exists, it will be overwritten. Otherwise, it will be created.', 'action': None}),
+            ('copy_source', {'required': True, 'default': None, 'help': ' A URL of up to 2 KB in length that specifies an Azure file or blob. The value should be URL-encoded as it would appear in a request URI. If the source is in another account, the source must either be public or must be authenticated via a shared access signature. If the source is public, no authentication is required. Examples: https://myaccount.file.core.windows.net/myshare/mydir/myfile https://otheraccount.file.core.windows.net/myshare/mydir/myfile?sastoken', 'action': None}),
+            ('metadata', {'required': False, 'default': None, 'help': ' Name-value pairs associated with the file as metadata. If no name-value pairs are specified, the operation will copy the metadata from the source blob or file to the destination file. If one or more name-value pairs are specified, the destination file is created with the specified metadata, and the metadata is not copied from the source blob or file.', 'action': None}),
+            ('timeout', {'required': False, 'default': None, 'help': ' The timeout parameter is expressed in seconds.', 'action': None}),
+        ]},
+    'azure.storage.file.fileservice#FileService.create_directory': {
+        'version': '0.32.0',
+        'parameters': {'names': ['self', 'share_name', 'directory_name', 'metadata', 'fail_on_exist', 'timeout'], 'defaults': [None, False, None]},
+        'doc': 'b4060127',
+        'arguments': [
+            ('share_name', {'required': True, 'default': None, 'help': ' Name of existing share.', 'action': None}),
+            ('directory_name', {'required': True, 'default': None, 'help': ' Name of directory to create, including the path to the parent directory.', 'action': None}),
+            ('metadata', {'required': False, 'default': None, 'help': " A dict with name_value pairs to associate with the share as metadata. Example:{'Category':'test'}", 'action': None}),
+            ('fail_on_exist', {'required': False, 'default': False, 'help': ' specify whether to throw an exception when the directory exists. False by default.', 'action': 'store_true'}),
+            ('timeout', {'required': False, 'default': None, 'help': ' The timeout parameter is expressed in seconds.', 'action': None}),
+        ]},
+    'azure.storage.file.fileservice#FileService.create_share': {
+        'version': '0.32.0',
+        'parameters': {'names': ['self', 'share_name', 'metadata', 'quota', 'fail_on_exist', 'timeout'], 'defaults': [None, None, False, None]},
+        'doc': '2e318c69',
+        'arguments': [
+            ('share_name', {'required': True, 'default': None, 'help': ' Name of share to create.', 'action': None}),
+            ('metadata', {'required': False, 'default': None, 'help': " A dict with name_value pairs to associate with the share as metadata. Example:{'Category':'test'}", 'action': None}),
+            ('quota', {'required': False, 'default': None, 'help': ' Specifies the maximum size of the share, in gigabytes. Must be greater than 0, and less than or equal to 5TB (5120).', 'action': None}),
+            ('fail_on_exist', {'required': False, 'default': False, 'help': ' Specify whether to throw an exception when the share exists. False by default.', 'action': 'store_true'}),
+            ('timeout', {'required': False, 'default': None, 'help': ' The timeout parameter is expressed in seconds.', 'action': None}),
+        ]},
+    'azure.storage.file.fileservice#FileService.delete_directory': {
+        'version': '0.32.0',
+        'parameters': {'names': ['self', 'share_name', 'directory_name', 'fail_not_exist', 'timeout'], 'defaults': [False, None]},
+        'doc': 'a658189e',
+        'arguments': [
+            ('share_name', {'required': True, 'default': None, 'help': ' Name of existing share.', 'action': None}),
+            ('directory_name', {'required': True, 'default': None, 'help': ' Name of directory to delete, including the path to the parent directory.', 'action': None}),
+            ('fail_not_exist', {'required': False, 'default': False, 'help': " Specify whether to throw an exception when the directory doesn't exist.", 'action': 'store_true'}),
+            ('timeout', {'required': False, 'default': None, 'help': ' The timeout parameter is expressed in seconds.', 'action': None}),
+        ]},
+    'azure.storage.file.fileservice#FileService.delete_file': {
+        'version': '0.32.0',
+        'parameters': {'names': ['self', 'share_name', 'directory_name', 'file_name', 'timeout'], 'defaults': [None]},
+        'doc': 'f3ae404f',
+        'arguments': [
+            ('share_name', {'required': True, 'default': None, 'help': ' Name of existing share.', 'action': None}),
+            ('directory_name', {'required': True, 'default': None, 'help': ' The path to the directory.', 'action': None}),
+            ('file_name', {'required': True, 'default': None, 'help': ' Name of existing file.', 'action': None}),
+            ('timeout', {'required': False, 'default': None, 'help': ' The timeout parameter is expressed in seconds.', 'action': None}),
+        ]},
+    'azure.storage.file.fileservice#FileService.delete_share': {
+        'version': '0.32.0',
+        'parameters': {'names': ['self', 'share_name', 'fail_not_exist', 'timeout'], 'defaults': [False, None]},
+        'doc': '6f806c4c',
+        'arguments': [
+            ('share_name', {'required': True, 'default': None, 'help': ' Name of share to delete.', 'action': None}),
+            ('fail_not_exist', {'required': False, 'default': False, 'help': " Specify whether to throw an exception when the share doesn't exist. False by default.", 'action': 'store_true'}),
+            ('timeout', {'required': False, 'default': None, 'help': ' The timeout parameter is expressed in seconds.', 'action': None}),
+        ]},
+    'azure.storage.file.fileservice#FileService.generate_file_shared_access_signature': {
+        'version': '0.32.0',
+        'parameters': {'names': ['self', 'share_name', 'directory_name', 'file_name', 'permission', 'expiry', 'start', 'id', 'ip', 'protocol', 'cache_control', 'content_disposition', 'content_encoding', 'content_language', 'content_type'], 'defaults': [None, None, None, None, None, None, None, None, None, None, None, None, None]},
+        'doc': 'a713c364',
+        'arguments': [
+            ('share_name', {'required': True, 'default': None, 'help': ' Name of share.', 'action': None}),
+            ('directory_name', {'required': False, 'default': None, 'help': ' Name of directory. SAS tokens cannot be created for directories, so this parameter should only be present if file_name is provided.', 'action': None}),
+            ('file_name', {'required': False, 'default': None, 'help': ' Name of file.', 'action': None}),
+            ('permission', {'required': False, 'default': None, 'help': ' The permissions associated with the shared access signature. The user is restricted to operations allowed by the permissions. Permissions must be ordered read, create, write, delete, list. Required unless an id is given referencing a stored access policy which contains this field. This field must be omitted if it has been specified in an associated stored access policy.', 'action': None}),
+            ('expiry', {'required': False, 'default': None, 'help': ' The time at which the shared access signature becomes invalid. Required unless an id is given referencing a stored access policy which contains this field. This field must be omitted if it has been specified in an associated stored access policy. Azure will always convert values to UTC. If a date is passed in without timezone info, it is assumed to be UTC.', 'action': None}),
+            ('start', {'required': False, 'default': None, 'help': ' The time at which the shared access signature becomes valid. If omitted, start time for this call is assumed to be the time when the storage service receives the request. Azure will always convert values to UTC. If a date is passed in without timezone info, it is assumed to be UTC.', 'action': None}),
+            ('id', {'required': False, 'default': None, 'help': ' A unique value up to 64 characters in length that correlates to a stored access policy. To create a stored access policy, use set_file_service_properties.', 'action': None}),
+            ('ip', {'required': False, 'default': None, 'help': ' Specifies an IP address or a range of IP addresses from which to accept requests. If the IP address from which the request originates does not match the IP address or address range specified on the SAS token, the request is not authenticated. For example, specifying sip=168.1.5.65 or sip=168.1.5.60-168.1.5.70 on the SAS restricts the request to those IP addresses.', 'action': None}),
+            ('protocol', {'required': False, 'default': None, 'help': ' Specifies the protocol permitted for a request made. Possible values are both HTTPS and HTTP (https,http) or HTTPS only (https). The default value is https,http. Note that HTTP only is not a permitted value.', 'action': None}),
+            ('cache_control', {'required': False, 'default': None, 'help': ' Response header value for Cache-Control when resource is accessed using this shared access signature.', 'action': None}),
+            ('content_disposition', {'required': False, 'default': None, 'help': ' Response header value for Content-Disposition when resource is accessed using this shared access signature.', 'action': None}),
+            ('content_encoding', {'required': False, 'default': None, 'help': ' Response header value for Content-Encoding when resource is accessed using this shared access signature.', 'action': None}),
+            ('content_language', {'required': False, 'default': None, 'help': ' Response header value for Content-Language when resource is accessed using this shared access signature.', 'action': None}),
+            ('content_type', {'required': False, 'default': None, 'help': ' Response header value for Content-Type when resource is accessed using this shared access signature.', 'action': None}),
+        ]},
+    'azure.storage.file.fileservice#FileService.generate_share_shared_access_signature': {
+        'version': '0.32.0',
+        'parameters': {'names': ['self', 'share_name', 'permission', 'expiry', 'start', 'id', 'ip', 'protocol', 'cache_control', 'content_disposition', 'content_encoding', 'content_language', 'content_type'], 'defaults': [None, None, None, None, None, None, None, None, None, None, None]},
+        'doc': '429ebed5',
+        'arguments': [
+            ('share_name', {'required': True, 'default': None, 'help': ' Name of share.', 'action': None}),
+            ('permission', {'required': False, 'default': None, 'help': ' The permissions associated with the shared access signature. The user is restricted to operations allowed by the permissions. Permissions must be ordered read, create, write, delete, list. Required unless an id is given referencing a stored access policy which contains this field. This field must be omitted if it has been specified in an associated stored access policy.', 'action': None}),
+            ('expiry', {'required': False, 'default': None, 'help': ' The time at which the shared access signature becomes invalid. Required unless an id is given referencing a stored access policy which contains this field. This field must be omitted if it has been specified in an associated stored access policy. Azure will always convert values to UTC. If a date is passed in without timezone info, it is assumed to be UTC.', 'action': None}),
+            ('start', {'required': False, 'default': None, 'help': ' The time at which the shared access signature becomes valid. If omitted, start time for this call is assumed to be the time when the storage service receives the request. Azure will always convert values to UTC. If a date is passed in without timezone info, it is assumed to be UTC.', 'action': None}),
+            ('id', {'required': False, 'default': None, 'help': ' A unique value up to 64 characters in length that correlates to a stored access policy. To create a stored access policy, use set_file_service_properties.', 'action': None}),
+            ('ip', {'required': False, 'default': None, 'help': ' Specifies an IP address or a range of IP addresses from which to accept requests. If the IP address from which the request originates does not match the IP address or address range specified on the SAS token, the request is not authenticated. For example, specifying sip=168.1.5.65 or sip=168.1.5.60-168.1.5.70 on the SAS restricts the request to those IP addresses.', 'action': None}),
+            ('protocol', {'required': False, 'default': None, 'help': ' Specifies the protocol permitted for a request made. Possible values are both HTTPS and HTTP (https,http) or HTTPS only (https). The default value is https,http. Note that HTTP only is not a permitted value.', 'action': None}),
+            ('cache_control', {'required': False, 'default': None, 'help': ' Response header value for Cache-Control when resource is accessed using this shared access signature.', 'action': None}),
+            ('content_disposition', {'required': False, 'default': None, 'help': ' Response header value for Content-Disposition when resource is accessed using this shared access signature.', 'action': None}),
+            ('content_encoding', {'required': False, 'default': None, 'help': ' Response header value for Content-Encoding when resource is accessed using this shared access signature.', 'action': None}),
+            ('content_language', {'required': False, 'default': None, 'help': ' Response header value for Content-Language when resource is accessed using this shared access signature.', 'action': None}),
+            ('content_type', {'required': False, 'default': None, 'help': ' Response header value for Content-Type when resource is accessed using this shared access signature.', 'action': None}),
+        ]},
+    'azure.storage.file.fileservice#FileService.get_directory_metadata': {
+        'version': '0.32.0',
+        'parameters': {'names': ['self', 'share_name', 'directory_name', 'timeout'], 'defaults': [None]},
+        'doc': '4f35c8d7',
+        'arguments': [
+            ('share_name', {'required': True, 'default': None, 'help': ' Name of existing share.', 'action': None}),
+            ('directory_name', {'required': True, 'default': None, 'help': ' The path to the directory.', 'action': None}),
+            ('timeout', {'required': False, 'default': None, 'help': ' The timeout parameter is expressed in seconds.', 'action': None}),
+        ]},
+    'azure.storage.file.fileservice#FileService.get_directory_properties': {
+        'version': '0.32.0',
+        'parameters': {'names': ['self', 'share_name', 'directory_name', 'timeout'], 'defaults': [None]},
+        'doc': 'e9e8c4e5',
+        'arguments': [
+            ('share_name', {'required': True, 'default': None, 'help': ' Name of existing share.', 'action': None}),
+            ('directory_name', {'required': True, 'default': None, 'help': ' The path to an existing directory.', 'action': None}),
+            ('timeout', {'required': False, 'default': None, 'help': ' The timeout parameter is expressed in seconds.', 'action': None}),
+        ]},
+    'azure.storage.file.fileservice#FileService.get_file_metadata': {
+        'version': '0.32.0',
+        'parameters': {'names': ['self', 'share_name', 'directory_name', 'file_name', 'timeout'], 'defaults': [None]},
+        'doc': 'b4ed48da',
+        'arguments': [
+            ('share_name', {'required': True, 'default': None, 'help': ' Name of existing share.', 'action': None}),
+            ('directory_name', {'required': True, 'default': None, 'help': ' The path to the directory.', 'action': None}),
+            ('file_name', {'required': True, 'default': None, 'help': ' Name of existing file.', 'action': None}),
+            ('timeout', {'required': False, 'default': None, 'help': ' The timeout parameter is expressed in seconds.', 'action': None}),
+        ]},
+    'azure.storage.file.fileservice#FileService.get_file_properties': {
+        'version': '0.32.0',
+        'parameters': {'names': ['self', 'share_name', 'directory_name', 'file_name', 'timeout'], 'defaults': [None]},
+        'doc': '2665f756',
+        'arguments': [
+            ('share_name', {'required': True, 'default': None, 'help': ' Name of existing share.', 'action': None}),
+            ('directory_name', {'required': True, 'default': None, 'help': ' The path to the directory.', 'action': None}),
+            ('file_name', {'required': True, 'default': None, 'help': ' Name of existing file.', 'action': None}),
+            ('timeout', {'required': False, 'default': None, 'help': ' The timeout parameter is expressed in seconds.', 'action': None}),
+        ]},
+    'azure.storage.file.fileservice#FileService.get_file_service_properties': {
+        'version': '0.32.0',
+        'parameters': {'names': ['self', 'timeout'], 'defaults': [None]},
+        'doc': '5a7a97a4',
+        'arguments': [
+            ('timeout', {'required': False, 'default': None, 'help': ' The timeout parameter is expressed in seconds.', 'action': None}),
+        ]},
+    'azure.storage.file.fileservice#FileService.get_share_metadata': {
+        'version': '0.32.0',
+        'parameters': {'names': ['self', 'share_name', 'timeout'], 'defaults': [None]},
+        'doc': '6355dbde',
+        'arguments': [
+            ('share_name', {'required': True, 'default': None, 'help': ' Name of existing share.', 'action': None}),
+            ('timeout', {'required': False, 'default': None, 'help': ' The timeout parameter is expressed in seconds.', 'action': None}),
+        ]},
+    'azure.storage.file.fileservice#FileService.get_share_properties': {
+        'version': '0.32.0',
+        'parameters': {'names': ['self', 'share_name', 'timeout'], 'defaults': [None]},
+        'doc': 'ee94b566',
+        'arguments': [
+            ('share_name', {'required': True, 'default': None, 'help': ' Name of existing share.', 'action': None}),
+            ('timeout', {'required': False, 'default': None, 'help': ' The timeout parameter is expressed in seconds.', 'action': None}),
+        ]},
+    'azure.storage.file.fileservice#FileService.get_share_stats': {
+        'version': '0.32.0',
+        'parameters': {'names': ['self', 'share_name', 'timeout'], 'defaults': [None]},
+        'doc': 'ba5b5314',
+        'arguments': [
+            ('share_name', {'required': True, 'default': None, 'help': ' Name of existing share.', 'action': None}),
+            ('timeout', {'required': False, 'default': None, 'help': ' The timeout parameter is expressed in seconds.', 'action': None}),
+        ]},
+    'azure.storage.file.fileservice#FileService.list_directories_and_files': {
+        'version': '0.32.0',
+        'parameters': {'names': ['self', 'share_name', 'directory_name', 'num_results', 'marker', 'timeout'], 'defaults': [None, None, None, None]},
+        'doc': '095f8b89',
+        'arguments': [
+            ('share_name', {'required': True, 'default': None, 'help': ' Name of existing share.', 'action': None}),
+            ('directory_name', {'required': False, 'default': None, 'help': ' The path to the directory.', 'action': None}),
+            ('num_results', {'required': False, 'default': None, 'help': ' Specifies the maximum number of files to return, including all directory elements. If the request does not specify num_results or specifies a value greater than 5,000, the server will return up to 5,000 items. Setting num_results to a value less than or equal to zero results in error response code 400 (Bad Request).', 'action': None}),
+            ('marker', {'required': False, 'default': None, 'help': ' An opaque continuation token. This value can be retrieved from the next_marker field of a previous generator object if num_results was specified and that generator has finished enumerating results. If specified, this generator will begin returning results from the point where the previous generator stopped.', 'action': None}),
+            ('timeout', {'required': False, 'default': None, 'help': ' The timeout parameter is expressed in seconds.', 'action': None}),
+        ]},
+    'azure.storage.file.fileservice#FileService.list_shares': {
+        'version': '0.32.0',
+        'parameters': {'names': ['self', 'prefix', 'marker', 'num_results', 'include_metadata', 'timeout'], 'defaults': [None, None, None, False, None]},
+        'doc': 'ce20bdf2',
+        'arguments': [
+            ('prefix', {'required': False, 'default': None, 'help': ' Filters the results to return only shares whose names begin with the specified prefix.', 'action': None}),
+            ('marker', {'required': False, 'default': None, 'help': ' An opaque continuation token. This value can be retrieved from the next_marker field of a previous generator object if num_results was specified and that generator has finished enumerating results. If specified, this generator will begin returning results from the point where the previous generator stopped.', 'action': None}),
+            ('num_results', {'required': False, 'default': None, 'help': ' Specifies the maximum number of shares to return.', 'action': None}),
+            ('include_metadata', {'required': False, 'default': False, 'help': ' Specifies that share metadata be returned in the response.', 'action': 'store_true'}),
+            ('timeout', {'required': False, 'default': None, 'help': ' The timeout parameter is expressed in seconds.', 'action': None}),
+        ]},
+    'azure.storage.file.fileservice#FileService.make_file_url': {
+        'version': '0.32.0',
+        'parameters': {'names': ['self', 'share_name', 'directory_name', 'file_name', 'protocol', 'sas_token'], 'defaults': [None, None]},
+        'doc': 'f527388c',
+        'arguments': [
+            ('share_name', {'required': True, 'default': None, 'help': ' Name of share.', 'action': None}),
+            ('directory_name', {'required': True, 'default': None, 'help': ' The path to the directory.', 'action': None}),
+            ('file_name', {'required': True, 'default': None, 'help': ' Name of file.', 'action': None}),
+            ('protocol', {'required': False, 'default': None, 'help': " Protocol to use: 'http' or 'https'. If not specified, uses the protocol specified when FileService was initialized.", 'action': None}),
+            ('sas_token', {'required': False, 'default': None, 'help': ' Shared access signature token created with generate_shared_access_signature.', 'action': None}),
+        ]},
+    'azure.storage.file.fileservice#FileService.resize_file': {
+        'version': '0.32.0',
+        'parameters': {'names': ['self', 'share_name', 'directory_name', 'file_name', 'content_length', 'timeout'], 'defaults': [None]},
+        'doc': '6bd49e69',
+        'arguments': [
+            ('share_name', {'required': True, 'default': None, 'help': ' Name of existing share.', 'action': None}),
+            ('directory_name', {'required': True, 'default': None, 'help': ' The path to the directory.', 'action': None}),
+            ('file_name', {'required': True, 'default': None, 'help': ' Name of existing file.', 'action': None}),
+            ('content_length', {'required': True, 'default': None, 'help': ' The length to resize the file to.', 'action': None}),
+            ('timeout', {'required': False, 'default': None, 'help': ' The timeout parameter is expressed in seconds.', 'action': None}),
+        ]},
+    'azure.storage.file.fileservice#FileService.set_directory_metadata': {
+        'version': '0.32.0',
+        'parameters': {'names': ['self', 'share_name', 'directory_name', 'metadata', 'timeout'], 'defaults': [None, None]},
+        'doc': '65603800',
+        'arguments': [
+            ('share_name', {'required': True, 'default': None, 'help': ' Name of existing share.', 'action': None}),
+            ('directory_name', {'required': True, 'default': None, 'help': ' The path to the directory.', 'action': None}),
+            ('metadata', {'required': False, 'default': None, 'help': " A dict containing name-value pairs to associate with the directory as metadata. Example: {'category':'test'}", 'action': None}),
+            ('timeout', {'required': False, 'default': None, 'help': ' The timeout parameter is expressed in seconds.', 'action': None}),
+        ]},
+    'azure.storage.file.fileservice#FileService.set_file_metadata': {
+        'version': '0.32.0',
+        'parameters': {'names': ['self', 'share_name', 'directory_name', 'file_name', 'metadata', 'timeout'], 'defaults': [None, None]},
+        'doc': 'dc23c21d',
+        'arguments': [
+            ('share_name', {'required': True, 'default': None, 'help': ' Name of existing share.', 'action': None}),
+            ('directory_name', {'required': True, 'default': None, 'help': ' The path to the directory.', 'action': None}),
+            ('file_name', {'required': True, 'default': None, 'help': ' Name of existing file.', 'action': None}),
+            ('metadata', {'required': False, 'default': None, 'help': ' Dict containing name and value pairs. Each call to this operation replaces all existing metadata attached to the file. To remove all metadata from the file, call this operation with no metadata headers.', 'action': None}),
+            ('timeout', {'required': False, 'default': None, 'help': ' The timeout parameter is expressed in seconds.', 'action': None}),
+        ]},
+    'azure.storage.file.fileservice#FileService.set_file_properties': {
+        'version': '0.32.0',
+        'parameters': {'names': ['self', 'share_name', 'directory_name', 'file_name', 'content_settings', 'timeout'], 'defaults': [None]},
+        'doc': 'f5efb50b',
+        'arguments': [
+            ('share_name', {'required': True, 'default': None, 'help': ' Name of existing share.', 'action': None}),
+            ('directory_name', {'required': True, 'default': None, 'help': ' The path to the directory.', 'action': None}),
+            ('file_name', {'required': True, 'default': None, 'help': ' Name of existing file.', 'action': None}),
+            ('content_settings', {'required': True, 'default': None, 'help': ' ContentSettings object used to set the file properties.', 'action': None}),
+            ('timeout', {'required': False, 'default': None, 'help': ' The timeout parameter is expressed in seconds.', 'action': None}),
+        ]},
+    'azure.storage.file.fileservice#FileService.set_file_service_properties': {
+        'version': '0.32.0',
+        'parameters': {'names': ['self', 'hour_metrics', 'minute_metrics', 'cors', 'timeout'], 'defaults': [None, None, None, None]},
+        'doc': '1fff3251',
+        'arguments': [
+            ('hour_metrics', {'required': False, 'default': None, 'help': ' The hour metrics settings provide a summary of request statistics grouped by API in hourly aggregates for files.', 'action': None}),
+            ('minute_metrics', {'required': False, 'default': None, 'help': ' The minute metrics settings provide request statistics for each minute for files.', 'action': None}),
+            ('cors', {'required': False, 'default': None, 'help': ' You can include up to five CorsRule elements in the list. If an empty list is specified, all CORS rules will be deleted, and CORS will be disabled for the service.', 'action': None}),
+            ('timeout', {'required': False, 'default': None, 'help': ' The timeout parameter is expressed in seconds.', 'action': None}),
+        ]},
+    'azure.storage.file.fileservice#FileService.set_share_metadata': {
+        'version': '0.32.0',
+        'parameters': {'names': ['self', 'share_name', 'metadata', 'timeout'], 'defaults': [None, None]},
+        'doc': '4721096a',
+        'arguments': [
+            ('share_name', {'required': True, 'default': None, 'help': ' Name of existing share.', 'action': None}),
+            ('metadata', {'required': False, 'default': None, 'help': " A dict containing name-value pairs to associate with the share as metadata. Example: {'category':'test'}", 'action': None}),
+            ('timeout', {'required': False, 'default': None, 'help': ' The timeout parameter is expressed in seconds.', 'action': None}),
+        ]},
+    'azure.storage.file.fileservice#FileService.set_share_properties': {
+        'version': '0.32.0',
+        'parameters': {'names': ['self', 'share_name', 'quota', 'timeout'], 'defaults': [None]},
+        'doc': 'd22a94a6',
+        'arguments': [
+            ('share_name', {'required': True, 'default': None, 'help': ' Name of existing share.', 'action': None}),
+            ('quota', {'required': True, 'default': None, 'help': ' Specifies the maximum size of the share, in gigabytes. Must be greater than 0, and less than or equal to 5 TB (5120 GB).', 'action': None}),
+            ('timeout', {'required': False, 'default': None, 'help': ' The timeout parameter is expressed in seconds.', 'action': None}),
+        ]},
+})
@@ -31,10 +31,8 @@ def list_storage_accounts(resource_group_name=None):
     from msrestazure.azure_active_directory import UserPassCredentials
     scf = storage_client_factory()
     if resource_group_name:
-        accounts = scf.storage_accounts.list_by_resource_group(resource_group_name)
-    else:
-        accounts = scf.storage_accounts.list()
-    return list(accounts)
+        return scf.storage_accounts.list_by_resource_group(resource_group_name)
+    return scf.storage_accounts.list()
 
 def renew_storage_account_keys(resource_group_name, account_name, key=None):
     ''' Regenerate one or both keys for a storage account.
@@ -5,6 +5,7 @@
 
 # pylint: disable=unused-import
 
+import azure.cli.command_modules.vm._signatures
 import azure.cli.command_modules.vm._help
 import azure.cli.command_modules.vm._params
 import azure.cli.command_modules.vm.generated
@@ -0,0 +1,801 @@
+#---------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+#---------------------------------------------------------------------------------------------
+
+# This file is generated by scripts/sdk_command_gen/gen_signatures.py. Do not modify it by hand.
+# pylint: skip-file
+
+from azure.cli.commands._introspection import register_signatures
+
+register_signatures({
+    'azure.cli.command_modules.vm.custom#attach_existing_disk': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'vm_name', 'vhd', 'lun', 'disk_name', 'caching'], 'defaults': [None, None, None]},
+        'doc': '5c4e84b8',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('vm_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('vhd', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('lun', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('disk_name', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('caching', {'required': False, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.vm.custom#attach_new_disk': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'vm_name', 'vhd', 'lun', 'disk_name', 'disk_size', 'caching'], 'defaults': [None, None, 1023, None]},
+        'doc': '83529bf1',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('vm_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('vhd', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('lun', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('disk_name', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('disk_size', {'required': False, 'default': 1023, 'help': None, 'action': None}),
+            ('caching', {'required': False, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.vm.custom#availset_get': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'name'], 'defaults': []},
+        'doc': None,
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('name', {'required': True, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.vm.custom#availset_set': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': [], 'defaults': []},
+        'doc': None,
+        'arguments': [
+        ]},
+    'azure.cli.command_modules.vm.custom#capture_vm': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'vm_name', 'vhd_name_prefix', 'storage_container', 'overwrite'], 'defaults': ['vhds', True]},
+        'doc': '290a79af',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('vm_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('vhd_name_prefix', {'required': True, 'default': None, 'help': 'the VHD name prefix specify for the VM disks', 'action': None}),
+            ('storage_container', {'required': False, 'default': 'vhds', 'help': 'the storage account container name to save the disks', 'action': None}),
+            ('overwrite', {'required': False, 'default': True, 'help': 'overwrite the existing disk file', 'action': 'store_false'}),
+        ]},
+    'azure.cli.command_modules.vm.custom#delete_linux_user': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'vm_name', 'username'], 'defaults': []},
+        'doc': '3556ad84',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('vm_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('username', {'required': True, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.vm.custom#detach_disk': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'vm_name', 'disk_name'], 'defaults': []},
+        'doc': '215fd96f',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('vm_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('disk_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.vm.custom#disable_boot_diagnostics': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'vm_name'], 'defaults': []},
+        'doc': None,
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('vm_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.vm.custom#enable_boot_diagnostics': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'vm_name', 'storage'], 'defaults': []},
+        'doc': '73e3f39d',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('vm_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('storage', {'required': True, 'default': None, 'help': 'a storage account name or a uri like https://your_stoage_account_name.blob.core.windows.net/', 'action': None}),
+        ]},
+    'azure.cli.command_modules.vm.custom#get_boot_log': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'vm_name'], 'defaults': []},
+        'doc': None,
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('vm_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.vm.custom#list_disks': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'vm_name'], 'defaults': []},
+        'doc': '4690756d',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('vm_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.vm.custom#list_extensions': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'vm_name'], 'defaults': []},
+        'doc': None,
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('vm_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.vm.custom#list_ip_addresses': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'vm_name'], 'defaults': [None, None]},
+        'doc': '8a8553ae',
+        'arguments': [
+            ('resource_group_name', {'required': False, 'default': None, 'help': 'Name of resource group.', 'action': None}),
+            ('vm_name', {'required': False, 'default': None, 'help': 'Name of virtual machine.', 'action': None}),
+        ]},
+    'azure.cli.command_modules.vm.custom#list_vm': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name'], 'defaults': [None]},
+        'doc': 'afcecb31',
+        'arguments': [
+            ('resource_group_name', {'required': False, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.vm.custom#list_vm_extension_images': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['image_location', 'publisher', 'name', 'version', 'latest'], 'defaults': [None, None, None, None, False]},
+        'doc': 'e6558d1d',
+        'arguments': [
+            ('image_location', {'required': False, 'default': None, 'help': 'Image location', 'action': None}),
+            ('publisher', {'required': False, 'default': None, 'help': 'Image publisher name', 'action': None}),
+            ('name', {'required': False, 'default': None, 'help': 'Image name', 'action': None}),
+            ('version', {'required': False, 'default': None, 'help': 'Image version', 'action': None}),
+            ('latest', {'required': False, 'default': False, 'help': 'Show the latest version only.', 'action': 'store_true'}),
+        ]},
+    'azure.cli.command_modules.vm.custom#list_vm_images': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['image_location', 'publisher', 'offer', 'sku', 'all'], 'defaults': [None, None, None, None, False]},
+        'doc': '4a33e741',
+        'arguments': [
+            ('image_location', {'required': False, 'default': None, 'help': 'Image location', 'action': None}),
+            ('publisher', {'required': False, 'default': None, 'help': 'Image publisher name', 'action': None}),
+            ('offer', {'required': False, 'default': None, 'help': 'Image offer name', 'action': None}),
+            ('sku', {'required': False, 'default': None, 'help': 'Image sku name', 'action': None}),
+            ('all', {'required': False, 'default': False, 'help': 'Retrieve all versions of images from all publishers', 'action': 'store_true'}),
+        ]},
+    'azure.cli.command_modules.vm.custom#reset_windows_admin': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'vm_name', 'username', 'password'], 'defaults': []},
+        'doc': '82c5a56e',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('vm_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('username', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('password', {'required': True, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.vm.custom#resize_vm': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'vm_name', 'size'], 'defaults': []},
+        'doc': '9fe4b6fe',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('vm_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('size', {'required': True, 'default': None, 'help': 'sizes such as Standard_A4, Standard_F4s, etc', 'action': None}),
+        ]},
+    'azure.cli.command_modules.vm.custom#set_diagnostics_extension': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'vm_name', 'storage_account', 'settings'], 'defaults': [None]},
+        'doc': '74757009',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('vm_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('storage_account', {'required': True, 'default': None, 'help': 'the storage account to upload diagnostics log', 'action': None}),
+            ('settings', {'required': False, 'default': None, 'help': 'the settings file which defines data to be collected. Default will be provided if missing', 'action': None}),
+        ]},
+    'azure.cli.command_modules.vm.custom#set_extension': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'vm_name', 'vm_extension_name', 'publisher', 'version', 'settings', 'protected_settings', 'auto_upgrade_minor_version'], 'defaults': [None, None, None, False]},
+        'doc': '8bd5aee2',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('vm_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('vm_extension_name', {'required': True, 'default': None, 'help': 'the name of the extension', 'action': None}),
+            ('publisher', {'required': True, 'default': None, 'help': 'the name of extension publisher', 'action': None}),
+            ('version', {'required': False, 'default': None, 'help': 'the version of extension.', 'action': None}),
+            ('settings', {'required': False, 'default': None, 'help': 'public settings or a file path with such contents', 'action': None}),
+            ('protected_settings', {'required': False, 'default': None, 'help': 'protected settings or a file path with such contents', 'action': None}),
+            ('auto_upgrade_minor_version', {'required': False, 'default': False, 'help': 'auto upgrade to the newer version if available', 'action': 'store_true'}),
+        ]},
+    'azure.cli.command_modules.vm.custom#set_linux_user': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'vm_name', 'username', 'password', 'ssh_key_value'], 'defaults': [None, None]},
+        'doc': '060be52b',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('vm_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('username', {'required': True, 'default': None, 'help': 'user name', 'action': None}),
+            ('password', {'required': False, 'default': None, 'help': 'user password.', 'action': None}),
+            ('ssh_key_value', {'required': False, 'default': None, 'help': 'SSH key file value or key file path', 'action': None}),
+        ]},
+    'azure.cli.command_modules.vm.custom#show_default_diagnostics_configuration': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': [], 'defaults': []},
+        'doc': '935a33a8',
+        'arguments': [
+        ]},
+    'azure.cli.command_modules.vm.custom#vm_add_nics': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'vm_name', 'nic_ids', 'nic_names', 'primary_nic'], 'defaults': [None, None, None]},
+        'doc': '3deb6371',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('vm_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('nic_ids', {'required': False, 'default': None, 'help': 'NIC resource IDs', 'action': None}),
+            ('nic_names', {'required': False, 'default': None, 'help': 'NIC names, assuming under the same resource group', 'action': None}),
+            ('primary_nic', {'required': False, 'default': None, 'help': 'name or id of the primary NIC. If missing, the first of the NIC list will be the primary', 'action': None}),
+        ]},
+    'azure.cli.command_modules.vm.custom#vm_delete_nics': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'vm_name', 'nic_ids', 'nic_names', 'primary_nic'], 'defaults': [None, None, None]},
+        'doc': '7bd2b5a2',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('vm_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('nic_ids', {'required': False, 'default': None, 'help': 'NIC resource IDs', 'action': None}),
+            ('nic_names', {'required': False, 'default': None, 'help': 'NIC names, assuming under the same resource group', 'action': None}),
+            ('primary_nic', {'required': False, 'default': None, 'help': 'name or id of the primary NIC. If missing, the first of the NIC list will be the primary', 'action': None}),
+        ]},
+    'azure.cli.command_modules.vm.custom#vm_open_port': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'vm_name', 'network_security_group_name', 'apply_to_subnet'], 'defaults': [None, False]},
+        'doc': '4e45b6f2',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('vm_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('network_security_group_name', {'required': False, 'default': None, 'help': None, 'action': None}),
+            ('apply_to_subnet', {'required': False, 'default': False, 'help': None, 'action': 'store_true'}),
+        ]},
+    'azure.cli.command_modules.vm.custom#vm_update_nics': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'vm_name', 'nic_ids', 'nic_names', 'primary_nic'], 'defaults': [None, None, None]},
+        'doc': '82b992ef',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('vm_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('nic_ids', {'required': False, 'default': None, 'help': 'NIC resource IDs', 'action': None}),
+            ('nic_names', {'required': False, 'default': None, 'help': 'NIC names, assuming under the same resource group', 'action': None}),
+            ('primary_nic', {'required': False, 'default': None, 'help': 'name or id of the primary nic. If missing, the first element of nic list will be set to the primary', 'action': None}),
+        ]},
+    'azure.cli.command_modules.vm.custom#vmss_deallocate': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'vm_scale_set_name', 'instance_ids'], 'defaults': [None]},
+        'doc': 'cd5c3890',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('vm_scale_set_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('instance_ids', {'required': False, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.vm.custom#vmss_delete_instances': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'vm_scale_set_name', 'instance_ids'], 'defaults': []},
+        'doc': 'fd300171',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('vm_scale_set_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('instance_ids', {'required': True, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.vm.custom#vmss_get': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'name'], 'defaults': []},
+        'doc': None,
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('name', {'required': True, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.vm.custom#vmss_get_instance_view': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'vm_scale_set_name', 'instance_id'], 'defaults': [None]},
+        'doc': '1b15b96d',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('vm_scale_set_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('instance_id', {'required': False, 'default': None, 'help': 'an VM instance id, or use "*" to list instance view for all VMs in a scale set', 'action': None}),
+        ]},
+    'azure.cli.command_modules.vm.custom#vmss_list': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name'], 'defaults': [None]},
+        'doc': '508b94f1',
+        'arguments': [
+            ('resource_group_name', {'required': False, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.vm.custom#vmss_reimage': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'vm_scale_set_name', 'instance_id'], 'defaults': [None]},
+        'doc': '22dd720d',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('vm_scale_set_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('instance_id', {'required': False, 'default': None, 'help': 'VM instance id. If missing, reimage all instances', 'action': None}),
+        ]},
+    'azure.cli.command_modules.vm.custom#vmss_restart': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'vm_scale_set_name', 'instance_ids'], 'defaults': [None]},
+        'doc': '993288ae',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('vm_scale_set_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('instance_ids', {'required': False, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.vm.custom#vmss_scale': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'vm_scale_set_name', 'new_capacity'], 'defaults': []},
+        'doc': '9b126226',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('vm_scale_set_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('new_capacity', {'required': True, 'default': None, 'help': 'number of virtual machines in a scale set', 'action': None}),
+        ]},
+    'azure.cli.command_modules.vm.custom#vmss_set': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': [], 'defaults': []},
+        'doc': None,
+        'arguments': [
+        ]},
+    'azure.cli.command_modules.vm.custom#vmss_show': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'vm_scale_set_name', 'instance_id'], 'defaults': [None]},
+        'doc': 'd5841fc0',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('vm_scale_set_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('instance_id', {'required': False, 'default': None, 'help': 'VM instance id. If missing, show scale set', 'action': None}),
+        ]},
+    'azure.cli.command_modules.vm.custom#vmss_start': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'vm_scale_set_name', 'instance_ids'], 'defaults': [None]},
+        'doc': '8b508aaf',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('vm_scale_set_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('instance_ids', {'required': False, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.vm.custom#vmss_stop': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'vm_scale_set_name', 'instance_ids'], 'defaults': [None]},
+        'doc': 'c8d3d0cc',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('vm_scale_set_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('instance_ids', {'required': False, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.vm.custom#vmss_update_instances': {
+        'version': '0.0.1.dev0',
+        'parameters': {'names': ['resource_group_name', 'vm_scale_set_name', 'instance_ids'], 'defaults': []},
+        'doc': 'a76557cc',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('vm_scale_set_name', {'required': True, 'default': None, 'help': None, 'action': None}),
+            ('instance_ids', {'required': True, 'default': None, 'help': None, 'action': None}),
+        ]},
+    'azure.cli.command_modules.vm.mgmt_acs.lib.operations.acs_operations#AcsOperations.create_or_update': {
+        'version': '2015-11-01',
+        'parameters': {'names': ['self', 'resource_group_name', 'deployment_name', 'dns_name_prefix', 'name', 'ssh_key_value', 'content_version', 'admin_username', 'agent_count', 'agent_vm_size', 'location', 'master_count', 'orchestrator_type', 'tags', 'custom_headers', 'raw'], 'defaults': [None, 'azureuser', '1', 'Standard_D2', None, '1', 'dcos', None, None, False]},
+        'doc': '0019490b',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group. The name is case insensitive.', 'action': None}),
+            ('deployment_name', {'required': True, 'default': None, 'help': 'The name of the deployment.', 'action': None}),
+            ('dns_name_prefix', {'required': True, 'default': None, 'help': 'Sets the Domain name prefix for the cluster. The concatenation of the domain name and the regionalized DNS zone make up the fully qualified domain name associated with the public IP address.', 'action': None}),
+            ('name', {'required': True, 'default': None, 'help': 'Resource name for the container service.', 'action': None}),
+            ('ssh_key_value', {'required': True, 'default': None, 'help': "Configure all linux machines with the SSH RSA public key string.  Your key should include three parts, for example 'ssh-rsa AAAAB...snip...UcyupgH azureuser@linuxvm", 'action': None}),
+            ('admin_username', {'required': False, 'default': 'azureuser', 'help': 'User name for the Linux Virtual Machines.', 'action': None}),
+            ('agent_count', {'required': False, 'default': '1', 'help': 'The number of agents for the cluster.  Note, for DC/OS clusters you will also get 1 or 2 public agents in addition to these seleted masters.', 'action': None}),
+            ('agent_vm_size', {'required': False, 'default': 'Standard_D2', 'help': 'The size of the Virtual Machine.', 'action': None}),
+            ('location', {'required': False, 'default': None, 'help': 'Location for VM resources.', 'action': None}),
+            ('master_count', {'required': False, 'default': '1', 'help': 'The number of DC/OS masters for the cluster.', 'action': None}),
+            ('orchestrator_type', {'required': False, 'default': 'dcos', 'help': "The type of orchestrator used to manage the applications on the cluster. Possible values include: 'dcos', 'swarm'", 'action': None}),
+            ('tags', {'required': False, 'default': None, 'help': 'Tags object.', 'action': None}),
+        ]},
+    'azure.cli.command_modules.vm.mgmt_avail_set.lib.operations.avail_set_operations#AvailSetOperations.create_or_update': {
+        'version': '2015-11-01',
+        'parameters': {'names': ['self', 'resource_group_name', 'deployment_name', 'name', 'content_version', 'location', 'platform_fault_domain_count', 'platform_update_domain_count', 'tags', 'custom_headers', 'raw'], 'defaults': [None, None, '3', '5', None, None, False]},
+        'doc': '67af8ca9',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group. The name is case insensitive.', 'action': None}),
+            ('deployment_name', {'required': True, 'default': None, 'help': 'The name of the deployment.', 'action': None}),
+            ('name', {'required': True, 'default': None, 'help': 'Name of the availability set.', 'action': None}),
+            ('location', {'required': False, 'default': None, 'help': 'Location to deploy the availability set.', 'action': None}),
+            ('platform_fault_domain_count', {'required': False, 'default': '3', 'help': 'Number of Fault Domains.', 'action': None}),
+            ('platform_update_domain_count', {'required': False, 'default': '5', 'help': 'Number of Update Domains.', 'action': None}),
+            ('tags', {'required': False, 'default': None, 'help': 'Tags object.', 'action': None}),
+        ]},
+    'azure.cli.command_modules.vm.mgmt_vm.lib.operations.vm_operations#VmOperations.create_or_update': {
+        'version': '2015-11-01',
+        'parameters': {'names': ['self', 'resource_group_name', 'deployment_name', 'admin_username', 'name', 'content_version', 'admin_password', 'authentication_type', 'availability_set', 'availability_set_type', 'custom_os_disk_type', 'custom_os_disk_uri', 'dns_name_for_public_ip', 'dns_name_type', 'location', 'network_interface_ids', 'network_interface_type', 'network_security_group', 'network_security_group_rule', 'network_security_group_type', 'os_disk_name', 'os_disk_type', 'os_disk_uri', 'os_offer', 'os_publisher', 'os_sku', 'os_type', 'os_version', 'private_ip_address', 'private_ip_address_allocation', 'public_ip_address', 'public_ip_address_allocation', 'public_ip_address_type', 'size', 'ssh_dest_key_path', 'ssh_key_value', 'storage_account', 'storage_account_type', 'storage_caching', 'storage_container_name', 'storage_type', 'subnet_ip_address_prefix', 'subnet_name', 'tags', 'virtual_network', 'virtual_network_ip_address_prefix', 'virtual_network_type', 'custom_headers', 'raw'], 'defaults': [None, None, 'password', None, 'none', 'windows', None, None, 'none', None, None, 'new', None, 'RDP', 'new', None, 'provided', None, 'WindowsServer', 'MicrosoftWindowsServer', '2012-R2-Datacenter', 'Win2012R2Datacenter', 'latest', None, 'dynamic', None, 'dynamic', 'new', 'Standard_DS1', None, None, None, 'new', 'ReadWrite', 'vhds', 'Premium_LRS', '10.0.0.0/24', None, None, None, '10.0.0.0/16', 'new', None, False]},
+        'doc': '6b489c36',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group. The name is case insensitive.', 'action': None}),
+            ('deployment_name', {'required': True, 'default': None, 'help': 'The name of the deployment.', 'action': None}),
+            ('admin_username', {'required': True, 'default': None, 'help': 'Username for the Virtual Machine.', 'action': None}),
+            ('name', {'required': True, 'default': None, 'help': 'The VM name.', 'action': None}),
+            ('admin_password', {'required': False, 'default': None, 'help': 'Password for the Virtual Machine.  Required if SSH (Linux only) is not specified.', 'action': None}),
+            ('authentication_type', {'required': False, 'default': 'password', 'help': "Password or SSH Public Key authentication. Possible values include: 'password', 'ssh'", 'action': None}),
+            ('availability_set', {'required': False, 'default': None, 'help': 'Name or ID of existing availability set for the VM.', 'action': None}),
+            ('availability_set_type', {'required': False, 'default': 'none', 'help': "Flag to add the VM to an existing availability set. Possible values include: 'none', 'existingName', 'existingId'", 'action': None}),
+            ('custom_os_disk_type', {'required': False, 'default': 'windows', 'help': "Custom image OS type. Possible values include: 'windows', 'linux'", 'action': None}),
+            ('custom_os_disk_uri', {'required': False, 'default': None, 'help': 'URI to a custom disk image.', 'action': None}),
+            ('dns_name_for_public_ip', {'required': False, 'default': None, 'help': 'Globally unique DNS Name for the Public IP used to access the Virtual Machine.  Requires a new public IP to be created by setting Public IP Address Type to New.', 'action': None}),
+            ('dns_name_type', {'required': False, 'default': 'none', 'help': "Associate VMs with a public IP address to a DNS name. Possible values include: 'none', 'new'", 'action': None}),
+            ('location', {'required': False, 'default': None, 'help': 'Location for VM resources.', 'action': None}),
+            ('network_interface_ids', {'required': False, 'default': None, 'help': 'One or more existing network intreface Ids to attach to the VM.', 'action': None}),
+            ('network_interface_type', {'required': False, 'default': 'new', 'help': "Whether to create a new network interface or use existing ones. Possible values include: 'new', 'existing'", 'action': None}),
+            ('network_security_group', {'required': False, 'default': None, 'help': 'Name or ID of the network security group.', 'action': None}),
+            ('network_security_group_rule', {'required': False, 'default': 'RDP', 'help': "The type of rule to add to a new network security group. Possible values include: 'RDP', 'SSH'", 'action': None}),
+            ('network_security_group_type', {'required': False, 'default': 'new', 'help': "Whether to use a network security group or not. Possible values include: 'new', 'existingName', 'existingId', 'none'", 'action': None}),
+            ('os_disk_name', {'required': False, 'default': None, 'help': 'Name of new VM OS disk.', 'action': None}),
+            ('os_disk_type', {'required': False, 'default': 'provided', 'help': "Use a custom image URI from the OS Disk URI parameter or use a provider's image. Possible values include: 'provided', 'custom'", 'action': None}),
+            ('os_disk_uri', {'required': False, 'default': None, 'help': 'URI for a custom VHD image.', 'action': None}),
+            ('os_offer', {'required': False, 'default': 'WindowsServer', 'help': 'The OS Offer to install.', 'action': None}),
+            ('os_publisher', {'required': False, 'default': 'MicrosoftWindowsServer', 'help': 'The OS publisher of the OS image.', 'action': None}),
+            ('os_sku', {'required': False, 'default': '2012-R2-Datacenter', 'help': 'The OS SKU to install.', 'action': None}),
+            ('os_type', {'required': False, 'default': 'Win2012R2Datacenter', 'help': "Common OS choices.  Choose 'Custom' to specify an image with the osPublisher, osOffer, osSKU, and osVersion parameters. Possible values include: 'Win2012R2Datacenter', 'Win2012Datacenter', 'Win2008R2SP1', 'Custom'", 'action': None}),
+            ('os_version', {'required': False, 'default': 'latest', 'help': 'The OS version to install.', 'action': None}),
+            ('private_ip_address', {'required': False, 'default': None, 'help': 'The private IP address to use with Private IP Address Allocation type Static.', 'action': None}),
+            ('private_ip_address_allocation', {'required': False, 'default': 'dynamic', 'help': "Private IP address allocation method. Possible values include: 'dynamic', 'static'", 'action': None}),
+            ('public_ip_address', {'required': False, 'default': None, 'help': 'Name or ID of public IP address to use.', 'action': None}),
+            ('public_ip_address_allocation', {'required': False, 'default': 'dynamic', 'help': "Public IP address allocation method. Possible values include: 'dynamic', 'static'", 'action': None}),
+            ('public_ip_address_type', {'required': False, 'default': 'new', 'help': "Use a public IP Address for the VM Nic. Possible values include: 'none', 'new', 'existingName', 'existingId'", 'action': None}),
+            ('size', {'required': False, 'default': 'Standard_DS1', 'help': 'The VM Size that should be created.  See https://azure.microsoft.com/en-us/pricing/details/virtual-machines/ for size info.', 'action': None}),
+            ('ssh_dest_key_path', {'required': False, 'default': None, 'help': 'Destination file path on VM for SSH key.', 'action': None}),
+            ('ssh_key_value', {'required': False, 'default': None, 'help': 'SSH key file data.', 'action': None}),
+            ('storage_account', {'required': False, 'default': None, 'help': 'Name or ID of storage account for the VM OS disk.', 'action': None}),
+            ('storage_account_type', {'required': False, 'default': 'new', 'help': "Whether to use an existing storage account or create a new one. Possible values include: 'new', 'existingName', 'existingId'", 'action': None}),
+            ('storage_caching', {'required': False, 'default': 'ReadWrite', 'help': "Storage caching type for the VM OS disk. Possible values include: 'ReadOnly', 'ReadWrite'", 'action': None}),
+            ('storage_container_name', {'required': False, 'default': 'vhds', 'help': 'Name of storage container for the VM OS disk.', 'action': None}),
+            ('storage_type', {'required': False, 'default': 'Premium_LRS', 'help': 'The VM storage type (Standard_LRS, Standard_GRS, Standard_RAGRS, ...).', 'action': None}),
+            ('subnet_ip_address_prefix', {'required': False, 'default': '10.0.0.0/24', 'help': 'The subnet address prefix in CIDR format.', 'action': None}),
+            ('subnet_name', {'required': False, 'default': None, 'help': 'The subnet name.', 'action': None}),
+            ('tags', {'required': False, 'default': None, 'help': 'Tags object.', 'action': None}),
+            ('virtual_network', {'required': False, 'default': None, 'help': 'Name or ID of virtual network to add VM to.', 'action': None}),
+            ('virtual_network_ip_address_prefix', {'required': False, 'default': '10.0.0.0/16', 'help': 'The virtual network IP address prefix in CIDR format.', 'action': None}),
+            ('virtual_network_type', {'required': False, 'default': 'new', 'help': "Whether to use an existing VNet or create a new one. Possible values include: 'new', 'existingName', 'existingId'", 'action': None}),
+        ]},
+    'azure.cli.command_modules.vm.mgmt_vmss.lib.operations.vmss_operations#VmssOperations.create_or_update': {
+        'version': '2015-11-01',
+        'parameters': {'names': ['self', 'resource_group_name', 'deployment_name', 'admin_username', 'name', 'content_version', 'admin_password', 'authentication_type', 'custom_os_disk_type', 'custom_os_disk_uri', 'dns_name_for_public_ip', 'dns_name_type', 'instance_count', 'load_balancer', 'load_balancer_backend_pool_name', 'load_balancer_type', 'location', 'os_disk_name', 'os_disk_type', 'os_offer', 'os_publisher', 'os_sku', 'os_type', 'os_version', 'overprovision', 'public_ip_address', 'public_ip_address_allocation', 'public_ip_address_type', 'ssh_dest_key_path', 'ssh_key_value', 'storage_caching', 'storage_container_name', 'storage_type', 'subnet_ip_address_prefix', 'subnet_name', 'tags', 'upgrade_policy_mode', 'virtual_network', 'virtual_network_ip_address_prefix', 'virtual_network_type', 'vm_sku', 'custom_headers', 'raw'], 'defaults': [None, None, 'password', 'windows', None, None, 'none', '2', None, None, 'new', None, 'osdiskimage', 'provided', 'WindowsServer', 'MicrosoftWindowsServer', '2012-R2-Datacenter', 'Win2012R2Datacenter', 'latest', False, None, 'dynamic', 'new', None, None, 'ReadOnly', 'vhds', 'Standard_LRS', '10.0.0.0/24', None, None, 'manual', None, '10.0.0.0/16', 'new', 'Standard_D1_v2', None, False]},
+        'doc': '26683051',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group. The name is case insensitive.', 'action': None}),
+            ('deployment_name', {'required': True, 'default': None, 'help': 'The name of the deployment.', 'action': None}),
+            ('admin_username', {'required': True, 'default': None, 'help': 'Username for the Virtual Machine.', 'action': None}),
+            ('name', {'required': True, 'default': None, 'help': 'The VM name.', 'action': None}),
+            ('admin_password', {'required': False, 'default': None, 'help': 'Password for the Virtual Machine.  Required if SSH (Linux only) is not specified.', 'action': None}),
+            ('authentication_type', {'required': False, 'default': 'password', 'help': "Password or SSH Public Key authentication. Possible values include: 'password', 'ssh'", 'action': None}),
+            ('custom_os_disk_type', {'required': False, 'default': 'windows', 'help': "Custom image OS type. Possible values include: 'windows', 'linux'", 'action': None}),
+            ('custom_os_disk_uri', {'required': False, 'default': None, 'help': 'URI to a custom disk image.', 'action': None}),
+            ('dns_name_for_public_ip', {'required': False, 'default': None, 'help': 'Globally unique DNS Name for the Public IP used to access the Virtual Machine.  Requires a new public IP to be created by setting Public IP Address Type to New.', 'action': None}),
+            ('dns_name_type', {'required': False, 'default': 'none', 'help': "Associate VMs with a public IP address to a DNS name. Possible values include: 'none', 'new'", 'action': None}),
+            ('instance_count', {'required': False, 'default': '2', 'help': 'Number of VMs in scale set.', 'action': None}),
+            ('load_balancer', {'required': False, 'default': None, 'help': 'Name or ID of load balancer.', 'action': None}),
+            ('load_balancer_backend_pool_name', {'required': False, 'default': None, 'help': 'Name of load balancer backend pool.', 'action': None}),
+            ('load_balancer_type', {'required': False, 'default': 'new', 'help': "Whether to use an existing load balancer, create a new one, or use no load balancer. Possible values include: 'new', 'existingName', 'existingId', 'none'", 'action': None}),
+            ('location', {'required': False, 'default': None, 'help': 'Location for VM resources.', 'action': None}),
+            ('os_disk_name', {'required': False, 'default': 'osdiskimage', 'help': 'Name of new VM OS disk.', 'action': None}),
+            ('os_disk_type', {'required': False, 'default': 'provided', 'help': "Use a custom image URI from the OS Disk URI parameter or use a provider's image. Possible values include: 'provided', 'custom'", 'action': None}),
+            ('os_offer', {'required': False, 'default': 'WindowsServer', 'help': 'The OS Offer to install.', 'action': None}),
+            ('os_publisher', {'required': False, 'default': 'MicrosoftWindowsServer', 'help': 'The OS publisher of the OS image.', 'action': None}),
+            ('os_sku', {'required': False, 'default': '2012-R2-Datacenter', 'help': 'The OS SKU to install.', 'action': None}),
+            ('os_type', {'required': False, 'default': 'Win2012R2Datacenter', 'help': "Common OS choices.  Choose 'Custom' to specify an image with the osPublisher, osOffer, osSKU, and osVersion parameters. Possible values include: 'Win2012R2Datacenter', 'Win2012Datacenter', 'Win2008R2SP1', 'Custom'", 'action': None}),
+            ('os_version', {'required': False, 'default': 'latest', 'help': 'The OS version to install.', 'action': None}),
+            ('overprovision', {'required': False, 'default': False, 'help': 'Overprovision option (see https://azure.microsoft.com/en-us/documentation/articles/virtual-machine-scale-sets-overview/ for details).', 'action': 'store_true'}),
+            ('public_ip_address', {'required': False, 'default': None, 'help': 'Name or ID of public IP address to use.', 'action': None}),
+            ('public_ip_address_allocation', {'required': False, 'default': 'dynamic', 'help': "Public IP address allocation method. Possible values include: 'dynamic', 'static'", 'action': None}),
+            ('public_ip_address_type', {'required': False, 'default': 'new', 'help': "Use a public IP Address for the VM Nic. Possible values include: 'none', 'new', 'existingName', 'existingId'", 'action': None}),
+            ('ssh_dest_key_path', {'required': False, 'default': None, 'help': 'Destination file path on VM for SSH key.', 'action': None}),
+            ('ssh_key_value', {'required': False, 'default': None, 'help': 'SSH key file data.', 'action': None}),
+            ('storage_caching', {'required': False, 'default': 'ReadOnly', 'help': "Storage caching type. Possible values include: 'ReadOnly', 'ReadWrite'", 'action': None}),
+            ('storage_container_name', {'required': False, 'default': 'vhds', 'help': 'Name of storage container for the VM OS disk.', 'action': None}),
+            ('storage_type', {'required': False, 'default': 'Standard_LRS', 'help': 'The VM storage type (Standard_LRS, Standard_GRS, Standard_RAGRS).', 'action': None}),
+            ('subnet_ip_address_prefix', {'required': False, 'default': '10.0.0.0/24', 'help': 'The subnet address prefix in CIDR format.', 'action': None}),
+            ('subnet_name', {'required': False, 'default': None, 'help': 'The subnet name.', 'action': None}),
+            ('tags', {'required': False, 'default': None, 'help': 'Tags object.', 'action': None}),
+            ('upgrade_policy_mode', {'required': False, 'default': 'manual', 'help': "Manual or Automatic upgrade mode. Possible values include: 'manual', 'automatic'", 'action': None}),
+            ('virtual_network', {'required': False, 'default': None, 'help': 'Name or ID of virtual network.', 'action': None}),
+            ('virtual_network_ip_address_prefix', {'required': False, 'default': '10.0.0.0/16', 'help': 'The virtual network IP address prefix in CIDR format.', 'action': None}),
+            ('virtual_network_type', {'required': False, 'default': 'new', 'help': "Whether to use an existing VNet or create a new one. Possible values include: 'new', 'existingName', 'existingId'", 'action': None}),
+            ('vm_sku', {'required': False, 'default': 'Standard_D1_v2', 'help': 'Size of VMs in the VM Scale Set.  See https://azure.microsoft.com/en-us/pricing/details/virtual-machines/ for size info.', 'action': None}),
+        ]},
+    'azure.mgmt.compute.operations.availability_sets_operations#AvailabilitySetsOperations.delete': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'availability_set_name', 'api_version', 'custom_headers', 'raw'], 'defaults': ['2016-03-30', None, False]},
+        'doc': '81f73c3f',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('availability_set_name', {'required': True, 'default': None, 'help': 'The name of the availability set.', 'action': None}),
+            ('api_version', {'required': False, 'default': '2016-03-30', 'help': 'Client Api Version.', 'action': None}),
+        ]},
+    'azure.mgmt.compute.operations.availability_sets_operations#AvailabilitySetsOperations.get': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'availability_set_name', 'api_version', 'custom_headers', 'raw'], 'defaults': ['2016-03-30', None, False]},
+        'doc': 'dc96b59c',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('availability_set_name', {'required': True, 'default': None, 'help': 'The name of the availability set.', 'action': None}),
+            ('api_version', {'required': False, 'default': '2016-03-30', 'help': 'Client Api Version.', 'action': None}),
+        ]},
+    'azure.mgmt.compute.operations.availability_sets_operations#AvailabilitySetsOperations.list': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'api_version', 'custom_headers', 'raw'], 'defaults': ['2016-03-30', None, False]},
+        'doc': 'dc821d65',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('api_version', {'required': False, 'default': '2016-03-30', 'help': 'Client Api Version.', 'action': None}),
+        ]},
+    'azure.mgmt.compute.operations.availability_sets_operations#AvailabilitySetsOperations.list_available_sizes': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'availability_set_name', 'api_version', 'custom_headers', 'raw'], 'defaults': ['2016-03-30', None, False]},
+        'doc': 'e6053324',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('availability_set_name', {'required': True, 'default': None, 'help': 'The name of the availability set.', 'action': None}),
+            ('api_version', {'required': False, 'default': '2016-03-30', 'help': 'Client Api Version.', 'action': None}),
+        ]},
+    'azure.mgmt.compute.operations.container_service_operations#ContainerServiceOperations.create_or_update': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'container_service_name', 'parameters', 'api_version', 'custom_headers', 'raw'], 'defaults': ['2016-03-30', None, False]},
+        'doc': '1b2131f3',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('container_service_name', {'required': True, 'default': None, 'help': 'The name of the container service within the given subscription and resource group.', 'action': None}),
+            ('parameters', {'required': True, 'default': None, 'help': 'Parameters supplied to the Create Container Service operation.', 'action': None}),
+            ('api_version', {'required': False, 'default': '2016-03-30', 'help': 'Client Api Version.', 'action': None}),
+        ]},
+    'azure.mgmt.compute.operations.container_service_operations#ContainerServiceOperations.delete': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'container_service_name', 'api_version', 'custom_headers', 'raw'], 'defaults': ['2016-03-30', None, False]},
+        'doc': '6e62fcac',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('container_service_name', {'required': True, 'default': None, 'help': 'The name of the container service within the given subscription and resource group.', 'action': None}),
+            ('api_version', {'required': False, 'default': '2016-03-30', 'help': 'Client Api Version.', 'action': None}),
+        ]},
+    'azure.mgmt.compute.operations.container_service_operations#ContainerServiceOperations.get': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'container_service_name', 'api_version', 'custom_headers', 'raw'], 'defaults': ['2016-03-30', None, False]},
+        'doc': '18c3c268',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('container_service_name', {'required': True, 'default': None, 'help': 'The name of the container service within the given subscription and resource group.', 'action': None}),
+            ('api_version', {'required': False, 'default': '2016-03-30', 'help': 'Client Api Version.', 'action': None}),
+        ]},
+    'azure.mgmt.compute.operations.container_service_operations#ContainerServiceOperations.list': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'api_version', 'custom_headers', 'raw'], 'defaults': ['2016-03-30', None, False]},
+        'doc': '0252159e',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('api_version', {'required': False, 'default': '2016-03-30', 'help': 'Client Api Version.', 'action': None}),
+        ]},
+    'azure.mgmt.compute.operations.usage_operations#UsageOperations.list': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'location', 'api_version', 'custom_headers', 'raw'], 'defaults': ['2016-03-30', None, False]},
+        'doc': '741f8618',
+        'arguments': [
+            ('location', {'required': True, 'default': None, 'help': 'The location upon which resource usage is queried.', 'action': None}),
+            ('api_version', {'required': False, 'default': '2016-03-30', 'help': 'Client Api Version.', 'action': None}),
+        ]},
+    'azure.mgmt.compute.operations.virtual_machine_extension_images_operations#VirtualMachineExtensionImagesOperations.get': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'location', 'publisher_name', 'type', 'version', 'api_version', 'custom_headers', 'raw'], 'defaults': ['2016-03-30', None, False]},
+        'doc': '233547de',
+        'arguments': [
+            ('location', {'required': True, 'default': None, 'help': '', 'action': None}),
+            ('publisher_name', {'required': True, 'default': None, 'help': '', 'action': None}),
+            ('type', {'required': True, 'default': None, 'help': '', 'action': None}),
+            ('version', {'required': True, 'default': None, 'help': '', 'action': None}),
+            ('api_version', {'required': False, 'default': '2016-03-30', 'help': 'Client Api Version.', 'action': None}),
+        ]},
+    'azure.mgmt.compute.operations.virtual_machine_extension_images_operations#VirtualMachineExtensionImagesOperations.list_types': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'location', 'publisher_name', 'api_version', 'custom_headers', 'raw'], 'defaults': ['2016-03-30', None, False]},
+        'doc': '32cd84e4',
+        'arguments': [
+            ('location', {'required': True, 'default': None, 'help': '', 'action': None}),
+            ('publisher_name', {'required': True, 'default': None, 'help': '', 'action': None}),
+            ('api_version', {'required': False, 'default': '2016-03-30', 'help': 'Client Api Version.', 'action': None}),
+        ]},
+    'azure.mgmt.compute.operations.virtual_machine_extension_images_operations#VirtualMachineExtensionImagesOperations.list_versions': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'location', 'publisher_name', 'type', 'api_version', 'filter', 'top', 'orderby', 'custom_headers', 'raw'], 'defaults': ['2016-03-30', None, None, None, None, False]},
+        'doc': '5f15d95a',
+        'arguments': [
+            ('location', {'required': True, 'default': None, 'help': '', 'action': None}),
+            ('publisher_name', {'required': True, 'default': None, 'help': '', 'action': None}),
+            ('type', {'required': True, 'default': None, 'help': '', 'action': None}),
+            ('api_version', {'required': False, 'default': '2016-03-30', 'help': 'Client Api Version.', 'action': None}),
+            ('filter', {'required': False, 'default': None, 'help': 'The filter to apply on the operation.', 'action': None}),
+            ('top', {'required': False, 'default': None, 'help': '', 'action': None}),
+            ('orderby', {'required': False, 'default': None, 'help': '', 'action': None}),
+        ]},
+    'azure.mgmt.compute.operations.virtual_machine_extensions_operations#VirtualMachineExtensionsOperations.delete': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'vm_name', 'vm_extension_name', 'api_version', 'custom_headers', 'raw'], 'defaults': ['2016-03-30', None, False]},
+        'doc': '306132fb',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('vm_name', {'required': True, 'default': None, 'help': 'The name of the virtual machine where the extension should be deleted.', 'action': None}),
+            ('vm_extension_name', {'required': True, 'default': None, 'help': 'The name of the virtual machine extension.', 'action': None}),
+            ('api_version', {'required': False, 'default': '2016-03-30', 'help': 'Client Api Version.', 'action': None}),
+        ]},
+    'azure.mgmt.compute.operations.virtual_machine_extensions_operations#VirtualMachineExtensionsOperations.get': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'vm_name', 'vm_extension_name', 'api_version', 'expand', 'custom_headers', 'raw'], 'defaults': ['2016-03-30', None, None, False]},
+        'doc': 'f647c570',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('vm_name', {'required': True, 'default': None, 'help': 'The name of the virtual machine containing the extension.', 'action': None}),
+            ('vm_extension_name', {'required': True, 'default': None, 'help': 'The name of the virtual machine extension.', 'action': None}),
+            ('api_version', {'required': False, 'default': '2016-03-30', 'help': 'Client Api Version.', 'action': None}),
+            ('expand', {'required': False, 'default': None, 'help': 'The expand expression to apply on the operation.', 'action': None}),
+        ]},
+    'azure.mgmt.compute.operations.virtual_machine_images_operations#VirtualMachineImagesOperations.get': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'location', 'publisher_name', 'offer', 'skus', 'version', 'api_version', 'custom_headers', 'raw'], 'defaults': ['2016-03-30', None, False]},
+        'doc': '1e32c8b5',
+        'arguments': [
+            ('location', {'required': True, 'default': None, 'help': '', 'action': None}),
+            ('publisher_name', {'required': True, 'default': None, 'help': '', 'action': None}),
+            ('offer', {'required': True, 'default': None, 'help': '', 'action': None}),
+            ('skus', {'required': True, 'default': None, 'help': '', 'action': None}),
+            ('version', {'required': True, 'default': None, 'help': '', 'action': None}),
+            ('api_version', {'required': False, 'default': '2016-03-30', 'help': 'Client Api Version.', 'action': None}),
+        ]},
+    'azure.mgmt.compute.operations.virtual_machine_images_operations#VirtualMachineImagesOperations.list_offers': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'location', 'publisher_name', 'api_version', 'custom_headers', 'raw'], 'defaults': ['2016-03-30', None, False]},
+        'doc': 'f9ab16d3',
+        'arguments': [
+            ('location', {'required': True, 'default': None, 'help': '', 'action': None}),
+            ('publisher_name', {'required': True, 'default': None, 'help': '', 'action': None}),
+            ('api_version', {'required': False, 'default': '2016-03-30', 'help': 'Client Api Version.', 'action': None}),
+        ]},
+    'azure.mgmt.compute.operations.virtual_machine_images_operations#VirtualMachineImagesOperations.list_publishers': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'location', 'api_version', 'custom_headers', 'raw'], 'defaults': ['2016-03-30', None, False]},
+        'doc': 'c7e6c764',
+        'arguments': [
+            ('location', {'required': True, 'default': None, 'help': '', 'action': None}),
+            ('api_version', {'required': False, 'default': '2016-03-30', 'help': 'Client Api Version.', 'action': None}),
+        ]},
+    'azure.mgmt.compute.operations.virtual_machine_images_operations#VirtualMachineImagesOperations.list_skus': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'location', 'publisher_name', 'offer', 'api_version', 'custom_headers', 'raw'], 'defaults': ['2016-03-30', None, False]},
+        'doc': 'fc5276d9',
+        'arguments': [
+            ('location', {'required': True, 'default': None, 'help': '', 'action': None}),
+            ('publisher_name', {'required': True, 'default': None, 'help': '', 'action': None}),
+            ('offer', {'required': True, 'default': None, 'help': '', 'action': None}),
+            ('api_version', {'required': False, 'default': '2016-03-30', 'help': 'Client Api Version.', 'action': None}),
+        ]},
+    'azure.mgmt.compute.operations.virtual_machine_scale_set_vms_operations#VirtualMachineScaleSetVMsOperations.list': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'virtual_machine_scale_set_name', 'api_version', 'filter', 'select', 'expand', 'custom_headers', 'raw'], 'defaults': ['2016-03-30', None, None, None, None, False]},
+        'doc': 'e4263fda',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('virtual_machine_scale_set_name', {'required': True, 'default': None, 'help': 'The name of the virtual machine scale set.', 'action': None}),
+            ('api_version', {'required': False, 'default': '2016-03-30', 'help': 'Client Api Version.', 'action': None}),
+            ('filter', {'required': False, 'default': None, 'help': 'The filter to apply on the operation.', 'action': None}),
+            ('select', {'required': False, 'default': None, 'help': 'The list parameters.', 'action': None}),
+            ('expand', {'required': False, 'default': None, 'help': 'The expand expression to apply on the operation.', 'action': None}),
+        ]},
+    'azure.mgmt.compute.operations.virtual_machine_scale_sets_operations#VirtualMachineScaleSetsOperations.delete': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'vm_scale_set_name', 'api_version', 'custom_headers', 'raw'], 'defaults': ['2016-03-30', None, False]},
+        'doc': '466e2418',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('vm_scale_set_name', {'required': True, 'default': None, 'help': 'The name of the virtual machine scale set.', 'action': None}),
+            ('api_version', {'required': False, 'default': '2016-03-30', 'help': 'Client Api Version.', 'action': None}),
+        ]},
+    'azure.mgmt.compute.operations.virtual_machine_scale_sets_operations#VirtualMachineScaleSetsOperations.list_skus': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'vm_scale_set_name', 'api_version', 'custom_headers', 'raw'], 'defaults': ['2016-03-30', None, False]},
+        'doc': 'c3ea8627',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('vm_scale_set_name', {'required': True, 'default': None, 'help': 'The name of the virtual machine scale set.', 'action': None}),
+            ('api_version', {'required': False, 'default': '2016-03-30', 'help': 'Client Api Version.', 'action': None}),
+        ]},
+    'azure.mgmt.compute.operations.virtual_machine_sizes_operations#VirtualMachineSizesOperations.list': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'location', 'api_version', 'custom_headers', 'raw'], 'defaults': ['2016-03-30', None, False]},
+        'doc': '753c4156',
+        'arguments': [
+            ('location', {'required': True, 'default': None, 'help': 'The location upon which virtual-machine-sizes is queried.', 'action': None}),
+            ('api_version', {'required': False, 'default': '2016-03-30', 'help': 'Client Api Version.', 'action': None}),
+        ]},
+    'azure.mgmt.compute.operations.virtual_machines_operations#VirtualMachinesOperations.create_or_update': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'vm_name', 'parameters', 'api_version', 'custom_headers', 'raw'], 'defaults': ['2016-03-30', None, False]},
+        'doc': '806bde98',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('vm_name', {'required': True, 'default': None, 'help': 'The name of the virtual machine.', 'action': None}),
+            ('parameters', {'required': True, 'default': None, 'help': 'Parameters supplied to the Create Virtual Machine operation.', 'action': None}),
+            ('api_version', {'required': False, 'default': '2016-03-30', 'help': 'Client Api Version.', 'action': None}),
+        ]},
+    'azure.mgmt.compute.operations.virtual_machines_operations#VirtualMachinesOperations.deallocate': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'vm_name', 'api_version', 'custom_headers', 'raw'], 'defaults': ['2016-03-30', None, False]},
+        'doc': '38969abd',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('vm_name', {'required': True, 'default': None, 'help': 'The name of the virtual machine.', 'action': None}),
+            ('api_version', {'required': False, 'default': '2016-03-30', 'help': 'Client Api Version.', 'action': None}),
+        ]},
+    'azure.mgmt.compute.operations.virtual_machines_operations#VirtualMachinesOperations.delete': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'vm_name', 'api_version', 'custom_headers', 'raw'], 'defaults': ['2016-03-30', None, False]},
+        'doc': '92e4641b',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('vm_name', {'required': True, 'default': None, 'help': 'The name of the virtual machine.', 'action': None}),
+            ('api_version', {'required': False, 'default': '2016-03-30', 'help': 'Client Api Version.', 'action': None}),
+        ]},
+    'azure.mgmt.compute.operations.virtual_machines_operations#VirtualMachinesOperations.generalize': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'vm_name', 'api_version', 'custom_headers', 'raw'], 'defaults': ['2016-03-30', None, False]},
+        'doc': 'a6ea5c50',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('vm_name', {'required': True, 'default': None, 'help': 'The name of the virtual machine.', 'action': None}),
+            ('api_version', {'required': False, 'default': '2016-03-30', 'help': 'Client Api Version.', 'action': None}),
+        ]},
+    'azure.mgmt.compute.operations.virtual_machines_operations#VirtualMachinesOperations.get': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'vm_name', 'api_version', 'expand', 'custom_headers', 'raw'], 'defaults': ['2016-03-30', None, None, False]},
+        'doc': '7a4a36dd',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('vm_name', {'required': True, 'default': None, 'help': 'The name of the virtual machine.', 'action': None}),
+            ('api_version', {'required': False, 'default': '2016-03-30', 'help': 'Client Api Version.', 'action': None}),
+            ('expand', {'required': False, 'default': None, 'help': "The expand expression to apply on the operation. Possible values include: 'instanceView'", 'action': None}),
+        ]},
+    'azure.mgmt.compute.operations.virtual_machines_operations#VirtualMachinesOperations.list_available_sizes': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'vm_name', 'api_version', 'custom_headers', 'raw'], 'defaults': ['2016-03-30', None, False]},
+        'doc': 'e35b7db8',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('vm_name', {'required': True, 'default': None, 'help': 'The name of the virtual machine.', 'action': None}),
+            ('api_version', {'required': False, 'default': '2016-03-30', 'help': 'Client Api Version.', 'action': None}),
+        ]},
+    'azure.mgmt.compute.operations.virtual_machines_operations#VirtualMachinesOperations.power_off': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'vm_name', 'api_version', 'custom_headers', 'raw'], 'defaults': ['2016-03-30', None, False]},
+        'doc': 'de7c8031',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('vm_name', {'required': True, 'default': None, 'help': 'The name of the virtual machine.', 'action': None}),
+            ('api_version', {'required': False, 'default': '2016-03-30', 'help': 'Client Api Version.', 'action': None}),
+        ]},
+    'azure.mgmt.compute.operations.virtual_machines_operations#VirtualMachinesOperations.redeploy': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'vm_name', 'api_version', 'custom_headers', 'raw'], 'defaults': ['2016-03-30', None, False]},
+        'doc': '3eb1d9d0',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('vm_name', {'required': True, 'default': None, 'help': 'The name of the virtual machine.', 'action': None}),
+            ('api_version', {'required': False, 'default': '2016-03-30', 'help': 'Client Api Version.', 'action': None}),
+        ]},
+    'azure.mgmt.compute.operations.virtual_machines_operations#VirtualMachinesOperations.restart': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'vm_name', 'api_version', 'custom_headers', 'raw'], 'defaults': ['2016-03-30', None, False]},
+        'doc': 'c2da27e9',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('vm_name', {'required': True, 'default': None, 'help': 'The name of the virtual machine.', 'action': None}),
+            ('api_version', {'required': False, 'default': '2016-03-30', 'help': 'Client Api Version.', 'action': None}),
+        ]},
+    'azure.mgmt.compute.operations.virtual_machines_operations#VirtualMachinesOperations.start': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'vm_name', 'api_version', 'custom_headers', 'raw'], 'defaults': ['2016-03-30', None, False]},
+        'doc': '5c456a58',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group.', 'action': None}),
+            ('vm_name', {'required': True, 'default': None, 'help': 'The name of the virtual machine.', 'action': None}),
+            ('api_version', {'required': False, 'default': '2016-03-30', 'help': 'Client Api Version.', 'action': None}),
+        ]},
+})
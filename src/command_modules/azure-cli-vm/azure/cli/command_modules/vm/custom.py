@@ -120,9 +120,8 @@ class ExtensionUpdateLongRunningOperation(LongRunningOperation): #pylint: disabl
 def list_vm(resource_group_name=None):
     ''' List Virtual Machines. '''
     ccf = _compute_client_factory()
-    vm_list = ccf.virtual_machines.list(resource_group_name=resource_group_name) \
+    return ccf.virtual_machines.list(resource_group_name=resource_group_name) \
         if resource_group_name else ccf.virtual_machines.list_all()
-    return list(vm_list)
 
 def list_vm_images(image_location=None, publisher=None, offer=None, sku=None, all=False): # pylint: disable=redefined-builtin
     '''vm image list
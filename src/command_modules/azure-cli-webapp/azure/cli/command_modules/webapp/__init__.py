@@ -5,5 +5,6 @@
 
 # pylint: disable=unused-import
 
+import azure.cli.command_modules.webapp._signatures
 import azure.cli.command_modules.webapp._params
 import azure.cli.command_modules.webapp.generated
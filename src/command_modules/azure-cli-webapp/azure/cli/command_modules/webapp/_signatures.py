@@ -0,0 +1,37 @@
+#---------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+#---------------------------------------------------------------------------------------------
+
+# This file is generated by scripts/sdk_command_gen/gen_signatures.py. Do not modify it by hand.
+# pylint: skip-file
+
+from azure.cli.commands._introspection import register_signatures
+
+register_signatures({
+    'azure.cli.command_modules.webapp.mgmt_webapp.lib.operations.webapp_operations#WebappOperations.create_or_update': {
+        'version': '2015-11-01',
+        'parameters': {'names': ['self', 'resource_group_name', 'deployment_name', 'name', 'content_version', 'hosting_plan', 'hosting_plan_type', 'number_of_workers', 'sku_capacity', 'sku_name', 'tags', 'custom_headers', 'raw'], 'defaults': [None, None, 'new', '1', '1', 'F1', None, None, False]},
+        'doc': '766f3598',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'The name of the resource group. The name is case insensitive.', 'action': None}),
+            ('deployment_name', {'required': True, 'default': None, 'help': 'The name of the deployment.', 'action': None}),
+            ('name', {'required': True, 'default': None, 'help': 'Name for the web application.', 'action': None}),
+            ('hosting_plan', {'required': False, 'default': None, 'help': "Name or ID of the web application's hosting plan.", 'action': None}),
+            ('hosting_plan_type', {'required': False, 'default': 'new', 'help': "Use a new or existing hosting plan. Possible values include: 'new', 'existingName', 'existingId'", 'action': None}),
+            ('number_of_workers', {'required': False, 'default': '1', 'help': 'Number of dedicated VMs in the farm.', 'action': None}),
+            ('sku_capacity', {'required': False, 'default': '1', 'help': "Describes plan's instance count", 'action': None}),
+            ('sku_name', {'required': False, 'default': 'F1', 'help': "Describes plan's pricing tier and instance size. Check details at https://azure.microsoft.com/en-us/pricing/details/app-service/", 'action': None}),
+            ('tags', {'required': False, 'default': None, 'help': 'Tags object.', 'action': None}),
+        ]},
+    'azure.mgmt.web.operations.sites_operations#SitesOperations.get_sites': {
+        'version': '0.30.0rc5',
+        'parameters': {'names': ['self', 'resource_group_name', 'properties_to_include', 'include_site_types', 'include_slots', 'custom_headers', 'raw'], 'defaults': [None, None, None, None, False]},
+        'doc': '117c37fd',
+        'arguments': [
+            ('resource_group_name', {'required': True, 'default': None, 'help': 'Name of resource group', 'action': None}),
+            ('properties_to_include', {'required': False, 'default': None, 'help': 'Additional web app properties included in the response', 'action': None}),
+            ('include_site_types', {'required': False, 'default': None, 'help': 'Types of apps included in the response', 'action': None}),
+            ('include_slots', {'required': False, 'default': None, 'help': 'Whether or not to include deployments slots in results', 'action': None}),
+        ]},
+})